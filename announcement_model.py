@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+공고/첨부파일 레코드 - 고정 필드(__slots__) + 나머지 값은 extra
+
+스크래퍼마다 다른 키 이름('author'/'writer', 'name'/'filename', 'num'/'post_num'/'number')을
+생성 시 한 번만 정규화하고, 이후에는 속성으로 바로 읽는다.
+기존 코드가 dict처럼 announcement['title'], .get('date'), 'number' in ann 으로 써도 동작하도록
+MutableMapping 인터페이스를 제공하며, 별칭 키로 읽고 써도 같은 필드를 가리킨다.
+값이 None인 필드는 dict에 키가 없는 것과 같게 취급한다.
+"""
+
+from collections.abc import MutableMapping
+from typing import Dict, Any, Iterator, Optional
+
+
+class _Record(MutableMapping):
+    """고정 필드 레코드 공통 구현"""
+
+    __slots__ = ()
+    FIELDS = ()  # 고정 필드 (extra 제외)
+    ALIASES = {}  # {별칭 키: 필드}
+
+    def __init__(self, **values):
+        for name in self.FIELDS:
+            setattr(self, name, None)
+        self.extra = {}
+        for key, value in values.items():
+            self._assign(key, value)
+
+    def _assign(self, key: str, value: Any):
+        """키 하나 저장 - 별칭은 정식 필드가 비어 있을 때만 필드로, 아니면 extra로"""
+        if key in self.FIELDS:
+            setattr(self, key, value)
+            return
+        field = self.ALIASES.get(key)
+        if field is not None and getattr(self, field) is None:
+            setattr(self, field, value)
+        else:
+            self.extra[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """기존 dict 변환 - 정식 키를 먼저 채운 뒤 별칭과 나머지 키 처리 (모두 _assign으로 변환)"""
+        record = cls()
+        for key in cls.FIELDS:
+            value = data.get(key)
+            if value is not None:
+                record._assign(key, value)
+        for key, value in data.items():
+            if key not in cls.FIELDS:
+                record._assign(key, value)
+        return record
+
+    @classmethod
+    def coerce(cls, value):
+        """레코드면 그대로, dict면 변환"""
+        if isinstance(value, cls):
+            return value
+        return cls.from_dict(value or {})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 dict - 값이 있는 필드 + extra"""
+        data = {name: getattr(self, name) for name in self.FIELDS if getattr(self, name) is not None}
+        data.update(self.extra)
+        return data
+
+    def copy(self):
+        return self.from_dict(self.to_dict())
+
+    # MutableMapping
+    def _field(self, key: str) -> Optional[str]:
+        if key in self.FIELDS:
+            return key
+        field = self.ALIASES.get(key)
+        if field is not None and key not in self.extra:
+            return field
+        return None
+
+    def __getitem__(self, key: str) -> Any:
+        field = self._field(key)
+        if field is not None:
+            value = getattr(self, field)
+            if value is None:
+                raise KeyError(key)
+            return value
+        return self.extra[key]
+
+    def __setitem__(self, key: str, value: Any):
+        field = self._field(key)
+        if field is not None:
+            setattr(self, field, value)
+        else:
+            self.extra[key] = value
+
+    def __delitem__(self, key: str):
+        field = self._field(key)
+        if field is not None:
+            if getattr(self, field) is None:
+                raise KeyError(key)
+            setattr(self, field, None)
+        else:
+            del self.extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self.FIELDS:
+            if getattr(self, name) is not None:
+                yield name
+        yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for name in self.FIELDS if getattr(self, name) is not None) + len(self.extra)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
+
+
+class Attachment(_Record):
+    """첨부파일 - filename, url, size + extra(사이트별 다운로드 파라미터 등)"""
+
+    __slots__ = ('filename', 'url', 'size', 'extra')
+    FIELDS = ('filename', 'url', 'size')
+    ALIASES = {'name': 'filename', 'file_name': 'filename', 'file_url': 'url', 'download_url': 'url'}
+
+
+class Announcement(_Record):
+    """공고 목록 행 - 제목, URL, 목록 메타 정보 + extra(사이트별 값)"""
+
+    __slots__ = ('title', 'url', 'announcement_id', 'number', 'date', 'writer', 'period', 'status',
+                 'organization', 'views', 'attachments', 'extra')
+    FIELDS = ('title', 'url', 'announcement_id', 'number', 'date', 'writer', 'period', 'status',
+              'organization', 'views', 'attachments')
+    ALIASES = {'author': 'writer', 'num': 'number', 'post_num': 'number'}
+
+    def _assign(self, key: str, value: Any):
+        if key == 'attachments' and value is not None:
+            value = [Attachment.coerce(item) for item in value]
+        super()._assign(key, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        if self.attachments is not None:
+            data['attachments'] = [item.to_dict() for item in self.attachments]
+        return data
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+공고 레코드 싱크 - 공고 하나당 한 줄씩 회전 JSONL 파일로 기록 (선택적 Parquet 변환)
+"""
+
+import os
+import sys
+import json
+import glob
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AnnouncementSink:
+    """회전 JSONL 공고 싱크
+
+    <output_base>/records/announcements_<site>_<run>_<NNNN>.jsonl 에 기록하며,
+    레코드 수나 파일 크기가 한도를 넘으면 다음 번호 파일로 넘어간다.
+    공고 폴더(content.md, attachments/)는 그대로 두고 이 싱크는 추가로 기록한다.
+    """
+
+    def __init__(self, output_base: str, site: str, run_id: Optional[str] = None,
+                 max_records_per_file: int = 1000, max_bytes_per_file: int = 64 * 1024 * 1024):
+        self.site = site
+        self.run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.records_dir = os.path.join(output_base, 'records')
+        self.max_records_per_file = max_records_per_file
+        self.max_bytes_per_file = max_bytes_per_file
+
+        self.paths: List[str] = []
+        self.total_records = 0
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._file_records = 0
+        self._file_bytes = 0
+
+    def _open_next_file(self):
+        """다음 회전 파일 열기 (호출자가 lock 보유)"""
+        if self._file is not None:
+            self._file.close()
+
+        os.makedirs(self.records_dir, exist_ok=True)
+        path = os.path.join(
+            self.records_dir,
+            f'announcements_{self.site}_{self.run_id}_{len(self.paths) + 1:04d}.jsonl'
+        )
+        self._file = open(path, 'a', encoding='utf-8')
+        self._file_records = 0
+        self._file_bytes = 0
+        self.paths.append(path)
+
+    def write(self, record: Dict[str, Any]):
+        """공고 레코드 한 줄 기록 - Announcement 등 레코드 객체는 to_dict()로 직렬화"""
+        if hasattr(record, 'to_dict'):
+            record = record.to_dict()
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        line_bytes = len(line.encode('utf-8'))
+
+        with self._lock:
+            if (self._file is None
+                    or self._file_records >= self.max_records_per_file
+                    or self._file_bytes + line_bytes > self.max_bytes_per_file):
+                self._open_next_file()
+
+            self._file.write(line)
+            self._file.flush()
+            self._file_records += 1
+            self._file_bytes += line_bytes
+            self.total_records += 1
+
+    def close(self):
+        """싱크 종료"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def iter_records(records_dir: str):
+    """싱크 디렉토리의 공고 레코드 순회"""
+    for path in sorted(glob.glob(os.path.join(records_dir, 'announcements_*.jsonl'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 중단 시 마지막 줄이 잘렸을 수 있음
+
+
+def export_parquet(records_dir: str, parquet_path: str) -> bool:
+    """JSONL 레코드를 Parquet 파일 하나로 변환 (pyarrow 필요)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        logger.error("pyarrow가 설치되지 않았습니다. pip install pyarrow 후 다시 실행하세요.")
+        return False
+
+    columns = ['site', 'announcement_id', 'title', 'url', 'date', 'period', 'status',
+               'writer', 'content', 'folder', 'collected_at']
+
+    rows = []
+    for record in iter_records(records_dir):
+        row = {column: record.get(column) for column in columns}
+        row['attachments'] = json.dumps(record.get('attachments', []), ensure_ascii=False)
+        rows.append(row)
+
+    if not rows:
+        logger.warning(f"변환할 공고 레코드가 없습니다: {records_dir}")
+        return False
+
+    os.makedirs(os.path.dirname(parquet_path) or '.', exist_ok=True)
+    table = pa.Table.from_pylist(rows)
+    pq.write_table(table, parquet_path, compression='zstd')
+    logger.info(f"Parquet 변환 완료: {parquet_path} ({len(rows)}개 공고)")
+    return True
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if len(sys.argv) != 4 or sys.argv[1] != 'parquet':
+        print("사용법: python announcement_sink.py parquet <records 디렉토리> <출력 parquet 경로>")
+        sys.exit(1)
+
+    sys.exit(0 if export_parquet(sys.argv[2], sys.argv[3]) else 1)
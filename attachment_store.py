@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+내용 주소 기반 첨부파일 저장소 - 같은 파일은 한 번만 저장하고 공고 폴더에는 링크로 연결
+"""
+
+import os
+import sys
+import shutil
+import sqlite3
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AttachmentStore:
+    """SHA-256 키 기반 첨부파일 blob 저장소
+
+    blob은 <root>/blobs/ab/cd/<sha256> 에 한 번만 저장하고, 공고 폴더의 attachments/ 에는
+    하드링크(실패 시 심볼릭 링크, 그것도 안 되면 복사)를 만든다.
+    기본 download_file이 쓰는 경로에만 링크하며, 사이트가 직접 저장한 파일은 다음 실행에서 같은 경로를 'wb'로
+    다시 열어 공유 blob을 덮어쓰므로 저장소에 넣지 않는다.
+    링크 목록과 참조 수는 <root>/index.sqlite3 에 기록하며, gc()로 참조가 없는 blob을 지운다.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+    # blob은 여러 공고 폴더가 공유하므로 읽기 전용으로 둔다 (링크 경로에 덮어쓰면 모든 폴더의 파일이 바뀜)
+    BLOB_MODE = 0o444
+
+    def __init__(self, root: str):
+        self.root = root
+        self.blob_dir = os.path.join(root, 'blobs')
+        self.index_path = os.path.join(root, 'index.sqlite3')
+        os.makedirs(self.blob_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.index_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS blobs (
+                sha256 TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                refcount INTEGER NOT NULL DEFAULT 0,
+                created_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS links (
+                path TEXT PRIMARY KEY,
+                sha256 TEXT NOT NULL,
+                link_type TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_links_sha256 ON links (sha256);
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def hash_file(path: str) -> str:
+        """파일 SHA-256 계산 (스트리밍)"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(AttachmentStore.CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def blob_path(self, sha256: str) -> str:
+        """blob 저장 경로"""
+        return os.path.join(self.blob_dir, sha256[:2], sha256[2:4], sha256)
+
+    def has_blob(self, sha256: str) -> bool:
+        """blob 존재 여부"""
+        return os.path.exists(self.blob_path(sha256))
+
+    def ingest(self, temp_path: str, sha256: str, dest_path: str) -> str:
+        """다운로드한 임시 파일을 저장소에 넣고 dest_path에 링크 생성
+
+        같은 내용의 blob이 이미 있으면 임시 파일은 지운다. 생성된 링크 경로를 반환한다.
+        """
+        blob = self.blob_path(sha256)
+        size = os.path.getsize(temp_path)
+
+        with self._lock:
+            if os.path.exists(blob):
+                if os.path.abspath(temp_path) != os.path.abspath(blob):
+                    os.remove(temp_path)
+                logger.info(f"중복 첨부파일 - 기존 blob 재사용: {sha256[:12]}")
+            else:
+                os.makedirs(os.path.dirname(blob), exist_ok=True)
+                try:
+                    os.replace(temp_path, blob)
+                except OSError:
+                    # 다른 파일시스템이면 이동 대신 복사
+                    shutil.move(temp_path, blob)
+            os.chmod(blob, self.BLOB_MODE)
+
+            link_type = self._link(blob, dest_path)
+            self._add_link(dest_path, sha256, size, link_type)
+
+        return dest_path
+
+    def link_existing(self, sha256: str, dest_path: str) -> Optional[str]:
+        """이미 저장된 blob을 dest_path에 연결 - blob이 없으면 None"""
+        blob = self.blob_path(sha256)
+        with self._lock:
+            if not os.path.exists(blob):
+                return None
+            link_type = self._link(blob, dest_path)
+            self._add_link(dest_path, sha256, os.path.getsize(blob), link_type)
+        return dest_path
+
+    def _link(self, blob: str, dest_path: str) -> str:
+        """blob을 dest_path에 연결 - 하드링크, 심볼릭 링크, 복사 순으로 시도"""
+        os.makedirs(os.path.dirname(dest_path) or '.', exist_ok=True)
+        if os.path.lexists(dest_path):
+            os.remove(dest_path)
+
+        try:
+            os.link(blob, dest_path)
+            return 'hardlink'
+        except OSError:
+            pass
+
+        try:
+            os.symlink(os.path.abspath(blob), dest_path)
+            return 'symlink'
+        except OSError:
+            pass
+
+        shutil.copy2(blob, dest_path)
+        os.chmod(dest_path, 0o644)
+        return 'copy'
+
+    def _add_link(self, path: str, sha256: str, size: int, link_type: str):
+        """링크 기록 및 참조 수 갱신 (호출자가 lock 보유)"""
+        now = datetime.now().isoformat()
+        path = os.path.abspath(path)
+
+        previous = self._conn.execute('SELECT sha256 FROM links WHERE path = ?', (path,)).fetchone()
+        if previous:
+            self._conn.execute('UPDATE blobs SET refcount = refcount - 1 WHERE sha256 = ?', (previous[0],))
+
+        self._conn.execute(
+            'INSERT OR IGNORE INTO blobs (sha256, size, refcount, created_at) VALUES (?, ?, 0, ?)',
+            (sha256, size, now)
+        )
+        self._conn.execute('UPDATE blobs SET refcount = refcount + 1 WHERE sha256 = ?', (sha256,))
+        self._conn.execute(
+            'INSERT OR REPLACE INTO links (path, sha256, link_type, created_at) VALUES (?, ?, ?, ?)',
+            (path, sha256, link_type, now)
+        )
+        self._conn.commit()
+
+    def gc(self, dry_run: bool = False) -> Dict[str, Any]:
+        """가비지 컬렉션 - 삭제된 공고 폴더의 링크를 정리하고 참조가 없는 blob 삭제"""
+        result = {'removed_links': 0, 'removed_blobs': 0, 'freed_bytes': 0}
+
+        with self._lock:
+            for path, sha256 in self._conn.execute('SELECT path, sha256 FROM links').fetchall():
+                if os.path.lexists(path):
+                    continue
+                result['removed_links'] += 1
+                if not dry_run:
+                    self._conn.execute('DELETE FROM links WHERE path = ?', (path,))
+                    self._conn.execute('UPDATE blobs SET refcount = refcount - 1 WHERE sha256 = ?', (sha256,))
+
+            for sha256, size in self._conn.execute('SELECT sha256, size FROM blobs WHERE refcount <= 0').fetchall():
+                result['removed_blobs'] += 1
+                result['freed_bytes'] += size
+                if not dry_run:
+                    blob = self.blob_path(sha256)
+                    if os.path.exists(blob):
+                        os.chmod(blob, 0o644)
+                        os.remove(blob)
+                    self._conn.execute('DELETE FROM blobs WHERE sha256 = ?', (sha256,))
+
+            if not dry_run:
+                self._conn.commit()
+
+        logger.info(f"첨부파일 저장소 정리: 링크 {result['removed_links']}개, blob {result['removed_blobs']}개, "
+                    f"{result['freed_bytes']:,} bytes")
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """저장소 통계 - 실제 저장 크기와 링크 기준 논리 크기"""
+        with self._lock:
+            blobs, stored = self._conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs').fetchone()
+            links, logical = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(b.size), 0) FROM links l JOIN blobs b ON l.sha256 = b.sha256'
+            ).fetchone()
+        return {
+            'blobs': blobs,
+            'links': links,
+            'stored_bytes': stored,
+            'logical_bytes': logical,
+            'saved_bytes': logical - stored
+        }
+
+    def close(self):
+        """인덱스 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if len(sys.argv) < 3 or sys.argv[1] not in ('gc', 'stats'):
+        print("사용법: python attachment_store.py [gc|stats] <저장소 경로> [--dry-run]")
+        sys.exit(1)
+
+    store = AttachmentStore(sys.argv[2])
+    if sys.argv[1] == 'gc':
+        print(store.gc(dry_run='--dry-run' in sys.argv))
+    else:
+        print(store.stats())
+    store.close()
@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+"""
+첨부파일 텍스트 추출 - PDF/HWP/HWPX/DOCX/XLSX 텍스트를 프로세스 풀에서 추출하여
+내용 해시별로 캐시하고 공고 폴더에 attachments.txt 로 저장
+"""
+
+import io
+import os
+import re
+import sys
+import zlib
+import struct
+import hashlib
+import logging
+import zipfile
+import threading
+import multiprocessing
+import concurrent.futures
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.hwp', '.hwpx', '.docx', '.xlsx')
+
+
+def _xml_text(data: bytes, text_tags: Tuple[str, ...], break_tags: Tuple[str, ...]) -> str:
+    """XML에서 지정한 태그의 텍스트만 추출 (break_tags가 끝날 때 줄바꿈)"""
+    lines, current = [], []
+    for event, element in ET.iterparse(io.BytesIO(data), events=('end',)):
+        tag = element.tag.rsplit('}', 1)[-1]
+        if tag in text_tags and element.text:
+            current.append(element.text)
+        elif tag in break_tags:
+            if current:
+                lines.append(''.join(current))
+                current = []
+            element.clear()
+    if current:
+        lines.append(''.join(current))
+    return '\n'.join(lines)
+
+
+def _natural_key(name: str):
+    """section10.xml이 section2.xml 뒤에 오도록 정렬"""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
+
+
+def extract_docx(path: str) -> str:
+    """DOCX 본문 텍스트"""
+    with zipfile.ZipFile(path) as archive:
+        return _xml_text(archive.read('word/document.xml'), ('t',), ('p',))
+
+
+def extract_hwpx(path: str) -> str:
+    """HWPX(OWPML) 본문 텍스트"""
+    with zipfile.ZipFile(path) as archive:
+        sections = sorted(
+            (name for name in archive.namelist() if re.match(r'Contents/section\d+\.xml$', name)),
+            key=_natural_key
+        )
+        return '\n'.join(_xml_text(archive.read(name), ('t',), ('p',)) for name in sections)
+
+
+def extract_xlsx(path: str) -> str:
+    """XLSX 셀 텍스트 - 공유 문자열과 인라인 문자열/숫자를 행 단위로"""
+    with zipfile.ZipFile(path) as archive:
+        names = archive.namelist()
+
+        shared = []
+        if 'xl/sharedStrings.xml' in names:
+            root = ET.fromstring(archive.read('xl/sharedStrings.xml'))
+            for item in root:
+                shared.append(''.join(node.text or '' for node in item.iter() if node.tag.endswith('}t')))
+
+        lines = []
+        sheets = sorted((name for name in names if re.match(r'xl/worksheets/sheet\d+\.xml$', name)), key=_natural_key)
+        for name in sheets:
+            root = ET.fromstring(archive.read(name))
+            for row in root.iter():
+                if not row.tag.endswith('}row'):
+                    continue
+                cells = []
+                for cell in row:
+                    value = next((node for node in cell if node.tag.endswith('}v')), None)
+                    if cell.get('t') == 's' and value is not None and value.text:
+                        index = int(value.text)
+                        cells.append(shared[index] if index < len(shared) else '')
+                    elif cell.get('t') == 'inlineStr':
+                        cells.append(''.join(node.text or '' for node in cell.iter() if node.tag.endswith('}t')))
+                    elif value is not None and value.text:
+                        cells.append(value.text)
+                if any(cells):
+                    lines.append('\t'.join(cells))
+        return '\n'.join(lines)
+
+
+def _hwp_records(data: bytes):
+    """HWP 레코드 (tag_id, payload) 순회"""
+    pos = 0
+    while pos + 4 <= len(data):
+        header = struct.unpack_from('<I', data, pos)[0]
+        pos += 4
+        tag_id = header & 0x3FF
+        size = (header >> 20) & 0xFFF
+        if size == 0xFFF:
+            size = struct.unpack_from('<I', data, pos)[0]
+            pos += 4
+        yield tag_id, data[pos:pos + size]
+        pos += size
+
+
+def _hwp_para_text(payload: bytes) -> str:
+    """HWPTAG_PARA_TEXT 레코드에서 제어 문자를 제외한 텍스트"""
+    chars = []
+    units = struct.unpack(f'<{len(payload) // 2}H', payload[:len(payload) // 2 * 2])
+    i = 0
+    while i < len(units):
+        code = units[i]
+        if code in (10, 13):
+            chars.append('\n')
+        elif code in (1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23):
+            i += 7  # 확장/인라인 제어 문자는 8 단위를 차지
+        elif code >= 32:
+            chars.append(chr(code))
+        i += 1
+    return ''.join(chars)
+
+
+def extract_hwp(path: str) -> str:
+    """HWP 5.0 본문 텍스트 (olefile 필요)"""
+    try:
+        import olefile
+    except ImportError:
+        logger.warning("olefile이 설치되지 않아 HWP 텍스트를 추출할 수 없습니다. pip install olefile")
+        return ''
+
+    HWPTAG_PARA_TEXT = 67
+
+    with olefile.OleFileIO(path) as ole:
+        header = ole.openstream('FileHeader').read()
+        compressed = bool(header[36] & 0x01) if len(header) > 36 else True
+
+        sections = sorted(
+            ('/'.join(entry) for entry in ole.listdir() if entry[0] == 'BodyText'),
+            key=_natural_key
+        )
+
+        paragraphs = []
+        for section in sections:
+            data = ole.openstream(section).read()
+            if compressed:
+                data = zlib.decompress(data, -15)
+            for tag_id, payload in _hwp_records(data):
+                if tag_id == HWPTAG_PARA_TEXT:
+                    paragraphs.append(_hwp_para_text(payload).rstrip('\n'))
+
+        if not paragraphs and ole.exists('PrvText'):
+            # 본문이 배포용(암호화) 문서면 미리보기 텍스트라도 사용
+            return ole.openstream('PrvText').read().decode('utf-16-le', errors='ignore')
+
+        return '\n'.join(paragraphs)
+
+
+def extract_pdf(path: str) -> str:
+    """PDF 텍스트 (pdfminer.six 또는 pypdf 필요)"""
+    try:
+        from pdfminer.high_level import extract_text
+        return extract_text(path)
+    except ImportError:
+        pass
+
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        logger.warning("pdfminer.six/pypdf가 설치되지 않아 PDF 텍스트를 추출할 수 없습니다. pip install pdfminer.six")
+        return ''
+
+    reader = PdfReader(path)
+    return '\n'.join(page.extract_text() or '' for page in reader.pages)
+
+
+EXTRACTORS = {
+    '.pdf': extract_pdf,
+    '.hwp': extract_hwp,
+    '.hwpx': extract_hwpx,
+    '.docx': extract_docx,
+    '.xlsx': extract_xlsx,
+}
+
+
+def extract_text(path: str) -> str:
+    """확장자에 맞는 추출기로 텍스트 추출 - 지원하지 않거나 실패하면 빈 문자열"""
+    extractor = EXTRACTORS.get(os.path.splitext(path)[1].lower())
+    if extractor is None:
+        return ''
+    try:
+        return extractor(path).strip()
+    except Exception as e:
+        logger.warning(f"텍스트 추출 실패 {os.path.basename(path)}: {e}")
+        return ''
+
+
+def _cache_path(cache_dir: str, sha256: str) -> str:
+    return os.path.join(cache_dir, sha256[:2], f'{sha256}.txt')
+
+
+def extract_cached(path: str, sha256: Optional[str], cache_dir: str) -> Tuple[str, str]:
+    """캐시 확인 후 텍스트 추출 - 프로세스 풀 작업 함수, (sha256, text) 반환"""
+    if not sha256:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+
+    cache_path = _cache_path(cache_dir, sha256)
+    if os.path.exists(cache_path):
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return sha256, f.read()
+
+    text = extract_text(path)
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    temp_path = f'{cache_path}.{os.getpid()}.part'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, cache_path)
+    return sha256, text
+
+
+class AttachmentTextExtractor:
+    """공고별 첨부파일 텍스트 추출기
+
+    submit()은 작업만 넣고 바로 반환하므로 크롤링을 막지 않는다. 추출은 크기가 제한된
+    프로세스 풀에서 실행하고, 결과는 SHA-256별로 <cache_dir>/ab/<sha256>.txt 에 캐시한다.
+    공고의 모든 첨부파일 추출이 끝나면 공고 폴더에 attachments.txt 를 쓰고,
+    검색 색인(search_index)이 있으면 첨부파일 텍스트를 색인한다.
+    """
+
+    def __init__(self, cache_dir: str, max_workers: int = 2, search_index=None):
+        self.cache_dir = cache_dir
+        self.search_index = search_index
+        os.makedirs(cache_dir, exist_ok=True)
+
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+        self._lock = threading.RLock()  # 이미 끝난 future의 콜백은 submit() 안에서 바로 실행됨
+        self._in_flight: Dict[str, concurrent.futures.Future] = {}  # 같은 해시의 파일은 한 번만 추출
+        self._pending: List[concurrent.futures.Future] = []
+        self.stats = {'submitted': 0, 'extracted': 0, 'deduplicated': 0, 'sidecars': 0}
+
+    def submit(self, folder_path: str, files: List[Tuple[str, Optional[str]]]):
+        """공고 첨부파일 (경로, sha256) 목록 추출 예약"""
+        targets = [(path, sha256) for path, sha256 in files
+                   if os.path.splitext(path)[1].lower() in SUPPORTED_EXTENSIONS and os.path.isfile(path)]
+        if not targets:
+            return
+
+        futures = []
+        with self._lock:
+            for path, sha256 in targets:
+                self.stats['submitted'] += 1
+                future = self._in_flight.get(sha256) if sha256 else None
+                if future is not None:
+                    self.stats['deduplicated'] += 1
+                else:
+                    future = self._executor.submit(extract_cached, path, sha256, self.cache_dir)
+                    if sha256:
+                        self._in_flight[sha256] = future
+                        future.add_done_callback(lambda _, key=sha256: self._forget(key))
+                futures.append((os.path.basename(path), future))
+
+            folder_future = concurrent.futures.Future()
+            self._pending.append(folder_future)
+
+        remaining = [len(futures)]
+
+        def on_done(_):
+            with self._lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            try:
+                self._write_sidecar(folder_path, futures)
+            finally:
+                folder_future.set_result(None)
+
+        for _, future in futures:
+            future.add_done_callback(on_done)
+
+    def _forget(self, sha256: str):
+        with self._lock:
+            self._in_flight.pop(sha256, None)
+
+    def _write_sidecar(self, folder_path: str, futures):
+        """attachments.txt 작성 및 색인"""
+        sections = []
+        for filename, future in futures:
+            try:
+                _, text = future.result()
+            except Exception as e:
+                logger.warning(f"텍스트 추출 작업 실패 {filename}: {e}")
+                continue
+            if text:
+                sections.append(f"===== {filename} =====\n{text}\n")
+
+        with self._lock:
+            self.stats['extracted'] += len(sections)
+
+        if not sections:
+            return
+
+        combined = '\n'.join(sections)
+        try:
+            with open(os.path.join(folder_path, 'attachments.txt'), 'w', encoding='utf-8') as f:
+                f.write(combined)
+            with self._lock:
+                self.stats['sidecars'] += 1
+            if self.search_index is not None:
+                self.search_index.set_attachment_text(folder_path, combined)
+        except Exception as e:
+            logger.error(f"첨부파일 텍스트 저장 실패 {folder_path}: {e}")
+
+    def close(self, wait: bool = True):
+        """남은 추출 작업 완료 대기 후 풀 종료"""
+        if wait:
+            with self._lock:
+                pending = list(self._pending)
+            concurrent.futures.wait(pending)
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        logger.info(f"첨부파일 텍스트 추출: {self.stats}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if len(sys.argv) < 2:
+        print("사용법: python attachment_text.py <첨부파일 경로>...")
+        sys.exit(1)
+
+    for file_path in sys.argv[1:]:
+        print(f"===== {os.path.basename(file_path)} =====")
+        print(extract_text(file_path))
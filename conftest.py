@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+테스트 공용 - 네트워크 없이 기본 스크래퍼 흐름을 돌리는 최소 구현 스크래퍼
+"""
+
+import pytest
+
+from enhanced_base_scraper import StandardTableScraper
+
+
+class DemoScraper(StandardTableScraper):
+    """pages에 준 공고 목록을 돌려주는 테스트용 스크래퍼
+
+    process(scraper, announcement, index, output_base)를 주면 공고 처리를 대신하고, 없으면 기본 처리를 쓴다.
+    detail은 parse_detail_page 결과이며, 그 밖의 키워드 인자는 같은 이름의 속성으로 설정한다
+    (get_page, download_file 같은 메서드를 바꿔 끼울 때도 사용).
+    """
+
+    def __init__(self, site='demo', pages=None, process=None, detail=None, **attrs):
+        super().__init__()
+        self.site = site
+        self.pages = pages or {}
+        self.process = process
+        self.detail = detail or {'content': '', 'attachments': []}
+        self.delay_between_pages = 0
+        self.delay_between_requests = 0
+        self.processed = []
+        for name, value in attrs.items():
+            setattr(self, name, value)
+
+    def get_site_key(self):
+        return self.site
+
+    def get_list_url(self, page_num):
+        return ''
+
+    def parse_list_page(self, html_content):
+        return []
+
+    def parse_detail_page(self, html_content):
+        return self.detail
+
+    def _get_page_announcements(self, page_num):
+        return self.pages.get(page_num, [])
+
+    def process_announcement(self, announcement, index, output_base='output'):
+        if self.process is None:
+            return super().process_announcement(announcement, index, output_base)
+        return self.process(self, announcement, index, output_base)
+
+
+@pytest.fixture
+def demo_scraper():
+    """DemoScraper 생성 함수"""
+    return DemoScraper
@@ -89,7 +89,7 @@ class EnhancedAgrixScraper(EnhancedBaseScraper):
             context = await self.browser.new_context(
                 accept_downloads=True
             )
-            self.page = await context.new_page()
+            self.page = self.guard_page(await context.new_page())
             
             # 타임아웃 설정
             self.page.set_default_timeout(30000)
@@ -726,6 +726,9 @@ class EnhancedAgrixScraper(EnhancedBaseScraper):
         
         # 첨부파일 다운로드 (비동기 방식)
         await self._download_attachments_async(detail['attachments'], folder_path)
+
+        # 직접 저장한 폴더를 매니페스트/레코드에 기록
+        self.record_saved_folder(folder_path, announcement)
         
         # 처리된 제목으로 추가
         self.add_processed_title(announcement['title'])
@@ -56,7 +56,7 @@ class EnhancedAnseongCCIScraper(StandardTableScraper):
         try:
             async with async_playwright() as p:
                 browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
+                page = self.guard_page(await browser.new_page())
                 
                 # 페이지 이동 및 로딩 대기
                 await page.goto(url, wait_until='networkidle')
@@ -105,7 +105,7 @@ class EnhancedAnseongCCIScraper(StandardTableScraper):
         try:
             async with async_playwright() as p:
                 browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
+                page = self.guard_page(await browser.new_page())
                 
                 # 먼저 목록 페이지로 이동
                 await page.goto(list_url, wait_until='networkidle')
@@ -393,8 +393,7 @@ class EnhancedAnseongCCIScraper(StandardTableScraper):
             
             if content_cell:
                 # HTML을 마크다운으로 변환
-                content_html = str(content_cell)
-                result['content'] = self.h.handle(content_html)
+                result['content'] = self.h.handle(content_cell)
             else:
                 logger.warning("본문 내용을 찾을 수 없습니다")
             
@@ -581,7 +580,7 @@ class EnhancedAnseongCCIScraper(StandardTableScraper):
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
 
 
 def main():
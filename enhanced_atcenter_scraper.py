@@ -210,8 +210,7 @@ class EnhancedAtcenterScraper(StandardTableScraper):
             for unwanted in content_area.find_all(['script', 'style', 'nav', 'header', 'footer']):
                 unwanted.decompose()
             
-            content_html = str(content_area)
-            content_markdown = self.h.handle(content_html)
+            content_markdown = self.h.handle(content_area)
         else:
             content_markdown = "본문을 찾을 수 없습니다."
             logger.warning("본문 영역을 찾을 수 없음")
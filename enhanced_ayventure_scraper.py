@@ -83,7 +83,7 @@ class EnhancedAyventureScraper(StandardTableScraper):
         
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
+            page = self.guard_page(browser.new_page())
             page.goto(url)
             
             # 테이블이 로드될 때까지 기다리기
@@ -205,14 +205,14 @@ class EnhancedAyventureScraper(StandardTableScraper):
         
         if content_elem:
             # HTML을 마크다운으로 변환
-            content = self.h.handle(str(content_elem))
+            content = self.h.handle(content_elem)
             logger.debug("본문을 bbs_memo 선택자로 찾음")
         else:
             # 대체 선택자들 시도
             for selector in ['.panel-body', '.view_content', '.board_view']:
                 content_elem = soup.select_one(selector)
                 if content_elem:
-                    content = self.h.handle(str(content_elem))
+                    content = self.h.handle(content_elem)
                     logger.debug(f"본문을 {selector} 선택자로 찾음")
                     break
         
@@ -4,7 +4,8 @@
 """
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag, NavigableString, CData
+from bs4.element import PreformattedString
 import os
 import time
 import html2text
@@ -14,12 +15,156 @@ import json
 import logging
 import chardet
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple
 import hashlib
 from datetime import datetime
 
+from run_manifest import RunManifest
+from run_checkpoint import RunCheckpoint
+from run_budget import BudgetExceeded, GuardedPage
+from announcement_sink import AnnouncementSink
+from announcement_model import Announcement, Attachment
+from near_duplicate_index import NearDuplicateIndex
+from attachment_store import AttachmentStore
+from scraper_metrics import ScraperMetrics
+from search_index import normalize_date
+
 logger = logging.getLogger(__name__)
 
+# 공고 안정 ID 기본 추출 규칙 - 목록 파서가 채우는 필드, 상세 URL의 쿼리 파라미터 순으로 시도
+DEFAULT_ID_FIELDS = ('announcement_id', 'content_id', 'contentsId', 'nttId', 'ancmId', 'ancm_id',
+                     'wr_id', 'bbs_seq', 'board_seq', 'article_id', 'notice_no', 'seq')
+DEFAULT_ID_QUERY_PARAMS = ('nttId', 'nttSn', 'contentsId', 'bbsno', 'bbs_seq', 'board_seq', 'mgr_seq',
+                           'wr_id', 'articleNo', 'article_id', 'ancmId', 'idx', 'seq', 'no')
+
+# 본문 후보에서 제외할 레이아웃 클래스/ID 키워드
+BOILERPLATE_CLASS_KEYWORDS = ['nav', 'header', 'footer', 'menu', 'gnb', 'lnb']
+
+
+def _collect_text_stats(root: Tag, keywords: List[str]) -> Dict[int, tuple]:
+    """후위 순회 한 번으로 각 태그의 텍스트 길이/링크 텍스트 길이/키워드 포함 여부 계산
+    
+    div/td/p 등 일반 태그의 텍스트 길이는 get_text(strip=True)의 길이와 같다.
+    """
+    stats = {}
+    stack = [(root, False)]
+    
+    while stack:
+        node, children_done = stack.pop()
+        
+        if not children_done:
+            stack.append((node, True))
+            for child in node.contents:
+                if isinstance(child, Tag):
+                    stack.append((child, False))
+            continue
+        
+        text_len = 0
+        link_len = 0
+        has_keyword = False
+        for child in node.contents:
+            if isinstance(child, Tag):
+                child_text_len, child_link_len, child_has_keyword = stats[id(child)]
+                text_len += child_text_len
+                link_len += child_link_len
+                has_keyword = has_keyword or child_has_keyword
+            elif type(child) in (NavigableString, CData):
+                stripped = child.strip()
+                text_len += len(stripped)
+                if keywords and not has_keyword:
+                    has_keyword = any(keyword in stripped for keyword in keywords)
+        
+        if node.name == 'a':
+            link_len = text_len
+        
+        stats[id(node)] = (text_len, link_len, has_keyword)
+    
+    return stats
+
+
+class TreeHTML2Text(html2text.HTML2Text):
+    """파싱된 BeautifulSoup 트리를 직접 마크다운으로 변환하는 html2text
+    
+    handle()에 Tag를 넘기면 str()로 직렬화한 뒤 다시 HTMLParser로 파싱하는 대신
+    트리를 순회하며 html2text의 시작/끝 태그, 텍스트, 엔티티 이벤트를 그대로 호출한다.
+    str(tag)를 넘겼을 때와 같은 이벤트 순서를 만들기 때문에 출력도 같다.
+    """
+    
+    # str(tag)가 엔티티로 바꾸는 문자 (HTMLParser에서는 엔티티 이벤트로 전달됨)
+    ESCAPED_CHARS = {'&': 'amp', '<': 'lt', '>': 'gt'}
+    ESCAPED_CHARS_PATTERN = re.compile(r'([&<>])')
+    # str(tag)가 엔티티 치환 없이 출력하는 태그
+    RAW_TEXT_TAGS = ('script', 'style')
+    
+    def handle(self, data: Union[str, Tag]) -> str:
+        """HTML 문자열 또는 BeautifulSoup 요소를 마크다운으로 변환"""
+        if not isinstance(data, Tag):
+            return super().handle(str(data))
+        
+        self.start = True
+        self._text_buffer = []
+        self._walk_tree(data)
+        self._flush_text()
+        
+        markdown = self.optwrap(self.finish())
+        if self.pad_tables:
+            return html2text.pad_tables_in_text(markdown)
+        return markdown
+    
+    def _walk_tree(self, root: Tag):
+        """트리를 문서 순서대로 순회하며 파서 이벤트 호출 (재귀 없이)"""
+        # BeautifulSoup 객체 자체는 태그를 출력하지 않음
+        if isinstance(root, BeautifulSoup):
+            stack = [(child, False) for child in reversed(root.contents)]
+        else:
+            stack = [(root, False)]
+        
+        while stack:
+            node, closing = stack.pop()
+            
+            if closing:
+                self._flush_text()
+                self.handle_endtag(node.name)
+                continue
+            
+            if isinstance(node, Tag):
+                self._flush_text()
+                attrs = [
+                    (name, ' '.join(value) if isinstance(value, list) else value)
+                    for name, value in node.attrs.items()
+                ]
+                self.handle_starttag(node.name, attrs)
+                stack.append((node, True))
+                for child in reversed(node.contents):
+                    stack.append((child, False))
+            elif isinstance(node, PreformattedString):
+                # 주석/CDATA/선언 등은 html2text에서 무시되지만 텍스트 흐름은 끊는다
+                self._flush_text()
+            elif isinstance(node, NavigableString):
+                self._text_buffer.append(node)
+    
+    def _flush_text(self):
+        """인접한 텍스트 노드를 하나의 텍스트 이벤트로 전달"""
+        if not self._text_buffer:
+            return
+        
+        first = self._text_buffer[0]
+        text = ''.join(self._text_buffer)
+        self._text_buffer = []
+        
+        if first.parent is not None and first.parent.name in self.RAW_TEXT_TAGS:
+            self.handle_data(text)
+            return
+        
+        for part in self.ESCAPED_CHARS_PATTERN.split(text):
+            if not part:
+                continue
+            if part in self.ESCAPED_CHARS:
+                self.handle_entityref(self.ESCAPED_CHARS[part])
+            else:
+                self.handle_data(part)
+
+
 class EnhancedBaseScraper(ABC):
     """향상된 베이스 스크래퍼 - 설정 주입 지원"""
     
@@ -31,8 +176,8 @@ class EnhancedBaseScraper(ABC):
         self.session = requests.Session()
         self.session.headers.update(self.headers)
         
-        # HTML to text 변환기
-        self.h = html2text.HTML2Text()
+        # HTML to text 변환기 (BeautifulSoup 요소를 직접 받을 수 있음)
+        self.h = TreeHTML2Text()
         self.h.ignore_links = False
         self.h.ignore_images = False
         
@@ -55,10 +200,80 @@ class EnhancedBaseScraper(ABC):
         
         # 현재 페이지 번호 (페이지네이션 지원)
         self.current_page_num = 1
-        self.processed_titles = set()  # 이전 실행에서 처리된 제목들
-        self.current_session_titles = set()  # 현재 세션에서 처리된 제목들
+        self.processed_titles = set()  # 이전 실행에서 처리된 공고 키들 ('id:<안정 ID>' 또는 제목 해시)
+        self.current_session_titles = set()  # 현재 세션에서 처리된 공고 키들
+        self.legacy_title_hashes = set()  # 안정 ID 도입 전에 제목 해시로만 기록된 공고들
+        self._pending_keys = {}  # {제목: [공고 키]} - filter_new_announcements에서 계산한 키를 처리 완료 시 사용
+        
+        # 최고 수위(high-water mark) 증분 수집 - 지난 실행의 최대 게시물 번호/ID/날짜 이하가 나오면 중단
+        # watermark_kind: None(자동 감지 - id/date), 'id', 'number', 'date', 'off'(사용 안 함 - 목록이 최신순이 아닌 사이트)
+        # 'number'(목록 번호 칸)는 삭제가 있으면 번호가 밀려 새 글이 수위 아래로 보이므로 설정으로만 사용
+        self.watermark_kind = None
+        self.high_water_file = None
+        self.high_water = None  # {'kind': ..., 'value': ...}
+        self._watermark_pending = {}  # {공고 키: (값, 고정 공지 여부)} - 이번 실행에서 새로 넘긴 공고
+        self._watermark_processed = []  # 이번 실행에서 처리 완료된 공고 값
+        self._watermark_detect_pending = True  # 수위 종류 자동 감지는 실행의 첫 목록 페이지에서만
+        self._below_mark_streak = 0  # 수위 이하 일반 행 연속 개수 (페이지를 넘어 이어짐)
+        
+        # 공고 안정 ID 추출 규칙 (사이트별 재정의) - 없으면 DEFAULT_ID_FIELDS/DEFAULT_ID_QUERY_PARAMS
+        # 예: [{'query_param': 'nttId'}], [{'field': 'content_id'}], [{'regex': r'fn_view\('(\d+)'', 'source': 'url'}]
+        self.id_rules = None
         self.enable_duplicate_check = True
-        self.duplicate_threshold = 3  # 동일 제목 3개 발견시 조기 종료
+        self.duplicate_threshold = 3  # 이전 실행에서 처리된 공고 3개 연속 발견시 조기 종료
+        
+        # 목록 페이지 부분 파싱 대상 게시판 컨테이너 (하위 클래스에서 설정)
+        # 'table', 'table.bdListTbl', 'div#board' 같은 단순 선택자 또는 {'name': 'table', 'attrs': {...}}
+        self.list_container = None
+        
+        # 파싱 전략 기록 (그룹별로 성공한 전략을 먼저 시도)
+        self.strategy_stats_file = None
+        self.strategy_stats = {}  # {group: {'preferred': name, 'strategies': {name: {'hits', 'misses', 'last_hit', ...}}}}
+        # run_all_strategies: 최근 N번 연속 결과가 없는 전략은 건너뛰고, 건너뛴 M번마다 한 번 다시 시도
+        self.strategy_skip_after = 20
+        self.strategy_reprobe_interval = 10
+        
+        # 엔드포인트 탐색 캐시 (그룹별로 동작이 확인된 URL 템플릿과 404 등으로 실패한 템플릿 기록)
+        self.endpoint_cache_file = None
+        self.endpoint_cache = {}  # {group: {'known': template, 'succeeded': [template], 'failed': {template: timestamp}}}
+        self.endpoint_negative_ttl = 7 * 24 * 3600  # 실패 기록 유지 시간 (초)
+        
+        # 실행 체크포인트 (중단 시 이어서 수집) - resume이면 중단된 실행의 페이지/공고 번호부터 재개
+        self.resume = False
+        self.checkpoint = None
+        self._resumed_keys = set()  # 재개한 실행에서 이미 처리한 공고 키 (이전 실행 중복으로 세지 않음)
+        
+        # 실행 매니페스트 (공고/첨부파일 저장 기록)
+        self.manifest = None
+        self._current_announcement = None
+        self._recorded_folders = set()  # 이번 실행에서 매니페스트에 기록한 공고 폴더
+        self.last_download_path = None  # 마지막으로 다운로드한 파일의 실제 저장 경로
+        self.last_download_sha256 = None  # 마지막으로 다운로드한 파일의 SHA-256
+        
+        # 내용 주소 기반 첨부파일 저장소 (선택적, AttachmentStore)
+        self.attachment_store = None
+        
+        # 구조화 공고 레코드 싱크 (공고 폴더와 함께 records/*.jsonl 에 기록)
+        self.enable_record_sink = True
+        self.record_sink = None
+        self._folder_files = {}  # {folder_name: [첨부파일 레코드]}
+        
+        # 전문 검색 색인 (선택적, SearchIndex - 공고 저장 시 바로 색인)
+        self.search_index = None
+        
+        # 사이트 간 유사 공고 색인 (선택적, NearDuplicateIndex - 다른 사이트가 다시 게시한 공고 표시)
+        self.near_duplicate_index = None
+        self.skip_duplicate_attachments = False  # 재게시 공고에서 원본이 같은 URL로 받아 둔 첨부파일은 다운로드 생략
+        
+        # 첨부파일 텍스트 추출기 (선택적, AttachmentTextExtractor - 다운로드 후 백그라운드 추출)
+        self.text_extractor = None
+        
+        # 실행 시간 예산 - 마감 시각(epoch 초)이 지나면 요청/다운로드/대기에서 BudgetExceeded
+        self.deadline = None
+        
+        # 단계별 계측 (여러 스크래퍼가 공유할 수 있음)
+        self.metrics = ScraperMetrics()
+        self._fetch_phase = 'detail_fetch'  # get_page/post_page 요청을 기록할 단계
         
     def set_config(self, config):
         """설정 객체 주입"""
@@ -77,6 +292,14 @@ class EnhancedBaseScraper(ABC):
             if hasattr(config, 'user_agent') and config.user_agent:
                 self.headers['User-Agent'] = config.user_agent
                 self.session.headers.update(self.headers)
+            
+            # 공고 안정 ID 추출 규칙
+            if getattr(config, 'id_rules', None):
+                self.id_rules = config.id_rules
+            
+            # 최고 수위 종류 (id/number/date/off)
+            if getattr(config, 'watermark', None):
+                self.watermark_kind = config.watermark
     
     @abstractmethod
     def get_list_url(self, page_num: int) -> str:
@@ -93,44 +316,116 @@ class EnhancedBaseScraper(ABC):
         """상세 페이지 파싱"""
         pass
     
+    def measure_phase(self, phase: str, url: Optional[str] = None):
+        """단계 소요 시간 계측 - with 블록에서 yield된 dict에 'bytes'/'error' 기록 가능"""
+        host = urlparse(url).netloc if url else ''
+        return self.metrics.measure(phase, self.get_site_key(), host)
+    
+    def remaining_time(self) -> Optional[float]:
+        """마감까지 남은 시간 (초) - 예산이 없으면 None"""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.time()
+    
+    def check_budget(self):
+        """마감이 지났으면 BudgetExceeded - 요청, 다운로드, 대기 전에 확인"""
+        remaining = self.remaining_time()
+        if remaining is not None and remaining <= 0:
+            raise BudgetExceeded(f"{self.get_site_key()} 시간 예산 초과")
+    
+    def _budget_timeout(self, timeout: Any) -> Any:
+        """요청 timeout을 남은 시간으로 줄임"""
+        remaining = self.remaining_time()
+        if remaining is None:
+            return timeout
+        remaining = max(0.1, remaining)
+        if isinstance(timeout, (int, float)):
+            return min(timeout, remaining)
+        return remaining  # None(무제한)이나 (연결, 읽기) 튜플
+    
+    def guard_page(self, page):
+        """Playwright 페이지의 이동/대기가 시간 예산을 따르도록 감쌈 - 예산이 없으면 원래 페이지와 같게 동작"""
+        return GuardedPage(page, self)
+    
+    def save_partial_progress(self):
+        """예산 초과로 중단된 실행의 상태 저장
+        
+        처리한 공고는 체크포인트에 이미 남아 있어 다음 실행(--resume)에서 이어받는다.
+        처리된 제목과 최고 수위는 저장하지 않는다 - 최고 수위가 수집하지 못한 구간을 넘지 않도록.
+        """
+        self.save_strategy_stats()
+        self.save_endpoint_cache()
+    
+    def sleep(self, seconds: float, phase: str = 'request_delay'):
+        """요청/페이지 간 대기 - 대기 시간도 단계별로 계측"""
+        if not seconds or seconds <= 0:
+            return
+        self.check_budget()
+        remaining = self.remaining_time()
+        if remaining is not None:
+            seconds = min(seconds, max(remaining, 0))
+        with self.measure_phase(phase):
+            time.sleep(seconds)
+    
+    @staticmethod
+    def _response_size(response: requests.Response, stream: bool) -> int:
+        """응답 크기 - 스트리밍 응답은 본문을 읽지 않고 Content-Length 사용"""
+        if stream:
+            return int(response.headers.get('Content-Length') or 0)
+        return len(response.content)
+    
     def get_page(self, url: str, **kwargs) -> Optional[requests.Response]:
         """페이지 가져오기 - 향상된 버전"""
-        try:
-            # 기본 옵션들
-            options = {
-                'verify': self.verify_ssl,
-                'timeout': self.timeout,
-                **kwargs
-            }
-            
-            response = self.session.get(url, **options)
-            
-            # 인코딩 처리
-            self._fix_encoding(response)
-            
-            return response
-            
-        except Exception as e:
-            logger.error(f"페이지 가져오기 실패 {url}: {e}")
-            return None
+        self.check_budget()
+        with self.measure_phase(self._fetch_phase, url) as sample:
+            try:
+                # 기본 옵션들
+                options = {
+                    'verify': self.verify_ssl,
+                    'timeout': self.timeout,
+                    **kwargs
+                }
+                options['timeout'] = self._budget_timeout(options['timeout'])
+                
+                response = self.session.get(url, **options)
+                
+                # 인코딩 처리
+                self._fix_encoding(response)
+                
+                sample['bytes'] = self._response_size(response, kwargs.get('stream', False))
+                sample['error'] = response.status_code >= 400
+                return response
+                
+            except Exception as e:
+                logger.error(f"페이지 가져오기 실패 {url}: {e}")
+                sample['error'] = True
+                self.check_budget()  # 남은 시간으로 줄인 timeout 때문에 실패했으면 예산 초과
+                return None
     
     def post_page(self, url: str, data: Dict[str, Any] = None, **kwargs) -> Optional[requests.Response]:
         """POST 요청"""
-        try:
-            options = {
-                'verify': self.verify_ssl,
-                'timeout': self.timeout,
-                **kwargs
-            }
-            
-            response = self.session.post(url, data=data, **options)
-            self._fix_encoding(response)
-            
-            return response
-            
-        except Exception as e:
-            logger.error(f"POST 요청 실패 {url}: {e}")
-            return None
+        self.check_budget()
+        with self.measure_phase(self._fetch_phase, url) as sample:
+            try:
+                options = {
+                    'verify': self.verify_ssl,
+                    'timeout': self.timeout,
+                    **kwargs
+                }
+                options['timeout'] = self._budget_timeout(options['timeout'])
+                
+                response = self.session.post(url, data=data, **options)
+                self._fix_encoding(response)
+                
+                sample['bytes'] = self._response_size(response, kwargs.get('stream', False))
+                sample['error'] = response.status_code >= 400
+                return response
+                
+            except Exception as e:
+                logger.error(f"POST 요청 실패 {url}: {e}")
+                sample['error'] = True
+                self.check_budget()
+                return None
     
     def _fix_encoding(self, response: requests.Response):
         """응답 인코딩 자동 수정"""
@@ -148,8 +443,91 @@ class EnhancedBaseScraper(ABC):
             else:
                 response.encoding = self.default_encoding
     
+    def _build_list_strainer(self, container: Union[str, Dict[str, Any], None]) -> Optional[SoupStrainer]:
+        """게시판 컨테이너 지정값을 SoupStrainer로 변환 - 복합 선택자는 None"""
+        if not container:
+            return None
+        
+        if isinstance(container, dict):
+            return SoupStrainer(container.get('name'), attrs=container.get('attrs', {}))
+        
+        # 'tag', 'tag.class', 'tag#id', '.class', '#id' 형태만 지원
+        match = re.fullmatch(r'([a-zA-Z][\w-]*)?(?:([.#])([\w가-힣-]+))?', container.strip())
+        if not match or not (match.group(1) or match.group(2)):
+            return None
+        
+        name, marker, value = match.groups()
+        attrs = {}
+        if marker == '.':
+            attrs['class'] = value
+        elif marker == '#':
+            attrs['id'] = value
+        
+        return SoupStrainer(name, attrs=attrs)
+    
+    def find_main_content_block(self, soup: BeautifulSoup, tags: List[str] = None, min_length: int = 100,
+                                skip_keywords: List[str] = None, skip_classes: List[str] = None,
+                                max_link_density: float = 0.5) -> Optional[Tag]:
+        """본문 영역 추정 - 링크 텍스트를 제외한 텍스트가 가장 긴 블록 반환
+        
+        텍스트 길이는 후위 순회 한 번으로 계산하므로 중첩 깊이에 관계없이 선형 시간에 동작한다.
+        skip_keywords가 포함된 블록, skip_classes에 해당하는 class/id를 가진 블록,
+        링크 텍스트 비율이 max_link_density를 넘는 블록은 후보에서 제외한다.
+        """
+        if tags is None:
+            tags = ['div']
+        if skip_classes is None:
+            skip_classes = BOILERPLATE_CLASS_KEYWORDS
+        
+        stats = _collect_text_stats(soup, skip_keywords or [])
+        
+        best_block = None
+        best_score = 0
+        
+        for element in soup.find_all(tags):
+            text_len, link_len, has_keyword = stats[id(element)]
+            if text_len <= min_length or has_keyword:
+                continue
+            
+            if link_len / text_len > max_link_density:
+                continue
+            
+            if skip_classes:
+                marker = ' '.join(element.get('class') or []) + ' ' + (element.get('id') or '')
+                if any(skip in marker for skip in skip_classes):
+                    continue
+            
+            score = text_len - link_len
+            if score > best_score:
+                best_score = score
+                best_block = element
+        
+        return best_block
+    
+    def _parse_list_html(self, html_content: str, container: Union[str, Dict[str, Any], None] = None) -> BeautifulSoup:
+        """목록 페이지 파싱 - 게시판 컨테이너 영역만 트리로 구성
+        
+        메뉴/푸터/스크립트 등 나머지 영역은 트리로 만들지 않는다.
+        컨테이너를 찾지 못하면 전체 문서를 파싱한다.
+        """
+        if container is None:
+            container = self.list_container
+        if container is None and self.config and getattr(self.config, 'selectors', None):
+            container = self.config.selectors.get('container') or self.config.selectors.get('table')
+        
+        strainer = self._build_list_strainer(container)
+        if strainer is not None:
+            soup = BeautifulSoup(html_content, 'html.parser', parse_only=strainer)
+            if soup.find(True):
+                return soup
+            logger.debug(f"게시판 컨테이너({container})를 찾지 못해 전체 문서 파싱")
+        
+        return BeautifulSoup(html_content, 'html.parser')
+    
     def download_file(self, url: str, save_path: str, attachment_info: Dict[str, Any] = None) -> bool:
-        """파일 다운로드 - 향상된 버전"""
+        """파일 다운로드 - 향상된 버전 (저장하면서 SHA-256 계산)"""
+        temp_path = None
+        self.check_budget()
         try:
             logger.info(f"파일 다운로드 시작: {url}")
             
@@ -162,7 +540,7 @@ class EnhancedBaseScraper(ABC):
                 url, 
                 headers=download_headers, 
                 stream=True, 
-                timeout=self.timeout,
+                timeout=self._budget_timeout(self.timeout),
                 verify=self.verify_ssl
             )
             response.raise_for_status()
@@ -172,18 +550,38 @@ class EnhancedBaseScraper(ABC):
             if actual_filename != save_path:
                 save_path = actual_filename
             
-            # 파일 저장
-            with open(save_path, 'wb') as f:
+            # 파일 저장 - 저장하면서 SHA-256 계산
+            temp_path = save_path + '.part'
+            digest = hashlib.sha256()
+            with open(temp_path, 'wb') as f:
                 for chunk in response.iter_content(chunk_size=8192):
                     if chunk:
                         f.write(chunk)
+                        digest.update(chunk)
+                        self.check_budget()
+            
+            sha256 = digest.hexdigest()
+            if self.attachment_store:
+                self.attachment_store.ingest(temp_path, sha256, save_path)
+            else:
+                os.replace(temp_path, save_path)
             
             file_size = os.path.getsize(save_path)
+            self.last_download_path = save_path
+            self.last_download_sha256 = sha256
             logger.info(f"다운로드 완료: {save_path} ({file_size:,} bytes)")
             return True
             
+        except BudgetExceeded:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
         except Exception as e:
             logger.error(f"파일 다운로드 실패 {url}: {e}")
+            # 중단된 임시 파일 정리
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            self.check_budget()
             return False
     
     def _extract_filename(self, response: requests.Response, default_path: str) -> str:
@@ -280,34 +678,230 @@ class EnhancedBaseScraper(ABC):
         normalized = self.normalize_title(title)
         return hashlib.md5(normalized.encode('utf-8')).hexdigest()
     
+    def extract_stable_id(self, announcement: Dict[str, Any]) -> Optional[str]:
+        """공고의 사이트 내 안정 ID 추출 - 제목이 바뀌어도 유지되는 게시물 번호 등
+        
+        id_rules의 각 규칙은 {'field': 이름}, {'query_param': 이름}, {'regex': 패턴, 'source': 필드명(기본 url)}
+        중 하나이며 순서대로 시도한다. id_rules가 없으면 기본 필드/쿼리 파라미터를 시도한다.
+        """
+        rules = self.id_rules
+        if rules is None:
+            rules = [{'field': name} for name in DEFAULT_ID_FIELDS] + \
+                    [{'query_param': name} for name in DEFAULT_ID_QUERY_PARAMS]
+        
+        url = announcement.get('url') or ''
+        query = None
+        
+        for rule in rules:
+            value = None
+            if 'field' in rule:
+                value = announcement.get(rule['field'])
+            elif 'query_param' in rule:
+                if query is None:
+                    query = parse_qs(urlparse(url).query)
+                values = query.get(rule['query_param'])
+                value = values[0] if values else None
+            elif 'regex' in rule:
+                match = re.search(rule['regex'], str(announcement.get(rule.get('source', 'url')) or ''))
+                value = (match.group(1) if match.groups() else match.group(0)) if match else None
+            
+            if value is not None and str(value).strip():
+                return str(value).strip()
+        
+        return None
+    
+    def get_announcement_key(self, announcement: Dict[str, Any]) -> str:
+        """중복 체크 키 - 안정 ID가 있으면 'id:<ID>', 없으면 제목 해시"""
+        stable_id = self.extract_stable_id(announcement)
+        if stable_id:
+            return f"id:{stable_id}"
+        return self.get_title_hash(announcement.get('title', ''))
+    
+    def _is_key_processed(self, key: str, title: str) -> bool:
+        """이전 실행에서 처리된 키인지 확인 (안정 ID 도입 전 제목 해시 기록도 확인)
+        
+        제목 해시 기록과 맞은 행은 그 키로 기록을 옮기고 해시는 지운다 - 같은 제목의 다음 공고는 새 공고로 본다.
+        """
+        if key in self.processed_titles:
+            return True
+        if not self.legacy_title_hashes:
+            return False
+        title_hash = self.get_title_hash(title)
+        if title_hash not in self.legacy_title_hashes:
+            return False
+        self.legacy_title_hashes.discard(title_hash)
+        self.processed_titles.add(key)
+        return True
+    
+    def is_pinned_announcement(self, announcement: Dict[str, Any]) -> bool:
+        """상단 고정 공지 행인지 확인 - 공지 플래그가 있거나 번호 칸이 숫자가 아닌 행"""
+        if any(announcement.get(flag) for flag in ('is_notice', 'notice', 'pinned', 'is_pinned')):
+            return True
+        for field in ('number', 'num'):
+            if field in announcement:
+                return not str(announcement[field]).strip().isdigit()
+        return False
+    
+    def get_watermark_value(self, announcement: Dict[str, Any], kind: str) -> Optional[Any]:
+        """공고의 수위 값 - id/number는 정수, date는 'YYYY-MM-DD'"""
+        if kind == 'id':
+            stable_id = self.extract_stable_id(announcement)
+            return int(stable_id) if stable_id and stable_id.isdigit() else None
+        if kind == 'number':
+            for field in ('number', 'num'):
+                value = str(announcement.get(field, '')).strip()
+                if value.isdigit():
+                    return int(value)
+            return None
+        if kind == 'date':
+            return normalize_date(announcement.get('date'))
+        return None
+    
+    def _detect_watermark_kind(self, announcements: List[Dict[str, Any]]) -> Optional[str]:
+        """첫 목록 페이지에서 수위 종류 감지 - 고정 공지를 뺀 모든 행에서 값을 얻을 수 있고 최신순인 첫 번째 종류
+        
+        공지 플래그 없이 상단에 고정된 행이 있을 수 있으므로 앞쪽 몇 행은 순서가 어긋나도 되고,
+        그 뒤 절반 이상(최소 3행)이 내림차순이면 된다.
+        """
+        rows = [ann for ann in announcements if not self.is_pinned_announcement(ann)]
+        for kind in ('id', 'date'):
+            values = [self.get_watermark_value(ann, kind) for ann in rows]
+            if not values or None in values:
+                continue
+            start = len(values) - 1
+            while start > 0 and values[start - 1] >= values[start]:
+                start -= 1
+            ordered = len(values) - start
+            if ordered >= max(3, (len(values) + 1) // 2) or ordered == len(values):
+                return kind
+        return None
+    
+    def _is_below_watermark(self, value: Any) -> bool:
+        """이미 수집한 구간인지 - 날짜는 같은 날 게시물이 더 있을 수 있어 이전 날짜만 해당"""
+        mark = self.high_water['value']
+        if self.high_water['kind'] == 'date':
+            return value < mark
+        return value <= mark
+    
+    def load_high_water(self, output_base: str = 'output'):
+        """최고 수위 로드"""
+        self.high_water_file = os.path.join(output_base, f'high_water_{self.get_site_key()}.json')
+        self.high_water = None
+        self._watermark_pending = {}
+        self._watermark_processed = []
+        self._watermark_detect_pending = True
+        self._below_mark_streak = 0
+        
+        if self.watermark_kind == 'off':
+            return
+        try:
+            if os.path.exists(self.high_water_file):
+                with open(self.high_water_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                # 자동 감지로 저장된 예전 'number' 수위는 설정한 사이트에서만 사용
+                kind_ok = data.get('kind') == self.watermark_kind if self.watermark_kind else data.get('kind') != 'number'
+                if data.get('value') is not None and kind_ok:
+                    self.high_water = {'kind': data['kind'], 'value': data['value']}
+                    logger.info(f"최고 수위 로드: {data['kind']} {data['value']}")
+        except Exception as e:
+            logger.error(f"최고 수위 로드 실패: {e}")
+    
+    def save_high_water(self):
+        """최고 수위 저장 - 처리하지 못한 공고가 있으면 그보다 낮은 값까지만 올림"""
+        if not self.high_water_file or not self._watermark_processed or self.watermark_kind == 'off':
+            return
+        
+        kind = self.high_water['kind'] if self.high_water else self.watermark_kind
+        if not kind:
+            return
+        
+        candidates = self._watermark_processed
+        # 처리 못 한 고정 공지는 오래된 글이므로 수위를 붙잡지 않음
+        unprocessed = [value for value, pinned in self._watermark_pending.values() if value is not None and not pinned]
+        if unprocessed:
+            # 처리 못 한 공고가 다음 실행에서 다시 보이도록 수위를 그 아래로 유지
+            limit = min(unprocessed)
+            candidates = [value for value in candidates if (value <= limit if kind == 'date' else value < limit)]
+        if not candidates:
+            return
+        
+        value = max(candidates)
+        if self.high_water and self.high_water['kind'] == kind:
+            value = max(value, self.high_water['value'])
+        
+        try:
+            os.makedirs(os.path.dirname(self.high_water_file), exist_ok=True)
+            with open(self.high_water_file, 'w', encoding='utf-8') as f:
+                json.dump({'kind': kind, 'value': value, 'last_updated': datetime.now().isoformat()},
+                          f, ensure_ascii=False, indent=2)
+            self.high_water = {'kind': kind, 'value': value}
+            logger.info(f"최고 수위 저장: {kind} {value}")
+        except Exception as e:
+            logger.error(f"최고 수위 저장 실패: {e}")
+    
+    def get_site_key(self) -> str:
+        """사이트 식별자 - 사이트별 상태 파일명에 사용"""
+        return self.__class__.__name__.replace('Scraper', '').lower()
+    
     def load_processed_titles(self, output_base: str = 'output'):
-        """처리된 제목 목록 로드"""
+        """처리된 제목 목록 로드 - 중단된 실행이 처리한 공고도 처리된 것으로 합침"""
+        self.open_checkpoint(output_base)
         if not self.enable_duplicate_check:
             return
         
+        self.load_high_water(output_base)
+        
         # 사이트별 파일명 생성
-        site_name = self.__class__.__name__.replace('Scraper', '').lower()
+        site_name = self.get_site_key()
         self.processed_titles_file = os.path.join(output_base, f'processed_titles_{site_name}.json')
         
         try:
             if os.path.exists(self.processed_titles_file):
                 with open(self.processed_titles_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    # 제목 해시만 로드
-                    self.processed_titles = set(data.get('title_hashes', []))
+                    if 'keys' in data:
+                        self.processed_titles = set(data['keys'])
+                        self.legacy_title_hashes = set(data.get('legacy_title_hashes', []))
+                    else:
+                        # 안정 ID 도입 전 파일 - 제목 해시는 이전 기록으로 유지하여 전체 재수집 방지
+                        self.processed_titles = set(data.get('title_hashes', []))
+                        self.legacy_title_hashes = set(self.processed_titles)
                     logger.info(f"기존 처리된 공고 {len(self.processed_titles)}개 로드")
             else:
                 self.processed_titles = set()
+                self.legacy_title_hashes = set()
                 logger.info("새로운 처리된 제목 파일 생성")
         except Exception as e:
             logger.error(f"처리된 제목 로드 실패: {e}")
             self.processed_titles = set()
+            self.legacy_title_hashes = set()
+        
+        interrupted = self.checkpoint.interrupted_keys
+        self._resumed_keys = set()
+        if interrupted and self.resume:
+            # 재개 - 같은 실행의 앞부분이므로 이번 세션 처리분으로 취급
+            self._resumed_keys = set(interrupted)
+            self.current_session_titles.update(interrupted)
+        elif interrupted:
+            self.processed_titles.update(interrupted)
+        if interrupted:
+            logger.info(f"중단된 실행에서 처리된 공고 {len(interrupted)}개 합침")
+    
+    def open_checkpoint(self, output_base: str = 'output'):
+        """실행 체크포인트 열기 - resume이면 중단된 실행의 진행 상황을 이어받음"""
+        self.checkpoint = RunCheckpoint(output_base, self.get_site_key())
+        if self.resume:
+            self.checkpoint.resume()
     
     def save_processed_titles(self):
-        """현재 세션에서 처리된 제목들을 이전 실행 기록에 합쳐서 저장"""
+        """현재 세션에서 처리된 제목들을 이전 실행 기록에 합쳐서 저장 - 저장되면 체크포인트 종료"""
         if not self.enable_duplicate_check or not self.processed_titles_file:
+            if self.checkpoint is not None:
+                self.checkpoint.finish()
             return
         
+        self.save_high_water()
+        
         try:
             os.makedirs(os.path.dirname(self.processed_titles_file), exist_ok=True)
             
@@ -315,7 +909,8 @@ class EnhancedBaseScraper(ABC):
             all_processed_titles = self.processed_titles | self.current_session_titles
             
             data = {
-                'title_hashes': list(all_processed_titles),
+                'keys': list(all_processed_titles),
+                'legacy_title_hashes': list(self.legacy_title_hashes),
                 'last_updated': datetime.now().isoformat(),
                 'total_count': len(all_processed_titles)
             }
@@ -324,24 +919,230 @@ class EnhancedBaseScraper(ABC):
                 json.dump(data, f, ensure_ascii=False, indent=2)
                 
             logger.info(f"처리된 제목 {len(all_processed_titles)}개 저장 완료 (이전: {len(self.processed_titles)}, 현재 세션: {len(self.current_session_titles)})")
+            if self.checkpoint is not None:
+                self.checkpoint.finish()
         except Exception as e:
             logger.error(f"처리된 제목 저장 실패: {e}")
     
-    def is_title_processed(self, title: str) -> bool:
-        """제목이 이미 처리되었는지 확인"""
+    def load_strategy_stats(self, output_base: str = 'output'):
+        """파싱 전략 통계 로드"""
+        self.strategy_stats_file = os.path.join(output_base, f'strategy_stats_{self.get_site_key()}.json')
+        
+        try:
+            if os.path.exists(self.strategy_stats_file):
+                with open(self.strategy_stats_file, 'r', encoding='utf-8') as f:
+                    self.strategy_stats = json.load(f).get('groups', {})
+                logger.info(f"파싱 전략 통계 로드: {len(self.strategy_stats)}개 그룹")
+        except Exception as e:
+            logger.error(f"파싱 전략 통계 로드 실패: {e}")
+            self.strategy_stats = {}
+    
+    def save_strategy_stats(self):
+        """파싱 전략 통계 저장 - 구조 변경(선호 전략 실패 증가) 추적용"""
+        if not self.strategy_stats_file or not self.strategy_stats:
+            return
+        
+        try:
+            os.makedirs(os.path.dirname(self.strategy_stats_file), exist_ok=True)
+            
+            data = {
+                'groups': self.strategy_stats,
+                'last_updated': datetime.now().isoformat()
+            }
+            
+            with open(self.strategy_stats_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.error(f"파싱 전략 통계 저장 실패: {e}")
+    
+    def run_strategies(self, group: str, strategies: List[Tuple[str, Callable[[], Any]]]) -> Any:
+        """여러 파싱 전략 중 결과를 낸 첫 전략의 결과 반환
+        
+        이전에 성공한 전략(preferred)을 먼저 시도하고, 실패했을 때만 나머지를 선언 순서대로 시도한다.
+        전략별 성공/실패 횟수를 기록하며, 모든 전략이 실패하면 빈 리스트를 반환한다.
+        """
+        group_stats = self.strategy_stats.setdefault(group, {'preferred': None, 'strategies': {}})
+        preferred = group_stats.get('preferred')
+        
+        ordered = sorted(strategies, key=lambda strategy: strategy[0] != preferred)
+        
+        for name, strategy in ordered:
+            stats = group_stats['strategies'].setdefault(name, {'hits': 0, 'misses': 0, 'last_hit': None})
+            
+            try:
+                result = strategy()
+            except Exception as e:
+                logger.error(f"[{group}] 전략 {name} 실행 중 오류: {e}")
+                result = None
+            
+            if result:
+                stats['hits'] += 1
+                stats['last_hit'] = datetime.now().isoformat()
+                if name != preferred:
+                    if preferred:
+                        logger.info(f"[{group}] 선호 전략 변경: {preferred} -> {name}")
+                    group_stats['preferred'] = name
+                return result
+            
+            stats['misses'] += 1
+            if name == preferred:
+                logger.debug(f"[{group}] 선호 전략 {name} 실패 - 다른 전략 시도")
+        
+        return []
+    
+    def run_all_strategies(self, group: str, strategies: List[Tuple[str, Callable[[], List[Any]]]]) -> List[Any]:
+        """모든 파싱 전략의 결과를 합쳐 반환 (여러 영역에 나뉜 첨부파일 등)
+        
+        최근 strategy_skip_after번 연속으로 결과가 없던 전략은 건너뛰되, 건너뛴 strategy_reprobe_interval번마다
+        한 번 다시 시도해 사이트 구조가 바뀌어 다시 결과를 내는 경우를 놓치지 않는다.
+        """
+        group_stats = self.strategy_stats.setdefault(group, {'preferred': None, 'strategies': {}})
+        results = []
+        
+        for name, strategy in strategies:
+            stats = group_stats['strategies'].setdefault(name, {'hits': 0, 'misses': 0, 'last_hit': None})
+            
+            if stats.get('miss_streak', 0) >= self.strategy_skip_after:
+                stats['skipped'] = stats.get('skipped', 0) + 1
+                if stats['skipped'] < self.strategy_reprobe_interval:
+                    continue
+                logger.debug(f"[{group}] 결과 없던 전략 {name} 재확인")
+                stats['skipped'] = 0
+            
+            try:
+                found = strategy()
+            except Exception as e:
+                logger.error(f"[{group}] 전략 {name} 실행 중 오류: {e}")
+                found = None
+            
+            if found:
+                stats['hits'] += 1
+                stats['last_hit'] = datetime.now().isoformat()
+                stats['miss_streak'] = 0
+                logger.debug(f"[{group}] {name}에서 {len(found)}개 발견")
+                results.extend(found)
+            else:
+                stats['misses'] += 1
+                stats['miss_streak'] = stats.get('miss_streak', 0) + 1
+                if stats['miss_streak'] == self.strategy_skip_after:
+                    logger.info(f"[{group}] 전략 {name}: {self.strategy_skip_after}번 연속 결과 없음 - 이후 건너뜀")
+        
+        return results
+    
+    def load_endpoint_cache(self, output_base: str = 'output'):
+        """엔드포인트 탐색 캐시 로드"""
+        self.endpoint_cache_file = os.path.join(output_base, f'endpoint_cache_{self.get_site_key()}.json')
+        
+        try:
+            if os.path.exists(self.endpoint_cache_file):
+                with open(self.endpoint_cache_file, 'r', encoding='utf-8') as f:
+                    self.endpoint_cache = json.load(f).get('groups', {})
+                logger.info(f"엔드포인트 캐시 로드: {len(self.endpoint_cache)}개 그룹")
+        except Exception as e:
+            logger.error(f"엔드포인트 캐시 로드 실패: {e}")
+            self.endpoint_cache = {}
+    
+    def save_endpoint_cache(self):
+        """엔드포인트 탐색 캐시 저장"""
+        if not self.endpoint_cache_file or not self.endpoint_cache:
+            return
+        
+        try:
+            os.makedirs(os.path.dirname(self.endpoint_cache_file), exist_ok=True)
+            
+            data = {
+                'groups': self.endpoint_cache,
+                'last_updated': datetime.now().isoformat()
+            }
+            
+            with open(self.endpoint_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.error(f"엔드포인트 캐시 저장 실패: {e}")
+    
+    def get_endpoint_candidates(self, group: str, templates: List[str]) -> List[str]:
+        """탐색할 엔드포인트 템플릿 순서 결정
+        
+        동작이 확인된 템플릿을 맨 앞에 두고, 최근 404 등으로 실패한 템플릿은 제외한다.
+        나머지 템플릿은 확인된 템플릿이 실패했을 때만 시도된다.
+        """
+        cache = self.endpoint_cache.get(group, {})
+        known = cache.get('known')
+        failed = cache.get('failed', {})
+        now = time.time()
+        
+        # 기간이 지난 실패 기록은 정리하여 다시 시도
+        for template, failed_at in list(failed.items()):
+            if now - failed_at >= self.endpoint_negative_ttl:
+                del failed[template]
+        
+        candidates = [known] if known in templates else []
+        for template in templates:
+            if template == known or template in failed:
+                continue
+            candidates.append(template)
+        
+        return candidates
+    
+    def is_known_endpoint(self, group: str, template: str) -> bool:
+        """동작이 확인된 엔드포인트 템플릿인지 확인"""
+        return self.endpoint_cache.get(group, {}).get('known') == template
+    
+    def record_endpoint_success(self, group: str, template: str):
+        """엔드포인트 탐색 성공 기록"""
+        cache = self.endpoint_cache.setdefault(group, {'known': None, 'failed': {}})
+        if cache.get('known') != template:
+            logger.info(f"[{group}] 엔드포인트 확인: {template}")
+        cache['known'] = template
+        succeeded = cache.setdefault('succeeded', [])
+        if template not in succeeded:
+            succeeded.append(template)
+        cache.setdefault('failed', {}).pop(template, None)
+    
+    def record_endpoint_failure(self, group: str, template: str, status_code: Optional[int] = None,
+                                per_resource: bool = False):
+        """엔드포인트 탐색 실패 기록 - 한 번도 동작하지 않은 템플릿의 404/405/410만 일정 시간 재시도하지 않음
+        
+        per_resource: 파일 하나의 존재 확인처럼 자원마다 결과가 다른 탐색 - 없는 파일 하나가
+        템플릿 자체의 실패를 뜻하지 않으므로 확인된 템플릿을 유지하고 실패로도 기록하지 않는다.
+        """
+        if per_resource:
+            return
+        cache = self.endpoint_cache.setdefault(group, {'known': None, 'failed': {}})
+        if cache.get('known') == template:
+            logger.info(f"[{group}] 확인된 엔드포인트 실패 ({status_code}) - 재탐색: {template}")
+            cache['known'] = None
+        if status_code in (404, 405, 410) and template not in cache.get('succeeded', []):
+            cache.setdefault('failed', {})[template] = time.time()
+    
+    def is_title_processed(self, title: str, announcement: Optional[Dict[str, Any]] = None) -> bool:
+        """공고가 이미 처리되었는지 확인 - announcement를 넘기면 안정 ID 기준"""
         if not self.enable_duplicate_check:
             return False
         
-        title_hash = self.get_title_hash(title)
-        return title_hash in self.processed_titles
+        key = self.get_announcement_key(announcement) if announcement else self.get_title_hash(title)
+        return self._is_key_processed(key, title)
     
-    def add_processed_title(self, title: str):
-        """현재 세션에서 처리된 제목 추가 (이전 실행 기록과는 별도 관리)"""
+    def add_processed_title(self, title: str, announcement: Optional[Dict[str, Any]] = None):
+        """현재 세션에서 처리된 공고 추가 (이전 실행 기록과는 별도 관리)
+        
+        announcement 없이 제목만 넘기면 filter_new_announcements에서 계산해 둔 키를 사용한다.
+        """
         if not self.enable_duplicate_check:
             return
         
-        title_hash = self.get_title_hash(title)
-        self.current_session_titles.add(title_hash)
+        pending = self._pending_keys.get(title)
+        key = pending.pop(0) if pending else None
+        if announcement:
+            key = self.get_announcement_key(announcement)
+        key = key or self.get_title_hash(title)
+        self.current_session_titles.add(key)
+        if self.checkpoint is not None:
+            self.checkpoint.key_completed(key)
+        
+        value, _ = self._watermark_pending.pop(key, (None, False))
+        if value is not None:
+            self._watermark_processed.append(value)
     
     def filter_new_announcements(self, announcements: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], bool]:
         """새로운 공고만 필터링 - 이전 실행 기록과만 중복 체크, 현재 세션 내에서는 중복 허용"""
@@ -350,31 +1151,235 @@ class EnhancedBaseScraper(ABC):
         
         new_announcements = []
         previous_session_duplicate_count = 0  # 이전 실행 중복만 카운트
+        reached_high_water = False
+        
+        # 수위 종류 감지는 실행의 첫 목록 페이지에서만 - 뒤 페이지에서 감지하면 앞 페이지 공고가 수위에서 빠짐
+        if self._watermark_detect_pending:
+            self._watermark_detect_pending = False
+            first_page = self.checkpoint is None or self.checkpoint.start_page == 1
+            if self.watermark_kind is None and not self.high_water and first_page:
+                self.watermark_kind = self._detect_watermark_kind(announcements)
+        kind = self.high_water['kind'] if self.high_water else self.watermark_kind
         
         for ann in announcements:
             title = ann.get('title', '')
-            title_hash = self.get_title_hash(title)
+            key = self.get_announcement_key(ann)
+            value = self.get_watermark_value(ann, kind) if kind and kind != 'off' else None
+            pinned = self.is_pinned_announcement(ann)
+            
+            # 최고 수위 이하 - 고정 공지는 건너뛰고, 일반 행이 두 개 연속이면 그 아래는 모두 수집한 구간이므로 중단
+            # (공지 플래그 없이 상단에 고정된 오래된 글 하나로 멈추지 않도록)
+            if self.high_water and value is not None and not pinned:
+                if self._is_below_watermark(value):
+                    self._below_mark_streak += 1
+                    if self._below_mark_streak >= 2:
+                        logger.info(f"최고 수위({kind} {self.high_water['value']}) 도달 - 조기 종료 신호: {title[:50]}...")
+                        reached_high_water = True
+                        break
+                else:
+                    self._below_mark_streak = 0
+            elif self.high_water and value is not None and self._is_below_watermark(value):
+                logger.debug(f"최고 수위 이하 고정 공지 스킵: {title[:50]}...")
+                continue
+            
+            # 재개한 실행에서 중단 전에 처리한 공고
+            if key in self._resumed_keys:
+                logger.debug(f"중단 전에 처리한 공고 스킵: {title[:50]}...")
+                continue
             
             # 이전 실행에서 처리된 공고인지만 확인 (현재 세션은 제외)
-            if title_hash in self.processed_titles:
+            if self._is_key_processed(key, title):
                 previous_session_duplicate_count += 1
                 logger.debug(f"이전 실행에서 처리된 공고 스킵: {title[:50]}...")
                 
-                # 연속된 이전 실행 중복 임계값 도달시 조기 종료 신호
-                if previous_session_duplicate_count >= self.duplicate_threshold:
+                # 연속된 이전 실행 중복 임계값 도달시 조기 종료 신호 (최고 수위가 있으면 수위로만 판단)
+                if not self.high_water and previous_session_duplicate_count >= self.duplicate_threshold:
                     logger.info(f"이전 실행 중복 공고 {previous_session_duplicate_count}개 연속 발견 - 조기 종료 신호")
                     break
             else:
                 # 이전 실행에 없는 새로운 공고는 무조건 포함 (현재 세션 내 중복 완전 무시)
                 new_announcements.append(ann)
+                self._pending_keys.setdefault(title, []).append(key)
+                if value is not None:
+                    self._watermark_pending[key] = (value, pinned)
                 previous_session_duplicate_count = 0  # 새로운 공고 발견시 중복 카운트 리셋
                 logger.debug(f"새로운 공고 추가: {title[:50]}...")
         
-        should_stop = previous_session_duplicate_count >= self.duplicate_threshold
+        should_stop = reached_high_water or (
+            not self.high_water and previous_session_duplicate_count >= self.duplicate_threshold
+        )
         logger.info(f"전체 {len(announcements)}개 중 새로운 공고 {len(new_announcements)}개, 이전 실행 중복 {previous_session_duplicate_count}개 발견")
         
         return new_announcements, should_stop
     
+    def get_manifest(self, output_base: str = 'output') -> RunManifest:
+        """실행 매니페스트 반환 - 출력 디렉토리별로 하나씩 생성"""
+        if self.manifest is None or self.manifest.manifest_dir != os.path.join(output_base, 'manifests'):
+            if self.manifest is not None:
+                self.manifest.close()
+            self.manifest = RunManifest(output_base, self.get_site_key())
+        return self.manifest
+    
+    def get_record_sink(self, output_base: str = 'output') -> Optional[AnnouncementSink]:
+        """공고 레코드 싱크 반환 - 출력 디렉토리별로 하나씩 생성"""
+        if not self.enable_record_sink:
+            return None
+        if self.record_sink is None or self.record_sink.records_dir != os.path.join(output_base, 'records'):
+            if self.record_sink is not None:
+                self.record_sink.close()
+            self.record_sink = AnnouncementSink(output_base, self.get_site_key())
+        return self.record_sink
+    
+    def close_run_outputs(self):
+        """매니페스트와 레코드 싱크 종료 - 이 사이트의 계측 결과도 <output_base>/metrics/ 에 저장"""
+        if self.manifest is not None:
+            self.manifest.close()
+            output_base = os.path.dirname(self.manifest.manifest_dir)
+            self.metrics.write(os.path.join(output_base, 'metrics'), self.manifest.run_id, site=self.get_site_key())
+        if self.record_sink is not None:
+            self.record_sink.close()
+    
+    @staticmethod
+    def _parse_meta_info(markdown: str) -> Dict[str, Any]:
+        """_create_meta_info 형식의 content.md에서 메타 정보와 본문 분리"""
+        labels = {
+            '작성자': 'writer',
+            '작성일': 'date',
+            '접수기간': 'period',
+            '상태': 'status',
+            '기관': 'organization',
+            '조회수': 'views',
+            '원본 URL': 'url'
+        }
+        
+        meta = {}
+        head, sep, body = markdown.partition('\n---\n')
+        if not sep:
+            return {'content': markdown}
+        
+        for line in head.splitlines():
+            if line.startswith('# ') and 'title' not in meta:
+                meta['title'] = line[2:].strip()
+                continue
+            match = re.match(r'^\*\*(.+?)\*\*:\s*(.*)$', line)
+            if match and match.group(1) in labels:
+                meta[labels[match.group(1)]] = match.group(2).strip()
+        
+        meta['content'] = body.lstrip('\n')
+        return meta
+    
+    def _write_announcement_record(self, folder_path: str, current: Dict[str, Any]):
+        """공고 하나를 구조화 레코드로 싱크와 검색 색인에 기록"""
+        sink = self.get_record_sink(os.path.dirname(folder_path))
+        folder_name = os.path.basename(folder_path)
+        files = self._folder_files.pop(folder_name, [])
+        if sink is None and self.search_index is None:
+            return
+        
+        announcement = Announcement.coerce(current.get('announcement'))
+        content = current.get('content')
+        
+        # process_announcement를 재정의한 사이트는 방금 저장한 content.md에서 복원
+        meta = {}
+        if content is None:
+            content_path = os.path.join(folder_path, 'content.md')
+            if os.path.exists(content_path):
+                with open(content_path, 'r', encoding='utf-8') as f:
+                    meta = self._parse_meta_info(f.read())
+            content = meta.get('content', '')
+        
+        def field(name):
+            return getattr(announcement, name) or meta.get(name)
+        
+        record = {
+            'site': self.get_site_key(),
+            'announcement_id': current.get('announcement_id') or announcement.announcement_id,
+            'title': current.get('title') or meta.get('title') or folder_name.split('_', 1)[-1],
+            'url': current.get('url') or meta.get('url', ''),
+            'date': field('date'),
+            'period': field('period'),
+            'status': field('status'),
+            'writer': field('writer'),
+            'content': content,
+            'attachments': files,
+            'folder': folder_name,
+            'collected_at': datetime.now().isoformat()
+        }
+        if current.get('near_duplicate_of'):
+            record['near_duplicate_of'] = current['near_duplicate_of']
+        
+        if sink is not None:
+            sink.write(record)
+        if self.search_index is not None:
+            self.search_index.add(record, folder_path)
+    
+    def _record_announcement_folder(self, folder_path: str, status: str = 'success', duration: float = 0.0, **extra):
+        """공고 폴더 저장 결과를 매니페스트에 기록"""
+        self._recorded_folders.add(os.path.abspath(folder_path))
+        try:
+            manifest = self.get_manifest(os.path.dirname(folder_path))
+            folder_name = os.path.basename(folder_path)
+            
+            # process_announcement에서 넘긴 공고 정보가 있으면 사용, 없으면 폴더명으로 대신
+            current = self._current_announcement or {}
+            if current.get('folder') != folder_name:
+                current = {}
+            
+            content_path = os.path.join(folder_path, 'content.md')
+            content_bytes = os.path.getsize(content_path) if os.path.exists(content_path) else 0
+            
+            manifest.record_announcement(
+                folder=folder_name,
+                title=current.get('title') or folder_name.split('_', 1)[-1],
+                url=current.get('url', ''),
+                status=status,
+                announcement_id=current.get('announcement_id'),
+                content_bytes=content_bytes,
+                duration=time.time() - current['started'] if current.get('started') else duration,
+                **extra
+            )
+        except Exception as e:
+            logger.error(f"매니페스트 기록 실패: {e}")
+        
+        if extra.get('near_duplicate_of'):
+            current = dict(current, near_duplicate_of=extra['near_duplicate_of'])
+        
+        if status != 'success':
+            self._folder_files.pop(os.path.basename(folder_path), None)
+            return
+        
+        try:
+            self._write_announcement_record(folder_path, current)
+        except Exception as e:
+            logger.error(f"공고 레코드 기록 실패: {e}")
+    
+    def _record_file(self, folder_path: str, file_path: str, url: str, success: bool, duration: float,
+                     sha256: Optional[str] = None):
+        """첨부파일 다운로드 결과를 매니페스트에 기록"""
+        try:
+            manifest = self.get_manifest(os.path.dirname(folder_path))
+            size = os.path.getsize(file_path) if success and os.path.exists(file_path) else 0
+            manifest.record_file(
+                folder=os.path.basename(folder_path),
+                filename=os.path.basename(file_path),
+                url=url,
+                size=size,
+                status='success' if success else 'failed',
+                duration=duration,
+                sha256=sha256
+            )
+            
+            # 공고 레코드의 첨부파일 목록으로 사용
+            self._folder_files.setdefault(os.path.basename(folder_path), []).append({
+                'filename': os.path.basename(file_path),
+                'url': url,
+                'size': size,
+                'sha256': sha256,
+                'status': 'success' if success else 'failed'
+            })
+        except Exception as e:
+            logger.error(f"매니페스트 기록 실패: {e}")
+    
     def process_announcement(self, announcement: Dict[str, Any], index: int, output_base: str = 'output'):
         """개별 공고 처리 - 향상된 버전"""
         logger.info(f"공고 처리 중 {index}: {announcement['title']}")
@@ -392,31 +1397,48 @@ class EnhancedBaseScraper(ABC):
         folder_path = os.path.join(output_base, folder_name)
         os.makedirs(folder_path, exist_ok=True)
         
+        self._current_announcement = {
+            'folder': folder_name,
+            'title': announcement['title'],
+            'url': announcement['url'],
+            'announcement_id': announcement.get('announcement_id'),
+            'started': time.time()
+        }
+        
         # 상세 페이지 가져오기
         response = self.get_page(announcement['url'])
         if not response:
             logger.error(f"상세 페이지 가져오기 실패: {announcement['title']}")
+            self._record_announcement_folder(folder_path, status='detail_fetch_failed')
             return
         
         # 상세 내용 파싱
         try:
-            # URL을 함께 전달 (URL이 필요한 특수 사이트들을 위해)
-            if hasattr(self, 'parse_detail_page') and 'url' in self.parse_detail_page.__code__.co_varnames:
-                detail = self.parse_detail_page(response.text, announcement['url'])
-            else:
-                detail = self.parse_detail_page(response.text)
+            with self.measure_phase('detail_parse'):
+                # URL을 함께 전달 (URL이 필요한 특수 사이트들을 위해)
+                if hasattr(self, 'parse_detail_page') and 'url' in self.parse_detail_page.__code__.co_varnames:
+                    detail = self.parse_detail_page(response.text, announcement['url'])
+                else:
+                    detail = self.parse_detail_page(response.text)
             logger.info(f"상세 페이지 파싱 완료 - 내용길이: {len(detail['content'])}, 첨부파일: {len(detail['attachments'])}")
         except Exception as e:
             logger.error(f"상세 페이지 파싱 실패: {e}")
+            self._record_announcement_folder(folder_path, status='parse_failed')
             return
         
+        self._current_announcement['announcement'] = announcement
+        self._current_announcement['content'] = detail['content']
+        
         # 메타 정보 생성
         meta_info = self._create_meta_info(announcement)
         
         # 본문 저장
         content_path = os.path.join(folder_path, 'content.md')
-        with open(content_path, 'w', encoding='utf-8') as f:
-            f.write(meta_info + detail['content'])
+        with self.measure_phase('content_write') as sample:
+            markdown = meta_info + detail['content']
+            with open(content_path, 'w', encoding='utf-8') as f:
+                f.write(markdown)
+            sample['bytes'] = len(markdown.encode('utf-8'))
         
         logger.info(f"내용 저장 완료: {content_path}")
         
@@ -424,15 +1446,15 @@ class EnhancedBaseScraper(ABC):
         self._download_attachments(detail['attachments'], folder_path)
         
         # 처리된 제목으로 추가
-        self.add_processed_title(announcement['title'])
+        self.add_processed_title(announcement['title'], announcement)
         
         # 요청 간 대기
-        if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+        self.sleep(self.delay_between_requests)
     
-    def _create_meta_info(self, announcement: Dict[str, Any]) -> str:
-        """메타 정보 생성"""
-        meta_lines = [f"# {announcement['title']}", ""]
+    def _create_meta_info(self, announcement: Union[Announcement, Dict[str, Any]]) -> str:
+        """메타 정보 생성 - 기존 dict는 Announcement로 변환 ('author' 등 별칭 키 포함)"""
+        announcement = Announcement.coerce(announcement)
+        meta_lines = [f"# {announcement.title}", ""]
         
         # 동적으로 메타 정보 추가
         meta_fields = {
@@ -445,11 +1467,12 @@ class EnhancedBaseScraper(ABC):
         }
         
         for field, label in meta_fields.items():
-            if field in announcement and announcement[field]:
-                meta_lines.append(f"**{label}**: {announcement[field]}")
+            value = getattr(announcement, field)
+            if value:
+                meta_lines.append(f"**{label}**: {value}")
         
         meta_lines.extend([
-            f"**원본 URL**: {announcement['url']}",
+            f"**원본 URL**: {announcement.url}",
             "",
             "---",
             ""
@@ -457,20 +1480,78 @@ class EnhancedBaseScraper(ABC):
         
         return "\n".join(meta_lines)
     
-    def _download_attachments(self, attachments: List[Dict[str, Any]], folder_path: str):
-        """첨부파일 다운로드"""
+    def _check_near_duplicate(self, folder_path: str) -> Optional[Dict[str, Any]]:
+        """다른 사이트에 먼저 저장된 같은 공고 찾기 - 찾으면 원본 정보, 이 공고는 색인에 등록
+        
+        process_announcement를 재정의한 사이트는 방금 저장한 content.md의 제목/본문으로 비교한다.
+        """
+        if self.near_duplicate_index is None:
+            return None
+        
+        folder_name = os.path.basename(folder_path)
+        current = self._current_announcement or {}
+        if current.get('folder') != folder_name:
+            current = {}
+        
+        try:
+            title, content = current.get('title'), current.get('content')
+            meta = {}
+            if content is None:
+                content_path = os.path.join(folder_path, 'content.md')
+                if os.path.exists(content_path):
+                    with open(content_path, 'r', encoding='utf-8') as f:
+                        meta = self._parse_meta_info(f.read())
+                content = meta.get('content', '')
+            title = title or meta.get('title') or folder_name.split('_', 1)[-1]
+            
+            fingerprint = NearDuplicateIndex.fingerprint(title, content)
+            if fingerprint is None:
+                return None
+            
+            site = self.get_site_key()
+            duplicate = self.near_duplicate_index.find(fingerprint, site)
+            self.near_duplicate_index.add(site, folder_path, title, current.get('url') or meta.get('url', ''),
+                                          fingerprint, duplicate)
+            if duplicate:
+                logger.info(f"다른 사이트의 유사 공고: [{duplicate['site']}] {duplicate['title']} "
+                            f"(거리 {duplicate['distance']})")
+            return duplicate
+        except Exception as e:
+            logger.error(f"유사 공고 확인 실패: {e}")
+            return None
+    
+    def _download_attachments(self, attachments: List[Union[Attachment, Dict[str, Any]]], folder_path: str):
+        """첨부파일 다운로드 - 공고 폴더 저장 결과를 매니페스트에 기록"""
+        started = time.time()
+        
+        duplicate = self._check_near_duplicate(folder_path)
+        extra = {'near_duplicate_of': f"{duplicate['site']}/{os.path.basename(duplicate['folder_path'])}"} \
+            if duplicate else {}
+        
         if not attachments:
             logger.info("첨부파일이 없습니다")
+            self._record_announcement_folder(folder_path, duration=time.time() - started, attachments=0, **extra)
             return
         
+        # 재게시 공고는 원본이 같은 URL에서 받아 SHA-256까지 기록한 첨부파일만 생략 (파일명은 회차만 달라도 같을 수 있음)
+        canonical_files = {}
+        if duplicate and self.skip_duplicate_attachments:
+            canonical_files = {f['url']: f['sha256'] for f in duplicate.get('attachment_files', [])
+                               if f.get('url') and f.get('sha256')}
+        
         logger.info(f"{len(attachments)}개 첨부파일 다운로드 시작")
         attachments_folder = os.path.join(folder_path, 'attachments')
         os.makedirs(attachments_folder, exist_ok=True)
+        downloaded = []  # 텍스트 추출 대상 (저장 경로, sha256)
+        downloaded_urls = []  # downloaded의 첨부파일 URL (유사 공고 색인용)
+        skipped = 0
         
         for i, attachment in enumerate(attachments):
             try:
-                # 파일명 추출 - 다양한 키 지원 (name, filename)
-                file_name = attachment.get('filename') or attachment.get('name') or f"attachment_{i+1}"
+                # 파일명/URL - 별칭 키(name, file_name 등)는 Attachment 변환 시 정규화
+                record = Attachment.coerce(attachment)
+                url = record.url
+                file_name = record.filename or f"attachment_{i+1}"
                 logger.info(f"  첨부파일 {i+1}: {file_name}")
                 
                 # 파일명 처리
@@ -480,13 +1561,124 @@ class EnhancedBaseScraper(ABC):
                 
                 file_path = os.path.join(attachments_folder, file_name)
                 
-                # 파일 다운로드
-                success = self.download_file(attachment['url'], file_path, attachment)
-                if not success:
+                # 중단된 실행에서 이미 받은 파일은 다시 받지 않음
+                done = self.checkpoint.completed_file(folder_path, url) if self.checkpoint else None
+                if done:
+                    logger.info(f"  이전 실행에서 다운로드 완료: {os.path.basename(done['path'])}")
+                    self._record_file(folder_path, done['path'], url, True, 0.0, done.get('sha256'))
+                    downloaded.append((done['path'], done.get('sha256')))
+                    downloaded_urls.append(url)
+                    continue
+                
+                # 저장소에 원본 blob이 있어 이 공고 폴더에 연결한 경우에만 생략 (없으면 평소처럼 다운로드)
+                if (url in canonical_files and self.attachment_store
+                        and self.attachment_store.link_existing(canonical_files[url], file_path)):
+                    logger.info(f"  원본 공고에 저장된 첨부파일 - 다운로드 생략: {file_name}")
+                    skipped += 1
+                    self._record_file(folder_path, file_path, url, True, 0.0, canonical_files[url])
+                    continue
+                
+                # 이전 실행의 파일이 저장소 blob의 하드링크일 수 있으므로 먼저 끊어 둠
+                # (download_file을 재정의한 사이트는 save_path를 'wb'로 열어 공유 blob을 덮어씀)
+                if os.path.lexists(file_path):
+                    os.unlink(file_path)
+                
+                # 파일 다운로드 (Content-Disposition에 따라 실제 저장 경로가 바뀔 수 있음)
+                download_started = time.time()
+                self.last_download_path = None
+                self.last_download_sha256 = None
+                with self.measure_phase('attachment_download', url) as sample:
+                    success = self.download_file(url, file_path, attachment)
+                    saved_path = self.last_download_path or file_path
+                    if success and os.path.isfile(saved_path):
+                        sample['bytes'] = os.path.getsize(saved_path)
+                    sample['error'] = not success
+                
+                # download_file을 재정의한 사이트는 저장 후 해시만 계산 - 사이트가 직접 쓰는 경로는 다음 실행에서
+                # 'wb'로 다시 열리므로 공유 blob 링크로 바꾸지 않음
+                if success and not self.last_download_sha256 and os.path.isfile(saved_path):
+                    self.last_download_sha256 = AttachmentStore.hash_file(saved_path)
+                
+                self._record_file(folder_path, saved_path, url,
+                                  success, time.time() - download_started, self.last_download_sha256)
+                if success:
+                    downloaded.append((saved_path, self.last_download_sha256))
+                    downloaded_urls.append(url)
+                    if self.checkpoint is not None:
+                        self.checkpoint.file_done(url, saved_path, self.last_download_sha256)
+                else:
                     logger.warning(f"첨부파일 다운로드 실패: {file_name}")
                 
             except Exception as e:
                 logger.error(f"첨부파일 처리 중 오류: {e}")
+        
+        if skipped:
+            extra = dict(extra, skipped_attachments=skipped)
+        self._finish_announcement_folder(folder_path, started, len(attachments), downloaded, downloaded_urls,
+                                         duplicate, extra)
+    
+    def _finish_announcement_folder(self, folder_path: str, started: float, attachment_count: int,
+                                    downloaded: List[Tuple[str, Optional[str]]], downloaded_urls: List[str],
+                                    duplicate: Optional[Dict[str, Any]], extra: Dict[str, Any]):
+        """첨부파일 처리 후 공고 폴더 마무리 - 유사 공고 색인 갱신, 매니페스트/레코드 기록, 텍스트 추출 예약"""
+        if self.near_duplicate_index is not None and not duplicate:
+            try:
+                files = [{'url': url, 'sha256': sha256 or AttachmentStore.hash_file(path)}
+                         for (path, sha256), url in zip(downloaded, downloaded_urls) if os.path.isfile(path)]
+                self.near_duplicate_index.set_attachments(folder_path, files)
+            except Exception as e:
+                logger.error(f"유사 공고 색인 갱신 실패: {e}")
+        
+        self._record_announcement_folder(folder_path, duration=time.time() - started, attachments=attachment_count,
+                                         **extra)
+        
+        # 첨부파일 텍스트 추출은 프로세스 풀에 넘기고 바로 다음 공고로 진행
+        if self.text_extractor is not None and downloaded:
+            try:
+                self.text_extractor.submit(folder_path, downloaded)
+            except Exception as e:
+                logger.error(f"첨부파일 텍스트 추출 예약 실패: {e}")
+    
+    def record_saved_folder(self, folder_path: str, announcement: Optional[Dict[str, Any]] = None):
+        """사이트가 직접 저장한 공고 폴더와 첨부파일 기록
+        
+        process_announcement나 _download_attachments를 재정의해 _download_attachments(기본)를 거치지 않는
+        사이트는 폴더를 다 저장한 뒤 이 메서드를 호출한다. 이미 기록한 폴더는 다시 기록하지 않는다.
+        """
+        if os.path.abspath(folder_path) in self._recorded_folders:
+            return
+        if announcement is not None:
+            self._current_announcement = {
+                'folder': os.path.basename(folder_path),
+                'title': announcement.get('title', ''),
+                'url': announcement.get('url', ''),
+                'announcement_id': announcement.get('announcement_id'),
+                'announcement': announcement
+            }
+        
+        started = time.time()
+        duplicate = self._check_near_duplicate(folder_path)
+        extra = {'near_duplicate_of': f"{duplicate['site']}/{os.path.basename(duplicate['folder_path'])}"} \
+            if duplicate else {}
+        
+        downloaded = []
+        attachments_folder = os.path.join(folder_path, 'attachments')
+        if os.path.isdir(attachments_folder):
+            for name in sorted(os.listdir(attachments_folder)):
+                file_path = os.path.join(attachments_folder, name)
+                if not os.path.isfile(file_path):
+                    continue
+                # 사이트가 직접 쓴 파일은 공유 blob 링크로 바꾸지 않고 해시만 기록
+                sha256 = None
+                try:
+                    sha256 = AttachmentStore.hash_file(file_path)
+                except OSError as e:
+                    logger.error(f"첨부파일 해시 계산 실패: {e}")
+                self._record_file(folder_path, file_path, '', True, 0.0, sha256)
+                downloaded.append((file_path, sha256))
+        
+        self._finish_announcement_folder(folder_path, started, len(downloaded), downloaded,
+                                         [''] * len(downloaded), duplicate, extra)
     
     def scrape_pages(self, max_pages: int = 4, output_base: str = 'output'):
         """여러 페이지 스크래핑 - 중복 체크 지원"""
@@ -494,18 +1686,29 @@ class EnhancedBaseScraper(ABC):
         
         # 처리된 제목 목록 로드
         self.load_processed_titles(output_base)
-        
-        announcement_count = 0
+        self.load_strategy_stats(output_base)
+        self.load_endpoint_cache(output_base)
+        self.get_manifest(output_base)
+        self.get_record_sink(output_base)
+        self._recorded_folders = set()
+        
+        # resume이면 중단된 실행의 다음 페이지와 공고 번호부터 (새 실행은 1페이지, 1번부터)
+        start_page = self.checkpoint.start_page if self.checkpoint else 1
+        announcement_count = self.checkpoint.next_index - 1 if self.checkpoint else 0
         processed_count = 0
         early_stop = False
         stop_reason = ""
         
-        for page_num in range(1, max_pages + 1):
+        for page_num in range(start_page, max_pages + 1):
             logger.info(f"페이지 {page_num} 처리 중")
             
             try:
-                # 목록 가져오기 및 파싱
-                announcements = self._get_page_announcements(page_num)
+                # 목록 가져오기 및 파싱 (이 동안의 요청은 목록 요청으로 계측)
+                self._fetch_phase = 'list_fetch'
+                try:
+                    announcements = self._get_page_announcements(page_num)
+                finally:
+                    self._fetch_phase = 'detail_fetch'
                 
                 if not announcements:
                     logger.warning(f"페이지 {page_num}에 공고가 없습니다")
@@ -526,8 +1729,14 @@ class EnhancedBaseScraper(ABC):
                 for ann in new_announcements:
                     announcement_count += 1
                     processed_count += 1
+                    if self.checkpoint is not None:
+                        self.checkpoint.announcement_started(announcement_count)
                     self.process_announcement(ann, announcement_count, output_base)
-
+                    if self.checkpoint is not None:
+                        self.checkpoint.announcement_finished()
+                
+                if self.checkpoint is not None:
+                    self.checkpoint.page_done(page_num)
 
                 # 중복 임계값 도달시 조기 종료
                 if should_stop:
@@ -536,8 +1745,8 @@ class EnhancedBaseScraper(ABC):
                     stop_reason = f"중복 {self.duplicate_threshold}개 연속"
                     break
                 
-                # 새로운 공고가 없으면 조기 종료 (연속된 페이지에서)
-                if not new_announcements and page_num > 1:
+                # 새로운 공고가 없으면 조기 종료 (연속된 페이지에서 - 재개한 첫 페이지는 이미 처리한 공고뿐일 수 있음)
+                if not new_announcements and page_num > start_page:
                     logger.info("새로운 공고가 없어 스크래핑 조기 종료")
                     early_stop = True
                     stop_reason = "새로운 공고 없음"
@@ -550,8 +1759,8 @@ class EnhancedBaseScraper(ABC):
                 #     self.process_announcement(ann, announcement_count, output_base)
                 
                 # 페이지 간 대기
-                if page_num < max_pages and self.delay_between_pages > 0:
-                    time.sleep(self.delay_between_pages)
+                if page_num < max_pages:
+                    self.sleep(self.delay_between_pages, 'page_delay')
                 
             except Exception as e:
                 logger.error(f"페이지 {page_num} 처리 중 오류: {e}")
@@ -560,6 +1769,9 @@ class EnhancedBaseScraper(ABC):
         
         # 처리된 제목 목록 저장
         self.save_processed_titles()
+        self.save_strategy_stats()
+        self.save_endpoint_cache()
+        self.close_run_outputs()
         
         if early_stop:
             logger.info(f"스크래핑 완료: 총 {processed_count}개 새로운 공고 처리 (조기종료: {stop_reason})")
@@ -584,7 +1796,8 @@ class EnhancedBaseScraper(ABC):
         
         # 현재 페이지 번호를 인스턴스 변수로 저장
         self.current_page_num = page_num
-        announcements = self.parse_list_page(response.text)
+        with self.measure_phase('list_parse'):
+            announcements = self.parse_list_page(response.text)
         
         # 추가 마지막 페이지 감지 로직
         if not announcements and page_num > 1:
@@ -619,7 +1832,7 @@ class StandardTableScraper(EnhancedBaseScraper):
             # 하위 클래스에서 직접 구현
             return super().parse_list_page(html_content)
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = self._parse_list_html(html_content)
         announcements = []
         
         selectors = self.config.selectors
@@ -676,14 +1889,33 @@ class StandardTableScraper(EnhancedBaseScraper):
 
 
 class AjaxAPIScraper(EnhancedBaseScraper):
-    """AJAX/JSON API 기반 스크래퍼"""
+    """AJAX/JSON API 기반 스크래퍼
+    
+    page_size_param을 지정한 사이트는 목록 API가 실제로 받아들이는 최대 페이지 크기를 처음 사용할 때
+    탐색하여 엔드포인트 캐시에 기록하고, 한 번의 요청으로 여러 논리 페이지(page_size개 단위)를 받는다.
+    scrape_pages의 max_pages는 논리 페이지 기준이므로 수집 범위는 그대로이고 요청 수만 줄어든다.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        # 목록 API 페이지 크기 확대 (fetch_api_page를 구현한 사이트에서 사용)
+        self.page_size_param = None  # 페이지 크기 파라미터 이름 (예: 'pageUnit', 'recordCountPerPage')
+        self.page_size = 10  # 사이트 기본 페이지 크기 = 논리 페이지 크기
+        self.max_page_size = 100  # 탐색할 최대 페이지 크기
+        self.page_size_ttl = 7 * 24 * 3600  # 탐색 결과 유지 시간 (초)
+        self._api_page_size = None  # 이번 실행에서 사용하는 물리 페이지 크기
+        self._api_pages = {}  # {물리 페이지 번호: 공고 목록}
+        self._api_last_page = None  # 항목이 모자라게 온 마지막 물리 페이지
     
     def get_list_url(self, page_num: int) -> str:
         """API URL 반환"""
         return getattr(self.config, 'api_url', self.list_url)
     
-    def _get_page_announcements(self, page_num: int) -> List[Dict[str, Any]]:
-        """API를 통한 공고 목록 가져오기"""
+    def fetch_api_page(self, page_num: int, page_size: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """목록 API 물리 페이지 하나 요청 - page_size가 있으면 page_size_param으로 함께 전송
+        
+        실패하면 None, 항목이 없으면 빈 목록을 반환한다.
+        """
         if not self.config or not self.config.api_config:
             return super()._get_page_announcements(page_num)
         
@@ -698,6 +1930,8 @@ class AjaxAPIScraper(EnhancedBaseScraper):
         if pagination.get('type') == 'post_data':
             param = pagination.get('param', 'page')
             data[param] = str(page_num)
+        if page_size and self.page_size_param:
+            data[self.page_size_param] = str(page_size)
         
         # API 호출
         if api_config.get('method', 'POST').upper() == 'POST':
@@ -706,14 +1940,90 @@ class AjaxAPIScraper(EnhancedBaseScraper):
             response = self.get_page(api_url, params=data)
         
         if not response:
-            return []
+            return None
         
         try:
-            json_data = response.json()
-            return self.parse_api_response(json_data, page_num)
+            with self.measure_phase('list_parse'):
+                json_data = response.json()
+                return self.parse_api_response(json_data, page_num)
         except json.JSONDecodeError as e:
             logger.error(f"JSON 파싱 실패: {e}")
-            return []
+            return None
+    
+    def _get_page_announcements(self, page_num: int) -> List[Dict[str, Any]]:
+        """API를 통한 공고 목록 가져오기 - 논리 페이지를 확대된 물리 페이지에서 잘라 반환"""
+        if not self.page_size_param:
+            return self.fetch_api_page(page_num) or []
+        
+        if page_num == 1:
+            # 실행마다 목록이 바뀌므로 물리 페이지는 실행 단위로만 재사용
+            self._api_pages = {}
+            self._api_last_page = None
+        size = self._resolve_api_page_size()
+        
+        start = (page_num - 1) * self.page_size
+        end = start + self.page_size
+        first, last = start // size + 1, (end - 1) // size + 1
+        
+        rows = []
+        for physical in range(first, last + 1):
+            if self._api_last_page is not None and physical > self._api_last_page:
+                break
+            page = self._get_api_page(physical, size)
+            if page is None:
+                break
+            rows.extend(page)
+        
+        offset = start - (first - 1) * size
+        return rows[offset:offset + self.page_size]
+    
+    def _get_api_page(self, physical: int, size: int) -> Optional[List[Dict[str, Any]]]:
+        """물리 페이지 요청 (실행 중 캐시)"""
+        if physical not in self._api_pages:
+            page = self.fetch_api_page(physical, size)
+            if page is None:
+                return None
+            self._api_pages[physical] = page
+            if len(page) < size:
+                self._api_last_page = physical
+        return self._api_pages[physical]
+    
+    def _resolve_api_page_size(self) -> int:
+        """서버가 받아들이는 페이지 크기 - 캐시가 없거나 오래되면 max_page_size로 한 번 요청해 확인
+        
+        탐색 요청의 결과는 1페이지로 그대로 사용하므로 추가 요청이 생기지 않는다.
+        """
+        if self._api_page_size:
+            return self._api_page_size
+        
+        cache = self.endpoint_cache.get('list_page_size', {})
+        if cache.get('page_size') and time.time() - cache.get('probed_at', 0) < self.page_size_ttl:
+            self._api_page_size = max(int(cache['page_size']), self.page_size)
+            return self._api_page_size
+        
+        rows = self.fetch_api_page(1, self.max_page_size)
+        if rows is None:
+            self._api_page_size = self.page_size
+            return self._api_page_size
+        
+        count = len(rows)
+        if count >= self.max_page_size:
+            honored = self.max_page_size
+        elif count > self.page_size:
+            honored = count  # 서버 상한이거나 전체 목록 - 어느 쪽이든 1페이지와 일치
+        else:
+            honored = self.page_size  # 파라미터를 무시했거나 목록이 한 페이지 이하
+        
+        self._api_page_size = honored
+        self._api_pages[1] = rows[:honored]
+        if count < honored:
+            self._api_last_page = 1
+        
+        # 목록이 기본 크기보다 짧으면 판단할 수 없으므로 기록하지 않음
+        if count >= self.page_size:
+            self.endpoint_cache['list_page_size'] = {'page_size': honored, 'probed_at': time.time()}
+            logger.info(f"목록 API 페이지 크기 확인: {honored}개 (기본 {self.page_size}개)")
+        return honored
     
     def parse_api_response(self, json_data: Dict[str, Any], page_num: int) -> List[Dict[str, Any]]:
         """API 응답 파싱 - 하위 클래스에서 구현"""
@@ -306,7 +306,7 @@ class EnhancedBCCIScraper(StandardTableScraper):
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
 
 # 테스트용 함수
 def test_bcci_scraper(pages=3):
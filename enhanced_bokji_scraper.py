@@ -187,7 +187,7 @@ class EnhancedBokjiScraper(EnhancedBaseScraper):
         content_elem = soup.find('div', class_='boardContent')
         if content_elem:
             # HTML을 마크다운으로 변환
-            content = self.h.handle(str(content_elem))
+            content = self.h.handle(content_elem)
             # 불필요한 공백 제거
             content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
             content = content.strip()
@@ -411,13 +411,16 @@ class EnhancedBokjiScraper(EnhancedBaseScraper):
         
         # 첨부파일 다운로드
         self._download_attachments(detail['attachments'], folder_path)
+
+        # 직접 저장한 폴더를 매니페스트/레코드에 기록
+        self.record_saved_folder(folder_path, announcement)
         
         # 처리된 제목으로 추가
         self.add_processed_title(announcement['title'])
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
     
     def _create_meta_info(self, announcement: Dict[str, Any]) -> str:
         """메타 정보 생성"""
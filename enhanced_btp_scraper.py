@@ -199,7 +199,7 @@ class EnhancedBTPScraper(StandardTableScraper):
         
         if content_elem:
             # HTML을 마크다운으로 변환
-            return self.h.handle(str(content_elem))
+            return self.h.handle(content_elem)
         else:
             logger.warning("본문 내용을 찾을 수 없습니다")
             return ""
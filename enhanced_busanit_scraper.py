@@ -197,8 +197,7 @@ class EnhancedBusanitScraper(StandardTableScraper):
                     # 이미지가 있는 경우
                     if cell_content.find('img'):
                         # HTML을 마크다운으로 변환
-                        cell_html = str(cell_content)
-                        markdown_content = self.h.handle(cell_html)
+                        markdown_content = self.h.handle(cell_content)
                         content_parts.append(markdown_content)
                     else:
                         # 텍스트만 있는 경우
@@ -170,7 +170,7 @@ class EnhancedCbfScraper(StandardTableScraper):
             logger.warning("본문 내용 추출 실패")
         else:
             # HTML을 마크다운으로 변환
-            content_text = self.h.handle(str(content_area))
+            content_text = self.h.handle(content_area)
             # 과도한 줄바꿈 정리
             content_text = re.sub(r'\n{3,}', '\n\n', content_text)
         
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+CCEI 패밀리 스크래퍼 - 전국 창조경제혁신센터를 JSON API 한 번으로 수집
+모든 지역 센터가 같은 호스트(ccei.creativekorea.or.kr)와 noticeList.json API를 쓰고,
+목록 행의 COUNTRY_NM(지역명 또는 '통합')으로 어느 센터 공고인지 구분된다.
+페이지마다 API를 한 번만 호출하여 행을 지역별로 나누고, 여러 지역에 걸친 행은 SEQ로
+중복 제거하여 한 번만 상세/첨부파일을 받은 뒤 지역별 출력 폴더로 연결한다.
+허브 API가 다른 센터 공고를 돌려주지 않으면(첫 페이지를 다른 센터 API와 비교) 센터별 API를 각각 호출한다.
+"""
+
+import os
+import re
+import shutil
+import logging
+from typing import Dict, List, Optional
+
+from enhanced_ccei_scraper import EnhancedCCEIScraper
+
+logger = logging.getLogger(__name__)
+
+# 0424full.csv의 지역 센터 - site_code: (경로, 센터명, COUNTRY_NM 지역명)
+CCEI_REGIONS = {
+    'cceiSeoul': ('seoul', '서울창조경제혁신센터', '서울'),
+    'cceiBusan': ('busan', '부산창조경제혁신센터', '부산'),
+    'cceiDaeGu': ('daegu', '대구창조경제혁신센터', '대구'),
+    'cceiIncheon': ('incheon', '인천창조경제혁신센터', '인천'),
+    'cceiGwangju': ('gwangju', '광주창조경제혁신센터', '광주'),
+    'cceiDaejeon': ('daejeon', '대전창조경제혁신센터', '대전'),
+    'cceiUlsan': ('ulsan', '울산창조경제혁신센터', '울산'),
+    'cceiSejong': ('sejong', '세종창조경제혁신센터', '세종'),
+    'cceiGyeonggi': ('gyeonggi', '경기창조경제혁신센터', '경기'),
+    'cceiGangwon': ('gangwon', '강원창조경제혁신센터', '강원'),
+    'cceiChungbuk': ('chungbuk', '충북창조경제혁신센터', '충북'),
+    'cceiChungnam': ('chungnam', '충남창조경제혁신센터', '충남'),
+    'cceiJeonbuk': ('jeonbuk', '전북창조경제혁신센터', '전북'),
+    'cceiJeonnam': ('jeonnam', '전남창조경제혁신센터', '전남'),
+    'cceiGyeongbuk': ('gyeongbuk', '경북창조경제혁신센터', '경북'),
+    'cceiGyeongnam': ('gyeongnam', '경남창조경제혁신센터', '경남'),
+    'cceiJeju': ('jeju', '제주창조경제혁신센터', '제주'),
+    'cceiPohang': ('pohang', '포항창조경제혁신센터', '포항'),
+    'cceiBitgaram': ('bitgaram', '빛가람창조경제혁신센터', '빛가람'),
+}
+
+# 모든 지역에 해당하는 공통 공고의 COUNTRY_NM
+SHARED_LABELS = ('통합', '전국', '')
+
+# 센터별 출력 폴더명 - NNN_제목
+REGION_FOLDER_PATTERN = re.compile(r'^(\d+)_')
+
+
+class EnhancedCCEIFamilyScraper(EnhancedCCEIScraper):
+    """전국 창조경제혁신센터 통합 스크래퍼
+
+    공고는 output_base 아래에 한 번만 저장하고 (중복 체크, 매니페스트, 레코드도 한 벌),
+    지역별 출력은 <output_base>/regions/<site_code>/ 에 하드링크(불가하면 복사)로 만든다.
+    regions로 일부 센터만 지정하면 그 센터에 해당하지 않는 행은 건너뛴다.
+    per_region_endpoints가 None이면 첫 수집 전에 허브 API가 전 센터 공고를 주는지 확인해 정한다.
+    """
+
+    def __init__(self, regions: Optional[List[str]] = None, hub: str = 'chungbuk'):
+        super().__init__()
+        unknown = [code for code in regions or [] if code not in CCEI_REGIONS]
+        if unknown:
+            raise ValueError(f"알 수 없는 CCEI 센터: {', '.join(unknown)}")
+
+        self.regions = list(regions) if regions else list(CCEI_REGIONS)
+        self.set_region_path(hub)
+        self.region_output_root = None  # 기본값: <output_base>/regions
+        self.per_region_endpoints: Optional[bool] = True if len(self.regions) == 1 else None
+        self._endpoint_region: Optional[str] = None
+        self.id_rules = [{'field': 'seq'}]
+
+        self._label_to_region = {label: code for code, (_, _, label) in CCEI_REGIONS.items()}
+        self._seen_seqs = set()
+        self._region_counts: Dict[str, int] = {}
+        self.region_stats: Dict[str, int] = {}
+        self.unmatched_labels: Dict[str, int] = {}
+
+    def regions_for_item(self, label: str) -> List[str]:
+        """COUNTRY_NM에 해당하는 센터 목록 - 공통 공고는 선택된 모든 센터"""
+        label = (label or '').strip()
+        if label in SHARED_LABELS:
+            return list(self.regions)
+        code = self._label_to_region.get(label)
+        if code is None:
+            # '충북창조경제혁신센터'처럼 전체 이름으로 오는 경우
+            code = next((c for c, (_, name, _) in CCEI_REGIONS.items() if label == name), None)
+        if code is None:
+            self.unmatched_labels[label] = self.unmatched_labels.get(label, 0) + 1
+            return []
+        return [code] if code in self.regions else []
+
+    def parse_api_response(self, json_data: dict, page_num: int) -> list:
+        """API 응답 파싱 - 행을 지역별로 나누고 SEQ로 중복 제거"""
+        announcements = []
+        for announcement in super().parse_api_response(json_data, page_num):
+            seq = str(announcement['seq'])
+            if seq in self._seen_seqs:
+                logger.debug(f"이미 받은 SEQ {seq} 스킵: {announcement['title'][:50]}")
+                continue
+
+            regions = self.regions_for_item(announcement.get('organization', ''))
+            if not regions and self._endpoint_region:
+                regions = [self._endpoint_region]  # 센터별 API의 행은 그 센터 공고
+            if not regions and len(self.regions) < len(CCEI_REGIONS):
+                continue  # 선택하지 않은 센터의 공고
+
+            self._seen_seqs.add(seq)
+            announcement['regions'] = regions
+            announcements.append(announcement)
+
+        return announcements
+
+    def _hub_covers_regions(self) -> bool:
+        """허브 API가 다른 센터 공고도 돌려주는지 - 다른 센터 API의 첫 페이지와 SEQ가 80% 이상 겹치면 공용 API
+
+        센터별 API여도 '통합' 공고는 양쪽에 나오므로 일부 겹치는 것만으로는 공용으로 보지 않는다.
+        """
+        hub_path = self.region_path
+        probe = next((code for code in self.regions if CCEI_REGIONS[code][0] != hub_path), None) \
+            or next(code for code, (path, _, _) in CCEI_REGIONS.items() if path != hub_path)
+
+        hub_seqs = self._first_page_seqs(hub_path)
+        probe_seqs = self._first_page_seqs(CCEI_REGIONS[probe][0])
+        if not hub_seqs or not probe_seqs:
+            logger.warning(f"허브 API 확인 실패 (허브 {len(hub_seqs)}개, {probe} {len(probe_seqs)}개) - 센터별 API 사용")
+            return False
+
+        shared = len(hub_seqs & probe_seqs) * 5 >= min(len(hub_seqs), len(probe_seqs)) * 4
+        logger.info(f"허브 API({hub_path})와 {probe} API 첫 페이지 비교: "
+                    f"{'공용 API' if shared else '센터별 API'} (겹친 SEQ {len(hub_seqs & probe_seqs)}개)")
+        return shared
+
+    def _first_page_seqs(self, region_path: str) -> set:
+        """센터 API 첫 페이지의 SEQ 목록"""
+        response = self.post_page(f"{self.base_url}/{region_path}/custom/noticeList.json",
+                                  data={'pn': '1', 'boardGubun': '', 'keyword': '', 'title': ''})
+        try:
+            items = response.json().get('result', {}).get('list', []) if response is not None else []
+        except Exception as e:
+            logger.debug(f"{region_path} API 응답 파싱 실패: {e}")
+            return set()
+        return {str(item['SEQ']) for item in items if item.get('SEQ')}
+
+    def _get_page_announcements(self, page_num: int) -> list:
+        """허브 API 한 번, 또는 센터별 API를 차례로 호출해 합친 목록"""
+        if not self.per_region_endpoints:
+            return super()._get_page_announcements(page_num)
+
+        hub_path = self.region_path
+        announcements = []
+        try:
+            for code in self.regions:
+                self.set_region_path(CCEI_REGIONS[code][0])
+                self._endpoint_region = code
+                announcements.extend(super()._get_page_announcements(page_num))
+        finally:
+            self.set_region_path(hub_path)
+            self._endpoint_region = None
+        return announcements
+
+    def download_file(self, url: str, save_path: str, attachment_info: dict = None) -> bool:
+        """기본 다운로드 사용 - 실제 저장 경로와 SHA-256을 남겨 매니페스트/첨부파일 저장소에 기록"""
+        return super(EnhancedCCEIScraper, self).download_file(url, save_path, attachment_info)
+
+    def process_announcement(self, announcement: dict, index: int, output_base: str = 'output'):
+        """공고를 기본 처리 경로(_download_attachments)로 한 번 저장한 뒤 해당 센터별 출력으로 연결"""
+        self._current_announcement = None
+        super(EnhancedCCEIScraper, self).process_announcement(announcement, index, output_base)
+
+        folder_name = (self._current_announcement or {}).get('folder')
+        if not folder_name or not os.path.exists(os.path.join(output_base, folder_name, 'content.md')):
+            return  # 상세 페이지 실패
+        folder_path = os.path.join(output_base, folder_name)
+
+        region_root = self.region_output_root or os.path.join(output_base, 'regions')
+        for code in announcement.get('regions', []):
+            try:
+                self._region_counts[code] = self._region_counts.get(code, 0) + 1
+                dest = os.path.join(region_root, code, f"{self._region_counts[code]:03d}_{folder_name.split('_', 1)[1]}")
+                self.link_tree(folder_path, dest)
+                self.region_stats[code] = self.region_stats.get(code, 0) + 1
+            except Exception as e:
+                logger.error(f"[{code}] 지역 출력 연결 실패: {e}")
+
+    @staticmethod
+    def link_tree(src: str, dest: str):
+        """폴더 복제 - attachments/ 아래 첨부파일은 하드링크(안 되는 파일시스템이면 복사), 나머지는 복사
+        
+        content.md 같은 작은 메타 파일은 기본 process_announcement가 다음 실행에서 같은 경로를 'w'로 다시 쓰므로
+        하드링크하면 이전에 만든 센터별 사본까지 바뀐다.
+        """
+        for root, _, files in os.walk(src):
+            relative = os.path.relpath(root, src)
+            target_dir = os.path.join(dest, relative)
+            os.makedirs(target_dir, exist_ok=True)
+            is_attachment = relative.split(os.sep)[0] == 'attachments'
+            for name in files:
+                target = os.path.join(target_dir, name)
+                if os.path.lexists(target):
+                    os.remove(target)
+                if is_attachment:
+                    try:
+                        os.link(os.path.join(root, name), target)
+                        continue
+                    except OSError:
+                        pass
+                shutil.copy2(os.path.join(root, name), target)
+
+    @staticmethod
+    def existing_region_counts(region_root: str) -> Dict[str, int]:
+        """이전 실행에서 만든 센터별 폴더의 마지막 번호 - regions/<site_code>/NNN_제목"""
+        counts = {}
+        if not os.path.isdir(region_root):
+            return counts
+        for code in os.listdir(region_root):
+            region_dir = os.path.join(region_root, code)
+            if not os.path.isdir(region_dir):
+                continue
+            numbers = [int(m.group(1)) for m in map(REGION_FOLDER_PATTERN.match, os.listdir(region_dir)) if m]
+            if numbers:
+                counts[code] = max(numbers)
+        return counts
+
+    def scrape_pages(self, max_pages: int = 4, output_base: str = 'output'):
+        """전 센터 수집 - 종료 후 센터별 공고 수 기록"""
+        self._seen_seqs = set()
+        self._region_counts = self.existing_region_counts(self.region_output_root or os.path.join(output_base, 'regions'))
+        self.region_stats = {}
+        self.unmatched_labels = {}
+        if self.per_region_endpoints is None:
+            self.per_region_endpoints = not self._hub_covers_regions()
+
+        result = super().scrape_pages(max_pages=max_pages, output_base=output_base)
+
+        for code in self.regions:
+            logger.info(f"[{code}] {CCEI_REGIONS[code][1]}: 공고 {self.region_stats.get(code, 0)}개")
+        if self.unmatched_labels:
+            logger.warning(f"센터를 알 수 없는 COUNTRY_NM: {self.unmatched_labels}")
+        return result
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='전국 창조경제혁신센터 통합 수집')
+    parser.add_argument('--regions', nargs='+', choices=list(CCEI_REGIONS), help='수집할 센터 (기본: 전체)')
+    parser.add_argument('--pages', type=int, default=3, help='최대 페이지 수')
+    parser.add_argument('--output', default='output/ccei_family', help='출력 디렉토리')
+    args = parser.parse_args()
+
+    scraper = EnhancedCCEIFamilyScraper(regions=args.regions)
+    scraper.scrape_pages(max_pages=args.pages, output_base=args.output)
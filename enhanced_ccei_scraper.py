@@ -21,10 +21,15 @@ class EnhancedCCEIScraper(AjaxAPIScraper):
     def __init__(self):
         super().__init__()
         self.base_url = "https://ccei.creativekorea.or.kr"
-        self.list_url = "https://ccei.creativekorea.or.kr/chungbuk/custom/notice_list.do"
-        self.api_url = "https://ccei.creativekorea.or.kr/chungbuk/custom/noticeList.json"
+        self.set_region_path("chungbuk")
         self._list_data_cache = {}  # improved.py와 동일한 네이밍
         
+    def set_region_path(self, region_path: str):
+        """센터 경로 설정 - 18개 지역 센터가 같은 호스트에서 /<지역>/custom/ 경로만 다르게 사용"""
+        self.region_path = region_path
+        self.list_url = f"{self.base_url}/{region_path}/custom/notice_list.do"
+        self.api_url = f"{self.base_url}/{region_path}/custom/noticeList.json"
+    
     def get_list_url(self, page_num: int) -> str:
         """API URL 반환"""
         return self.api_url
@@ -102,7 +107,7 @@ class EnhancedCCEIScraper(AjaxAPIScraper):
                 # SEQ로 상세 URL 구성
                 seq = item.get('SEQ', '')
                 if seq:
-                    detail_url = f"{self.base_url}/chungbuk/custom/notice_view.do?no={seq}"
+                    detail_url = f"{self.base_url}/{self.region_path}/custom/notice_view.do?no={seq}"
                 else:
                     continue
                 
@@ -182,7 +187,7 @@ class EnhancedCCEIScraper(AjaxAPIScraper):
                 # For each UUID, create download URL
                 for i, uuid in enumerate(file_uuids):
                     if uuid.strip():
-                        file_url = f"{self.base_url}/chungbuk/json/common/fileDown.download?uuid={uuid.strip()}"
+                        file_url = f"{self.base_url}/{self.region_path}/json/common/fileDown.download?uuid={uuid.strip()}"
                         # We don't have filename info here, so we'll get it during download
                         attachments.append({
                             'name': f'attachment_{i+1}',  # Placeholder name
@@ -193,12 +198,12 @@ class EnhancedCCEIScraper(AjaxAPIScraper):
         # 본문을 마크다운으로 변환
         content_md = ""
         if content_area:
-            content_md = self.h.handle(str(content_area))
+            content_md = self.h.handle(content_area)
         else:
             # 전체 페이지에서 헤더/푸터 제외하고 추출 시도
             main_content = soup.find('div', class_='content_wrap') or soup.find('div', id='content')
             if main_content:
-                content_md = self.h.handle(str(main_content))
+                content_md = self.h.handle(main_content)
                 
         return {
             'content': content_md,
@@ -284,14 +289,17 @@ class EnhancedCCEIScraper(AjaxAPIScraper):
             logger.error(f"Error downloading file from {url}: {e}")
             return False
     
+    def get_folder_name(self, announcement: dict, index: int) -> str:
+        """공고 폴더명 - 번호_제목(50자)"""
+        folder_title = self.sanitize_filename(announcement['title'])[:50]
+        return f"{index:03d}_{folder_title}"
+    
     def process_announcement(self, announcement: dict, index: int, output_base: str = 'output'):
         """개별 공고 처리 - CCEI 특화 (improved.py 기반)"""
         logger.info(f"Processing announcement {index}: {announcement['title']}")
         
         # 폴더 생성
-        folder_title = self.sanitize_filename(announcement['title'])[:50]
-        folder_name = f"{index:03d}_{folder_title}"
-        folder_path = os.path.join(output_base, folder_name)
+        folder_path = os.path.join(output_base, self.get_folder_name(announcement, index))
         os.makedirs(folder_path, exist_ok=True)
         
         # 상세 페이지 가져오기
@@ -338,5 +346,8 @@ class EnhancedCCEIScraper(AjaxAPIScraper):
         else:
             logger.info("No attachments found")
         
+        # 직접 저장한 폴더를 매니페스트/레코드에 기록
+        self.record_saved_folder(folder_path, announcement)
+        
         # 처리된 제목으로 추가
         self.add_processed_title(announcement['title'])
\ No newline at end of file
@@ -241,8 +241,7 @@ class EnhancedCCIScraper(StandardTableScraper):
             self._clean_html_content(content_cell)
             
             # HTML을 마크다운으로 변환
-            content_html = str(content_cell)
-            content_md = self.h.handle(content_html)
+            content_md = self.h.handle(content_cell)
             
             # 과도한 공백 정리
             content_md = re.sub(r'\n\s*\n\s*\n', '\n\n', content_md)
@@ -375,7 +374,7 @@ class EnhancedCCIScraper(StandardTableScraper):
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
     
     def _create_cci_meta_info(self, announcement: Dict[str, Any]) -> str:
         """CCI 전용 메타 정보 생성"""
@@ -455,7 +454,7 @@ class EnhancedCCIScraper(StandardTableScraper):
                 
                 # 페이지 간 대기
                 if page_num < max_pages and self.delay_between_pages > 0:
-                    time.sleep(self.delay_between_pages)
+                    self.sleep(self.delay_between_pages, 'page_delay')
                 
             except Exception as e:
                 logger.error(f"페이지 {page_num} 처리 중 오류: {e}")
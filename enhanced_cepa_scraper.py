@@ -202,7 +202,7 @@ class EnhancedCEPAScraper(StandardTableScraper):
         
         if content_area:
             # HTML을 마크다운으로 변환
-            content = self.h.handle(str(content_area))
+            content = self.h.handle(content_area)
             
             # 내용 정리
             content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
@@ -350,7 +350,7 @@ class EnhancedCEPAScraper(StandardTableScraper):
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
     
     def _create_cepa_meta_info(self, announcement: Dict[str, Any]) -> str:
         """CEPA 전용 메타 정보 생성"""
@@ -429,7 +429,7 @@ class EnhancedCEPAScraper(StandardTableScraper):
                 
                 # 페이지 간 대기
                 if page_num < max_pages and self.delay_between_pages > 0:
-                    time.sleep(self.delay_between_pages)
+                    self.sleep(self.delay_between_pages, 'page_delay')
                 
             except Exception as e:
                 logger.error(f"페이지 {page_num} 처리 중 오류: {e}")
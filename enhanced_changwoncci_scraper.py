@@ -145,7 +145,7 @@ class EnhancedChangwoncciScraper(StandardTableScraper):
             
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+                page = self.guard_page(browser.new_page())
                 
                 # 타임아웃 설정 증가
                 page.set_default_timeout(60000)  # 60초
@@ -265,7 +265,7 @@ class EnhancedChangwoncciScraper(StandardTableScraper):
             
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+                page = self.guard_page(browser.new_page())
                 
                 # 타임아웃 설정 증가
                 page.set_default_timeout(60000)  # 60초
@@ -489,7 +489,7 @@ class EnhancedChangwoncciScraper(StandardTableScraper):
         
         # 요청 간 대기 시간 증가
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
 
 # 테스트용 함수
 def test_changwoncci_scraper(pages=3):
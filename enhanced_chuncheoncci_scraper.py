@@ -145,7 +145,7 @@ class EnhancedChuncheoncciScraper(StandardTableScraper):
             
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+                page = self.guard_page(browser.new_page())
                 
                 # 페이지 로드
                 page.goto(self.list_url)
@@ -259,7 +259,7 @@ class EnhancedChuncheoncciScraper(StandardTableScraper):
             
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+                page = self.guard_page(browser.new_page())
                 
                 # 목록 페이지로 이동
                 page.goto(self.list_url)
@@ -479,7 +479,7 @@ class EnhancedChuncheoncciScraper(StandardTableScraper):
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
 
 # 테스트용 함수
 def test_chuncheoncci_scraper(pages=3):
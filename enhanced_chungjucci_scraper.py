@@ -143,7 +143,7 @@ class EnhancedChungjuCCIScraper(StandardTableScraper):
             
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+                page = self.guard_page(browser.new_page())
                 
                 # 페이지 로드
                 page.goto(self.list_url)
@@ -259,7 +259,7 @@ class EnhancedChungjuCCIScraper(StandardTableScraper):
             
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+                page = self.guard_page(browser.new_page())
                 
                 # 목록 페이지로 이동
                 page.goto(self.list_url)
@@ -459,7 +459,7 @@ class EnhancedChungjuCCIScraper(StandardTableScraper):
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
 
 # 테스트용 함수
 def test_chungjucci_scraper(pages=3):
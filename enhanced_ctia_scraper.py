@@ -254,7 +254,7 @@ class EnhancedCTIAScraper(StandardTableScraper):
             logger.info(f"다운로드 완료: {save_path} ({file_size:,} bytes)")
             
             # 잠시 대기 (서버 부하 방지)
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
             
             return True
             
@@ -227,7 +227,7 @@ class EnhancedCTPScraper(StandardTableScraper):
             if content_elem:
                 try:
                     # HTML to Markdown 변환
-                    content_md = self.h.handle(str(content_elem))
+                    content_md = self.h.handle(content_elem)
                     content_parts.append("## 본문")
                     content_parts.append(content_md)
                     content_found = True
@@ -29,6 +29,7 @@ class EnhancedDaejeonCCIScraper(StandardTableScraper):
         self.timeout = 30
         self.delay_between_requests = 2  # JavaScript 렌더링 고려
         self.use_playwright = True  # JavaScript 필수
+        self.list_container = 'table'  # 목록 파싱은 게시판 테이블 영역만
         
     def get_list_url(self, page_num: int) -> str:
         """페이지별 URL 생성 - JavaScript 기반이므로 기본 URL 반환"""
@@ -36,7 +37,7 @@ class EnhancedDaejeonCCIScraper(StandardTableScraper):
     
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱 - 표준 테이블 구조 처리 (수정된 버전)"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = self._parse_list_html(html_content)
         announcements = []
         
         # 공지사항 테이블 찾기 - "게시판 리스트 화면" 클래스 또는 테이블 구조로 찾기
@@ -203,14 +204,14 @@ class EnhancedDaejeonCCIScraper(StandardTableScraper):
         
         # 본문 내용이 비어있으면 다른 방법으로 찾기
         if not content.strip():
-            # 긴 텍스트 블록 찾기
-            all_text_elements = soup.find_all(['div', 'td', 'p'])
-            for element in all_text_elements:
-                element_text = element.get_text(strip=True)
-                if len(element_text) > 100:  # 100자 이상인 텍스트
-                    if not any(keyword in element_text for keyword in ['메뉴', '로그인', '회원가입', '홈', '게시판']):
-                        if len(element_text) > len(content):
-                            content = element_text
+            # 긴 텍스트 블록 찾기 (100자 이상, 메뉴성 문구 제외)
+            content_block = self.find_main_content_block(
+                soup,
+                tags=['div', 'td', 'p'],
+                skip_keywords=['메뉴', '로그인', '회원가입', '홈', '게시판']
+            )
+            if content_block:
+                content = content_block.get_text(strip=True)
         
         # 첨부파일 추출
         attachments = self._extract_attachments(soup)
@@ -376,7 +377,7 @@ class EnhancedDaejeonCCIScraper(StandardTableScraper):
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             context = browser.new_context(ignore_https_errors=True)
-            page = context.new_page()
+            page = self.guard_page(context.new_page())
             
             # 페이지 객체를 클래스 속성으로 저장
             self.playwright_page = page
@@ -440,7 +441,7 @@ class EnhancedDaejeonCCIScraper(StandardTableScraper):
                                 self.navigate_to_page(page_num)
                             
                             # 요청 간 대기
-                            time.sleep(self.delay_between_requests)
+                            self.sleep(self.delay_between_requests)
                             
                         except Exception as e:
                             logger.error(f"공고 처리 중 오류 ({announcement['title']}): {e}")
@@ -209,8 +209,7 @@ class EnhancedDCBScraper(StandardTableScraper):
                 
                 # HTML을 마크다운으로 변환
                 try:
-                    view_html = str(view_box)
-                    view_markdown = self.h.handle(view_html)
+                    view_markdown = self.h.handle(view_box)
                     
                     # 내용 정리
                     view_markdown = re.sub(r'\n\s*\n\s*\n', '\n\n', view_markdown)
@@ -243,7 +242,7 @@ class EnhancedDCBScraper(StandardTableScraper):
             logger.warning("기본 본문 추출 실패 - 대체 방법 시도")
             main_content = soup.find('div', id='sub_content')
             if main_content:
-                content = self.h.handle(str(main_content))
+                content = self.h.handle(main_content)
             else:
                 content = "내용을 추출할 수 없습니다."
         
@@ -411,7 +410,7 @@ class EnhancedDCBScraper(StandardTableScraper):
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
     
     def _create_dcb_meta_info(self, announcement: Dict[str, Any]) -> str:
         """DCB 전용 메타 정보 생성"""
@@ -496,7 +495,7 @@ class EnhancedDCBScraper(StandardTableScraper):
                 
                 # 페이지 간 대기
                 if page_num < max_pages and self.delay_between_pages > 0:
-                    time.sleep(self.delay_between_pages)
+                    self.sleep(self.delay_between_pages, 'page_delay')
                 
             except Exception as e:
                 logger.error(f"페이지 {page_num} 처리 중 오류: {e}")
@@ -380,8 +380,7 @@ class EnhancedDGDPScraper(AjaxAPIScraper):
         
         if content_area:
             # HTML to Markdown 변환
-            content_html = str(content_area)
-            markdown_content = self.h.handle(content_html)
+            markdown_content = self.h.handle(content_area)
             content_parts.append(markdown_content)
         else:
             # 대체: 본문으로 추정되는 모든 p, div 태그에서 텍스트 추출
@@ -735,7 +734,7 @@ class EnhancedDGDPScraper(AjaxAPIScraper):
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
 
 
 # 하위 호환성을 위한 별칭
@@ -227,7 +227,7 @@ class EnhancedDipScraper(StandardTableScraper):
         if content_area:
             # read__content 영역에서 본문 추출
             try:
-                result['content'] = self.h.handle(str(content_area))
+                result['content'] = self.h.handle(content_area)
                 logger.debug("read__content 영역에서 본문 추출 완료")
             except Exception as e:
                 logger.error(f"HTML to Markdown 변환 실패: {e}")
@@ -246,7 +246,7 @@ class EnhancedDipScraper(StandardTableScraper):
                 content_elem = soup.select_one(selector)
                 if content_elem:
                     try:
-                        result['content'] = self.h.handle(str(content_elem))
+                        result['content'] = self.h.handle(content_elem)
                         logger.debug(f"{selector} 선택자로 본문 추출 완료")
                         break
                     except Exception as e:
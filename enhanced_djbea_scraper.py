@@ -55,14 +55,12 @@ class EnhancedDJBEAScraper(StandardTableScraper):
             logger.info("이 페이지에 게시글이 없습니다")
             return announcements
         
-        # 여러 전략으로 목록 파싱 시도
-        announcements = self._try_table_parsing(soup)
-        
-        if not announcements:
-            announcements = self._try_list_parsing(soup)
-        
-        if not announcements:
-            announcements = self._try_div_parsing(soup)
+        # 여러 전략으로 목록 파싱 시도 (이전에 성공한 전략 우선)
+        announcements = self.run_strategies('list', [
+            ('table', lambda: self._try_table_parsing(soup)),
+            ('list', lambda: self._try_list_parsing(soup)),
+            ('div', lambda: self._try_div_parsing(soup)),
+        ])
         
         logger.info(f"총 {len(announcements)}개 공고 파싱 완료")
         return announcements
@@ -316,7 +314,7 @@ class EnhancedDJBEAScraper(StandardTableScraper):
         # 요약 영역 찾기
         summary_area = soup.find('div', class_='summary') or soup.find('div', class_='board_summary')
         if summary_area:
-            content_md += "## 요약\n" + self.h.handle(str(summary_area)) + "\n\n"
+            content_md += "## 요약\n" + self.h.handle(summary_area) + "\n\n"
         
         # 본문 내용 영역 찾기
         content_selectors = [
@@ -367,8 +365,7 @@ class EnhancedDJBEAScraper(StandardTableScraper):
                 content_md += content_area
             else:
                 try:
-                    content_html = str(content_area)
-                    content_markdown = self.h.handle(content_html)
+                    content_markdown = self.h.handle(content_area)
                     
                     # 내용 정리
                     content_markdown = re.sub(r'\n\s*\n\s*\n', '\n\n', content_markdown)
@@ -385,78 +382,26 @@ class EnhancedDJBEAScraper(StandardTableScraper):
         return content_md
     
     def _find_largest_text_block(self, soup: BeautifulSoup) -> Optional[BeautifulSoup]:
-        """가장 큰 텍스트 블록 찾기"""
-        all_divs = soup.find_all('div')
-        max_text_div = None
-        max_text_len = 0
-        
-        for div in all_divs:
-            # 네비게이션과 헤더 div 제외
-            if div.get('class'):
-                class_str = ' '.join(div.get('class'))
-                if any(skip in class_str for skip in ['nav', 'header', 'footer', 'menu', 'gnb', 'lnb']):
-                    continue
-            
-            text = div.get_text(strip=True)
-            if len(text) > max_text_len and len(text) > 100:
-                max_text_len = len(text)
-                max_text_div = div
-        
-        return max_text_div
+        """가장 큰 텍스트 블록 찾기 - 네비게이션/헤더 div 제외"""
+        return self.find_main_content_block(soup, tags=['div'])
     
     def _extract_detail_attachments(self, soup: BeautifulSoup, current_url: str = None) -> List[Dict[str, Any]]:
         """상세 페이지 첨부파일 추출 - DJBEA A2mUpload 시스템 대응"""
-        attachments = []
-        
-        # 전략 1: DJBEA A2mUpload 시스템에서 첨부파일 추출
-        a2m_attachments = self._extract_djbea_a2m_files(soup)
-        if a2m_attachments:
-            attachments.extend(a2m_attachments)
-            logger.debug(f"A2mUpload에서 {len(a2m_attachments)}개 첨부파일 발견")
-        
-        # 전략 2: dext5-multi-container에서 파일 정보 추출
-        dext5_containers = soup.find_all('div', class_='dext5-multi-container')
-        for container in dext5_containers:
-            dext5_files = self._extract_from_dext5_container(container)
-            if dext5_files:
-                attachments.extend(dext5_files)
-                logger.debug(f"dext5 컨테이너에서 {len(dext5_files)}개 첨부파일 발견")
-        
-        # 전략 3: 특정 파일 영역에서 추출 (기존 방식)
-        file_sections = soup.find_all('div', class_=re.compile('file|attach'))
-        for section in file_sections:
-            section_files = self._extract_from_file_section(section)
-            if section_files:
-                attachments.extend(section_files)
-                logger.debug(f"파일 섹션에서 {len(section_files)}개 첨부파일 발견")
-        
-        # 전략 4: JavaScript 다운로드 링크에서 추출
-        download_links = soup.find_all('a', onclick=re.compile('download|fileDown|fnDown'))
-        for link in download_links:
-            attachment = self._extract_from_js_link(link)
-            if attachment:
-                attachments.append(attachment)
-        
-        # 전략 5: 파일 확장자를 가진 모든 링크에서 추출
-        file_links = soup.find_all('a', href=re.compile(r'\.(pdf|hwp|doc|docx|xls|xlsx|zip|rar|ppt|pptx)', re.I))
-        for link in file_links:
-            attachment = self._extract_from_file_link(link)
-            if attachment:
-                attachments.append(attachment)
-        
-        # 전략 6: 텍스트 패턴에서 첨부파일 정보 추출
-        text_attachments = self._extract_from_text_patterns(soup)
-        if text_attachments:
-            attachments.extend(text_attachments)
-            logger.debug(f"텍스트 패턴에서 {len(text_attachments)}개 첨부파일 발견")
+        # 첨부파일이 여러 영역(A2mUpload, dext5, 파일 영역, 링크)에 나뉘어 있을 수 있어 모든 전략 결과를 합친다
+        # (한 전략만 기억해 두면 일부 파일만 찾는 전략이 선호되어 나머지를 놓침)
+        # 최근 페이지들에서 결과가 없던 전략은 건너뜀 - a2m은 목록 API POST와 해시 경로 HEAD 요청 4개를 보냄
+        attachments = self.run_all_strategies('attachments', [
+            ('a2m', lambda: self._extract_djbea_a2m_files(soup)),
+            ('dext5', lambda: self._extract_from_dext5_containers(soup)),
+            ('file_section', lambda: self._extract_from_file_sections(soup)),
+            ('js_link', lambda: self._extract_from_js_links(soup)),
+            ('file_link', lambda: self._extract_from_file_links(soup)),
+            ('text_pattern', lambda: self._extract_from_text_patterns(soup)),
+        ])
         
-        # 전략 7: 하드코딩된 파일 정보 추출 (특정 공고에만 적용)
-        # 다른 방법으로 첨부파일을 찾지 못한 경우에만 시도
+        # 하드코딩된 파일 정보는 다른 방법으로 찾지 못한 경우에만 시도
         if not attachments:
-            hardcoded_files = self._extract_hardcoded_djbea_files(current_url)
-            if hardcoded_files:
-                attachments.extend(hardcoded_files)
-                logger.debug(f"하드코딩된 파일에서 {len(hardcoded_files)}개 첨부파일 발견")
+            attachments = self._extract_hardcoded_djbea_files(current_url) or []
         
         # 중복 제거
         seen = set()
@@ -470,6 +415,38 @@ class EnhancedDJBEAScraper(StandardTableScraper):
         logger.debug(f"첨부파일 추출 완료: {len(unique_attachments)}개")
         return unique_attachments
     
+    def _extract_from_dext5_containers(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """dext5-multi-container들에서 첨부파일 추출"""
+        attachments = []
+        for container in soup.find_all('div', class_='dext5-multi-container'):
+            attachments.extend(self._extract_from_dext5_container(container))
+        return attachments
+    
+    def _extract_from_file_sections(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """파일 영역(div.file/attach)들에서 첨부파일 추출"""
+        attachments = []
+        for section in soup.find_all('div', class_=re.compile('file|attach')):
+            attachments.extend(self._extract_from_file_section(section))
+        return attachments
+    
+    def _extract_from_js_links(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """JavaScript 다운로드 링크들에서 첨부파일 추출"""
+        attachments = []
+        for link in soup.find_all('a', onclick=re.compile('download|fileDown|fnDown')):
+            attachment = self._extract_from_js_link(link)
+            if attachment:
+                attachments.append(attachment)
+        return attachments
+    
+    def _extract_from_file_links(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """파일 확장자를 가진 링크들에서 첨부파일 추출"""
+        attachments = []
+        for link in soup.find_all('a', href=re.compile(r'\.(pdf|hwp|doc|docx|xls|xlsx|zip|rar|ppt|pptx)', re.I)):
+            attachment = self._extract_from_file_link(link)
+            if attachment:
+                attachments.append(attachment)
+        return attachments
+    
     def _extract_from_file_table(self, file_table) -> List[Dict[str, Any]]:
         """파일 테이블에서 첨부파일 추출"""
         attachments = []
@@ -904,13 +881,16 @@ class EnhancedDJBEAScraper(StandardTableScraper):
         
         # 첨부파일 다운로드
         self._download_attachments(detail['attachments'], folder_path)
+
+        # 직접 저장한 폴더를 매니페스트/레코드에 기록
+        self.record_saved_folder(folder_path, announcement)
         
         # 처리된 제목으로 추가
         self.add_processed_title(announcement['title'])
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
     
     def _download_attachments(self, attachments: List[Dict[str, Any]], folder_path: str):
         """DJBEA 전용 첨부파일 다운로드 오버라이드"""
@@ -1144,6 +1124,7 @@ class EnhancedDJBEAScraper(StandardTableScraper):
         
         # 처리된 제목 목록 로드
         self.load_processed_titles(output_base)
+        self.load_strategy_stats(output_base)
         
         announcement_count = 0
         processed_count = 0
@@ -1189,7 +1170,7 @@ class EnhancedDJBEAScraper(StandardTableScraper):
                 
                 # 페이지 간 대기
                 if page_num < max_pages and self.delay_between_pages > 0:
-                    time.sleep(self.delay_between_pages)
+                    self.sleep(self.delay_between_pages, 'page_delay')
                 
             except Exception as e:
                 logger.error(f"페이지 {page_num} 처리 중 오류: {e}")
@@ -1198,6 +1179,7 @@ class EnhancedDJBEAScraper(StandardTableScraper):
         
         # 처리된 제목 목록 저장
         self.save_processed_titles()
+        self.save_strategy_stats()
         
         if early_stop:
             logger.info(f"DJBEA 스크래핑 완료: 총 {processed_count}개 새로운 공고 처리 (조기종료: {stop_reason})")
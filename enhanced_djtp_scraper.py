@@ -207,13 +207,16 @@ class EnhancedDJTPScraper(StandardTableScraper):
         # 첨부파일 다운로드 - 목록에서 추출한 것과 상세에서 추출한 것 합치기
         all_attachments = announcement.get('attachments', []) + detail.get('attachments', [])
         self._download_attachments_djtp(all_attachments, folder_path)
+
+        # 직접 저장한 폴더를 매니페스트/레코드에 기록
+        self.record_saved_folder(folder_path, announcement)
         
         # 처리된 제목으로 추가
         self.add_processed_title(announcement['title'])
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
     
     def _download_attachments_djtp(self, attachments: List[Dict[str, Any]], folder_path: str):
         """DJTP 특화 첨부파일 다운로드"""
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+"""
+전자정부 표준프레임워크 계열 게시판 공용 스크래퍼
+selectBoardList.do(bbsId/nttId), BD_selectBbsList.do(q_bbsCode/q_bbscttSn),
+selectNttList.do(bbsId/nttSn) 게시판을 파라미터 이름과 선택자 설정만으로 수집하고,
+atchFileId/fileSn 방식 첨부파일은 공용 다운로드 URL로 받는다.
+"""
+
+import re
+import logging
+from urllib.parse import urljoin, urlparse, parse_qs, urlencode
+from typing import Dict, List, Any, Optional
+
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+
+from enhanced_base_scraper import StandardTableScraper
+from announcement_model import Announcement
+
+logger = logging.getLogger(__name__)
+
+# 게시판 계열별 파라미터 - list_url의 마지막 경로를 view_path로 바꾸면 상세 URL
+EGOV_PRESETS = {
+    # 표준프레임워크 기본 게시판 (cop/bbs/selectBoardList.do)
+    'egov': {
+        'page_param': 'pageIndex',
+        'board_param': 'bbsId',
+        'id_param': 'nttId',
+        'view_path': 'selectBoardArticle.do',
+        'file_url': '/cmm/fms/FileDown.do?atchFileId={file_id}&fileSn={file_sn}',
+        'file_list_url': '/cmm/fms/selectFileInfs.do?param_atchFileId={file_id}',
+    },
+    # 행정기관 CMS 게시판 (BD_selectBbsList.do)
+    'bd_bbs': {
+        'page_param': 'q_currPage',
+        'board_param': 'q_bbsCode',
+        'id_param': 'q_bbscttSn',
+        'view_path': 'BD_selectBbs.do',
+        'file_url': '/component/file/ND_fileDownload.do?q_fileSn={file_sn}&q_fileId={file_id}',
+        'file_list_url': None,
+    },
+    # 공공기관 홈페이지 게시판 (na/ntt/selectNttList.do)
+    'ntt': {
+        'page_param': 'currPage',
+        'board_param': 'bbsId',
+        'id_param': 'nttSn',
+        'view_path': 'selectNttInfo.do',
+        'file_url': None,
+        'file_list_url': None,
+    },
+}
+
+# 기본 선택자 - 사이트 설정의 selectors로 항목별 재정의
+DEFAULT_SELECTORS = {
+    'rows': 'table tbody tr, ul.bbs_list > li, .board_list > ul > li',
+    'title_link': 'td.subject a, td.title a, td.tit a, .subject a, .title a, a',
+    'date': 'td.date, td.reg_date, .date',
+    'writer': 'td.writer, td.name, .writer',
+    'notice': '.notice, .icon_notice, img[alt*="공지"]',
+    'content': '.view_cont, .view_content, .bbs_content, #bbs_content, .board_view .cont, .bbsView .cont, td.content',
+}
+
+DATE_PATTERN = re.compile(r'(\d{4})[-./](\d{1,2})[-./](\d{1,2})')
+JS_ARGS_PATTERN = re.compile(r'\w+\s*\(([^)]*)\)')
+FILE_ID_PATTERN = re.compile(r'(?:atchFileId|q_fileId|fileId)=([\w-]+)')
+FILE_SN_PATTERN = re.compile(r'(?:fileSn|q_fileSn)=(\d+)')
+JS_FILE_PATTERN = re.compile(r"""\(\s*['"](FILE_\w+|[\w-]{16,})['"]\s*,\s*['"]?(\d+)['"]?""")
+DOWNLOAD_HREF_PATTERN = re.compile(r'(?i)down\w*\.(?:do|jsp|php|aspx?)')
+FILE_SIZE_PATTERN = re.compile(r'\s*[\[(]\s*[\d.,]+\s*[KMG]?B(?:yte)?s?\s*[\])]\s*$', re.I)
+
+# 0424full.csv에서 계열이 확인된 게시판 - site_code: (기관명, 목록 URL, 계열, 추가 설정)
+EGOV_SITES = {
+    'forest': ('산림청', 'https://www.forest.go.kr/kfsweb/cop/bbs/selectBoardList.do?bbsId=BBSMSTR_1032&mn=NKFS_04_01_02',
+               'egov', {'context_path': '/kfsweb'}),
+    'kicox': ('한국산업단지공단', 'https://www.kicox.or.kr/user/bbs/BD_selectBbsList.do?q_bbsCode=1016', 'bd_bbs', {}),
+    'kohi': ('한국보건복지인재원', 'https://www.kohi.or.kr/user/bbs/BD_selectBbsList.do?q_bbsCode=1013', 'bd_bbs', {}),
+    'reb': ('한국부동산원', 'https://www.reb.or.kr/reb/na/ntt/selectNttList.do?mi=9564&bbsId=1134', 'ntt', {}),
+    'kodit': ('신용보증기금', 'https://www.kodit.co.kr/kodit/na/ntt/selectNttList.do?mi=2638&bbsId=148', 'ntt', {}),
+}
+
+
+class EnhancedEgovBoardScraper(StandardTableScraper):
+    """전자정부 표준프레임워크 계열 게시판 공용 스크래퍼
+
+    목록 URL과 계열(preset)만 주면 페이지/게시판/게시물 파라미터 이름과 상세 경로가 정해지고,
+    settings로 파라미터 이름, selectors, context_path, file_url을 재정의한다.
+    선택자는 생성 시 한 번 컴파일하여 모든 행/페이지에 재사용한다.
+    """
+
+    def __init__(self, list_url: Optional[str] = None, preset: str = 'egov', site_code: Optional[str] = None,
+                 settings: Optional[Dict[str, Any]] = None):
+        super().__init__()
+        if site_code and not list_url:
+            if site_code not in EGOV_SITES:
+                raise ValueError(f"알 수 없는 eGov 게시판: {site_code}")
+            _, list_url, preset, site_settings = EGOV_SITES[site_code]
+            settings = {**site_settings, **(settings or {})}
+
+        self.site_code = site_code
+        self.configure(list_url, preset, settings)
+
+    def configure(self, list_url: str, preset: str = 'egov', settings: Optional[Dict[str, Any]] = None):
+        """목록 URL, 계열, 재정의 설정 적용"""
+        if not list_url:
+            raise ValueError("list_url 또는 site_code가 필요합니다")
+        if preset not in EGOV_PRESETS:
+            raise ValueError(f"지원하지 않는 게시판 계열: {preset} ({', '.join(EGOV_PRESETS)})")
+
+        settings = dict(settings or {})
+        self.preset = preset
+        self.board = {**EGOV_PRESETS[preset], **{k: v for k, v in settings.items() if k in EGOV_PRESETS[preset]}}
+        self.context_path = settings.get('context_path', '')
+
+        parsed = urlparse(list_url)
+        self.base_url = f"{parsed.scheme}://{parsed.netloc}"
+        self.list_params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        self.list_params.pop(self.board['page_param'], None)
+        self.list_path = parsed.path
+        self.view_path = settings.get('view_path') or f"{parsed.path.rsplit('/', 1)[0]}/{self.board['view_path']}"
+        self.list_url = f"{self.base_url}{self.list_path}?{urlencode(self.list_params)}" if self.list_params \
+            else f"{self.base_url}{self.list_path}"
+
+        self.selectors = {**DEFAULT_SELECTORS, **settings.get('selectors', {})}
+        self._compiled = {name: soupsieve.compile(selector) for name, selector in self.selectors.items()}
+        self.id_rules = [{'field': 'announcement_id'}]
+
+    def set_config(self, config):
+        """sites_config.yaml 설정 주입 - egov 항목에 preset과 재정의 설정"""
+        super().set_config(config)
+        egov = dict(getattr(config, 'egov', None) or {})
+        if getattr(config, 'selectors', None):
+            egov.setdefault('selectors', config.selectors)
+        self.configure(config.list_url, egov.pop('preset', 'egov'), egov)
+
+    def get_site_key(self) -> str:
+        if self.site_code:
+            return self.site_code
+        board_id = self.list_params.get(self.board['board_param'], '')
+        return f"egov_{urlparse(self.base_url).netloc.replace('.', '_')}_{board_id}".rstrip('_')
+
+    def get_list_url(self, page_num: int) -> str:
+        separator = '&' if '?' in self.list_url else '?'
+        return f"{self.list_url}{separator}{self.board['page_param']}={page_num}"
+
+    def get_view_url(self, article_id: str, board_id: Optional[str] = None) -> str:
+        """상세 URL - 목록의 게시판 파라미터(mi, mn 등 포함)에 게시물 ID를 더함"""
+        params = dict(self.list_params)
+        if board_id:
+            params[self.board['board_param']] = board_id
+        params[self.board['id_param']] = article_id
+        return f"{self.base_url}{self.view_path}?{urlencode(params)}"
+
+    def extract_article_id(self, link: Tag) -> Optional[Dict[str, str]]:
+        """링크에서 게시물 ID - href 쿼리 파라미터, 없으면 fn_view('123', 'BBSMSTR_...') 형태의 인자"""
+        target = ' '.join(filter(None, [link.get('href'), link.get('onclick')]))
+        match = re.search(rf"[?&;]{re.escape(self.board['id_param'])}=(\w+)", target)
+        if match:
+            board = re.search(rf"[?&;]{re.escape(self.board['board_param'])}=(\w+)", target)
+            return {'id': match.group(1), 'board': board.group(1) if board else None}
+
+        match = JS_ARGS_PATTERN.search(target)
+        if not match:
+            return None
+        # 숫자 게시판 ID(bbsId=1134 등)는 게시물 ID 후보에서 제외
+        current_board = self.list_params.get(self.board['board_param'])
+        args = [arg.strip().strip('\'"') for arg in match.group(1).split(',') if arg.strip()]
+        article_id = next((arg for arg in args if arg.isdigit() and arg != current_board), None)
+        if article_id is None:
+            return None
+        board_id = next((arg for arg in args if arg.startswith('BBSMSTR')), None)
+        return {'id': article_id, 'board': board_id}
+
+    def parse_list_page(self, html_content: str) -> List[Announcement]:
+        """목록 파싱 - 컴파일된 선택자로 행/제목/날짜 추출"""
+        soup = self._parse_list_html(html_content)
+        announcements = []
+
+        for row in self._compiled['rows'].select(soup):
+            try:
+                link = next((a for a in self._compiled['title_link'].select(row) if self.extract_article_id(a)), None)
+                if link is None:
+                    continue
+                title = link.get_text(' ', strip=True) or link.get('title', '').strip()
+                if not title:
+                    continue
+
+                ids = self.extract_article_id(link)
+                announcement = Announcement(title=title, url=self.get_view_url(ids['id'], ids['board']),
+                                            announcement_id=ids['id'])
+                self._extract_row_meta(row, announcement)
+                announcements.append(announcement)
+            except Exception as e:
+                logger.error(f"행 파싱 중 오류: {e}")
+
+        logger.info(f"[{self.get_site_key()}] 목록 {len(announcements)}개 파싱")
+        return announcements
+
+    def _extract_row_meta(self, row: Tag, announcement: Dict[str, Any]):
+        """번호, 공지 여부, 작성자, 작성일"""
+        cells = row.find_all('td', recursive=False)
+        number = cells[0].get_text(strip=True) if cells else ''
+        if number:
+            announcement['number'] = number
+        if number == '공지' or self._compiled['notice'].select_one(row) is not None \
+                or 'notice' in ' '.join(row.get('class') or []):
+            announcement['is_notice'] = True
+
+        writer = self._compiled['writer'].select_one(row)
+        if writer:
+            announcement['writer'] = writer.get_text(strip=True)
+
+        date_cell = self._compiled['date'].select_one(row)
+        match = DATE_PATTERN.search(date_cell.get_text(strip=True) if date_cell else row.get_text(' ', strip=True))
+        if match:
+            year, month, day = match.groups()
+            announcement['date'] = f"{year}-{int(month):02d}-{int(day):02d}"
+
+    def parse_detail_page(self, html_content: str, url: str = None) -> Dict[str, Any]:
+        """상세 파싱 - 본문과 첨부파일"""
+        soup = BeautifulSoup(html_content, 'html.parser')
+
+        content_area = self._compiled['content'].select_one(soup) or self.find_main_content_block(soup)
+        content = ''
+        if content_area is not None:
+            for tag in content_area.find_all(['script', 'style']):
+                tag.decompose()
+            content = self.h.handle(content_area)
+
+        return {
+            'content': content,
+            'attachments': self.extract_attachments(soup),
+        }
+
+    def build_file_url(self, file_id: str, file_sn: str = '0') -> Optional[str]:
+        """atchFileId/fileSn 다운로드 URL"""
+        if not self.board.get('file_url'):
+            return None
+        path = self.board['file_url'].format(file_id=file_id, file_sn=file_sn)
+        return f"{self.base_url}{self.context_path}{path}"
+
+    def extract_attachments(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """첨부파일 - 다운로드 링크는 그대로, 스크립트 호출은 atchFileId/fileSn으로 URL 구성
+
+        링크가 없고 atchFileId만 있는 페이지(파일 목록을 별도 요청으로 그리는 경우)는 파일 목록을 요청한다.
+        """
+        attachments = []
+        seen = set()
+
+        for link in soup.find_all('a'):
+            href = (link.get('href') or '').replace('&amp;', '&')
+            target = f"{href} {link.get('onclick') or ''}"
+
+            file_url = None
+            if href and not href.startswith(('javascript:', '#')) and DOWNLOAD_HREF_PATTERN.search(href):
+                file_url = urljoin(self.base_url + self.list_path, href)
+            else:
+                file_id, file_sn = FILE_ID_PATTERN.search(target), FILE_SN_PATTERN.search(target)
+                if file_id:
+                    file_url = self.build_file_url(file_id.group(1), file_sn.group(1) if file_sn else '0')
+                else:
+                    match = JS_FILE_PATTERN.search(target)
+                    if match and re.search(r'(?i)down', target):
+                        file_url = self.build_file_url(match.group(1), match.group(2))
+
+            if not file_url or file_url in seen:
+                continue
+            seen.add(file_url)
+            name = FILE_SIZE_PATTERN.sub('', link.get_text(' ', strip=True)).strip()
+            attachments.append({'name': name or f"attachment_{len(attachments) + 1}", 'url': file_url})
+
+        if not attachments and self.board.get('file_list_url'):
+            holder = soup.find('input', attrs={'name': 'atchFileId'})
+            if holder and holder.get('value'):
+                attachments = self.list_attachments(holder['value'])
+
+        return attachments
+
+    def list_attachments(self, file_id: str) -> List[Dict[str, Any]]:
+        """atchFileId의 파일 목록 요청 (selectFileInfs.do)"""
+        url = f"{self.base_url}{self.context_path}{self.board['file_list_url'].format(file_id=file_id)}"
+        response = self.get_page(url)
+        if response is None:
+            return []
+        soup = BeautifulSoup(response.text, 'html.parser')
+        attachments = []
+        for link in soup.find_all('a'):
+            target = f"{link.get('href') or ''} {link.get('onclick') or ''}"
+            js_call, sn_param = JS_FILE_PATTERN.search(target), FILE_SN_PATTERN.search(target)
+            if js_call:
+                file_sn = js_call.group(2)
+            elif sn_param:
+                file_sn = sn_param.group(1)
+            else:
+                continue
+            name = FILE_SIZE_PATTERN.sub('', link.get_text(' ', strip=True)).strip()
+            attachments.append({'name': name or f"attachment_{len(attachments) + 1}",
+                                'url': self.build_file_url(file_id, file_sn)})
+        return attachments
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='전자정부 표준프레임워크 계열 게시판 수집')
+    parser.add_argument('site', help=f"site_code ({', '.join(EGOV_SITES)}) 또는 목록 URL")
+    parser.add_argument('--preset', default='egov', choices=list(EGOV_PRESETS), help='게시판 계열 (URL 지정 시)')
+    parser.add_argument('--pages', type=int, default=3, help='최대 페이지 수')
+    parser.add_argument('--output', help='출력 디렉토리 (기본: output/<site>)')
+    args = parser.parse_args()
+
+    if args.site.startswith('http'):
+        scraper = EnhancedEgovBoardScraper(list_url=args.site, preset=args.preset)
+    else:
+        scraper = EnhancedEgovBoardScraper(site_code=args.site)
+    scraper.scrape_pages(max_pages=args.pages, output_base=args.output or f"output/{scraper.get_site_key()}")
@@ -585,7 +585,7 @@ class EnhancedEumseongcciScraper(StandardTableScraper):
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
 
 
 # 하위 호환성을 위한 별칭
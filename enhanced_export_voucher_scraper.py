@@ -229,7 +229,7 @@ class EnhancedExportVoucherScraper(StandardTableScraper):
         for selector in content_selectors:
             content_area = soup.select_one(selector)
             if content_area:
-                content = self.h.handle(str(content_area))
+                content = self.h.handle(content_area)
                 logger.debug(f"본문을 {selector} 선택자로 찾음")
                 break
         
@@ -249,7 +249,7 @@ class EnhancedExportVoucherScraper(StandardTableScraper):
                         best_div = div
             
             if best_div:
-                content = self.h.handle(str(best_div))
+                content = self.h.handle(best_div)
                 logger.info(f"대체 방법으로 본문 추출 완료 (길이: {len(content)})")
             else:
                 # 최후 수단: 전체 페이지에서 텍스트 추출
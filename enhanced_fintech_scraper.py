@@ -57,7 +57,7 @@ class EnhancedFintechScraper(StandardTableScraper):
             try:
                 with sync_playwright() as p:
                     browser = p.chromium.launch(headless=True)
-                    page = browser.new_page()
+                    page = self.guard_page(browser.new_page())
                     
                     # 페이지 로드 - 더 짧은 타임아웃
                     page.goto(url, wait_until="domcontentloaded", timeout=15000)
@@ -64,7 +64,7 @@ class EnhancedGangwon6Scraper(StandardTableScraper):
             
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+                page = self.guard_page(browser.new_page())
                 
                 # 페이지 로드
                 page.goto(url, wait_until="networkidle", timeout=30000)
@@ -201,7 +201,7 @@ class EnhancedGbsinboScraper(StandardTableScraper):
         """Playwright를 사용한 동적 상세 페이지 파싱"""
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+            page = self.guard_page(await browser.new_page())
             
             try:
                 # 목록 페이지 먼저 로드
@@ -245,8 +245,7 @@ class EnhancedGbtpScraper(StandardTableScraper):
                     if header == "내용":
                         content_cell = cells[1]
                         # 내용 셀에서 HTML을 마크다운으로 변환
-                        content_html = str(content_cell)
-                        content_text = self.h.handle(content_html)
+                        content_text = self.h.handle(content_cell)
                         logger.debug("테이블 '내용' 행에서 본문 추출")
                         break
             if content_text:
@@ -257,8 +256,7 @@ class EnhancedGbtpScraper(StandardTableScraper):
             figures = soup.find_all('figure')
             if figures:
                 for figure in figures:
-                    content_html = str(figure)
-                    content_text += self.h.handle(content_html) + "\n\n"
+                    content_text += self.h.handle(figure) + "\n\n"
                 logger.debug("figure 태그에서 본문 추출")
         
         # 3. 긴 텍스트가 있는 셀 찾기
@@ -273,8 +271,7 @@ class EnhancedGbtpScraper(StandardTableScraper):
                         if parent_row:
                             row_cells = parent_row.find_all(['td', 'th'])
                             if len(row_cells) >= 2 and cell == row_cells[-1]:  # 마지막 셀
-                                content_html = str(cell)
-                                content_text = self.h.handle(content_html)
+                                content_text = self.h.handle(cell)
                                 logger.debug("긴 텍스트 셀에서 본문 추출")
                                 break
                 if content_text:
@@ -293,8 +290,7 @@ class EnhancedGbtpScraper(StandardTableScraper):
             for selector in content_areas:
                 area = soup.select_one(selector)
                 if area:
-                    content_html = str(area)
-                    content_text = self.h.handle(content_html)
+                    content_text = self.h.handle(area)
                     logger.debug(f"{selector}에서 본문 추출")
                     break
         
@@ -56,7 +56,7 @@ class EnhancedGBTPPlaywrightScraper(EnhancedBaseScraper):
                 headless=self.browser_options['headless'],
                 args=self.browser_options['args']
             )
-            self.page = self.browser.new_page()
+            self.page = self.guard_page(self.browser.new_page())
             
             # 사용자 에이전트 설정
             self.page.set_extra_http_headers({
@@ -413,7 +413,7 @@ class EnhancedGBTPPlaywrightScraper(EnhancedBaseScraper):
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
     
     def _create_meta_info_playwright(self, announcement: Dict[str, Any]) -> str:
         """Playwright 버전 메타 정보 생성"""
@@ -503,7 +503,7 @@ class EnhancedGBTPPlaywrightScraper(EnhancedBaseScraper):
                     
                     # 페이지 간 대기
                     if page_num < max_pages and self.delay_between_pages > 0:
-                        time.sleep(self.delay_between_pages)
+                        self.sleep(self.delay_between_pages, 'page_delay')
                     
                 except Exception as e:
                     logger.error(f"페이지 {page_num} 처리 중 오류: {e}")
@@ -294,7 +294,7 @@ class EnhancedGCAFScraper(StandardTableScraper):
                     self.add_processed_title(detail_data['title'])
                     
                     # 요청 간격 조절
-                    time.sleep(self.delay_between_requests)
+                    self.sleep(self.delay_between_requests)
                 
                 if should_stop:
                     logger.info("중복 임계값 도달로 스크래핑 중단")
@@ -305,7 +305,7 @@ class EnhancedGCAFScraper(StandardTableScraper):
                 continue
             
             # 페이지 간 대기
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
         
         # 처리된 제목 저장
         self.save_processed_titles()
@@ -173,8 +173,7 @@ class EnhancedGCUBEScraper(StandardTableScraper):
             
             if content_elem:
                 # HTML을 마크다운으로 변환
-                content_html = str(content_elem)
-                result['content'] = self.h.handle(content_html).strip()
+                result['content'] = self.h.handle(content_elem).strip()
                 logger.info(f"본문 추출 완료 (길이: {len(result['content'])})")
             else:
                 logger.warning("본문을 찾을 수 없습니다")
@@ -129,14 +129,14 @@ class EnhancedGdcScraper(StandardTableScraper):
         
         if content_elem:
             # HTML을 마크다운으로 변환
-            content = self.h.handle(str(content_elem))
+            content = self.h.handle(content_elem)
             logger.debug("본문을 bo_v_body 선택자로 찾음")
         else:
             # 대체 선택자들 시도
             for selector in ['.board_view', '.view_content', '.bo_v_con']:
                 content_elem = soup.select_one(selector)
                 if content_elem:
-                    content = self.h.handle(str(content_elem))
+                    content = self.h.handle(content_elem)
                     logger.debug(f"본문을 {selector} 선택자로 찾음")
                     break
         
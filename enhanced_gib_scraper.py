@@ -368,8 +368,7 @@ class EnhancedGIBScraper(StandardTableScraper):
         # 본문 내용 변환
         if content_area:
             try:
-                content_html = str(content_area)
-                content_markdown = self.h.handle(content_html)
+                content_markdown = self.h.handle(content_area)
                 
                 # 내용 정리
                 content_markdown = re.sub(r'\n\s*\n\s*\n', '\n\n', content_markdown)
@@ -386,24 +385,8 @@ class EnhancedGIBScraper(StandardTableScraper):
         return content_md
     
     def _find_largest_text_block(self, soup: BeautifulSoup) -> Optional[BeautifulSoup]:
-        """가장 큰 텍스트 블록 찾기"""
-        all_divs = soup.find_all('div')
-        max_text_div = None
-        max_text_len = 0
-        
-        for div in all_divs:
-            # 네비게이션과 헤더 div 제외
-            if div.get('class'):
-                class_str = ' '.join(div.get('class'))
-                if any(skip in class_str for skip in ['nav', 'header', 'footer', 'menu', 'gnb', 'lnb']):
-                    continue
-            
-            text = div.get_text(strip=True)
-            if len(text) > max_text_len and len(text) > 100:
-                max_text_len = len(text)
-                max_text_div = div
-        
-        return max_text_div
+        """가장 큰 텍스트 블록 찾기 - 네비게이션/헤더 div 제외"""
+        return self.find_main_content_block(soup, tags=['div'])
     
     def _extract_detail_attachments(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """상세 페이지 첨부파일 추출 - GIB 특화"""
@@ -614,13 +597,16 @@ class EnhancedGIBScraper(StandardTableScraper):
         
         # 첨부파일 다운로드
         self._download_attachments(detail['attachments'], folder_path)
+
+        # 직접 저장한 폴더를 매니페스트/레코드에 기록
+        self.record_saved_folder(folder_path, announcement)
         
         # 처리된 제목으로 추가
         self.add_processed_title(announcement['title'])
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
     
     def _download_attachments(self, attachments: List[Dict[str, Any]], folder_path: str):
         """GIB 전용 첨부파일 다운로드 오버라이드"""
@@ -853,7 +839,7 @@ class EnhancedGIBScraper(StandardTableScraper):
                 
                 # 페이지 간 대기
                 if page_num < max_pages and self.delay_between_pages > 0:
-                    time.sleep(self.delay_between_pages)
+                    self.sleep(self.delay_between_pages, 'page_delay')
                 
             except Exception as e:
                 logger.error(f"페이지 {page_num} 처리 중 오류: {e}")
@@ -171,7 +171,7 @@ class EnhancedGIPAScraper(StandardTableScraper):
             
             if content_area:
                 # 본문을 markdown으로 변환
-                content_text = self.h.handle(str(content_area))
+                content_text = self.h.handle(content_area)
                 result['content'] = content_text
                 logger.debug(f"본문을 .board_content 선택자로 찾음")
             else:
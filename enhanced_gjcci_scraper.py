@@ -299,13 +299,16 @@ class EnhancedGJCCIScraper(StandardTableScraper):
         
         # 첨부파일 다운로드
         self._download_attachments(detail['attachments'], folder_path)
+
+        # 직접 저장한 폴더를 매니페스트/레코드에 기록
+        self.record_saved_folder(folder_path, announcement)
         
         # 처리된 제목으로 추가
         self.add_processed_title(announcement['title'])
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
     
     def _create_meta_info(self, announcement: dict) -> str:
         """메타 정보 생성"""
@@ -321,8 +321,7 @@ class EnhancedGjcitylibScraper(StandardTableScraper):
             # 본문 내용 변환
             if content_elem:
                 # HTML을 마크다운으로 변환
-                content_html = str(content_elem)
-                content_markdown = self.h.handle(content_html)
+                content_markdown = self.h.handle(content_elem)
                 content_parts.append(content_markdown.strip())
             else:
                 # 본문을 찾지 못한 경우 전체 페이지에서 추출
@@ -504,7 +503,7 @@ class EnhancedGjcitylibScraper(StandardTableScraper):
         
         # 요청 간 대기 (웹 방화벽 우회용 긴 대기)
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
     
     def _create_meta_info(self, announcement: Dict[str, Any]) -> str:
         """메타 정보 생성"""
@@ -221,7 +221,7 @@ class EnhancedGJTPScraper(StandardTableScraper):
             if any(keyword in table_text for keyword in ['지원규모', '접수기간', '사업기간', '사업목적', '사업내용', '지원대상']):
                 try:
                     # 테이블을 마크다운으로 변환
-                    table_md = self.h.handle(str(table))
+                    table_md = self.h.handle(table)
                     content_parts.append(table_md)
                     logger.debug("테이블을 본문으로 추가")
                 except Exception as e:
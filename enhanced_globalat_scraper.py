@@ -259,8 +259,7 @@ class EnhancedGlobalatScraper(StandardTableScraper):
             for tag in content_area.find_all(['script', 'style', 'nav', 'header', 'footer']):
                 tag.decompose()
             
-            content_html = str(content_area)
-            content_text = self.h.handle(content_html)
+            content_text = self.h.handle(content_area)
             
             # 내용 정리 - 불필요한 줄바꿈 제거
             content_text = re.sub(r'\n\s*\n\s*\n', '\n\n', content_text)
@@ -527,7 +526,7 @@ class EnhancedGlobalatScraper(StandardTableScraper):
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
 
 # 하위 호환성을 위한 별칭
 GlobalatScraper = EnhancedGlobalatScraper
\ No newline at end of file
@@ -194,8 +194,7 @@ class EnhancedGNAGPScraper(StandardTableScraper):
             for tag in content_area.find_all(['script', 'style', 'nav', 'header', 'footer']):
                 tag.decompose()
             
-            content_html = str(content_area)
-            content_text = self.h.handle(content_html)
+            content_text = self.h.handle(content_area)
             
             # 내용 정리 - 불필요한 줄바꿈 제거
             content_text = re.sub(r'\n\s*\n\s*\n', '\n\n', content_text)
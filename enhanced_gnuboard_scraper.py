@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""
+그누보드(bbs/board.php?bo_table=) 게시판 공용 스크래퍼
+호스트와 bo_table만으로 설정하며, 스킨과 무관하게 wr_id 링크로 목록을 읽고
+download.php?bo_table=&wr_id=&no= 첨부파일, bbs/rss.php 변경 피드를 사용한다.
+"""
+
+import re
+import logging
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from urllib.parse import urljoin, urlparse, parse_qs, urlencode
+from typing import Dict, List, Any, Optional
+
+from bs4 import BeautifulSoup, Tag
+
+from enhanced_base_scraper import StandardTableScraper
+from announcement_model import Announcement
+
+logger = logging.getLogger(__name__)
+
+# 0424full.csv의 그누보드 게시판 - site_code: (기관명, 게시판 URL)
+GNUBOARD_SITES = {
+    'sjtp': ('(재)세종테크노파크', 'https://sjtp.or.kr/bbs/board.php?bo_table=business01'),
+    'jbba': ('전북특별자치도경제통상진흥원', 'https://www.jbba.kr/bbs/board.php?bo_table=sub01_09'),
+    'gwbaInfo': ('강원특별자치도경제진흥원', 'https://www.gwep.or.kr/bbs/board.php?bo_table=gw_sub21'),
+    'debc': ('장애인기업종합지원센터', 'https://www.debc.or.kr/bbs/board.php?bo_table=s2_2'),
+    'jbsos': ('전북소상공인광역지원센터', 'https://www.jbsos.or.kr/bbs/board.php?bo_table=s_sub04_01'),
+    'dctf': ('동해문화관광재단', 'https://dctf.or.kr/bbs/board.php?bo_table=3_sub1'),
+    'gwse': ('강원지속가능경제지원센터', 'https://gwse.or.kr/bbs/board.php?bo_table=sub41&sca=%EC%82%AC%EC%97%85%EA%B3%B5%EA%B3%A0'),
+    'agrimst': ('충남농업마이스터대학', 'https://agrimst.com/bbs/board.php?bo_table=brd5_1&top=5&sub=1'),
+    'jnse': ('전남사회적경제통합지원센터', 'http://www.jn-se.kr/bbs/board.php?bo_table=nco4_1'),
+    'gcaf': ('경남문화예술진흥원', 'https://www.gcaf.or.kr/bbs/board.php?bo_table=sub3_7'),
+    'gnagp': ('경상남도항노화플랫폼', 'http://www.gnagp.com/bbs/board.php?bo_table=sub4_1'),
+    'gnlife': ('경남50+행복내일센터', 'http://gnlife5064.kr/bbs/board.php?bo_table=notice'),
+    'haenamloca': ('해남먹거리통합지원센터', 'https://haenamlocalfood.kr/bbs/board.php?bo_table=lf4_1'),
+    'cngec': ('충남녹색환경지원센터', 'http://www.cngec.or.kr/bbs/board.php?bo_table=notice'),
+    'cpri': ('철원플라즈마산업기술연구원', 'http://www.cpri.re.kr/bbs/board.php?bo_table=sub1_1_1'),
+    'gei': ('녹색에너지연구원', 'http://www.gei.re.kr/bbs/board.php?bo_table=bbs7_01'),
+    'gnwomenwork': ('경남여성새로일하기센터', 'https://www.gnwomenwork.or.kr/bri/board.php?bo_table=notice&menu=10'),
+    'jmbic': ('(재)전남바이오진흥원 해양바이오연구센터', 'http://www.jmbic.or.kr/bbs/board.php?code=open_08&bo_table=open_08'),
+    'jnsec': ('사단법인 상생나무', 'http://www.jnsec.kr/bbs/board.php?bo_table=notice'),
+    'liquorfest': ('광주주류관광페스타', 'https://www.liquorfesta.com/bbs/board.php?bo_table=notice'),
+    'scherb': ('산청한방약초축제', 'http://www.scherb.or.kr/bbs/board.php?bo_table=sub7_1'),
+    'gsff': ('재단법인군산먹거리통합지원센터', 'https://www.gsff.or.kr/bbs/board.php?bo_table=sub03_01'),
+    'gnsinbo': ('경남신용보증재단', 'https://www.gnsinbo.or.kr/bbs/board.php?bo_table=6_2_1'),
+}
+
+# 그누보드 기본/일반 스킨의 본문 영역
+CONTENT_SELECTORS = ['#bo_v_con', '.bo_v_con', '#bo_v_atc', 'article#bo_v', '.view_content', '#view_content']
+
+DATE_PATTERN = re.compile(r'(\d{2,4})[-./](\d{1,2})[-./](\d{1,2})')
+TIME_PATTERN = re.compile(r'^\d{1,2}:\d{2}$')
+FILE_SIZE_PATTERN = re.compile(r'\s*\(\s*[\d.,]+\s*[KMG]?B?\s*\)\s*$', re.I)
+
+
+class EnhancedGnuboardScraper(StandardTableScraper):
+    """그누보드 게시판 공용 스크래퍼
+
+    board_url(board.php?bo_table=...)이나 GNUBOARD_SITES의 site_code로 생성한다.
+    목록은 wr_id 링크를 게시물 단위로 묶어 읽으므로 테이블/목록형 스킨 모두 처리하고,
+    wr_id를 안정 ID와 최고 수위로 사용한다. RSS가 켜진 게시판은 최신 wr_id가 최고 수위 이하면
+    목록을 요청하지 않고 종료한다.
+    """
+
+    def __init__(self, board_url: Optional[str] = None, site_code: Optional[str] = None):
+        super().__init__()
+        if site_code and not board_url:
+            if site_code not in GNUBOARD_SITES:
+                raise ValueError(f"알 수 없는 그누보드 사이트: {site_code}")
+            board_url = GNUBOARD_SITES[site_code][1]
+        if not board_url:
+            raise ValueError("board_url 또는 site_code가 필요합니다")
+
+        parsed = urlparse(board_url)
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        self.bo_table = query.pop('bo_table', None)
+        if not self.bo_table:
+            raise ValueError(f"bo_table이 없는 게시판 URL: {board_url}")
+        query.pop('page', None)
+
+        self.site_code = site_code
+        self.base_url = f"{parsed.scheme}://{parsed.netloc}"
+        self.bbs_url = f"{self.base_url}{parsed.path.rsplit('/', 1)[0]}"  # .../bbs
+        self.list_params = {'bo_table': self.bo_table, **query}  # sca, menu 등 게시판 필터 유지
+        self.list_url = f"{self.bbs_url}/board.php?{urlencode(self.list_params)}"
+        self.feed_url = f"{self.bbs_url}/rss.php?bo_table={self.bo_table}"
+
+        self.list_container = {'name': 'form', 'attrs': {'name': 'fboardlist'}}
+        self.id_rules = [{'field': 'wr_id'}]
+        self.watermark_kind = 'id'
+        self.use_feed = True
+
+        self._wr_id_patterns = [
+            re.compile(r'[?&]wr_id=(\d+)'),
+            re.compile(rf'/{re.escape(self.bo_table)}/(\d+)(?:[/?#]|$)'),  # 짧은 주소
+        ]
+
+    def get_site_key(self) -> str:
+        """상태 파일명 - 같은 클래스를 여러 게시판이 쓰므로 게시판별로 구분"""
+        if self.site_code:
+            return self.site_code
+        return f"gnuboard_{urlparse(self.base_url).netloc.replace('.', '_')}_{self.bo_table}"
+
+    def get_list_url(self, page_num: int) -> str:
+        if page_num == 1:
+            return self.list_url
+        return f"{self.list_url}&page={page_num}"
+
+    def get_view_url(self, wr_id: str) -> str:
+        """상세 URL - 목록의 page/sca 등을 뺀 정규 형태"""
+        return f"{self.bbs_url}/board.php?bo_table={self.bo_table}&wr_id={wr_id}"
+
+    def extract_wr_id(self, href: str) -> Optional[str]:
+        """링크에서 이 게시판의 wr_id 추출"""
+        if not href:
+            return None
+        table = re.search(r'bo_table=([^&#\'"]+)', href)
+        if table and table.group(1) != self.bo_table:
+            return None
+        for pattern in self._wr_id_patterns:
+            match = pattern.search(href)
+            if match:
+                return match.group(1)
+        return None
+
+    def parse_list_page(self, html_content: str) -> List[Announcement]:
+        """목록 파싱 - wr_id 링크를 게시물별로 묶고 가장 긴 링크 텍스트를 제목으로 사용"""
+        soup = self._parse_list_html(html_content)
+        posts: Dict[str, Dict[str, Any]] = {}
+
+        for link in soup.find_all('a', href=True):
+            wr_id = self.extract_wr_id(link['href'])
+            if not wr_id:
+                continue
+            # 댓글 수, '새글' 아이콘 텍스트 등은 제외
+            for extra in link.select('.cnt_cmt, .sound_only, .new_icon, .fa'):
+                extra.decompose()
+            text = link.get_text(' ', strip=True)
+
+            post = posts.setdefault(wr_id, {'title': '', 'row': link.find_parent(['tr', 'li']) or link.parent})
+            if len(text) > len(post['title']):
+                post['title'] = text
+
+        announcements = []
+        for wr_id, post in posts.items():
+            if not post['title']:
+                continue
+            announcement = Announcement(title=post['title'], url=self.get_view_url(wr_id), wr_id=wr_id)
+            self._extract_row_meta(post['row'], announcement)
+            announcements.append(announcement)
+
+        logger.info(f"[{self.bo_table}] 목록 {len(announcements)}개 파싱")
+        return announcements
+
+    def _extract_row_meta(self, row: Tag, announcement: Dict[str, Any]):
+        """행에서 공지 여부, 번호, 작성자, 작성일 추출 (기본 스킨 클래스 우선, 없으면 텍스트 패턴)"""
+        if row is None:
+            return
+        classes = ' '.join(row.get('class') or [])
+        number_cell = row.select_one('.td_num2, .td_num, .num')
+        number = number_cell.get_text(strip=True) if number_cell else ''
+        if 'notice' in classes or number == '공지' or row.select_one('.notice_icon, .bo_notice'):
+            announcement['is_notice'] = True
+        if number:
+            announcement['number'] = number
+
+        writer = row.select_one('.td_name .sv_member, .td_name, .sv_member, .writer')
+        if writer:
+            announcement['writer'] = writer.get_text(strip=True)
+
+        date_cell = row.select_one('.td_datetime, .datetime, .date')
+        texts = [date_cell.get_text(strip=True)] if date_cell else list(row.stripped_strings)
+        for text in texts:
+            match = DATE_PATTERN.search(text)
+            if match:
+                year, month, day = match.groups()
+                year = f"20{year}" if len(year) == 2 else year
+                announcement['date'] = f"{year}-{int(month):02d}-{int(day):02d}"
+                break
+            if TIME_PATTERN.match(text):
+                # 오늘 글은 시각만 표시
+                announcement['date'] = datetime.now().strftime('%Y-%m-%d')
+                break
+
+    def parse_detail_page(self, html_content: str, url: str = None) -> Dict[str, Any]:
+        """상세 파싱 - 본문(#bo_v_con)과 첨부파일(download.php)"""
+        soup = BeautifulSoup(html_content, 'html.parser')
+
+        content_area = None
+        for selector in CONTENT_SELECTORS:
+            content_area = soup.select_one(selector)
+            if content_area:
+                break
+        if content_area is None:
+            content_area = self.find_main_content_block(soup)
+
+        content = ''
+        if content_area is not None:
+            for tag in content_area.find_all(['script', 'style']):
+                tag.decompose()
+            content = self.h.handle(content_area)
+
+        wr_id = self.extract_wr_id(url or '')
+        return {
+            'content': content,
+            'attachments': self._extract_attachments(soup, wr_id),
+        }
+
+    def _extract_attachments(self, soup: BeautifulSoup, wr_id: Optional[str]) -> List[Dict[str, Any]]:
+        """첨부파일 - href/onclick의 download.php 링크, 링크가 없으면 파일 목록 순서로 no= 구성"""
+        attachments = []
+        seen = set()
+
+        for link in soup.find_all('a'):
+            target = ' '.join(filter(None, [link.get('href'), link.get('onclick')]))
+            match = re.search(r'download\.php\?[^\'"\s]+', target)
+            if not match:
+                continue
+            file_url = urljoin(f"{self.bbs_url}/", match.group(0).replace('&amp;', '&'))
+            if file_url in seen:
+                continue
+            seen.add(file_url)
+            attachments.append({'name': self._attachment_name(link, len(attachments)), 'url': file_url})
+
+        if not attachments and wr_id:
+            # 스크립트로만 내려받는 스킨 - 파일 목록 순서가 no 값
+            for no, item in enumerate(soup.select('#bo_v_file li')):
+                attachments.append({
+                    'name': self._attachment_name(item, no),
+                    'url': f"{self.bbs_url}/download.php?bo_table={self.bo_table}&wr_id={wr_id}&no={no}",
+                })
+
+        return attachments
+
+    @staticmethod
+    def _attachment_name(element: Tag, index: int) -> str:
+        """파일명 - <strong> 우선, 없으면 링크 텍스트에서 파일 크기 표시 제거"""
+        strong = element.find('strong')
+        name = (strong or element).get_text(' ', strip=True)
+        name = FILE_SIZE_PATTERN.sub('', name).strip()
+        return name or f"attachment_{index + 1}"
+
+    def fetch_feed(self) -> Optional[List[Dict[str, Any]]]:
+        """RSS 피드의 게시물 목록 - 피드를 쓰지 않는 게시판이면 None"""
+        self._fetch_phase = 'list_fetch'
+        try:
+            response = self.get_page(self.feed_url)
+        finally:
+            self._fetch_phase = 'detail_fetch'
+        if response is None or b'<rss' not in response.content[:512]:
+            return None
+
+        try:
+            root = ET.fromstring(response.content)
+        except ET.ParseError as e:
+            logger.debug(f"[{self.bo_table}] RSS 파싱 실패: {e}")
+            return None
+
+        items = []
+        for item in root.iter('item'):
+            wr_id = self.extract_wr_id(item.findtext('link') or '')
+            if wr_id:
+                items.append({'title': (item.findtext('title') or '').strip(), 'wr_id': int(wr_id)})
+        return items
+
+    def has_new_posts(self, output_base: str = 'output') -> bool:
+        """RSS 최신 wr_id가 최고 수위보다 큰지 - 판단할 수 없으면 True"""
+        self.load_high_water(output_base)
+        if not self.high_water or self.high_water['kind'] != 'id':
+            return True
+
+        items = self.fetch_feed()
+        if not items:
+            return True
+
+        newest = max(item['wr_id'] for item in items)
+        logger.info(f"[{self.bo_table}] RSS 최신 wr_id {newest}, 최고 수위 {self.high_water['value']}")
+        return newest > self.high_water['value']
+
+    def scrape_pages(self, max_pages: int = 4, output_base: str = 'output'):
+        """RSS로 새 글이 없음을 확인하면 목록 요청 없이 종료"""
+        if self.use_feed and not self.has_new_posts(output_base):
+            logger.info(f"[{self.bo_table}] 새 게시물 없음 (RSS) - 수집 생략")
+            return True
+        return super().scrape_pages(max_pages=max_pages, output_base=output_base)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='그누보드 게시판 수집')
+    parser.add_argument('site', help=f"site_code ({', '.join(GNUBOARD_SITES)}) 또는 board.php URL")
+    parser.add_argument('--pages', type=int, default=3, help='최대 페이지 수')
+    parser.add_argument('--output', help='출력 디렉토리 (기본: output/<site>)')
+    parser.add_argument('--no-feed', action='store_true', help='RSS 변경 확인 사용 안 함')
+    args = parser.parse_args()
+
+    if args.site.startswith('http'):
+        scraper = EnhancedGnuboardScraper(board_url=args.site)
+    else:
+        scraper = EnhancedGnuboardScraper(site_code=args.site)
+    scraper.use_feed = not args.no_feed
+    scraper.scrape_pages(max_pages=args.pages, output_base=args.output or f"output/{scraper.get_site_key()}")
@@ -266,7 +266,7 @@ class EnhancedGtpScraper(StandardTableScraper):
         for selector in content_areas:
             area = soup.select_one(selector)
             if area:
-                main_content = self.h.handle(str(area))
+                main_content = self.h.handle(area)
                 logger.debug(f"{selector}에서 본문 추출")
                 break
         
@@ -278,8 +278,7 @@ class EnhancedGtpScraper(StandardTableScraper):
             
             for p in img_paragraphs:
                 if p.find('img'):
-                    img_html = str(p)
-                    img_content.append(self.h.handle(img_html))
+                    img_content.append(self.h.handle(p))
             
             if img_content:
                 main_content = "\n\n".join(img_content)
@@ -291,7 +290,7 @@ class EnhancedGtpScraper(StandardTableScraper):
             for elem in all_paragraphs:
                 text = elem.get_text(strip=True)
                 if len(text) > 100:  # 충분히 긴 텍스트
-                    main_content = self.h.handle(str(elem))
+                    main_content = self.h.handle(elem)
                     logger.debug("긴 텍스트 영역에서 본문 추출")
                     break
         
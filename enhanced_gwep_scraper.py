@@ -212,7 +212,7 @@ class EnhancedGwepScraper(StandardTableScraper):
         if content_area:
             # bo_v_con 영역에서 본문 추출
             try:
-                result['content'] = self.h.handle(str(content_area))
+                result['content'] = self.h.handle(content_area)
                 logger.debug("bo_v_con 영역에서 본문 추출 완료")
             except Exception as e:
                 logger.error(f"HTML to Markdown 변환 실패: {e}")
@@ -232,7 +232,7 @@ class EnhancedGwepScraper(StandardTableScraper):
                 content_elem = soup.select_one(selector)
                 if content_elem:
                     try:
-                        result['content'] = self.h.handle(str(content_elem))
+                        result['content'] = self.h.handle(content_elem)
                         logger.debug(f"{selector} 선택자로 본문 추출 완료")
                         break
                     except Exception as e:
@@ -170,8 +170,7 @@ class EnhancedHaenamLocalFoodScraper(StandardTableScraper):
                 if src and not src.startswith('http'):
                     img['src'] = urljoin(self.base_url, src)
             
-            content_html = str(content_area)
-            content_text = self.h.handle(content_html)
+            content_text = self.h.handle(content_area)
             
             # 내용 정리 - 불필요한 줄바꿈 제거
             content_text = re.sub(r'\n\s*\n\s*\n', '\n\n', content_text)
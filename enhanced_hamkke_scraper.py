@@ -53,7 +53,7 @@ class EnhancedHamkkeScraper(StandardTableScraper):
         """Context manager for Playwright"""
         self.playwright = sync_playwright().start()
         self.browser = self.playwright.chromium.launch(headless=True)
-        self.page = self.browser.new_page()
+        self.page = self.guard_page(self.browser.new_page())
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -400,8 +400,7 @@ class EnhancedHamkkeScraper(StandardTableScraper):
                 if src and not src.startswith('http'):
                     img['src'] = urljoin(self.base_url, src)
             
-            content_html = str(content_area)
-            content_text = self.h.handle(content_html)
+            content_text = self.h.handle(content_area)
             content_text = re.sub(r'\n\s*\n\s*\n', '\n\n', content_text).strip()
             
             # 최소 길이 확인 (너무 짧으면 다른 선택자 시도)
@@ -414,7 +413,7 @@ class EnhancedHamkkeScraper(StandardTableScraper):
                     for unwanted in body.find_all(['nav', 'header', 'footer', '.header', '.footer', '.nav']):
                         unwanted.decompose()
                     
-                    content_text = self.h.handle(str(body))
+                    content_text = self.h.handle(body)
                     content_text = re.sub(r'\n\s*\n\s*\n', '\n\n', content_text).strip()
         else:
             content_text = "내용을 추출할 수 없습니다."
@@ -12,13 +12,13 @@ import os
 import json
 import base64
 from urllib.parse import urljoin, parse_qs, urlparse, unquote
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import AjaxAPIScraper
 import time
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 logger = logging.getLogger(__name__)
 
-class EnhancedIrisScraper(StandardTableScraper):
+class EnhancedIrisScraper(AjaxAPIScraper):
     """국가과학기술연구회(IRIS) 전용 스크래퍼 - 향상된 버전"""
     
     def __init__(self):
@@ -52,6 +52,10 @@ class EnhancedIrisScraper(StandardTableScraper):
         self.timeout = 30
         self.delay_between_requests = 2
         
+        # 목록 API 페이지 크기 (pageUnit) - 서버가 받아들이는 최대 크기로 확대
+        self.page_size = 10
+        self.page_size_param = 'pageUnit'
+        
         # 세션 데이터 캐시
         self._session_initialized = False
         
@@ -92,7 +96,7 @@ class EnhancedIrisScraper(StandardTableScraper):
             logger.error(f"세션 초기화 실패: {e}")
             return False
     
-    def get_page_data(self, page_num: int) -> dict:
+    def get_page_data(self, page_num: int, page_size: Optional[int] = None) -> dict:
         """POST 요청으로 페이지 데이터 가져오기"""
         if not self._initialize_session():
             return None
@@ -101,7 +105,7 @@ class EnhancedIrisScraper(StandardTableScraper):
             # IRIS POST 요청 데이터
             post_data = {
                 'pageIndex': str(page_num),
-                'pageUnit': '10',
+                'pageUnit': str(page_size or self.page_size),
                 'searchKeyword': '',
                 'searchCondition': '',
                 'searchBgnDe': '',
@@ -151,6 +155,13 @@ class EnhancedIrisScraper(StandardTableScraper):
             logger.error(f"{page_num}페이지 데이터 가져오기 실패: {e}")
             return None
     
+    def fetch_api_page(self, page_num: int, page_size: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """목록 물리 페이지 가져오기"""
+        page_data = self.get_page_data(page_num, page_size)
+        if not page_data:
+            return None
+        return self.parse_list_page(page_data)
+    
     def parse_list_page(self, page_data: dict) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - JSON 우선, HTML 폴백"""
         announcements = []
@@ -507,8 +518,7 @@ class EnhancedIrisScraper(StandardTableScraper):
         
         if main_content:
             # HTML을 마크다운으로 변환
-            content_html = str(main_content)
-            markdown_content = self.h.handle(content_html)
+            markdown_content = self.h.handle(main_content)
             content_parts.append(markdown_content)
         else:
             # 폴백: 의미있는 텍스트 블록 추출
@@ -714,19 +724,15 @@ class EnhancedIrisScraper(StandardTableScraper):
                 logger.error("세션 초기화 실패")
                 return False
             
+            # 목록 API 페이지 크기 탐색 결과
+            self.load_endpoint_cache(output_base)
             total_processed = 0
             
             for page_num in range(1, max_pages + 1):
                 logger.info(f"\n=== IRIS {page_num}페이지 처리 시작 ===")
                 
-                # 페이지 데이터 가져오기
-                page_data = self.get_page_data(page_num)
-                if not page_data:
-                    logger.error(f"{page_num}페이지 데이터 가져오기 실패")
-                    break
-                
-                # 목록 파싱
-                announcements = self.parse_list_page(page_data)
+                # 목록 가져오기 (확대된 페이지에서 잘라 옴)
+                announcements = self._get_page_announcements(page_num)
                 if not announcements:
                     logger.warning(f"{page_num}페이지에 공고가 없습니다")
                     break
@@ -810,7 +816,7 @@ class EnhancedIrisScraper(StandardTableScraper):
                         total_processed += 1
                         logger.info(f"처리 완료: {title} (첨부파일 정보: {len(attachments)}개)")
                         
-                        time.sleep(self.delay_between_requests)
+                        self.sleep(self.delay_between_requests)
                         
                     except Exception as e:
                         logger.error(f"공고 처리 중 오류: {e}")
@@ -819,6 +825,7 @@ class EnhancedIrisScraper(StandardTableScraper):
                 logger.info(f"{page_num}페이지 처리 완료")
                 time.sleep(3)
             
+            self.save_endpoint_cache()
             logger.info(f"\n=== IRIS 스크래핑 완료: 총 {total_processed}개 공고 처리 ===")
             return True
             
@@ -136,12 +136,12 @@ class EnhancedITPScraper(JavaScriptScraper):
         # 본문을 마크다운으로 변환
         content_md = ""
         if content_area:
-            content_md = self.h.handle(str(content_area))
+            content_md = self.h.handle(content_area)
         else:
             # 전체 페이지에서 헤더/푸터 제외하고 추출 시도
             main_content = soup.find('div', class_='content_area') or soup.find('div', id='content')
             if main_content:
-                content_md = self.h.handle(str(main_content))
+                content_md = self.h.handle(main_content)
                 
         return {
             'content': content_md,
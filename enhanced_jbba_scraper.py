@@ -210,8 +210,7 @@ class EnhancedJBBAScraper(StandardTableScraper):
         
         if main_content:
             # HTML을 마크다운으로 변환
-            content_html = str(main_content)
-            markdown_content = self.h.handle(content_html)
+            markdown_content = self.h.handle(main_content)
             content_parts.append(markdown_content)
         else:
             # 폴백: 전체 페이지에서 의미있는 텍스트 추출
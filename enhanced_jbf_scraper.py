@@ -198,7 +198,7 @@ class EnhancedJBFScraper(StandardTableScraper):
         
         if content_area:
             # HTML을 마크다운으로 변환
-            return self.h.handle(str(content_area))
+            return self.h.handle(content_area)
         else:
             logger.warning("본문 내용을 찾을 수 없습니다")
             logger.debug(f"HTML 길이: {len(str(soup))}")
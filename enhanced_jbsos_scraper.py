@@ -222,8 +222,7 @@ class EnhancedJBSOSScraper(StandardTableScraper):
                 tag.decompose()
             
             # HTML을 마크다운으로 변환
-            content_html = str(main_content)
-            markdown_content = self.h.handle(content_html)
+            markdown_content = self.h.handle(main_content)
             content_parts.append("\n## 본문 내용")
             content_parts.append(markdown_content)
         else:
@@ -238,8 +237,7 @@ class EnhancedJBSOSScraper(StandardTableScraper):
                 # 본문 섹션 찾기
                 content_section = article.find('div', string=re.compile(r'본문'))
                 if content_section and content_section.parent:
-                    content_html = str(content_section.parent)
-                    markdown_content = self.h.handle(content_html)
+                    markdown_content = self.h.handle(content_section.parent)
                     content_parts.append("\n## 본문 내용")
                     content_parts.append(markdown_content)
         
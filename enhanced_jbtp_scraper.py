@@ -204,9 +204,8 @@ class EnhancedJbtpScraper(StandardTableScraper):
         
         # HTML을 마크다운으로 변환
         if content_area:
-            content_html = str(content_area)
             try:
-                result['content'] = self.h.handle(content_html)
+                result['content'] = self.h.handle(content_area)
             except Exception as e:
                 logger.error(f"HTML to Markdown 변환 실패: {e}")
                 result['content'] = content_area.get_text(separator='\n', strip=True)
@@ -52,7 +52,7 @@ class EnhancedJciaScraper(StandardTableScraper):
         try:
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+                page = self.guard_page(browser.new_page())
                 
                 # User-Agent 설정
                 page.set_extra_http_headers({
@@ -238,7 +238,7 @@ class EnhancedJciaScraper(StandardTableScraper):
         
         # HTML을 마크다운으로 변환
         try:
-            content_markdown = self.h.handle(str(content_area))
+            content_markdown = self.h.handle(content_area)
             return content_markdown.strip()
         except Exception as e:
             logger.error(f"마크다운 변환 실패: {e}")
@@ -423,7 +423,7 @@ class EnhancedJciaScraper(StandardTableScraper):
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
 
 
 # 하위 호환성을 위한 별칭
@@ -201,7 +201,7 @@ class EnhancedJejuCCIScraper(StandardTableScraper):
         content_td = soup.find('td', class_='td_p')
         if content_td:
             # HTML을 마크다운으로 변환
-            content = self.h.handle(str(content_td))
+            content = self.h.handle(content_td)
         else:
             # 대체 방법: boardveiw 테이블에서 내용 추출
             boardview = soup.find('div', class_='boardveiw')
@@ -213,7 +213,7 @@ class EnhancedJejuCCIScraper(StandardTableScraper):
                     tds = row.find_all('td')
                     for td in tds:
                         if td.get('colspan') == '4' and 'td_p' in td.get('class', []):
-                            content = self.h.handle(str(td))
+                            content = self.h.handle(td)
                             break
                     if content:
                         break
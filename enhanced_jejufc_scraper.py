@@ -65,7 +65,7 @@ class EnhancedJEJUFCScraper(StandardTableScraper):
                 headless=True,
                 args=['--no-sandbox', '--disable-dev-shm-usage']
             )
-            self.page = self.browser.new_page()
+            self.page = self.guard_page(self.browser.new_page())
             
             # 페이지 설정
             self.page.set_viewport_size({"width": 1920, "height": 1080})
@@ -445,6 +445,9 @@ class EnhancedJEJUFCScraper(StandardTableScraper):
                 except Exception as e:
                     logger.error(f"첨부파일 처리 중 오류: {e}")
         
+        # 직접 저장한 폴더를 매니페스트/레코드에 기록
+        self.record_saved_folder(output_folder, announcement)
+        
         logger.info(f"공고 처리 완료: {folder_name}")
     
     def _extract_attachments(self, soup: BeautifulSoup, page_url: str = None) -> List[Dict[str, Any]]:
@@ -196,7 +196,7 @@ class EnhancedJEPAScraper(StandardTableScraper):
         content_div = soup.find('div', class_='board_view_contents')
         if content_div:
             # HTML을 마크다운으로 변환
-            content = self.h.handle(str(content_div))
+            content = self.h.handle(content_div)
             logger.debug("본문을 board_view_contents div에서 추출")
         
         # 기본 추출에 실패한 경우 대체 방법들
@@ -216,7 +216,7 @@ class EnhancedJEPAScraper(StandardTableScraper):
             if not content or len(content.strip()) < 50:
                 board_view = soup.find('div', class_='board_view')
                 if board_view:
-                    content = self.h.handle(str(board_view))
+                    content = self.h.handle(board_view)
                     logger.debug("본문을 board_view div 전체에서 추출")
             
             # 3. 최후 수단: 텍스트가 많은 div 찾기
@@ -234,7 +234,7 @@ class EnhancedJEPAScraper(StandardTableScraper):
                             best_div = div
                 
                 if best_div:
-                    content = self.h.handle(str(best_div))
+                    content = self.h.handle(best_div)
                     logger.info(f"대체 방법으로 본문 추출 완료 (길이: {len(content)})")
         
         # 첨부파일 정보 추출
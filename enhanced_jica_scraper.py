@@ -202,7 +202,7 @@ class EnhancedJicaScraper(StandardTableScraper):
                 content_text = '\n'.join(lines[:100])
         else:
             # HTML을 마크다운으로 변환
-            content_text = self.h.handle(str(content_area))
+            content_text = self.h.handle(content_area)
             # 과도한 줄바꿈 정리
             content_text = re.sub(r'\n{3,}', '\n\n', content_text)
         
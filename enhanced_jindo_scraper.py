@@ -191,7 +191,7 @@ class EnhancedJindoScraper(StandardTableScraper):
                           for keyword in ['content', 'body', 'article', 'text']):
                         text = div.get_text(strip=True)
                         if text and len(text) > 50:
-                            content_parts.append(self.h.handle(str(div)))
+                            content_parts.append(self.h.handle(div))
                             break
         
         # 3. 최종 대체 방법: 긴 텍스트가 있는 요소 찾기
@@ -202,7 +202,7 @@ class EnhancedJindoScraper(StandardTableScraper):
                 text = elem.get_text(strip=True)
                 if len(text) > 100:  # 100자 이상인 경우 본문으로 간주
                     logger.debug(f"긴 텍스트 영역을 본문으로 사용: {len(text)}자")
-                    content_parts.append(self.h.handle(str(elem)))
+                    content_parts.append(self.h.handle(elem))
                     break
         
         if not content_parts:
@@ -232,8 +232,7 @@ class EnhancedKBANScraper(StandardTableScraper):
                                             if href and not href.startswith('http') and not href.startswith('javascript'):
                                                 link['href'] = urljoin(self.base_url, href)
                                         
-                                        iframe_html = str(iframe_body)
-                                        content_text = self.h.handle(iframe_html)
+                                        content_text = self.h.handle(iframe_body)
                                         content_text = re.sub(r'\n\s*\n\s*\n', '\n\n', content_text).strip()
                                         logger.debug(f"iframe URL에서 콘텐츠 추출: {len(content_text)}자")
                                         
@@ -287,8 +286,7 @@ class EnhancedKBANScraper(StandardTableScraper):
                         if src and not src.startswith('http'):
                             img['src'] = urljoin(self.base_url, src)
                     
-                    content_html = str(content_area)
-                    content_text = self.h.handle(content_html)
+                    content_text = self.h.handle(content_area)
                     content_text = re.sub(r'\n\s*\n\s*\n', '\n\n', content_text).strip()
                     
                     if len(content_text) >= 50:
@@ -522,20 +520,25 @@ class EnhancedKBANScraper(StandardTableScraper):
                 expected_filename = known_files_by_id[file_id]
                 logger.debug(f"ID {file_id}에 대한 알려진 파일: {expected_filename}")
                 
-                # KBAN fileUpload.js 분석 결과를 바탕으로 한 다운로드 URL 패턴
-                download_patterns = [
+                # KBAN fileUpload.js 분석 결과를 바탕으로 한 다운로드 URL 패턴 (엔드포인트 캐시 적용)
+                download_templates = [
                     # 표준 download.do 패턴
-                    f"/download.do?file={file_id}/{expected_filename}&oldFile={expected_filename}",
+                    "/download.do?file={file_id}/{filename}&oldFile={filename}",
                     # ETR 타입 다운로드
-                    f"/download3.do?type=etr&file={file_id}/{expected_filename}&oldFile={expected_filename}",
+                    "/download3.do?type=etr&file={file_id}/{filename}&oldFile={filename}",
                     # 인코딩된 파일명 버전
-                    f"/download.do?file={file_id}/{expected_filename.replace(' ', '%20')}&oldFile={expected_filename.replace(' ', '%20')}",
+                    "/download.do?file={file_id}/{encoded_filename}&oldFile={encoded_filename}",
                     # 다른 가능한 패턴들
-                    f"/fileDown.do?fileId={file_id}&fileName={expected_filename}",
-                    f"/jsp/ext/etc/fileDown.jsp?fileId={file_id}&fileName={expected_filename}",
+                    "/fileDown.do?fileId={file_id}&fileName={filename}",
+                    "/jsp/ext/etc/fileDown.jsp?fileId={file_id}&fileName={filename}",
                 ]
                 
-                for pattern in download_patterns:
+                for template in self.get_endpoint_candidates('known_file_download', download_templates):
+                    pattern = template.format(
+                        file_id=file_id,
+                        filename=expected_filename,
+                        encoded_filename=expected_filename.replace(' ', '%20')
+                    )
                     try:
                         download_url = urljoin(self.base_url, pattern)
                         logger.debug(f"알려진 파일 다운로드 시도: {download_url}")
@@ -544,7 +547,10 @@ class EnhancedKBANScraper(StandardTableScraper):
                         head_response = self.session.head(download_url, timeout=10)
                         logger.debug(f"HEAD 응답 코드: {head_response.status_code}")
                         
-                        if head_response.status_code == 200:
+                        if head_response.status_code != 200:
+                            self.record_endpoint_failure('known_file_download', template, head_response.status_code,
+                                                         per_resource=True)
+                        else:
                             content_length = head_response.headers.get('content-length', '0')
                             content_disposition = head_response.headers.get('content-disposition', '')
                             
@@ -565,35 +571,41 @@ class EnhancedKBANScraper(StandardTableScraper):
                             }
                             attachments.append(attachment)
                             logger.info(f"알려진 파일 확인 성공: {filename} ({attachment['size']} bytes)")
+                            self.record_endpoint_success('known_file_download', template)
                             return attachments  # 성공하면 즉시 반환
                             
                     except Exception as e:
                         logger.debug(f"알려진 파일 패턴 {pattern} 실패: {e}")
+                        self.record_endpoint_failure('known_file_download', template, per_resource=True)
                         continue
             
             # 2. 알려진 파일 확인 실패 시 일반적인 API 패턴 시도
-            api_patterns = [
+            # 엔드포인트 캐시 적용 - 확인된 패턴 우선, 404 패턴은 일정 기간 제외
+            api_templates = [
                 # 파일 정보 조회 API들
-                f"/jsp/ext/etc/fileList.jsp?atchFileId={file_id}",
-                f"/jsp/common/file/fileList.jsp?atchFileId={file_id}",
-                f"/common/file/fileList.do?atchFileId={file_id}",
-                f"/etr/file/fileList.jsp?id={file_id}",
-                f"/jsp/ext/etc/cmm_file_list.jsp?fileId={file_id}",
+                "/jsp/ext/etc/fileList.jsp?atchFileId={file_id}",
+                "/jsp/common/file/fileList.jsp?atchFileId={file_id}",
+                "/common/file/fileList.do?atchFileId={file_id}",
+                "/etr/file/fileList.jsp?id={file_id}",
+                "/jsp/ext/etc/cmm_file_list.jsp?fileId={file_id}",
                 # 직접 다운로드 시도
-                f"/download.do?fileId={file_id}",
-                f"/download3.do?fileId={file_id}",
-                f"/fileDown.do?fileId={file_id}",
+                "/download.do?fileId={file_id}",
+                "/download3.do?fileId={file_id}",
+                "/fileDown.do?fileId={file_id}",
             ]
             
-            for pattern in api_patterns:
+            for template in self.get_endpoint_candidates('file_list', api_templates):
+                api_path = template.format(file_id=file_id)
                 try:
-                    api_url = urljoin(self.base_url, pattern)
+                    api_url = urljoin(self.base_url, api_path)
                     logger.debug(f"API 패턴 시도: {api_url}")
                     
                     response = self.session.get(api_url, timeout=10)
                     logger.debug(f"API 응답 코드: {response.status_code}")
                     
-                    if response.status_code == 200:
+                    if response.status_code != 200:
+                        self.record_endpoint_failure('file_list', template, response.status_code)
+                    else:
                         content_type = response.headers.get('content-type', '').lower()
                         content = response.text.strip()
                         
@@ -661,10 +673,16 @@ class EnhancedKBANScraper(StandardTableScraper):
                             logger.info(f"직접 파일 다운로드 성공: {filename}")
                         
                         if attachments:
+                            self.record_endpoint_success('file_list', template)
+                            break
+                        
+                        # 확인된 엔드포인트의 정상 응답이면 첨부파일이 없는 것으로 보고 재탐색하지 않음
+                        if self.is_known_endpoint('file_list', template):
                             break
                             
                 except Exception as e:
-                    logger.debug(f"API 패턴 {pattern} 실패: {e}")
+                    logger.debug(f"API 패턴 {api_path} 실패: {e}")
+                    self.record_endpoint_failure('file_list', template)
                     continue
             
             # 3. 모든 시도 실패 시 BBS_NO 기반으로 시도
@@ -698,21 +716,24 @@ class EnhancedKBANScraper(StandardTableScraper):
         attachments = []
         
         try:
-            # KBAN JSP 사이트의 첨부파일 패턴
-            api_patterns = [
-                f"/jsp/ext/etc/file_info.jsp?BBS_NO={bbs_no}",
-                f"/jsp/ext/etc/attachment_list.jsp?BBS_NO={bbs_no}",
-                f"/api/file/list?bbs_no={bbs_no}",
-                f"/jsp/ext/etc/cmm_file_list.jsp?BBS_NO={bbs_no}",
+            # KBAN JSP 사이트의 첨부파일 패턴 (엔드포인트 캐시 적용)
+            api_templates = [
+                "/jsp/ext/etc/file_info.jsp?BBS_NO={bbs_no}",
+                "/jsp/ext/etc/attachment_list.jsp?BBS_NO={bbs_no}",
+                "/api/file/list?bbs_no={bbs_no}",
+                "/jsp/ext/etc/cmm_file_list.jsp?BBS_NO={bbs_no}",
             ]
             
-            for pattern in api_patterns:
+            for template in self.get_endpoint_candidates('bbs_file_list', api_templates):
+                api_path = template.format(bbs_no=bbs_no)
                 try:
-                    api_url = urljoin(self.base_url, pattern)
+                    api_url = urljoin(self.base_url, api_path)
                     logger.debug(f"첨부파일 목록 API 시도: {api_url}")
                     
                     response = self.session.get(api_url, timeout=10)
-                    if response.status_code == 200 and response.text.strip():
+                    if response.status_code != 200:
+                        self.record_endpoint_failure('bbs_file_list', template, response.status_code)
+                    elif response.text.strip():
                         content = response.text.strip()
                         
                         # HTML이 아닌 경우 (JSON 등)
@@ -760,10 +781,16 @@ class EnhancedKBANScraper(StandardTableScraper):
                         
                         if attachments:
                             logger.debug(f"API에서 {len(attachments)}개 첨부파일 발견")
+                            self.record_endpoint_success('bbs_file_list', template)
                             break
+                    
+                    # 확인된 엔드포인트의 정상 응답이면 첨부파일이 없는 것으로 보고 재탐색하지 않음
+                    if response.status_code == 200 and self.is_known_endpoint('bbs_file_list', template):
+                        break
                             
                 except Exception as e:
-                    logger.debug(f"API 패턴 {pattern} 실패: {e}")
+                    logger.debug(f"API 패턴 {api_path} 실패: {e}")
+                    self.record_endpoint_failure('bbs_file_list', template)
                     continue
         
         except Exception as e:
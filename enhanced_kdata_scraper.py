@@ -178,8 +178,7 @@ class EnhancedKdataScraper(StandardTableScraper):
             
             if content_area:
                 # HTML을 마크다운으로 변환
-                content_html = str(content_area)
-                markdown_content = self.h.handle(content_html)
+                markdown_content = self.h.handle(content_area)
                 result['content'] = markdown_content.strip()
                 logger.info(f"본문 추출 완료 - 길이: {len(result['content'])}")
             else:
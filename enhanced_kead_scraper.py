@@ -253,8 +253,7 @@ class EnhancedKEADScraper(StandardTableScraper):
                     if href and not href.startswith('http') and not href.startswith('javascript'):
                         link['href'] = urljoin(self.base_url, href)
                 
-                content_html = str(main_text)
-                content_text = self.h.handle(content_html)
+                content_text = self.h.handle(main_text)
                 content_text = re.sub(r'\n\s*\n\s*\n', '\n\n', content_text).strip()
                 logger.debug(f"본문 추출 완료: {len(content_text)}자")
             
@@ -309,8 +308,7 @@ class EnhancedKEADScraper(StandardTableScraper):
                         if src and not src.startswith('http'):
                             img['src'] = urljoin(self.base_url, src)
                     
-                    content_html = str(content_area)
-                    content_text = self.h.handle(content_html)
+                    content_text = self.h.handle(content_area)
                     content_text = re.sub(r'\n\s*\n\s*\n', '\n\n', content_text).strip()
                     
                     if len(content_text) >= 50:
@@ -466,7 +464,7 @@ class EnhancedKEADScraper(StandardTableScraper):
                     
                     # 페이지 간 대기
                     if page_num < max_pages:
-                        time.sleep(self.delay_between_requests)
+                        self.sleep(self.delay_between_requests)
                 
                 except Exception as e:
                     error_msg = f"{page_num}페이지 처리 실패: {e}"
@@ -233,7 +233,7 @@ class EnhancedKEITScraper(StandardTableScraper):
                 content_area = soup.select_one(selector)
                 if content_area:
                     # HTML을 마크다운으로 변환
-                    content = self.h.handle(str(content_area))
+                    content = self.h.handle(content_area)
                     logger.debug(f"본문을 {selector} 선택자로 찾음")
                     break
         
@@ -246,7 +246,7 @@ class EnhancedKEITScraper(StandardTableScraper):
                 for elem in body.find_all(['nav', 'header', 'footer', 'aside', 'script', 'style']):
                     elem.decompose()
                 
-                content = self.h.handle(str(body))
+                content = self.h.handle(body)
         
         # 첨부파일 정보 추출
         attachments = self._extract_attachments(soup)
@@ -276,7 +276,7 @@ class EnhancedKEITScraper(StandardTableScraper):
                 for elem in content_area.find_all(['script', 'style', 'nav', 'header', 'footer']):
                     elem.decompose()
                 
-                content = self.h.handle(str(content_area))
+                content = self.h.handle(content_area)
                 if content and len(content.strip()) > 100:
                     logger.debug(f"iframe 본문을 {selector} 선택자로 찾음")
                     return content
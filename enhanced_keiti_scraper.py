@@ -65,7 +65,7 @@ class EnhancedKEITIScraper(StandardTableScraper):
                 headless=True,
                 args=['--no-sandbox', '--disable-dev-shm-usage']
             )
-            self.page = self.browser.new_page()
+            self.page = self.guard_page(self.browser.new_page())
             
             # 페이지 설정
             self.page.set_viewport_size({"width": 1920, "height": 1080})
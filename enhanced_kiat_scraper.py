@@ -223,7 +223,7 @@ class EnhancedKiatScraper(StandardTableScraper):
         
         # HTML을 마크다운으로 변환
         try:
-            content_markdown = self.h.handle(str(content_area))
+            content_markdown = self.h.handle(content_area)
             return content_markdown.strip()
         except Exception as e:
             logger.error(f"마크다운 변환 실패: {e}")
@@ -441,7 +441,7 @@ class EnhancedKiatScraper(StandardTableScraper):
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
 
 
 # 하위 호환성을 위한 별칭
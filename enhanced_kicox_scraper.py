@@ -88,7 +88,7 @@ class EnhancedKicoxScraper(StandardTableScraper):
                     ignore_https_errors=True,  # SSL 에러 무시
                     user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 )
-                page = context.new_page()
+                page = self.guard_page(context.new_page())
                 
                 # 페이지 로드
                 response = page.goto(url, timeout=30000, wait_until='networkidle')
@@ -291,8 +291,7 @@ class EnhancedKicoxScraper(StandardTableScraper):
             for unwanted in content_area.find_all(['script', 'style', 'nav', 'header', 'footer']):
                 unwanted.decompose()
             
-            content_html = str(content_area)
-            content_markdown = self.h.handle(content_html)
+            content_markdown = self.h.handle(content_area)
         else:
             content_markdown = "본문을 찾을 수 없습니다."
             logger.warning("본문 영역을 찾을 수 없음")
@@ -505,7 +504,7 @@ class EnhancedKicoxScraper(StandardTableScraper):
                     accept_downloads=True,
                     user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 )
-                page = context.new_page()
+                page = self.guard_page(context.new_page())
                 
                 try:
                     logger.info(f"Playwright로 URL 접근 중: {url}")
@@ -137,13 +137,13 @@ class EnhancedKIDPScraper(JavaScriptScraper):
         # 본문을 마크다운으로 변환
         content_md = ""
         if content_area:
-            content_md = self.h.handle(str(content_area))
+            content_md = self.h.handle(content_area)
             logger.debug(f"본문 변환 완료: {len(content_md)} 문자")
         else:
             # 전체 페이지에서 헤더/푸터 제외하고 추출 시도
             main_content = soup.find('div', class_='content_wrap') or soup.find('div', id='content')
             if main_content:
-                content_md = self.h.handle(str(main_content))
+                content_md = self.h.handle(main_content)
                 logger.debug("전체 페이지에서 본문 추출")
             else:
                 logger.warning("본문 영역을 찾을 수 없습니다")
@@ -505,6 +505,9 @@ class EnhancedKIDPScraper(JavaScriptScraper):
         else:
             logger.info("첨부파일이 없습니다")
         
+        # 직접 저장한 폴더를 매니페스트/레코드에 기록
+        self.record_saved_folder(folder_path, announcement)
+        
         # 처리된 제목으로 추가
         self.add_processed_title(announcement['title'])
                 
@@ -512,7 +515,7 @@ class EnhancedKIDPScraper(JavaScriptScraper):
         if self.delay_between_requests > 0:
             logger.debug(f"{self.delay_between_requests}초 대기")
             import time
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
     
     def _create_meta_info(self, announcement: dict) -> str:
         """메타 정보 생성"""
@@ -238,8 +238,7 @@ class EnhancedKimstScraper(StandardTableScraper):
             for unwanted in content_area.find_all(['script', 'style', 'nav', 'header', 'footer']):
                 unwanted.decompose()
             
-            content_html = str(content_area)
-            content_markdown = self.h.handle(content_html)
+            content_markdown = self.h.handle(content_area)
         else:
             content_markdown = "본문을 찾을 수 없습니다."
             logger.warning("본문 영역을 찾을 수 없음")
@@ -332,7 +331,7 @@ class EnhancedKimstScraper(StandardTableScraper):
         if not self.playwright:
             self.playwright = sync_playwright().start()
             self.browser = self.playwright.chromium.launch(headless=True)
-            self.page = self.browser.new_page()
+            self.page = self.guard_page(self.browser.new_page())
             
             # 기본 헤더 설정
             self.page.set_extra_http_headers({
@@ -545,6 +544,9 @@ class EnhancedKimstScraper(StandardTableScraper):
         
         # 첨부파일 다운로드 - detail_url 전달
         self._download_attachments(detail['attachments'], folder_path, detail_url)
+
+        # 직접 저장한 폴더를 매니페스트/레코드에 기록
+        self.record_saved_folder(folder_path, announcement)
         
         # 처리한 제목을 기록
         self.add_processed_title(announcement['title'])
@@ -249,8 +249,7 @@ class EnhancedKitaScraper(StandardTableScraper):
         
         if main_content:
             # HTML을 마크다운으로 변환
-            content_html = str(main_content)
-            markdown_content = self.h.handle(content_html)
+            markdown_content = self.h.handle(main_content)
             content_parts.append(markdown_content)
         else:
             # 폴백: 제목과 기본 정보만 추출
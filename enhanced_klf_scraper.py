@@ -226,8 +226,7 @@ class EnhancedKlfScraper(StandardTableScraper):
             if content_elem:
                 logger.debug(f"본문을 {selector} 선택자로 찾음")
                 # HTML을 Markdown으로 변환
-                content_html = str(content_elem)
-                markdown_content = self.h.handle(content_html)
+                markdown_content = self.h.handle(content_elem)
                 if markdown_content.strip():
                     content_parts.append(markdown_content)
                     main_content_found = True
@@ -251,7 +250,7 @@ class EnhancedKlfScraper(StandardTableScraper):
                 text = elem.get_text(strip=True)
                 if len(text) > 200:  # 200자 이상인 경우 본문으로 간주
                     logger.debug(f"긴 텍스트 영역을 본문으로 사용: {len(text)}자")
-                    content_parts.append(self.h.handle(str(elem)))
+                    content_parts.append(self.h.handle(elem))
                     break
         
         if not content_parts:
@@ -243,7 +243,7 @@ class EnhancedKMEDIHUBScraper(StandardTableScraper):
         # 1. definition 태그에서 글내용 찾기
         content_def = soup.find('definition')
         if content_def:
-            content = self.h.handle(str(content_def))
+            content = self.h.handle(content_def)
             logger.debug("본문을 definition 태그에서 추출")
         
         # 2. 본문이 없으면 다른 방법으로 시도
@@ -262,7 +262,7 @@ class EnhancedKMEDIHUBScraper(StandardTableScraper):
                         best_div = div
             
             if best_div:
-                content = self.h.handle(str(best_div))
+                content = self.h.handle(best_div)
                 logger.info(f"대체 방법으로 본문 추출 완료 (길이: {len(content)})")
             else:
                 # 최후 수단: 전체 페이지에서 텍스트 추출
@@ -577,6 +577,9 @@ class EnhancedKMEDIHUBScraper(StandardTableScraper):
                         logger.error(f"첨부파일 다운로드 중 오류: {e}")
                         continue
             
+            # 직접 저장한 폴더를 매니페스트/레코드에 기록
+            self.record_saved_folder(announcement_dir, announcement)
+            
             return True
             
         except Exception as e:
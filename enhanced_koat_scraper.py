@@ -288,7 +288,7 @@ class EnhancedKOATScraper(StandardTableScraper):
         
         # 본문 텍스트 추출
         if content_area:
-            content = self.h.handle(str(content_area))
+            content = self.h.handle(content_area)
             content = content.strip()
         else:
             logger.warning("본문 영역을 찾을 수 없습니다")
@@ -186,7 +186,7 @@ class EnhancedKOCCAScraper(StandardTableScraper):
             if content_elem:
                 try:
                     # HTML to Markdown 변환
-                    content_md = self.h.handle(str(content_elem))
+                    content_md = self.h.handle(content_elem)
                     content_parts.append(content_md)
                     content_found = True
                     logger.debug(f"{selector} 선택자로 본문 추출 완료")
@@ -183,8 +183,7 @@ class EnhancedKOEMAScraper(StandardTableScraper):
                 unwanted.decompose()
             
             # HTML을 마크다운으로 변환
-            content_html = str(content_area)
-            content_text = self.h.handle(content_html)
+            content_text = self.h.handle(content_area)
             
             # 빈 줄 정리
             content_lines = [line.strip() for line in content_text.split('\n')]
@@ -166,8 +166,7 @@ class EnhancedKofpiScraper(StandardTableScraper):
         content_area = soup.find('td', class_='view_cont')
         if content_area:
             # HTML을 마크다운으로 변환
-            content_html = str(content_area)
-            content_md = self.h.handle(content_html)
+            content_md = self.h.handle(content_area)
             result['content'] = content_md.strip()
             logger.debug(f"본문을 .view_cont 선택자로 찾음")
         else:
@@ -182,7 +182,7 @@ class EnhancedKosefScraper(StandardTableScraper):
         
         # 본문 텍스트 추출
         if content_area:
-            content = self.h.handle(str(content_area))
+            content = self.h.handle(content_area)
         else:
             content = "본문을 찾을 수 없습니다."
         
@@ -196,7 +196,7 @@ class EnhancedKoshaScraper(StandardTableScraper):
                 text_content = content_td.get_text(strip=True)
                 logger.debug(f"본문을 view-body > p17 선택자로 찾음: {len(text_content)}자")
                 if len(text_content) > 10:  # 의미있는 내용이 있다면
-                    content_parts.append(self.h.handle(str(content_td)))
+                    content_parts.append(self.h.handle(content_td))
         
         # 2. 더 구체적인 선택자 시도
         if not content_parts:
@@ -210,7 +210,7 @@ class EnhancedKoshaScraper(StandardTableScraper):
                         text_content = content_td.get_text(strip=True)
                         logger.debug(f"구체적 선택자로 찾은 본문: {len(text_content)}자")
                         if len(text_content) > 10:
-                            content_parts.append(self.h.handle(str(content_td)))
+                            content_parts.append(self.h.handle(content_td))
         
         # 3. 모든 view-body 행 확인
         if not content_parts:
@@ -224,7 +224,7 @@ class EnhancedKoshaScraper(StandardTableScraper):
                     logger.debug(f"view-body 행 {i+1}, p17 셀 {j+1}: {len(text_content)}자")
                     if len(text_content) > 50:
                         logger.debug(f"충분한 내용 발견 - 사용: {text_content[:100]}...")
-                        content_parts.append(self.h.handle(str(cell)))
+                        content_parts.append(self.h.handle(cell))
                         break
                 if content_parts:
                     break
@@ -234,7 +234,7 @@ class EnhancedKoshaScraper(StandardTableScraper):
             hwp_content = soup.find('div', id='hwpEditorBoardContent')
             if hwp_content:
                 logger.debug("본문을 hwpEditorBoardContent로 찾음")
-                content_parts.append(self.h.handle(str(hwp_content)))
+                content_parts.append(self.h.handle(hwp_content))
         
         # 5. 클래스명이 없는 p17 셀들도 확인
         if not content_parts:
@@ -245,7 +245,7 @@ class EnhancedKoshaScraper(StandardTableScraper):
                     text_content = td.get_text(strip=True)
                     if len(text_content) > 50:
                         logger.debug(f"일반 p17 셀에서 본문 발견: {len(text_content)}자")
-                        content_parts.append(self.h.handle(str(td)))
+                        content_parts.append(self.h.handle(td))
                         break
         
         # 6. 최종 대체 방법: 긴 텍스트가 있는 td 찾기
@@ -256,7 +256,7 @@ class EnhancedKoshaScraper(StandardTableScraper):
                 text = td.get_text(strip=True)
                 if len(text) > 100:  # 100자 이상인 경우 본문으로 간주
                     logger.debug(f"긴 텍스트 영역을 본문으로 사용: {len(text)}자")
-                    content_parts.append(self.h.handle(str(td)))
+                    content_parts.append(self.h.handle(td))
                     break
         
         logger.debug("=== HTML 구조 디버깅 완료 ===")
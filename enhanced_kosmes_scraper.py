@@ -60,7 +60,7 @@ class EnhancedKosmesScraper(StandardTableScraper):
         try:
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+                page = self.guard_page(browser.new_page())
                 
                 # 페이지 이동
                 logger.info(f"Playwright로 페이지 {page_num} 로딩 중: {url}")
@@ -516,6 +516,9 @@ class EnhancedKosmesScraper(StandardTableScraper):
         else:
             logger.info("첨부파일이 없습니다")
         
+        # 직접 저장한 폴더를 매니페스트/레코드에 기록
+        self.record_saved_folder(folder_path, announcement)
+        
         # 처리된 제목 추가
         self.add_processed_title(announcement['title'])
     
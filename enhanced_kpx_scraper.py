@@ -12,13 +12,13 @@ import time
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse, unquote
 import logging
-from enhanced_base_scraper import StandardTableScraper
-from typing import Dict, List, Any
+from enhanced_base_scraper import AjaxAPIScraper
+from typing import Dict, List, Any, Optional
 from playwright.sync_api import sync_playwright
 
 logger = logging.getLogger(__name__)
 
-class EnhancedKPXScraper(StandardTableScraper):
+class EnhancedKPXScraper(AjaxAPIScraper):
     """KPX 전용 스크래퍼 - 향상된 버전"""
     
     def __init__(self):
@@ -37,7 +37,8 @@ class EnhancedKPXScraper(StandardTableScraper):
         self.delay_between_requests = 1
         
         # KPX 특화 설정
-        self.page_size = 15  # 한 페이지당 항목 수
+        self.page_size = 15  # 한 페이지당 항목 수 (논리 페이지)
+        self.page_size_param = 'recordCountPerPage'  # 목록 API가 받아들이는 최대 크기로 확대
         self.csrf_token = None  # CSRF 토큰
     
     def get_list_url(self, page_num: int) -> str:
@@ -49,18 +50,20 @@ class EnhancedKPXScraper(StandardTableScraper):
         # Fallback: KPX는 API 엔드포인트가 고정
         return self.list_api_url
     
-    def _get_page_announcements(self, page_num: int) -> List[Dict[str, Any]]:
-        """페이지별 공고 목록 가져오기 - AJAX API 호출"""
+    def fetch_api_page(self, page_num: int, page_size: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """목록 API 물리 페이지 가져오기 - AJAX API 호출"""
         try:
             # 첫 페이지에서 CSRF 토큰 획득
             if page_num == 1 and self.csrf_token is None:
                 self._get_csrf_token()
             
             # AJAX API 호출
-            api_data = self.fetch_announcements_api(page_num)
+            api_data = self.fetch_announcements_api(page_num, page_size)
             if not api_data:
+                if isinstance(api_data, list):
+                    return []
                 logger.warning(f"페이지 {page_num} API 응답을 가져올 수 없습니다")
-                return []
+                return None
             
             # API 응답 파싱
             announcements = self.parse_api_response(api_data)
@@ -73,7 +76,7 @@ class EnhancedKPXScraper(StandardTableScraper):
             
         except Exception as e:
             logger.error(f"페이지 {page_num} 공고 목록 가져오기 실패: {e}")
-            return []
+            return None
     
     def _get_csrf_token(self):
         """메인 페이지에서 CSRF 토큰 획득"""
@@ -95,14 +98,15 @@ class EnhancedKPXScraper(StandardTableScraper):
             logger.error(f"CSRF 토큰 획득 실패: {e}")
             self.csrf_token = None
     
-    def fetch_announcements_api(self, page_num: int) -> dict:
+    def fetch_announcements_api(self, page_num: int, page_size: Optional[int] = None) -> dict:
         """공고 목록 API 호출"""
         try:
             # API 페이로드 구성
+            page_size = page_size or self.page_size
             payload = {
                 "currentPageNo": page_num,
-                "recordCountPerPage": self.page_size,
-                "pageSize": self.page_size
+                "recordCountPerPage": page_size,
+                "pageSize": page_size
             }
             
             # POST 요청으로 API 호출
@@ -249,7 +253,7 @@ class EnhancedKPXScraper(StandardTableScraper):
             with sync_playwright() as p:
                 # 브라우저 시작
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+                page = self.guard_page(browser.new_page())
                 
                 # User-Agent 설정
                 page.set_extra_http_headers({
@@ -174,12 +174,12 @@ class EnhancedMIREScraper(SessionBasedScraper):
         # 본문을 마크다운으로 변환
         content_md = ""
         if content_area:
-            content_md = self.h.handle(str(content_area))
+            content_md = self.h.handle(content_area)
         else:
             # content_area가 없으면 전체 테이블을 마크다운으로 변환
             content_table = soup.find('table', class_='tb2')
             if content_table:
-                content_md = self.h.handle(str(content_table))
+                content_md = self.h.handle(content_table)
         
         return {
             'content': content_md,
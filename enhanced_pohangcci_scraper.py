@@ -36,6 +36,7 @@ class EnhancedPOHANGCCIScraper(StandardTableScraper):
         
         # Playwright 관련 설정
         self.use_playwright = True
+        self.list_container = 'table'  # 목록 파싱은 게시판 테이블 영역만
         self.browser = None
         self.page = None
         
@@ -55,7 +56,7 @@ class EnhancedPOHANGCCIScraper(StandardTableScraper):
                 self.context = await self.browser.new_context(
                     user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
                 )
-                self.page = await self.context.new_page()
+                self.page = self.guard_page(await self.context.new_page())
                 
                 # 타임아웃 설정
                 self.page.set_default_timeout(30000)
@@ -118,7 +119,7 @@ class EnhancedPOHANGCCIScraper(StandardTableScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - JSP/Spring 테이블 구조"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = self._parse_list_html(html_content)
         announcements = []
         
         try:
@@ -268,8 +269,7 @@ class EnhancedPOHANGCCIScraper(StandardTableScraper):
             
             if content_elem:
                 # HTML을 마크다운으로 변환
-                content_html = str(content_elem)
-                result['content'] = self.h.handle(content_html).strip()
+                result['content'] = self.h.handle(content_elem).strip()
                 logger.info(f"본문 추출 완료 (길이: {len(result['content'])})")
             else:
                 logger.warning("본문을 찾을 수 없습니다")
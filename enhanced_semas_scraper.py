@@ -135,7 +135,7 @@ class EnhancedSEMASScraper(StandardTableScraper):
             content_elem = soup.find('td', class_='cont')
             if content_elem:
                 # HTML 태그 제거하고 텍스트만 추출
-                content = self.h.handle(str(content_elem)).strip()
+                content = self.h.handle(content_elem).strip()
             
             # 메타 정보 추출
             meta_info = {}
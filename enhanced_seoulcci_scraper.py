@@ -166,7 +166,7 @@ class EnhancedSeoulCCIScraper(StandardTableScraper):
             
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+                page = self.guard_page(browser.new_page())
                 
                 # 페이지 로드
                 page.goto(self.list_url)
@@ -286,7 +286,7 @@ class EnhancedSeoulCCIScraper(StandardTableScraper):
             
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+                page = self.guard_page(browser.new_page())
                 
                 # 목록 페이지로 이동
                 page.goto(self.list_url)
@@ -328,7 +328,7 @@ class EnhancedSeoulCCIScraper(StandardTableScraper):
             
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+                page = self.guard_page(browser.new_page())
                 
                 # 목록 페이지로 이동
                 page.goto(self.list_url)
@@ -497,13 +497,16 @@ class EnhancedSeoulCCIScraper(StandardTableScraper):
         
         # 첨부파일 다운로드 (JavaScript 기반이라 실제 다운로드는 제한됨)
         self._download_attachments_seoulcci(detail['attachments'], folder_path)
+
+        # 직접 저장한 폴더를 매니페스트/레코드에 기록
+        self.record_saved_folder(folder_path, announcement)
         
         # 처리된 제목으로 추가
-        self.add_processed_title(announcement['title'])
+        self.add_processed_title(announcement['title'], announcement)
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
     
     def _download_attachments_seoulcci(self, attachments: list, folder_path: str):
         """서울상공회의소 첨부파일 다운로드 (JavaScript 제한으로 인해 정보만 저장)"""
@@ -578,7 +581,7 @@ class EnhancedSeoulCCIScraper(StandardTableScraper):
         logger.info(f"기본 내용 저장 완료: {content_path}")
         
         # 처리된 제목으로 추가
-        self.add_processed_title(announcement['title'])
+        self.add_processed_title(announcement['title'], announcement)
     
     def scrape_pages(self, max_pages: int = 3, output_base: str = 'output') -> bool:
         """페이지별 스크래핑 실행 - Playwright 기반"""
@@ -595,7 +598,7 @@ class EnhancedSeoulCCIScraper(StandardTableScraper):
             
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+                page = self.guard_page(browser.new_page())
                 
                 for page_num in range(1, max_pages + 1):
                     logger.info(f"페이지 {page_num} 처리 중")
@@ -625,7 +628,7 @@ class EnhancedSeoulCCIScraper(StandardTableScraper):
                     consecutive_duplicates = 0
                     
                     for announcement in announcements:
-                        if self.is_title_processed(announcement['title']):
+                        if self.is_title_processed(announcement['title'], announcement):
                             consecutive_duplicates += 1
                             logger.debug(f"중복 공고 건너뜀: {announcement['title']}")
                             if consecutive_duplicates >= 3:
@@ -651,7 +654,7 @@ class EnhancedSeoulCCIScraper(StandardTableScraper):
                             continue
                     
                     # 페이지 간 대기
-                    time.sleep(self.delay_between_requests)
+                    self.sleep(self.delay_between_requests)
                 
                 browser.close()
                 
@@ -398,12 +398,15 @@ class EnhancedSeoulCCIScraper(StandardTableScraper):
                 # 다운로드 간 대기
                 time.sleep(1)
         
+        # 직접 저장한 폴더를 매니페스트/레코드에 기록
+        self.record_saved_folder(folder_path, announcement)
+        
         # 처리된 제목으로 추가
-        self.add_processed_title(announcement['title'])
+        self.add_processed_title(announcement['title'], announcement)
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
     
     def scrape_pages(self, max_pages: int = 3, output_base: str = 'output') -> bool:
         """페이지별 스크래핑 실행"""
@@ -442,7 +445,7 @@ class EnhancedSeoulCCIScraper(StandardTableScraper):
                 consecutive_duplicates = 0
                 
                 for announcement in announcements:
-                    if self.is_title_processed(announcement['title']):
+                    if self.is_title_processed(announcement['title'], announcement):
                         consecutive_duplicates += 1
                         logger.debug(f"중복 공고 건너뜀: {announcement['title']}")
                         if consecutive_duplicates >= 3:
@@ -468,7 +471,7 @@ class EnhancedSeoulCCIScraper(StandardTableScraper):
                         continue
                 
                 # 페이지 간 대기
-                time.sleep(self.delay_between_requests)
+                self.sleep(self.delay_between_requests)
                 
         except Exception as e:
             logger.error(f"스크래핑 중 오류: {e}")
@@ -245,8 +245,7 @@ class EnhancedSeoulRnbdScraper(StandardTableScraper):
                         # 긴 텍스트가 있는 셀을 본문으로 간주
                         if text and len(text) > 50:
                             # HTML을 마크다운으로 변환
-                            cell_html = str(cell)
-                            markdown_content = self.h.handle(cell_html)
+                            markdown_content = self.h.handle(cell)
                             content_parts.append(markdown_content)
             
             # 결과가 없으면 폴백 방법 사용
@@ -52,7 +52,7 @@ class EnhancedSEOULSBDCScraper(EnhancedBaseScraper):
                 headless=True,
                 args=['--no-sandbox', '--disable-web-security']
             )
-            self.page = self.browser.new_page()
+            self.page = self.guard_page(self.browser.new_page())
             
             # 기본 설정
             self.page.set_default_timeout(30000)
@@ -194,7 +194,7 @@ class EnhancedSmcsbaScraper(AjaxAPIScraper):
                 content_text = "본문 내용을 추출할 수 없습니다."
         else:
             # HTML을 마크다운으로 변환
-            content_text = self.h.handle(str(content_area))
+            content_text = self.h.handle(content_area)
             # 과도한 줄바꿈 정리
             content_text = re.sub(r'\n{3,}', '\n\n', content_text)
         
@@ -174,7 +174,7 @@ class EnhancedSMTECHScraper(StandardTableScraper):
                     td = row.find('td')
                     if td:
                         # HTML을 마크다운으로 변환
-                        content = self.h.handle(str(td))
+                        content = self.h.handle(td)
                         logger.debug("본문을 '내용' 테이블 셀에서 찾음")
                         break
         
@@ -196,7 +196,7 @@ class EnhancedSMTECHScraper(StandardTableScraper):
                         best_td = td
             
             if best_td:
-                content = self.h.handle(str(best_td))
+                content = self.h.handle(best_td)
                 logger.info(f"대체 방법으로 본문 추출 완료 (길이: {len(content)})")
         
         # 첨부파일 정보 추출
@@ -316,7 +316,7 @@ class EnhancedSmtechScraper(StandardTableScraper):
                 
                 # 페이지 간 지연
                 if page_num < max_pages:
-                    time.sleep(self.delay_between_pages)
+                    self.sleep(self.delay_between_pages, 'page_delay')
                     
             except Exception as e:
                 logger.error(f"페이지 {page_num} 처리 중 오류: {e}")
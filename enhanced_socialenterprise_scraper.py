@@ -192,7 +192,7 @@ class EnhancedSocialEnterpriseScraper(StandardTableScraper):
                 unwanted.decompose()
             
             # HTML을 마크다운으로 변환
-            content = self.h.handle(str(content_area))
+            content = self.h.handle(content_area)
         else:
             # Fallback: body 전체에서 텍스트 추출
             logger.warning("본문 영역을 찾을 수 없어 전체 페이지에서 추출합니다")
@@ -200,7 +200,7 @@ class EnhancedSocialEnterpriseScraper(StandardTableScraper):
             for unwanted in soup.select('header, nav, .header, .nav, .gnb, .snb, .footer, script, style'):
                 unwanted.decompose()
             
-            content = self.h.handle(str(soup))
+            content = self.h.handle(soup)
         
         # 첨부파일 추출
         attachments = self._extract_attachments(soup)
@@ -449,8 +449,7 @@ class EnhancedSROMEScraper(StandardTableScraper):
             content_elem = soup.select_one(selector)
             if content_elem:
                 # HTML을 마크다운으로 변환
-                content_html = str(content_elem)
-                content_md = self.h.handle(content_html)
+                content_md = self.h.handle(content_elem)
                 
                 if content_md and len(content_md.strip()) > 20:
                     logger.debug(f"본문을 {selector} 선택자로 찾음")
@@ -802,7 +801,7 @@ class EnhancedSROMEScraper(StandardTableScraper):
                         
                         logger.info(f"처리 완료: {title} (첨부파일: {downloaded_count}개)")
                         
-                        time.sleep(self.delay_between_requests)
+                        self.sleep(self.delay_between_requests)
                         
                     except Exception as e:
                         logger.error(f"공고 처리 중 오류: {e}")
@@ -200,8 +200,7 @@ class EnhancedSvhcScraper(EnhancedBaseScraper):
                     text_content = div.get_text(strip=True)
                     if len(text_content) > 50:  # 충분한 길이의 텍스트만
                         # HTML을 마크다운으로 변환
-                        content_html = str(div)
-                        content_markdown = self.h.handle(content_html)
+                        content_markdown = self.h.handle(div)
                         content_parts.append(content_markdown.strip())
                         break
             
@@ -181,8 +181,7 @@ class EnhancedTechnoparkScraper(StandardTableScraper):
             return "본문을 찾을 수 없습니다."
         
         # HTML을 마크다운으로 변환
-        content_html = str(content_area)
-        markdown_content = self.h.handle(content_html)
+        markdown_content = self.h.handle(content_area)
         
         return markdown_content
     
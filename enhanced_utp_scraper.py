@@ -320,7 +320,7 @@ class EnhancedUTPScraper(AjaxAPIScraper):
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
 
     def download_file(self, url: str, save_path: str, attachment_info: dict = None) -> bool:
         """파일 다운로드 - UTP 전용 처리"""
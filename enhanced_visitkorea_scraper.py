@@ -975,7 +975,7 @@ class EnhancedVisitKoreaScraper(StandardTableScraper):
                         
                         logger.info(f"처리 완료: {title} (첨부파일: {downloaded_count}개)")
                         
-                        time.sleep(self.delay_between_requests)
+                        self.sleep(self.delay_between_requests)
                         
                     except Exception as e:
                         logger.error(f"공고 처리 중 오류: {e}")
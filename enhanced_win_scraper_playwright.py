@@ -44,7 +44,7 @@ class EnhancedWinScraperPlaywright(StandardTableScraper):
         if not self.playwright:
             self.playwright = sync_playwright().start()
             self.browser = self.playwright.chromium.launch(headless=True)
-            self.page = self.browser.new_page()
+            self.page = self.guard_page(self.browser.new_page())
             
             # SSL 에러 무시
             self.page.set_extra_http_headers({
@@ -451,7 +451,7 @@ class EnhancedWinScraperPlaywright(StandardTableScraper):
                         total_announcements += 1
                     
                     # 요청 간격 조절
-                    time.sleep(self.delay_between_requests)
+                    self.sleep(self.delay_between_requests)
                 
                 logger.info(f"페이지 {page_num} 완료")
             
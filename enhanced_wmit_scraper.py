@@ -543,7 +543,7 @@ class EnhancedWMITScraper(StandardTableScraper):
         
         # 요청 간 대기
         if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
+            self.sleep(self.delay_between_requests)
     
     def _create_meta_info(self, announcement: Dict[str, Any]) -> str:
         """WMIT 메타 정보 생성"""
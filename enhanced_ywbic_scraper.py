@@ -193,7 +193,7 @@ class EnhancedYwbicScraper(StandardTableScraper):
         content = ""
         if content_cell:
             # 링크와 이미지 정보 포함하여 마크다운으로 변환
-            content = self.h.handle(str(content_cell))
+            content = self.h.handle(content_cell)
             content = content.strip()
         
         # 내용이 비어있다면 다른 방법들 시도
@@ -205,7 +205,7 @@ class EnhancedYwbicScraper(StandardTableScraper):
                 # 충분히 긴 텍스트이고, 메타정보가 아닌 것
                 if (len(td_text) > 100 and 
                     not any(keyword in td_text for keyword in ['작성자', '등록일', '조회', '파일', '자료 미등록'])):
-                    content = self.h.handle(str(td))
+                    content = self.h.handle(td)
                     content = content.strip()
                     break
         
@@ -221,7 +221,7 @@ class EnhancedYwbicScraper(StandardTableScraper):
                     if last_cell:
                         cell_text = last_cell.get_text(strip=True)
                         if len(cell_text) > 50:  # 충분한 내용이 있다면
-                            content = self.h.handle(str(last_cell))
+                            content = self.h.handle(last_cell)
                             content = content.strip()
         
         # 첨부파일 정보 추출
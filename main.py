@@ -8,10 +8,15 @@ Enhanced 스크래퍼 통합 실행기
 import os
 import sys
 import logging
+import argparse
+import re
+import threading
 import asyncio
 import concurrent.futures
 from datetime import datetime
 import time
+import json
+import signal
 from typing import List, Dict, Any
 
 # 현재 디렉토리를 Python 경로에 추가
@@ -20,7 +25,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 # Enhanced 스크래퍼들 import
 from enhanced_btp_scraper import EnhancedBTPScraper
 from enhanced_cci_scraper import EnhancedCCIScraper
-from enhanced_ccei_scraper import EnhancedCCEIScraper
+from enhanced_ccei_family_scraper import EnhancedCCEIFamilyScraper
 from enhanced_cepa_scraper import EnhancedCEPAScraper
 from enhanced_dcb_scraper import EnhancedDCBScraper
 from enhanced_djbea_scraper import EnhancedDJBEAScraper
@@ -38,6 +43,15 @@ from enhanced_smtech_scraper import EnhancedSMTECHScraper
 from enhanced_jepa_scraper import EnhancedJEPAScraper
 from enhanced_kmedihub_scraper import EnhancedKMEDIHUBScraper
 from enhanced_win_scraper import EnhancedWinScraper
+from attachment_store import AttachmentStore
+from search_index import SearchIndex
+from near_duplicate_index import NearDuplicateIndex
+from attachment_text import AttachmentTextExtractor
+from scraper_metrics import ScraperMetrics
+from scraper_profiler import ScraperProfiler, PROFILE_MODES
+from site_registry import load_site_list, resolve_sites
+from poll_scheduler import PollScheduler
+from run_budget import BudgetExceeded, parse_deadline, site_deadline
 
 # 로깅 설정
 logging.basicConfig(
@@ -51,6 +65,72 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# 첨부파일 저장소 - 모든 스크래퍼가 공유하여 사이트/실행 간 중복 파일을 한 번만 저장
+ATTACHMENT_STORE_DIR = './output/.attachment_store'
+_attachment_store = None
+_attachment_store_lock = threading.Lock()
+
+def get_attachment_store() -> AttachmentStore:
+    """공유 첨부파일 저장소 반환 (최초 사용 시 생성)"""
+    global _attachment_store
+    with _attachment_store_lock:
+        if _attachment_store is None:
+            _attachment_store = AttachmentStore(ATTACHMENT_STORE_DIR)
+    return _attachment_store
+
+# 전문 검색 색인 - 모든 스크래퍼가 공유 (python search_index.py 로 조회)
+SEARCH_INDEX_PATH = './output/.search_index.sqlite3'
+_search_index = None
+_search_index_lock = threading.Lock()
+
+def get_search_index() -> SearchIndex:
+    """공유 검색 색인 반환 (최초 사용 시 생성)"""
+    global _search_index
+    with _search_index_lock:
+        if _search_index is None:
+            _search_index = SearchIndex(SEARCH_INDEX_PATH)
+    return _search_index
+
+# 사이트 간 유사 공고 색인 - 모든 스크래퍼가 공유 (python near_duplicate_index.py 로 재게시 공고 조회)
+NEAR_DUPLICATE_INDEX_PATH = './output/.near_duplicates.sqlite3'
+_near_duplicate_index = None
+_near_duplicate_index_lock = threading.Lock()
+
+def get_near_duplicate_index() -> NearDuplicateIndex:
+    """공유 유사 공고 색인 반환 (최초 사용 시 생성)"""
+    global _near_duplicate_index
+    with _near_duplicate_index_lock:
+        if _near_duplicate_index is None:
+            _near_duplicate_index = NearDuplicateIndex(NEAR_DUPLICATE_INDEX_PATH)
+    return _near_duplicate_index
+
+# 첨부파일 텍스트 추출 - 내용 해시별 캐시, 추출 결과는 공고 폴더의 attachments.txt
+ATTACHMENT_TEXT_CACHE_DIR = './output/.attachment_text_cache'
+_text_extractor = None
+_text_extractor_lock = threading.Lock()
+
+def get_text_extractor() -> AttachmentTextExtractor:
+    """공유 첨부파일 텍스트 추출기 반환 (최초 사용 시 생성)"""
+    global _text_extractor
+    with _text_extractor_lock:
+        if _text_extractor is None:
+            _text_extractor = AttachmentTextExtractor(ATTACHMENT_TEXT_CACHE_DIR, max_workers=2,
+                                                      search_index=get_search_index())
+    return _text_extractor
+
+# 단계별 계측 - 모든 스크래퍼가 공유하여 실행 종료 시 ./output/metrics/ 에 통합 보고서 저장
+METRICS_DIR = './output/metrics'
+metrics = ScraperMetrics()
+
+# 프로파일 결과 저장 위치 (--profile 사용 시)
+PROFILE_DIR = './output/profiles'
+
+# 사이트 목록 CSV로 실행할 때 스크래퍼를 찾지 못한 사이트 보고서 (--site-list 사용 시)
+UNRESOLVED_SITES_PATH = './output/site_list_unresolved.json'
+
+# 데몬 모드의 사이트별 수집 주기 상태 (--daemon 사용 시)
+DAEMON_STATE_PATH = './output/daemon_schedule.json'
+
 # Enhanced 스크래퍼 정의
 ENHANCED_SCRAPERS = {
     'btp': {
@@ -64,8 +144,8 @@ ENHANCED_SCRAPERS = {
         'output_dir': 'cci_enhanced'
     },
     'ccei': {
-        'class': EnhancedCCEIScraper,
-        'name': 'CCEI (창조경제연구원)',
+        'class': EnhancedCCEIFamilyScraper,
+        'name': 'CCEI (전국 창조경제혁신센터)',
         'output_dir': 'ccei_enhanced'
     },
     'cepa': {
@@ -156,39 +236,96 @@ ENHANCED_SCRAPERS = {
 }
 
 def run_single_scraper(scraper_config: Dict[str, Any], max_pages: int = 3) -> Dict[str, Any]:
-    """단일 스크래퍼 실행"""
+    """단일 스크래퍼 실행 - scraper_config['profile']에 모드가 있으면 프로파일러로 감싸서 실행
+    
+    scraper_config['scraper']에 인스턴스가 있으면 새로 만들지 않고 재사용한다 (데몬 모드).
+    scraper_config['site_budget'](초)과 scraper_config['deadline'](epoch 초)이 있으면 그 안에서만 실행하고,
+    넘으면 진행 상황을 저장한 뒤 status='budget_exceeded'로 반환한다.
+    """
     scraper_key = scraper_config['key']
     scraper_info = scraper_config['info']
+    profile_mode = scraper_config.get('profile')
     
     start_time = time.time()
+    deadline = site_deadline(start_time, scraper_config.get('site_budget'), scraper_config.get('deadline'))
+    
+    if deadline is not None and deadline <= start_time:
+        logger.warning(f"⏱️ [{scraper_key.upper()}] 전체 실행 마감 시각이 지나 시작하지 않음")
+        return {
+            'scraper': scraper_key,
+            'name': scraper_info['name'],
+            'status': 'budget_exceeded',
+            'error': '전체 실행 마감 시각 경과 - 시작하지 않음',
+            'duration': 0,
+            'announcements': 0,
+            'files': 0,
+            'total_size': 0
+        }
     
     try:
         logger.info(f"🚀 [{scraper_key.upper()}] {scraper_info['name']} 스크래핑 시작")
         
-        # 스크래퍼 인스턴스 생성
-        scraper_class = scraper_info['class']
-        scraper = scraper_class()
+        # 스크래퍼 인스턴스 생성 (재사용 시 실행 단위 출력과 처리 상태만 새로 시작)
+        scraper = scraper_config.get('scraper')
+        if scraper is None:
+            scraper = scraper_info['class']()
+        else:
+            scraper.manifest = None
+            scraper.record_sink = None
+            scraper.current_session_titles = set()
+            scraper._pending_keys = {}
+            scraper._folder_files = {}
+            scraper._recorded_folders = set()
+        scraper.resume = scraper_config.get('resume', False)
+        scraper.deadline = deadline
+        scraper.attachment_store = get_attachment_store()
+        scraper.search_index = get_search_index()
+        scraper.near_duplicate_index = get_near_duplicate_index()
+        scraper.skip_duplicate_attachments = scraper_config.get('skip_duplicate_attachments', False)
+        scraper.text_extractor = get_text_extractor()
+        scraper.metrics = metrics
         
         # 출력 디렉토리 설정
         output_dir = f"./output/{scraper_info['output_dir']}"
         
-        # 스크래핑 실행
-        scraper.scrape_pages(max_pages=max_pages, output_base=output_dir)
+        # 스크래핑 실행 - 시간 예산을 넘으면 처리한 부분까지 저장하고 작업자 반환
+        status = 'success'
+        budget_error = None
+        try:
+            if profile_mode:
+                with ScraperProfiler(PROFILE_DIR, scraper_key, mode=profile_mode,
+                                     run_id=scraper_config.get('run_id')) as profiler:
+                    scraper.scrape_pages(max_pages=max_pages, output_base=output_dir)
+            else:
+                scraper.scrape_pages(max_pages=max_pages, output_base=output_dir)
+        except BudgetExceeded as e:
+            status = 'budget_exceeded'
+            budget_error = str(e)
+            scraper.save_partial_progress()
+        finally:
+            scraper.deadline = None
         
         end_time = time.time()
         duration = end_time - start_time
         
         # 결과 통계 수집
-        stats = collect_scraper_stats(output_dir)
+        stats = collect_scraper_stats(output_dir, scraper)
         stats.update({
             'scraper': scraper_key,
             'name': scraper_info['name'],
-            'status': 'success',
+            'status': status,
             'duration': duration,
             'output_dir': output_dir
         })
         
-        logger.info(f"✅ [{scraper_key.upper()}] 완료 - {duration:.1f}초, 공고 {stats['announcements']}개, 파일 {stats['files']}개")
+        if profile_mode:
+            stats['profile'] = profiler.summary.get('files', {})
+        
+        if budget_error:
+            stats['error'] = budget_error
+            logger.warning(f"⏱️ [{scraper_key.upper()}] 시간 예산 초과로 중단 - {duration:.1f}초, 공고 {stats['announcements']}개까지 저장 (--resume으로 이어서 수집)")
+        else:
+            logger.info(f"✅ [{scraper_key.upper()}] 완료 - {duration:.1f}초, 공고 {stats['announcements']}개, 파일 {stats['files']}개")
         
         return stats
         
@@ -209,23 +346,51 @@ def run_single_scraper(scraper_config: Dict[str, Any], max_pages: int = 3) -> Di
             'total_size': 0
         }
 
-def collect_scraper_stats(output_dir: str) -> Dict[str, Any]:
-    """스크래퍼 실행 결과 통계 수집"""
+def collect_scraper_stats(output_dir: str, scraper=None) -> Dict[str, Any]:
+    """스크래퍼 실행 결과 통계 수집
+    
+    스크래퍼가 실행 매니페스트에 공고를 기록했으면 그 합계를 그대로 사용하고,
+    매니페스트가 없거나 비어 있는 스크래퍼(scrape_pages를 재정의한 사이트 등)는 출력 디렉토리를 훑는다.
+    new_announcements는 이번 실행에서 새로 저장한 공고 수로, 이전 실행분까지 세는 디렉토리 합계는 쓰지 않는다.
+    """
     stats = {
         'announcements': 0,
+        'new_announcements': 0,
         'files': 0,
         'total_size': 0
     }
     
+    manifest = getattr(scraper, 'manifest', None)
+    if manifest is not None:
+        scraper.close_run_outputs()
+        stats['new_announcements'] = manifest.summary['announcements']
+    elif scraper is not None:
+        # 매니페스트를 열지 않은 스크래퍼는 이번 실행에서 처리 완료한 공고 키 수
+        stats['new_announcements'] = len(getattr(scraper, 'current_session_titles', ()))
+    if manifest is not None and (manifest.summary['announcements'] or manifest.summary['failed_announcements']):
+        summary = manifest.summary
+        stats.update({
+            'announcements': summary['announcements'],
+            'files': summary['files'],
+            'total_size': summary['total_size'],
+            'failed_announcements': summary['failed_announcements'],
+            'failed_files': summary['failed_files'],
+            'manifest': manifest.path
+        })
+        record_sink = getattr(scraper, 'record_sink', None)
+        if record_sink is not None:
+            stats['records'] = record_sink.total_records
+            stats['record_files'] = record_sink.paths
+        return stats
+    
     try:
         if not os.path.exists(output_dir):
             return stats
         
-        # 공고 폴더들 찾기
+        # 공고 폴더들 찾기 (번호_제목 형식, 번호 자릿수 무관)
         announcement_folders = [
             item for item in os.listdir(output_dir)
-            if os.path.isdir(os.path.join(output_dir, item)) and 
-               any(item.startswith(prefix) for prefix in ['001_', '002_', '003_', '004_', '005_', '006_', '007_', '008_', '009_'])
+            if os.path.isdir(os.path.join(output_dir, item)) and re.match(r'^\d+_', item)
         ]
         
         stats['announcements'] = len(announcement_folders)
@@ -297,16 +462,19 @@ def print_summary(all_results: List[Dict[str, Any]]):
     
     successful = [r for r in all_results if r['status'] == 'success']
     failed = [r for r in all_results if r['status'] in ['error', 'exception']]
+    exceeded = [r for r in all_results if r['status'] == 'budget_exceeded']
+    collected = successful + exceeded  # 예산 초과 사이트도 저장한 부분까지 집계
     
     total_duration = sum(r['duration'] for r in all_results)
-    total_announcements = sum(r['announcements'] for r in successful)
-    total_files = sum(r['files'] for r in successful)
-    total_size = sum(r['total_size'] for r in successful)
+    total_announcements = sum(r['announcements'] for r in collected)
+    total_files = sum(r['files'] for r in collected)
+    total_size = sum(r['total_size'] for r in collected)
     
     print(f"📊 전체 통계:")
     print(f"  • 총 스크래퍼: {len(all_results)}개")
     print(f"  • 성공: {len(successful)}개")
     print(f"  • 실패: {len(failed)}개")
+    print(f"  • 시간 예산 초과: {len(exceeded)}개")
     print(f"  • 전체 실행 시간: {total_duration:.1f}초")
     print(f"  • 총 수집 공고: {total_announcements}개")
     print(f"  • 총 다운로드 파일: {total_files}개")
@@ -322,36 +490,196 @@ def print_summary(all_results: List[Dict[str, Any]]):
         for result in failed:
             print(f"  • {result['name']}: {result.get('error', 'Unknown error')}")
     
+    if exceeded:
+        print(f"\n⏱️ 시간 예산 초과 스크래퍼들 (--resume으로 이어서 수집):")
+        for result in exceeded:
+            print(f"  • {result['name']}: {result['announcements']}개 공고까지 저장, {result['duration']:.1f}초 - {result.get('error', '')}")
+    
     print("\n" + "="*80)
 
-def main():
-    """메인 실행 함수"""
+def load_site_list_scrapers(site_lists: List[str], include_disabled: bool = False) -> Dict[str, Dict[str, Any]]:
+    """사이트 목록 CSV의 사이트를 스크래퍼로 매핑 - 찾지 못한 사이트는 출력하고 보고서로 저장"""
+    site_rows = []
+    for path in site_lists:
+        site_rows.extend(load_site_list(path, include_disabled=include_disabled))
+    
+    scrapers, unresolved = resolve_sites(site_rows, registered=ENHANCED_SCRAPERS)
+    
+    if unresolved:
+        print(f"⚠️  스크래퍼를 찾지 못한 사이트 {len(unresolved)}개:")
+        for site in unresolved:
+            print(f"   • {site['site_code']} ({site['site_name']}): {site['reason']}")
+        print()
+        
+        os.makedirs(os.path.dirname(UNRESOLVED_SITES_PATH), exist_ok=True)
+        with open(UNRESOLVED_SITES_PATH, 'w', encoding='utf-8') as f:
+            json.dump({
+                'site_lists': site_lists,
+                'created_at': datetime.now().isoformat(),
+                'sites': unresolved
+            }, f, ensure_ascii=False, indent=2)
+        logger.warning(f"스크래퍼 미지원 사이트 {len(unresolved)}개 - {UNRESOLVED_SITES_PATH}")
+    
+    return scrapers
+
+def run_daemon(scrapers: Dict[str, Dict[str, Any]], max_pages: int = 10, max_workers: int = 3,
+               scheduler: PollScheduler = None, session_max_age: float = 6 * 3600,
+               site_budget: float = None, skip_duplicate_attachments: bool = False):
+    """상주 실행 - 사이트마다 학습한 주기로 반복 수집
+    
+    스크래퍼 인스턴스(HTTP 세션, 엔드포인트/파싱 전략 캐시)는 session_max_age초 동안 재사용하고,
+    그보다 오래되면 새로 만든다. SIGTERM/SIGINT를 받으면 진행 중인 수집을 마치고 종료한다.
+    """
+    scheduler = scheduler or PollScheduler(DAEMON_STATE_PATH)
+    keys = list(scrapers)
+    scheduler.register(keys)
+    scheduler.save()
+    
+    stop_event = threading.Event()
+    def request_stop(signum, frame):
+        logger.info(f"종료 신호 수신 ({signum}) - 진행 중인 수집을 마치고 종료")
+        stop_event.set()
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+    
+    instances = {}  # {key: (스크래퍼, 생성 시각)}
+    running = {}  # {future: key}
+    
+    def run_site(key: str) -> Dict[str, Any]:
+        scraper, created = instances.get(key, (None, 0))
+        if scraper is None or time.time() - created > session_max_age:
+            scraper = scrapers[key]['class']()
+            instances[key] = (scraper, time.time())
+        config = {'key': key, 'info': scrapers[key], 'scraper': scraper, 'site_budget': site_budget,
+                  'skip_duplicate_attachments': skip_duplicate_attachments,
+                  'run_id': datetime.now().strftime('%Y%m%d_%H%M%S')}
+        return run_single_scraper(config, max_pages)
+    
+    logger.info(f"데몬 모드 시작 - {len(keys)}개 사이트, 동시 {max_workers}개")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while not stop_event.is_set():
+            # 빈 작업자 수만큼 예정 시각이 지난 사이트 투입
+            busy = set(running.values())
+            for key in scheduler.due_sites(keys):
+                if len(running) >= max_workers:
+                    break
+                if key not in busy:
+                    running[executor.submit(run_site, key)] = key
+            
+            # 다음 예정 시각 또는 수집 완료까지 대기
+            next_due = scheduler.next_due([key for key in keys if key not in running.values()])
+            timeout = 60 if next_due is None else min(60, max(1, next_due - time.time()))
+            if running:
+                done, _ = concurrent.futures.wait(list(running), timeout=timeout,
+                                                  return_when=concurrent.futures.FIRST_COMPLETED)
+            else:
+                stop_event.wait(timeout)
+                done = set()
+            
+            for future in done:
+                key = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {'status': 'exception', 'error': str(e)}
+                
+                if result['status'] == 'budget_exceeded':
+                    instances.pop(key, None)  # 실행 도중 중단된 인스턴스는 재사용하지 않음
+                if result['status'] in ('success', 'budget_exceeded'):
+                    next_run = scheduler.record_run(key, result.get('new_announcements', 0))
+                else:
+                    instances.pop(key, None)  # 세션 문제일 수 있으므로 다음에는 새 인스턴스
+                    next_run = scheduler.record_failure(key)
+                scheduler.save()
+                logger.info(f"[{key.upper()}] 다음 수집: {datetime.fromtimestamp(next_run).strftime('%Y-%m-%d %H:%M:%S')}")
+        
+        # 진행 중인 수집 마무리
+        for future in concurrent.futures.as_completed(list(running)):
+            key = running.pop(future)
+            try:
+                result = future.result()
+                if result['status'] == 'success':
+                    scheduler.record_run(key, result.get('new_announcements', 0))
+            except Exception:
+                pass
+        scheduler.save()
+    
+    if _text_extractor is not None:
+        _text_extractor.close()
+    metrics.write(METRICS_DIR, f"daemon_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    logger.info("데몬 모드 종료")
+
+def main(sites: List[str] = None, profile: List[str] = None, profile_mode: str = 'deterministic',
+         site_lists: List[str] = None, include_disabled: bool = False, daemon: bool = False,
+         min_interval: float = 1800, max_interval: float = 86400, resume: bool = False,
+         site_budget: float = None, deadline: float = None, skip_duplicate_attachments: bool = False):
+    """메인 실행 함수
+    
+    sites: 실행할 스크래퍼 키 목록 (없으면 전체)
+    profile: 프로파일링할 스크래퍼 키 목록 ('all'이면 전체)
+    site_lists: 사이트 목록 CSV 경로 - 지정하면 ENHANCED_SCRAPERS 대신 CSV의 실행 대상 사이트를 실행
+    include_disabled: 사이트 목록의 실행 여부 열이 꺼진 사이트도 실행
+    daemon: 한 번 실행하고 끝내지 않고 사이트별 학습 주기로 계속 수집
+    min_interval, max_interval: 데몬 모드의 사이트별 수집 간격 범위 (초)
+    resume: 중단된 실행의 체크포인트가 남은 사이트는 멈춘 페이지/공고 번호부터 이어서 수집
+    site_budget: 사이트별 제한 시간 (초) - 넘으면 처리한 부분까지 저장하고 다음 사이트로
+    deadline: 전체 실행 마감 시각 (epoch 초) - 이후에는 진행 중인 사이트를 멈추고 남은 사이트는 시작하지 않음
+    skip_duplicate_attachments: 재게시 공고의 첨부파일 중 원본 공고가 같은 URL에서 받아 둔 파일은 다운로드 생략
+    """
     print("🚀 Enhanced 스크래퍼 통합 실행기 시작")
     print("="*60)
     
     start_time = datetime.now()
     logger.info("Enhanced 스크래퍼 통합 실행 시작")
     
+    scrapers = load_site_list_scrapers(site_lists, include_disabled) if site_lists else ENHANCED_SCRAPERS
+    
+    unknown = [key for key in (sites or []) + (profile or []) if key != 'all' and key not in scrapers]
+    if unknown:
+        raise ValueError(f"알 수 없는 스크래퍼: {', '.join(unknown)}")
+    
+    if daemon:
+        selected = {key: info for key, info in scrapers.items() if not sites or key in sites}
+        scheduler = PollScheduler(DAEMON_STATE_PATH, min_interval=min_interval, max_interval=max_interval)
+        run_daemon(selected, max_pages=10, scheduler=scheduler, site_budget=site_budget,
+                   skip_duplicate_attachments=skip_duplicate_attachments)
+        return []
+    
     # 스크래퍼 설정 준비
+    run_id = start_time.strftime('%Y%m%d_%H%M%S')
+    profile = profile or []
     scraper_configs = []
-    for key, info in ENHANCED_SCRAPERS.items():
+    for key, info in scrapers.items():
+        if sites and key not in sites:
+            continue
         scraper_configs.append({
             'key': key,
-            'info': info
+            'info': info,
+            'profile': profile_mode if ('all' in profile or key in profile) else None,
+            'run_id': run_id,
+            'resume': resume,
+            'site_budget': site_budget,
+            'deadline': deadline,
+            'skip_duplicate_attachments': skip_duplicate_attachments
         })
     
     print(f"📋 총 {len(scraper_configs)}개 Enhanced 스크래퍼 실행 예정")
     print("   3개씩 동시 실행하여 전체 스크래핑 수행")
     print()
     
-    # 3개씩 배치로 나누기
+    # 3개씩 배치로 나누기 - 프로파일링 사이트는 마지막에 하나씩 단독 실행
+    # (cProfile, tracemalloc, 최대 RSS가 프로세스 전역이라 동시에 돌면 다른 사이트 수치가 섞임)
     batch_size = 3
+    profiled = [config for config in scraper_configs if config['profile']]
+    unprofiled = [config for config in scraper_configs if not config['profile']]
+    if profiled:
+        logger.warning(f"프로파일링 사이트 {len(profiled)}개는 동시 실행하지 않고 하나씩 실행합니다")
+    batches = [unprofiled[i:i + batch_size] for i in range(0, len(unprofiled), batch_size)]
+    batches += [[config] for config in profiled]
     all_results = []
     
-    for i in range(0, len(scraper_configs), batch_size):
-        batch = scraper_configs[i:i + batch_size]
-        batch_num = (i // batch_size) + 1
-        
+    for batch_num, batch in enumerate(batches, 1):
         print(f"🔄 배치 {batch_num} 실행 중 ({len(batch)}개 스크래퍼):")
         for config in batch:
             print(f"   • {config['info']['name']}")
@@ -368,6 +696,13 @@ def main():
     
     logger.info(f"Enhanced 스크래퍼 통합 실행 완료 - 총 {total_duration:.1f}초")
     
+    # 남은 첨부파일 텍스트 추출 마무리
+    if _text_extractor is not None:
+        _text_extractor.close()
+    
+    # 단계별 계측 보고서 (OpenMetrics 텍스트 + JSON)
+    metrics.write(METRICS_DIR, f"run_{run_id}")
+    
     # 결과 요약 출력
     print_summary(all_results)
     
@@ -377,8 +712,45 @@ def main():
     return all_results
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Enhanced 스크래퍼 통합 실행기')
+    parser.add_argument('--sites', type=str, help='실행할 스크래퍼 키 (쉼표 구분, 기본값: 전체)')
+    parser.add_argument('--profile', type=str,
+                        help="프로파일링할 스크래퍼 키 (쉼표 구분, 'all'이면 전체) - 하나씩 단독 실행, 결과는 ./output/profiles/")
+    parser.add_argument('--profile-mode', type=str, default='deterministic', choices=PROFILE_MODES,
+                        help='deterministic: cProfile pstats, sampling: collapsed stack (기본값: deterministic)')
+    parser.add_argument('--site-list', type=str,
+                        help='사이트 목록 CSV (쉼표 구분, 예: 0424full.csv) - 스크래퍼를 찾은 실행 대상 사이트 전체 실행')
+    parser.add_argument('--include-disabled', action='store_true',
+                        help='사이트 목록의 실행 여부 열이 꺼진 사이트도 실행')
+    parser.add_argument('--resume', action='store_true',
+                        help='중단된 실행 이어서 수집 - 체크포인트가 남은 사이트는 멈춘 페이지/공고부터')
+    parser.add_argument('--site-budget', type=float,
+                        help='사이트별 제한 시간 (분) - 넘으면 처리한 부분까지 저장하고 작업자 반환')
+    parser.add_argument('--deadline', type=str,
+                        help='전체 실행 마감 시각 (HH:MM, 지났으면 다음 날) - 이후 진행 중인 사이트는 멈추고 남은 사이트는 건너뜀')
+    parser.add_argument('--skip-duplicate-attachments', action='store_true',
+                        help='재게시 공고의 첨부파일 중 원본 공고가 같은 URL에서 받아 둔 파일은 다운로드 생략')
+    parser.add_argument('--daemon', action='store_true',
+                        help='상주 실행 - 사이트별로 새 공고 게시 기록에서 학습한 주기로 계속 수집')
+    parser.add_argument('--min-interval', type=int, default=30, help='데몬 모드 최소 수집 간격 (분, 기본값: 30)')
+    parser.add_argument('--max-interval', type=int, default=1440, help='데몬 모드 최대 수집 간격 (분, 기본값: 1440)')
+    args = parser.parse_args()
+    
     try:
-        results = main()
+        results = main(
+            sites=args.sites.split(',') if args.sites else None,
+            profile=args.profile.split(',') if args.profile else None,
+            profile_mode=args.profile_mode,
+            site_lists=args.site_list.split(',') if args.site_list else None,
+            include_disabled=args.include_disabled,
+            daemon=args.daemon,
+            min_interval=args.min_interval * 60,
+            max_interval=args.max_interval * 60,
+            resume=args.resume,
+            site_budget=args.site_budget * 60 if args.site_budget else None,
+            deadline=parse_deadline(args.deadline) if args.deadline else None,
+            skip_duplicate_attachments=args.skip_duplicate_attachments
+        )
         print("\n🎉 모든 Enhanced 스크래퍼 실행이 완료되었습니다!")
     except KeyboardInterrupt:
         print("\n⚠️  사용자에 의해 실행이 중단되었습니다.")
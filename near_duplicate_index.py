@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+사이트 간 유사 공고 색인 - 여러 기관이 다시 게시한 같은 공고를 SimHash로 찾음
+
+technopark.kr처럼 다른 기관 공고를 모아 올리는 사이트나 대한상의 공고를 그대로 옮기는 상공회의소들은
+같은 공고를 조금씩 다른 머리말/링크로 다시 게시한다. 정규화한 제목+본문의 글자 n-gram으로
+64비트 SimHash를 만들고, 해밍 거리가 max_distance 이하인 다른 사이트의 먼저 저장된 공고를 원본으로 본다.
+공고 본문은 웹 문서보다 짧아 머리말 한 줄에도 몇 비트씩 바뀌므로 기본 거리는 6비트로 둔다
+(같은 단어를 뒤섞은 글도 15비트 이상 떨어진다).
+"""
+
+import os
+import re
+import json
+import sys
+import sqlite3
+import hashlib
+import logging
+import argparse
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SHINGLE_SIZE = 3
+MIN_TEXT_LENGTH = 200  # 정규화 후 이보다 짧으면 ('첨부파일 참조' 등) 비교하지 않음
+BANDS = 8  # 64비트를 8비트씩 나눈 후보 검색용 밴드
+
+URL_PATTERN = re.compile(r'https?://\S+')
+NON_TEXT_PATTERN = re.compile(r'[^0-9a-z가-힣]+')
+
+
+def normalize_text(text: str) -> str:
+    """비교용 정규화 - URL, 공백, 문장부호, 마크다운 기호 제거 후 소문자"""
+    text = URL_PATTERN.sub(' ', text or '').lower()
+    return NON_TEXT_PATTERN.sub('', text)
+
+
+def simhash(text: str) -> int:
+    """정규화된 텍스트의 글자 n-gram 64비트 SimHash"""
+    shingles = Counter(text[i:i + SHINGLE_SIZE] for i in range(max(len(text) - SHINGLE_SIZE + 1, 1)))
+    weights = [0] * 64
+    for shingle, count in shingles.items():
+        value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            if value >> bit & 1:
+                weights[bit] += count
+            else:
+                weights[bit] -= count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def _to_signed(value: int) -> int:
+    """SQLite INTEGER(부호 있는 64비트)로 저장하기 위한 변환"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _bands(value: int) -> List[int]:
+    width = 64 // BANDS
+    return [value >> (i * width) & ((1 << width) - 1) for i in range(BANDS)]
+
+
+class NearDuplicateIndex:
+    """SQLite 기반 SimHash 색인
+
+    공고마다 지문을 저장하고, 먼저 저장된 다른 사이트 공고와 가까우면 그 공고를 원본(canonical_id)으로 기록한다.
+    max_distance가 밴드 수보다 작으면 가까운 지문은 적어도 한 밴드가 같으므로 밴드 색인으로 후보만 비교한다.
+    """
+
+    def __init__(self, db_path: str, max_distance: int = 6):
+        if max_distance >= BANDS:
+            raise ValueError(f"max_distance는 {BANDS} 미만이어야 합니다: {max_distance}")
+        self.db_path = db_path
+        self.max_distance = max_distance
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                id INTEGER PRIMARY KEY,
+                folder_path TEXT UNIQUE NOT NULL,
+                site TEXT NOT NULL,
+                title TEXT NOT NULL,
+                url TEXT,
+                simhash INTEGER NOT NULL,
+                {', '.join(f'band{i} INTEGER NOT NULL' for i in range(BANDS))},
+                canonical_id INTEGER,
+                attachment_files TEXT DEFAULT '[]',
+                added_at TEXT NOT NULL
+            );
+            {' '.join(f'CREATE INDEX IF NOT EXISTS idx_fingerprints_band{i} ON fingerprints (band{i});'
+                      for i in range(BANDS))}
+            CREATE INDEX IF NOT EXISTS idx_fingerprints_canonical ON fingerprints (canonical_id);
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def fingerprint(title: str, content: str) -> Optional[int]:
+        """제목+본문 지문 - 본문이 너무 짧으면 None"""
+        text = normalize_text(f"{title or ''}\n{content or ''}")
+        if len(text) < MIN_TEXT_LENGTH:
+            return None
+        return simhash(text)
+
+    def find(self, fingerprint: int, site: str) -> Optional[Dict[str, Any]]:
+        """다른 사이트의 가장 가까운 원본 공고
+
+        {'id', 'site', 'folder_path', 'title', 'url', 'attachment_files', 'distance'} - attachment_files는
+        원본이 다운로드를 마친 첨부파일의 [{'url', 'sha256'}] 목록
+        """
+        bands = _bands(fingerprint)
+        with self._lock:
+            rows = self._conn.execute(f"""
+                SELECT id, site, folder_path, title, url, simhash, attachment_files
+                FROM fingerprints
+                WHERE ({' OR '.join(f'band{i} = ?' for i in range(BANDS))})
+                  AND canonical_id IS NULL AND site != ?
+                ORDER BY id
+            """, (*bands, site)).fetchall()
+
+        best = None
+        for row in rows:
+            distance = bin((row['simhash'] & ((1 << 64) - 1)) ^ fingerprint).count('1')
+            if distance <= self.max_distance and (best is None or distance < best['distance']):
+                best = dict(row, distance=distance, attachment_files=json.loads(row['attachment_files']))
+                del best['simhash']
+        return best
+
+    def add(self, site: str, folder_path: str, title: str, url: str, fingerprint: int,
+            canonical: Optional[Dict[str, Any]] = None):
+        """공고 지문 등록 (같은 폴더는 갱신) - canonical은 find()가 돌려준 원본"""
+        with self._lock:
+            self._conn.execute(f"""
+                INSERT INTO fingerprints (folder_path, site, title, url, simhash,
+                                          {', '.join(f'band{i}' for i in range(BANDS))}, canonical_id, added_at)
+                VALUES (?, ?, ?, ?, ?, {', '.join('?' * BANDS)}, ?, ?)
+                ON CONFLICT (folder_path) DO UPDATE SET
+                    site = excluded.site, title = excluded.title, url = excluded.url, simhash = excluded.simhash,
+                    {', '.join(f'band{i} = excluded.band{i}' for i in range(BANDS))},
+                    canonical_id = excluded.canonical_id, added_at = excluded.added_at
+            """, (
+                os.path.abspath(folder_path), site, title, url, _to_signed(fingerprint),
+                *_bands(fingerprint), canonical['id'] if canonical else None, datetime.now().isoformat()
+            ))
+            self._conn.commit()
+
+    def set_attachments(self, folder_path: str, files: List[Dict[str, Optional[str]]]):
+        """공고의 다운로드 완료 첨부파일 [{'url', 'sha256'}] - 재게시 공고의 다운로드 생략 판단에 사용"""
+        with self._lock:
+            self._conn.execute('UPDATE fingerprints SET attachment_files = ? WHERE folder_path = ?',
+                               (json.dumps(files, ensure_ascii=False), os.path.abspath(folder_path)))
+            self._conn.commit()
+
+    def reposts(self, site: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """재게시된 원본 공고 목록 - 다시 게시한 사이트 수가 많은 순"""
+        condition = 'WHERE c.site = ?' if site else ''
+        params = ([site] if site else []) + [limit]
+        with self._lock:
+            rows = self._conn.execute(f"""
+                SELECT c.site, c.title, c.url, c.folder_path, COUNT(r.id) AS copies,
+                       GROUP_CONCAT(DISTINCT r.site) AS sites
+                FROM fingerprints c
+                JOIN fingerprints r ON r.canonical_id = c.id
+                {condition}
+                GROUP BY c.id
+                ORDER BY copies DESC, c.id DESC
+                LIMIT ?
+            """, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self):
+        """색인 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='사이트 간 재게시 공고 조회')
+    parser.add_argument('--db', type=str, default='output/.near_duplicates.sqlite3', help='색인 파일 경로')
+    parser.add_argument('--site', type=str, help='원본 사이트 (예: technopark)')
+    parser.add_argument('--limit', type=int, default=50, help='최대 결과 수 (기본값: 50)')
+
+    args = parser.parse_args()
+    if not os.path.exists(args.db):
+        print(f"색인이 없습니다: {args.db}")
+        sys.exit(1)
+
+    index = NearDuplicateIndex(args.db)
+    results = index.reposts(site=args.site, limit=args.limit)
+    for result in results:
+        print(f"[{result['site']}] {result['title']}  (재게시 {result['copies']}건: {result['sites']})")
+        print(f"            {result['url']}")
+    print(f"\n{len(results)}건")
+    index.close()
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+사이트별 적응형 수집 주기 스케줄러 (main.py --daemon 에서 사용)
+사이트마다 새 공고가 실제로 올라온 기록으로 다음 수집 시각을 정한다.
+
+- 게시 간격: 최근 새 공고 관측 기록의 (경과 시간 / 새 공고 수), 그 절반 간격으로 수집
+- 조용한 사이트: 새 공고가 없을 때마다 간격을 backoff배씩 늘림 (max_interval까지)
+- 게시 시간대: 관측된 새 공고가 충분하면, 한 번도 게시가 없던 시간대(예: 새벽)는 건너뜀
+- 지터: 간격에 ±jitter 비율을 섞어 여러 사이트가 같은 시각에 몰리지 않게 함
+- 실패: 연속 실패 횟수만큼 min_interval부터 두 배씩 늘림
+
+상태는 JSON 파일 하나에 저장하여 데몬을 다시 시작해도 학습한 주기를 이어서 쓴다.
+"""
+
+import os
+import json
+import random
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PollScheduler:
+    """사이트별 다음 수집 시각 관리"""
+
+    def __init__(self, state_path: str, min_interval: float = 1800, max_interval: float = 86400,
+                 default_interval: float = 3600, backoff: float = 1.5, jitter: float = 0.1,
+                 history_size: int = 50, min_observations: int = 3, min_hour_samples: int = 20):
+        self.state_path = state_path
+        self.min_interval = min_interval  # 가장 자주 수집하는 간격 (초)
+        self.max_interval = max_interval  # 가장 드물게 수집하는 간격 (초)
+        self.default_interval = default_interval  # 기록이 부족할 때 간격 (초)
+        self.backoff = backoff  # 새 공고가 없을 때 간격 증가 배수
+        self.jitter = jitter  # 간격에 섞는 무작위 비율
+        self.history_size = history_size  # 게시 간격 추정에 쓰는 최근 관측 수
+        self.min_observations = min_observations  # 게시 간격을 추정하기 위한 최소 관측 수
+        self.min_hour_samples = min_hour_samples  # 시간대 보정에 필요한 최소 새 공고 수
+        self.sites: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """상태 파일 로드"""
+        try:
+            if os.path.exists(self.state_path):
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    self.sites = json.load(f).get('sites', {})
+                logger.info(f"수집 주기 상태 로드: {len(self.sites)}개 사이트")
+        except Exception as e:
+            logger.error(f"수집 주기 상태 로드 실패: {e}")
+            self.sites = {}
+
+    def save(self):
+        """상태 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        with self._lock:
+            data = {'sites': self.sites, 'last_updated': datetime.now().isoformat()}
+            try:
+                os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+                tmp_path = f"{self.state_path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.state_path)
+            except Exception as e:
+                logger.error(f"수집 주기 상태 저장 실패: {e}")
+
+    def register(self, keys: List[str], now: Optional[float] = None, stagger: float = 300):
+        """수집 대상 등록 - 처음 보는 사이트는 stagger초 안에 흩어서 바로 수집"""
+        now = now if now is not None else time.time()
+        with self._lock:
+            for key in keys:
+                if key not in self.sites:
+                    self.sites[key] = {
+                        'interval': self.default_interval,
+                        'next_run': now + random.uniform(0, stagger),
+                        'last_run': None,
+                        'first_run': None,
+                        'quiet_runs': 0,
+                        'failures': 0,
+                        'observations': [],  # [[시각, 새 공고 수], ...]
+                        'hour_counts': [0] * 24
+                    }
+
+    def due_sites(self, keys: List[str], now: Optional[float] = None) -> List[str]:
+        """지금 수집할 사이트 (예정 시각이 이른 순)"""
+        now = now if now is not None else time.time()
+        due = [key for key in keys if key in self.sites and self.sites[key]['next_run'] <= now]
+        return sorted(due, key=lambda key: self.sites[key]['next_run'])
+
+    def next_due(self, keys: List[str]) -> Optional[float]:
+        """가장 이른 다음 수집 시각"""
+        times = [self.sites[key]['next_run'] for key in keys if key in self.sites]
+        return min(times) if times else None
+
+    def learned_interval(self, key: str, now: Optional[float] = None) -> float:
+        """관측 기록으로 추정한 수집 간격 - 평균 게시 간격의 절반"""
+        now = now if now is not None else time.time()
+        state = self.sites[key]
+        observations = state['observations']
+        if len(observations) < self.min_observations:
+            return self.default_interval
+
+        # 기록이 잘렸으면 남은 가장 오래된 관측 이후, 아니면 첫 수집 이후의 새 공고 수
+        if len(observations) > self.history_size:
+            since = observations[0][0]
+            posts = sum(count for _, count in observations[1:])
+        else:
+            since = state['first_run']
+            posts = sum(count for _, count in observations)
+        if posts <= 0:
+            return self.default_interval
+
+        gap = (now - since) / posts
+        return min(self.max_interval, max(self.min_interval, gap / 2))
+
+    def record_run(self, key: str, new_count: int, now: Optional[float] = None) -> float:
+        """수집 결과 기록 후 다음 수집 시각 반환"""
+        now = now if now is not None else time.time()
+        with self._lock:
+            state = self.sites[key]
+            if state['first_run'] is None:
+                state['first_run'] = now
+            state['last_run'] = now
+            state['failures'] = 0
+
+            # 첫 수집의 공고는 기존 게시물이므로 게시 간격 관측에서 제외
+            if new_count > 0 and state['first_run'] != now:
+                state['observations'].append([now, new_count])
+                del state['observations'][:-(self.history_size + 1)]
+                state['hour_counts'][datetime.fromtimestamp(now).hour] += new_count
+
+        base = self.learned_interval(key, now)
+        with self._lock:
+            if new_count > 0:
+                state['quiet_runs'] = 0
+                interval = base
+            else:
+                state['quiet_runs'] += 1
+                interval = min(self.max_interval, base * self.backoff ** state['quiet_runs'])
+
+            state['interval'] = interval
+            state['next_run'] = self._active_hour(key, now + self._jittered(interval), now)
+            return state['next_run']
+
+    def record_failure(self, key: str, now: Optional[float] = None) -> float:
+        """수집 실패 기록 - 연속 실패마다 간격을 두 배로"""
+        now = now if now is not None else time.time()
+        with self._lock:
+            state = self.sites[key]
+            state['failures'] += 1
+            interval = min(self.max_interval, self.min_interval * 2 ** (state['failures'] - 1))
+            state['next_run'] = now + self._jittered(interval)
+            return state['next_run']
+
+    def _jittered(self, interval: float) -> float:
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _active_hour(self, key: str, when: float, now: float) -> float:
+        """게시 기록이 없는 시간대면 다음 게시 시간대 시작으로 미룸 (max_interval 이내)"""
+        hour_counts = self.sites[key]['hour_counts']
+        if sum(hour_counts) < self.min_hour_samples:
+            return when
+
+        moment = datetime.fromtimestamp(when)
+        if hour_counts[moment.hour] > 0:
+            return when
+
+        limit = now + self.max_interval
+        start = moment.replace(minute=0, second=0, microsecond=0)
+        for step in range(1, 25):
+            candidate = start + timedelta(hours=step)
+            if hour_counts[candidate.hour] > 0:
+                return min(candidate.timestamp(), limit)
+        return when
@@ -0,0 +1,375 @@
+# -*- coding: utf-8 -*-
+"""
+오프라인 재생 벤치마크 - 녹화한 목록/상세/첨부파일 응답을 로컬 HTTP 서버로 재생하면서
+스크래퍼를 처음부터 끝까지 실행하고 처리량, 단계별 p50/p95, 최대 메모리를 측정
+
+사용법:
+    python replay_benchmark.py run [--sites btp,gsif] [--latency 0.05] [--bandwidth 1000000]
+                                   [--repeat 3] [--compare 이전결과.json]
+    python replay_benchmark.py record <사이트> [--pages 2]   # 실제 사이트 응답 녹화
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import shutil
+import socket
+import logging
+import argparse
+import tempfile
+import platform
+import importlib
+import threading
+import subprocess
+import tracemalloc
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit
+from typing import Dict, Any, List, Optional
+
+from requests.adapters import HTTPAdapter
+
+from scraper_metrics import ScraperMetrics
+from scraper_profiler import peak_rss_bytes
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'replay')
+RESULT_DIR = './output/benchmarks'
+REPLAY_PREFIX = '/__replay__/'
+
+# 벤치마크 대상 사이트 - 녹화 파일은 fixtures/replay/<키>.jsonl
+BENCHMARK_SITES = {
+    'btp': {'module': 'enhanced_btp_scraper', 'class': 'EnhancedBTPScraper', 'max_pages': 3},
+    'gsif': {'module': 'enhanced_gsif_scraper', 'class': 'EnhancedGSIFScraper', 'max_pages': 3},
+}
+
+# 회귀로 판단할 처리량 감소 비율
+REGRESSION_THRESHOLD = 0.10
+
+
+def load_cassette(path: str) -> Dict[tuple, Dict[str, Any]]:
+    """녹화 파일 로드 - {(method, url): 응답} (본문은 base64)"""
+    entries = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            entry['body'] = base64.b64decode(entry.pop('body_b64', ''))
+            entries[(entry['method'], entry['url'])] = entry
+    return entries
+
+
+def append_cassette(path: str, method: str, url: str, status: int, headers: Dict[str, str], body: bytes):
+    """녹화 파일에 응답 하나 추가"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    keep = {name: value for name, value in headers.items()
+            if name.lower() in ('content-type', 'content-disposition', 'location')}
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({
+            'method': method,
+            'url': url,
+            'status': status,
+            'headers': keep,
+            'body_b64': base64.b64encode(body).decode('ascii')
+        }, ensure_ascii=False) + '\n')
+
+
+class ReplayServer:
+    """녹화한 응답을 돌려주는 로컬 HTTP 서버
+
+    요청 경로는 /__replay__/<scheme>/<host><path>?<query> 형식이며 ReplayAdapter가 변환한다.
+    latency(초)만큼 응답 전에 기다리고, bandwidth(바이트/초)로 본문 전송 속도를 제한한다.
+    """
+
+    def __init__(self, entries: Dict[tuple, Dict[str, Any]], latency: float = 0.0, bandwidth: Optional[int] = None):
+        self.entries = entries
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.misses: List[str] = []
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                # 헤더와 본문을 따로 쓰므로 Nagle 알고리즘 때문에 생기는 지연을 없앰
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def log_message(self, format, *args):
+                pass
+
+            def _serve(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    self.rfile.read(length)
+
+                url = self.path
+                if url.startswith(REPLAY_PREFIX):
+                    scheme, _, rest = url[len(REPLAY_PREFIX):].partition('/')
+                    url = f'{scheme}://{rest}'
+
+                entry = server.entries.get((self.command, url))
+                if server.latency:
+                    time.sleep(server.latency)
+
+                if entry is None:
+                    server.misses.append(f'{self.command} {url}')
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                body = entry['body']
+                self.send_response(entry['status'])
+                for name, value in entry['headers'].items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+
+                chunk_size = 16 * 1024
+                for start in range(0, len(body), chunk_size):
+                    chunk = body[start:start + chunk_size]
+                    self.wfile.write(chunk)
+                    if server.bandwidth:
+                        time.sleep(len(chunk) / server.bandwidth)
+
+            do_GET = _serve
+            do_POST = _serve
+            do_HEAD = _serve
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._httpd.daemon_threads = True
+        self.address = f'http://127.0.0.1:{self._httpd.server_port}'
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        return False
+
+
+class ReplayAdapter(HTTPAdapter):
+    """모든 요청을 ReplayServer로 돌리는 requests 어댑터 - 응답 URL은 원래 URL로 복원"""
+
+    def __init__(self, server_address: str, **kwargs):
+        super().__init__(**kwargs)
+        self.server_address = server_address
+
+    def send(self, request, **kwargs):
+        original_url = request.url
+        parts = urlsplit(original_url)
+        request.url = f'{self.server_address}{REPLAY_PREFIX}{parts.scheme}/{parts.netloc}{parts.path or "/"}'
+        if parts.query:
+            request.url += f'?{parts.query}'
+        request.headers['Host'] = self.server_address.split('://', 1)[1]
+        kwargs['verify'] = False
+
+        response = super().send(request, **kwargs)
+        response.url = original_url
+        request.url = original_url
+        return response
+
+
+class RecordingAdapter(HTTPAdapter):
+    """실제 응답을 녹화 파일에 남기는 requests 어댑터"""
+
+    def __init__(self, cassette_path: str, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette_path = cassette_path
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        body = response.content  # 스트리밍 요청도 녹화를 위해 본문을 모두 읽음
+        with self._lock:
+            append_cassette(self.cassette_path, request.method, request.url,
+                            response.status_code, dict(response.headers), body)
+        return response
+
+
+def create_scraper(site: str):
+    """BENCHMARK_SITES 설정으로 스크래퍼 생성"""
+    spec = BENCHMARK_SITES[site]
+    module = importlib.import_module(spec['module'])
+    return getattr(module, spec['class'])()
+
+
+def run_site(site: str, latency: float = 0.0, bandwidth: Optional[int] = None,
+             keep_delays: bool = False) -> Dict[str, Any]:
+    """사이트 하나를 재생 서버에 대해 처음부터 끝까지 실행"""
+    spec = BENCHMARK_SITES[site]
+    entries = load_cassette(os.path.join(FIXTURE_DIR, f'{site}.jsonl'))
+    output_base = tempfile.mkdtemp(prefix=f'replay_{site}_')
+
+    try:
+        with ReplayServer(entries, latency=latency, bandwidth=bandwidth) as server:
+            scraper = create_scraper(site)
+            scraper.metrics = ScraperMetrics(keep_samples=True)
+            if not keep_delays:
+                scraper.delay_between_requests = 0
+                scraper.delay_between_pages = 0
+
+            adapter = ReplayAdapter(server.address)
+            scraper.session.mount('http://', adapter)
+            scraper.session.mount('https://', adapter)
+
+            tracemalloc.start()
+            started = time.perf_counter()
+            scraper.scrape_pages(max_pages=spec['max_pages'], output_base=output_base)
+            wall_time = time.perf_counter() - started
+            traced_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            scraper.close_run_outputs()
+            summary = scraper.manifest.summary if scraper.manifest else {}
+            phases = scraper.metrics.report(site=scraper.get_site_key())['sites'].get(
+                scraper.get_site_key(), {}).get('phases', {})
+
+            return {
+                'site': site,
+                'wall_time': round(wall_time, 4),
+                'announcements': summary.get('announcements', 0),
+                'files': summary.get('files', 0),
+                'announcements_per_sec': round(summary.get('announcements', 0) / wall_time, 3) if wall_time else None,
+                'phases': {name: {key: phase.get(key) for key in ('count', 'p50', 'p95', 'seconds', 'bytes')}
+                           for name, phase in phases.items()},
+                'tracemalloc_peak_bytes': traced_peak,
+                'replay_misses': server.misses,
+            }
+    finally:
+        shutil.rmtree(output_base, ignore_errors=True)
+
+
+def git_revision() -> Optional[str]:
+    """현재 커밋 (결과 비교용)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def run_benchmark(sites: List[str], latency: float = 0.0, bandwidth: Optional[int] = None,
+                  repeat: int = 1, keep_delays: bool = False) -> Dict[str, Any]:
+    """벤치마크 실행 - 사이트별로 repeat번 실행하여 처리량이 가장 좋은 결과를 채택"""
+    results = {}
+    for site in sites:
+        runs = [run_site(site, latency, bandwidth, keep_delays) for _ in range(repeat)]
+        best = max(runs, key=lambda run: run['announcements_per_sec'] or 0)
+        best['runs'] = [run['announcements_per_sec'] for run in runs]
+        results[site] = best
+
+    return {
+        'revision': git_revision(),
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {'latency': latency, 'bandwidth': bandwidth, 'repeat': repeat, 'keep_delays': keep_delays},
+        'peak_rss_bytes': peak_rss_bytes(),
+        'sites': results,
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    threshold: float = REGRESSION_THRESHOLD) -> List[str]:
+    """이전 결과와 비교하여 처리량이 threshold 이상 떨어진 사이트 목록 반환"""
+    if current['params'] != baseline.get('params'):
+        logger.warning("실행 조건(latency/bandwidth 등)이 달라 비교 결과가 정확하지 않을 수 있습니다")
+
+    regressions = []
+    for site, result in current['sites'].items():
+        before = baseline.get('sites', {}).get(site)
+        if not before or not before.get('announcements_per_sec'):
+            continue
+        change = (result['announcements_per_sec'] - before['announcements_per_sec']) / before['announcements_per_sec']
+        print(f"  {site:10s} {before['announcements_per_sec']:>9.2f} -> {result['announcements_per_sec']:>9.2f} 공고/초 ({change:+.1%})")
+        if change <= -threshold:
+            regressions.append(site)
+    return regressions
+
+
+def print_report(report: Dict[str, Any]):
+    """벤치마크 결과 출력"""
+    print(f"\n리비전 {report['revision']}  Python {report['python']}  조건 {report['params']}")
+    for site, result in report['sites'].items():
+        print(f"\n[{site}] {result['announcements']}개 공고, {result['files']}개 파일, "
+              f"{result['wall_time']:.2f}초, {result['announcements_per_sec']} 공고/초, "
+              f"tracemalloc 최대 {result['tracemalloc_peak_bytes']:,} B")
+        for name, phase in sorted(result['phases'].items()):
+            print(f"    {name:20s} n={phase['count']:<4} p50={phase['p50']}s p95={phase['p95']}s")
+        if result['replay_misses']:
+            print(f"    녹화되지 않은 요청 {len(result['replay_misses'])}개: {result['replay_misses'][:3]}")
+
+
+def record_site(site: str, pages: int):
+    """실제 사이트 응답 녹화 - 기존 녹화 파일은 덮어씀"""
+    cassette_path = os.path.join(FIXTURE_DIR, f'{site}.jsonl')
+    if os.path.exists(cassette_path):
+        os.remove(cassette_path)
+
+    output_base = tempfile.mkdtemp(prefix=f'record_{site}_')
+    try:
+        scraper = create_scraper(site)
+        adapter = RecordingAdapter(cassette_path)
+        scraper.session.mount('http://', adapter)
+        scraper.session.mount('https://', adapter)
+        scraper.scrape_pages(max_pages=pages, output_base=output_base)
+        scraper.close_run_outputs()
+    finally:
+        shutil.rmtree(output_base, ignore_errors=True)
+    logger.info(f"녹화 완료: {cassette_path}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='오프라인 재생 벤치마크')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='벤치마크 실행')
+    run_parser.add_argument('--sites', type=str, help=f"대상 사이트 (쉼표 구분, 기본값: {','.join(BENCHMARK_SITES)})")
+    run_parser.add_argument('--latency', type=float, default=0.0, help='응답 지연 (초)')
+    run_parser.add_argument('--bandwidth', type=int, default=None, help='전송 속도 제한 (바이트/초)')
+    run_parser.add_argument('--repeat', type=int, default=3, help='사이트별 반복 횟수 (기본값: 3)')
+    run_parser.add_argument('--keep-delays', action='store_true', help='사이트의 요청/페이지 간 대기 유지')
+    run_parser.add_argument('--compare', type=str, help='비교할 이전 결과 JSON')
+    run_parser.add_argument('--output', type=str, default=RESULT_DIR, help='결과 저장 디렉토리')
+
+    record_parser = subparsers.add_parser('record', help='실제 사이트 응답 녹화')
+    record_parser.add_argument('site', choices=list(BENCHMARK_SITES))
+    record_parser.add_argument('--pages', type=int, default=2, help='녹화할 페이지 수 (기본값: 2)')
+
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record_site(args.site, args.pages)
+        sys.exit(0)
+
+    sites = args.sites.split(',') if args.sites else list(BENCHMARK_SITES)
+    report = run_benchmark(sites, args.latency, args.bandwidth, args.repeat, args.keep_delays)
+    print_report(report)
+
+    os.makedirs(args.output, exist_ok=True)
+    result_path = os.path.join(args.output, f"{report['revision'] or 'unknown'}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {result_path}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\n{args.compare} 대비:")
+        regressions = compare_results(report, baseline)
+        if regressions:
+            print(f"처리량 회귀 ({REGRESSION_THRESHOLD:.0%} 이상 감소): {', '.join(regressions)}")
+            sys.exit(1)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+실행 시간 예산 - 사이트별 제한 시간과 전체 실행 마감 시각을 협조적으로 적용
+스크래퍼는 get_page/post_page/download_file/sleep과 브라우저 대기에서 남은 시간을 확인하고,
+시간이 지나면 BudgetExceeded를 던져 작업자를 돌려준다.
+"""
+
+import inspect
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BudgetExceeded(BaseException):
+    """시간 예산 초과 - 협조적 취소 신호
+
+    스크래퍼 곳곳의 `except Exception`에 삼켜지지 않고 run_single_scraper까지 올라가도록
+    KeyboardInterrupt처럼 BaseException을 상속한다.
+    """
+
+
+def parse_deadline(value: str, now: Optional[datetime] = None) -> float:
+    """'HH:MM' 마감 시각을 epoch 초로 - 이미 지난 시각이면 다음 날"""
+    now = now or datetime.now()
+    hour, minute = (int(part) for part in value.split(':'))
+    deadline = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if deadline <= now:
+        deadline += timedelta(days=1)
+    return deadline.timestamp()
+
+
+def site_deadline(started: float, site_budget: Optional[float] = None,
+                  run_deadline: Optional[float] = None) -> Optional[float]:
+    """사이트 마감 시각 - 사이트별 제한 시간과 전체 마감 시각 중 이른 쪽"""
+    candidates = [run_deadline] if run_deadline else []
+    if site_budget:
+        candidates.append(started + site_budget)
+    return min(candidates) if candidates else None
+
+
+class GuardedPage:
+    """Playwright 페이지 래퍼 - 이동/대기 호출 전에 예산을 확인하고 timeout을 남은 시간으로 줄임
+
+    sync/async 페이지 모두 지원하며, 그 외 속성은 원래 페이지로 그대로 넘긴다.
+    """
+
+    # timeout 인자(밀리초)를 받는 이동/대기 메서드
+    GUARDED_METHODS = ('goto', 'reload', 'go_back', 'go_forward', 'wait_for_load_state', 'wait_for_selector',
+                       'wait_for_url', 'wait_for_function', 'wait_for_event', 'wait_for_navigation',
+                       'click', 'fill', 'expect_navigation', 'expect_download')
+
+    def __init__(self, page, scraper):
+        self._page = page
+        self._scraper = scraper
+        self._default_timeout = 30000  # Playwright 기본값
+
+    def __getattr__(self, name):
+        attr = getattr(self._page, name)
+        if name in self.GUARDED_METHODS and callable(attr):
+            return self._guard(attr)
+        return attr
+
+    def set_default_timeout(self, timeout):
+        self._default_timeout = timeout
+        return self._page.set_default_timeout(timeout)
+
+    def wait_for_timeout(self, timeout):
+        """고정 대기 - 남은 시간보다 길게 기다리지 않음"""
+        self._scraper.check_budget()
+        remaining = self._remaining_ms()
+        if remaining is not None and timeout > remaining:
+            timeout = remaining
+        return self._page.wait_for_timeout(timeout)
+
+    def _remaining_ms(self) -> Optional[float]:
+        remaining = self._scraper.remaining_time()
+        return None if remaining is None else max(remaining * 1000, 1)
+
+    def _guard(self, method):
+        def guarded(*args, **kwargs):
+            self._scraper.check_budget()
+            remaining = self._remaining_ms()
+            if remaining is not None:
+                timeout = kwargs.get('timeout')
+                if timeout is None:
+                    timeout = self._default_timeout
+                if timeout == 0 or remaining < timeout:  # 0은 무제한
+                    kwargs['timeout'] = remaining
+
+            try:
+                result = method(*args, **kwargs)
+            except Exception:
+                self._scraper.check_budget()  # 줄인 timeout 때문에 실패했으면 예산 초과로
+                raise
+            if inspect.isawaitable(result):
+                return self._await(result)
+            return result
+        return guarded
+
+    async def _await(self, awaitable):
+        try:
+            return await awaitable
+        except Exception:
+            self._scraper.check_budget()
+            raise
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+실행 체크포인트 - 중단된 실행을 이어서 수집하기 위한 사이트별 진행 상황 기록
+"""
+
+import os
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RunCheckpoint:
+    """사이트별 실행 체크포인트
+
+    <output_base>/checkpoint_<site>.json 에 마지막으로 끝난 페이지, 공고 폴더 번호,
+    처리 완료된 공고 키, 진행 중인 공고의 다운로드 완료 파일을 기록한다.
+    이벤트마다 임시 파일에 쓴 뒤 교체하므로 프로세스가 죽어도 마지막 기록은 온전히 남는다.
+    정상 종료(finish) 시 파일을 지운다 - 파일이 남아 있으면 중단된 실행이다.
+    """
+
+    def __init__(self, output_base: str, site: str):
+        self.site = site
+        self.path = os.path.join(output_base, f'checkpoint_{site}.json')
+        self.previous = self._load()  # 중단된 이전 실행의 체크포인트 (없으면 None)
+        self.state = self._new_state()
+        self.state['completed_keys'] = self.interrupted_keys  # 다시 중단되어도 잃지 않도록 이어서 기록
+        self._lock = threading.Lock()
+
+    def _new_state(self) -> Dict[str, Any]:
+        return {
+            'site': self.site,
+            'started_at': datetime.now().isoformat(),
+            'updated_at': None,
+            'last_page': 0,  # 공고 처리까지 끝난 마지막 목록 페이지
+            'last_index': 0,  # 마지막으로 시작한 공고 폴더 번호
+            'completed_keys': [],  # 처리 완료된 공고 키
+            'in_progress': None,  # {'index', 'files': {url: {'path', 'sha256'}}}
+        }
+
+    def _load(self) -> Optional[Dict[str, Any]]:
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                logger.info(f"중단된 실행 체크포인트 발견: {self.path} "
+                            f"(페이지 {data.get('last_page', 0)}, 완료 공고 {len(data.get('completed_keys', []))}개)")
+                return data
+        except Exception as e:
+            logger.error(f"체크포인트 로드 실패: {e}")
+        return None
+
+    @property
+    def interrupted_keys(self) -> List[str]:
+        """중단된 이전 실행에서 처리 완료된 공고 키 - 재개 여부와 관계없이 처리된 공고로 취급"""
+        return list(self.previous.get('completed_keys', [])) if self.previous else []
+
+    def resume(self) -> bool:
+        """중단된 실행의 진행 상황을 이어받음 - 이어받을 체크포인트가 없으면 False"""
+        if not self.previous:
+            return False
+        with self._lock:
+            self.state.update({
+                'started_at': self.previous.get('started_at', self.state['started_at']),
+                'last_page': self.previous.get('last_page', 0),
+                'last_index': self.previous.get('last_index', 0),
+                'in_progress': self.previous.get('in_progress'),
+            })
+        logger.info(f"체크포인트에서 재개: 페이지 {self.state['last_page'] + 1}부터, "
+                    f"공고 번호 {self.next_index}부터")
+        return True
+
+    @property
+    def start_page(self) -> int:
+        return self.state['last_page'] + 1
+
+    @property
+    def next_index(self) -> int:
+        """다음 공고 폴더 번호 - 진행 중이던 공고는 같은 번호(같은 폴더)로 다시 처리"""
+        in_progress = self.state['in_progress']
+        if in_progress:
+            return in_progress['index']
+        return self.state['last_index'] + 1
+
+    def _flush(self):
+        """임시 파일에 쓴 뒤 교체 (호출 측에서 잠금)"""
+        self.state['updated_at'] = datetime.now().isoformat()
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"체크포인트 저장 실패: {e}")
+
+    def announcement_started(self, index: int):
+        """공고 처리 시작 - 같은 번호를 다시 시작하면 완료된 다운로드 기록은 유지"""
+        with self._lock:
+            in_progress = self.state['in_progress']
+            if not in_progress or in_progress.get('index') != index:
+                self.state['in_progress'] = {'index': index, 'files': {}}
+            self.state['last_index'] = max(self.state['last_index'], index)
+            self._flush()
+
+    def announcement_finished(self):
+        """공고 처리 시도 종료 (성공/실패 무관)"""
+        with self._lock:
+            if self.state['in_progress'] is not None:
+                self.state['in_progress'] = None
+                self._flush()
+
+    def file_done(self, url: str, path: str, sha256: Optional[str] = None):
+        """진행 중인 공고의 첨부파일 다운로드 완료"""
+        with self._lock:
+            in_progress = self.state['in_progress']
+            if in_progress is not None:
+                in_progress['files'][url] = {'path': path, 'sha256': sha256}
+                self._flush()
+
+    def completed_file(self, folder_path: str, url: str) -> Optional[Dict[str, Any]]:
+        """재개 시 이 공고 폴더에 이미 받은 첨부파일 - 파일이 남아 있을 때만 {'path', 'sha256'}"""
+        in_progress = self.state['in_progress']
+        done = in_progress['files'].get(url) if in_progress else None
+        if done and done['path'].startswith(os.path.join(folder_path, '')) and os.path.isfile(done['path']):
+            return done
+        return None
+
+    def key_completed(self, key: str):
+        """공고 처리 완료 - 이 키는 중단되더라도 다음 실행에서 처리된 공고로 취급
+
+        진행 중이던 공고도 끝난 것으로 보아 재개 시 다음 번호부터 쓰도록 한다.
+        """
+        with self._lock:
+            self.state['completed_keys'].append(key)
+            self.state['in_progress'] = None
+            self._flush()
+
+    def page_done(self, page_num: int):
+        """목록 페이지의 공고 처리 완료"""
+        with self._lock:
+            self.state['last_page'] = max(self.state['last_page'], page_num)
+            self._flush()
+
+    def finish(self):
+        """정상 종료 - 처리 기록이 processed_titles에 저장된 뒤 호출"""
+        try:
+            for path in (self.path, f"{self.path}.tmp"):
+                if os.path.exists(path):
+                    os.remove(path)
+        except Exception as e:
+            logger.error(f"체크포인트 삭제 실패: {e}")
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+실행 매니페스트 - 스크래퍼가 공고/첨부파일을 저장할 때마다 실행별 JSONL에 기록
+"""
+
+import os
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RunManifest:
+    """실행별 append-only 매니페스트
+
+    <output_base>/manifests/<run_id>.jsonl 에 레코드를 한 줄씩 추가하고,
+    합계는 메모리에 유지하다가 close() 시 <run_id>.summary.json 으로 저장한다.
+    통계 조회는 출력 디렉토리를 다시 훑지 않고 합계만 읽는다.
+    """
+
+    def __init__(self, output_base: str, site: str, run_id: Optional[str] = None):
+        self.site = site
+        self.run_id = run_id or f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{site}_{os.getpid()}"
+        self.manifest_dir = os.path.join(output_base, 'manifests')
+        self.path = os.path.join(self.manifest_dir, f'{self.run_id}.jsonl')
+        self.summary_path = os.path.join(self.manifest_dir, f'{self.run_id}.summary.json')
+
+        self.started_at = datetime.now().isoformat()
+        self.summary = {
+            'run_id': self.run_id,
+            'site': site,
+            'started_at': self.started_at,
+            'finished_at': None,
+            'announcements': 0,
+            'failed_announcements': 0,
+            'files': 0,
+            'failed_files': 0,
+            'total_size': 0,
+            'content_size': 0
+        }
+
+        self._lock = threading.Lock()
+        self._file = None
+
+    def _write(self, record: Dict[str, Any]):
+        """레코드 한 줄 추가 - 중단되어도 이미 쓴 레코드는 남도록 즉시 flush"""
+        with self._lock:
+            if self._file is None:
+                os.makedirs(self.manifest_dir, exist_ok=True)
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self._file.flush()
+
+    def record_announcement(self, folder: str, title: str, url: str, status: str = 'success',
+                            announcement_id: Optional[str] = None, content_bytes: int = 0,
+                            duration: float = 0.0, **extra):
+        """공고 저장 기록"""
+        record = {
+            'type': 'announcement',
+            'time': datetime.now().isoformat(),
+            'announcement_id': announcement_id,
+            'folder': folder,
+            'title': title,
+            'url': url,
+            'status': status,
+            'content_bytes': content_bytes,
+            'duration': round(duration, 3),
+            **extra
+        }
+        self._write(record)
+
+        if status == 'success':
+            self.summary['announcements'] += 1
+            self.summary['content_size'] += content_bytes
+        else:
+            self.summary['failed_announcements'] += 1
+
+    def record_file(self, folder: str, filename: str, url: str, size: int = 0,
+                    status: str = 'success', duration: float = 0.0, **extra):
+        """첨부파일 저장 기록"""
+        record = {
+            'type': 'file',
+            'time': datetime.now().isoformat(),
+            'folder': folder,
+            'filename': filename,
+            'url': url,
+            'size': size,
+            'status': status,
+            'duration': round(duration, 3),
+            **extra
+        }
+        self._write(record)
+
+        if status == 'success':
+            self.summary['files'] += 1
+            self.summary['total_size'] += size
+        else:
+            self.summary['failed_files'] += 1
+
+    def close(self):
+        """매니페스트 종료 - 합계 저장"""
+        self.summary['finished_at'] = datetime.now().isoformat()
+
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+        try:
+            os.makedirs(self.manifest_dir, exist_ok=True)
+            with open(self.summary_path, 'w', encoding='utf-8') as f:
+                json.dump(self.summary, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.error(f"매니페스트 합계 저장 실패: {e}")
+
+    @staticmethod
+    def load_summary(manifest_path: str) -> Dict[str, Any]:
+        """매니페스트 합계 조회 - 합계 파일이 없으면(중단된 실행) JSONL에서 재계산"""
+        summary_path = manifest_path[:-len('.jsonl')] + '.summary.json'
+        if os.path.exists(summary_path):
+            with open(summary_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        summary = {
+            'announcements': 0,
+            'failed_announcements': 0,
+            'files': 0,
+            'failed_files': 0,
+            'total_size': 0,
+            'content_size': 0
+        }
+
+        if not os.path.exists(manifest_path):
+            return summary
+
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 중단 시 마지막 줄이 잘렸을 수 있음
+
+                success = record.get('status') == 'success'
+                if record.get('type') == 'announcement':
+                    if success:
+                        summary['announcements'] += 1
+                        summary['content_size'] += record.get('content_bytes', 0)
+                    else:
+                        summary['failed_announcements'] += 1
+                elif record.get('type') == 'file':
+                    if success:
+                        summary['files'] += 1
+                        summary['total_size'] += record.get('size', 0)
+                    else:
+                        summary['failed_files'] += 1
+
+        return summary
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+스크래퍼 단계별 계측 - 목록/상세 요청, 파싱, 저장, 첨부파일 다운로드, 대기 시간을
+사이트/호스트별 횟수, 바이트, 지연시간 히스토그램으로 집계하여 OpenMetrics 텍스트와 JSON으로 출력
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 지연시간 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+PHASES = (
+    'list_fetch',           # 목록 페이지 요청
+    'list_parse',           # 목록 파싱
+    'detail_fetch',         # 상세 페이지 요청
+    'detail_parse',         # 상세 파싱
+    'content_write',        # content.md 저장
+    'attachment_download',  # 첨부파일 다운로드
+    'request_delay',        # delay_between_requests 대기
+    'page_delay',           # delay_between_pages 대기
+)
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class ScraperMetrics:
+    """단계별 계측 집계
+
+    (phase, site, host) 조합마다 횟수, 오류 수, 바이트, 소요 시간 합계와 히스토그램을 유지한다.
+    여러 스크래퍼 스레드가 하나의 인스턴스를 공유할 수 있다.
+    keep_samples=True면 측정값을 모두 보관하여 보고서의 분위수를 정확히 계산한다 (벤치마크용).
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, keep_samples: bool = False):
+        self.buckets = tuple(buckets)
+        self.keep_samples = keep_samples
+        self.started_at = datetime.now().isoformat()
+        self._series: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, phase: str, site: str, seconds: float, host: str = '', nbytes: int = 0, error: bool = False):
+        """측정값 하나 기록"""
+        key = (phase, site, host or '')
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = {'count': 0, 'errors': 0, 'bytes': 0, 'seconds': 0.0,
+                          'buckets': [0] * (len(self.buckets) + 1), 'samples': []}
+                self._series[key] = series
+
+            series['count'] += 1
+            series['errors'] += 1 if error else 0
+            series['bytes'] += nbytes
+            series['seconds'] += seconds
+            if self.keep_samples:
+                series['samples'].append(seconds)
+
+            # 누적 구간은 출력 시 계산, 여기서는 해당 구간에만 더함
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    series['buckets'][i] += 1
+                    break
+            else:
+                series['buckets'][-1] += 1
+
+    @contextmanager
+    def measure(self, phase: str, site: str, host: str = ''):
+        """블록 소요 시간 기록 - yield한 dict에 'bytes'/'error'를 채우면 함께 기록"""
+        sample = {'bytes': 0, 'error': False}
+        started = time.perf_counter()
+        try:
+            yield sample
+        except Exception:
+            sample['error'] = True
+            raise
+        finally:
+            self.observe(phase, site, time.perf_counter() - started, host, sample['bytes'], sample['error'])
+
+    def _snapshot(self, site: Optional[str] = None) -> List[Tuple[Tuple[str, str, str], Dict[str, Any]]]:
+        with self._lock:
+            return [(key, {**series, 'buckets': list(series['buckets']), 'samples': list(series['samples'])})
+                    for key, series in sorted(self._series.items())
+                    if site is None or key[1] == site]
+
+    def _quantile(self, buckets: List[int], count: int, q: float) -> Optional[Any]:
+        """히스토그램 구간 상한으로 분위수 추정"""
+        if not count:
+            return None
+        target = q * count
+        cumulative = 0
+        for i, bucket_count in enumerate(buckets):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return self.buckets[i] if i < len(self.buckets) else '+Inf'
+        return '+Inf'
+
+    def to_openmetrics(self, site: Optional[str] = None) -> str:
+        """OpenMetrics 텍스트 형식"""
+        snapshot = self._snapshot(site)
+        lines = [
+            '# TYPE scraper_phase_seconds histogram',
+            '# UNIT scraper_phase_seconds seconds',
+            '# HELP scraper_phase_seconds Time spent per scraper phase.',
+        ]
+        for (phase, series_site, host), series in snapshot:
+            labels = f'phase="{_escape_label(phase)}",site="{_escape_label(series_site)}",host="{_escape_label(host)}"'
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, series['buckets']):
+                cumulative += bucket_count
+                lines.append(f'scraper_phase_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'scraper_phase_seconds_bucket{{{labels},le="+Inf"}} {series["count"]}')
+            lines.append(f'scraper_phase_seconds_count{{{labels}}} {series["count"]}')
+            lines.append(f'scraper_phase_seconds_sum{{{labels}}} {series["seconds"]:.6f}')
+
+        for name, field, help_text in (
+            ('scraper_phase_bytes', 'bytes', 'Bytes transferred or written per scraper phase.'),
+            ('scraper_phase_errors', 'errors', 'Failed operations per scraper phase.'),
+        ):
+            lines.append(f'# TYPE {name} counter')
+            lines.append(f'# HELP {name} {help_text}')
+            for (phase, series_site, host), series in snapshot:
+                labels = f'phase="{_escape_label(phase)}",site="{_escape_label(series_site)}",host="{_escape_label(host)}"'
+                lines.append(f'{name}_total{{{labels}}} {series[field]}')
+
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def report(self, site: Optional[str] = None) -> Dict[str, Any]:
+        """JSON 실행 보고서 - 사이트별 단계 합계와 호스트별 상세"""
+        sites: Dict[str, Dict[str, Any]] = {}
+        for (phase, series_site, host), series in self._snapshot(site):
+            site_report = sites.setdefault(series_site, {'phases': {}, 'hosts': {}})
+
+            phase_total = site_report['phases'].setdefault(
+                phase, {'count': 0, 'errors': 0, 'bytes': 0, 'seconds': 0.0,
+                        'buckets': [0] * (len(self.buckets) + 1), 'samples': []}
+            )
+            for field in ('count', 'errors', 'bytes', 'seconds'):
+                phase_total[field] += series[field]
+            phase_total['buckets'] = [a + b for a, b in zip(phase_total['buckets'], series['buckets'])]
+            phase_total['samples'].extend(series['samples'])
+
+            if host:
+                site_report['hosts'].setdefault(host, {})[phase] = {
+                    'count': series['count'],
+                    'errors': series['errors'],
+                    'bytes': series['bytes'],
+                    'seconds': round(series['seconds'], 3),
+                }
+
+        for site_report in sites.values():
+            for phase_total in site_report['phases'].values():
+                buckets = phase_total.pop('buckets')
+                samples = sorted(phase_total.pop('samples'))
+                count = phase_total['count']
+                phase_total['seconds'] = round(phase_total['seconds'], 3)
+                phase_total['mean'] = round(phase_total['seconds'] / count, 4) if count else None
+                phase_total['p50_le'] = self._quantile(buckets, count, 0.5)
+                phase_total['p95_le'] = self._quantile(buckets, count, 0.95)
+                if samples:
+                    phase_total['p50'] = round(samples[int(0.5 * (len(samples) - 1))], 5)
+                    phase_total['p95'] = round(samples[int(0.95 * (len(samples) - 1))], 5)
+            site_report['total_seconds'] = round(sum(p['seconds'] for p in site_report['phases'].values()), 3)
+
+        return {
+            'started_at': self.started_at,
+            'generated_at': datetime.now().isoformat(),
+            'buckets': list(self.buckets),
+            'sites': sites,
+        }
+
+    def write(self, directory: str, name: str, site: Optional[str] = None):
+        """<directory>/<name>.prom 과 <name>.json 저장"""
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(os.path.join(directory, f'{name}.prom'), 'w', encoding='utf-8') as f:
+                f.write(self.to_openmetrics(site))
+            with open(os.path.join(directory, f'{name}.json'), 'w', encoding='utf-8') as f:
+                json.dump(self.report(site), f, ensure_ascii=False, indent=2, default=str)
+        except Exception as e:
+            logger.error(f"계측 결과 저장 실패: {e}")
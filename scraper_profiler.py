@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+스크래퍼 프로파일링 - scrape_pages 실행을 결정적(cProfile) 또는 샘플링 프로파일러로 감싸고
+pstats/collapsed stack, tracemalloc 상위 할당 위치, 최대 RSS를 사이트/실행별 파일로 저장
+"""
+
+import os
+import sys
+import json
+import time
+import pstats
+import cProfile
+import logging
+import threading
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ('deterministic', 'sampling')
+
+# tracemalloc은 프로세스 전역이라 여러 스크래퍼가 동시에 프로파일링할 때 참조 수로 관리
+_tracemalloc_users = 0
+_tracemalloc_lock = threading.Lock()
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """프로세스 최대 RSS (바이트)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024  # Linux는 KB 단위
+
+
+class StackSampler:
+    """대상 스레드의 스택을 주기적으로 수집하여 collapsed stack 형식으로 집계
+
+    flamegraph.pl, speedscope, inferno 등에 그대로 넣을 수 있다.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+                frame = frame.f_back
+            self.samples[';'.join(reversed(stack))] += 1
+
+    def write_collapsed(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class ScraperProfiler:
+    """scrape_pages 한 번을 감싸는 프로파일러 (with 문으로 사용)
+
+    <profile_dir>/<site>_<run_id>.pstats (결정적) 또는 .collapsed (샘플링),
+    .memory.txt (tracemalloc 상위 할당 위치), .profile.json (요약)을 남긴다.
+    Python 3.12부터 cProfile은 동시에 하나만 켤 수 있으므로, 다른 스크래퍼가 이미 결정적
+    프로파일링 중이면 샘플링으로 전환한다.
+
+    메모리 수치는 프로세스 전역이다. tracemalloc 할당 위치와 최대치는 같은 프로세스의 모든 스레드를 포함하고,
+    최대 RSS(ru_maxrss)는 프로세스 시작 후 최대값이다. 사이트별 수치가 필요하면 다른 스크래퍼와 동시에
+    실행하지 않는다 (main.py --profile은 프로파일링 사이트를 하나씩 실행).
+    """
+
+    def __init__(self, profile_dir: str, site: str, mode: str = 'deterministic',
+                 run_id: Optional[str] = None, sample_interval: float = 0.005, top_allocations: int = 25):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"지원하지 않는 프로파일 모드: {mode} ({', '.join(PROFILE_MODES)})")
+
+        self.profile_dir = profile_dir
+        self.site = site
+        self.mode = mode
+        self.run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.sample_interval = sample_interval
+        self.top_allocations = top_allocations
+        self.base_path = os.path.join(profile_dir, f'{site}_{self.run_id}')
+
+        self._profile = None
+        self._sampler = None
+        self._started = None
+        self.summary: Dict[str, Any] = {}
+
+    def __enter__(self):
+        global _tracemalloc_users
+        with _tracemalloc_lock:
+            if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+            _tracemalloc_users += 1
+
+        if self.mode == 'deterministic':
+            self._profile = cProfile.Profile()
+            try:
+                self._profile.enable()
+            except ValueError:
+                logger.warning(f"[{self.site}] 다른 프로파일러가 실행 중이어서 샘플링 모드로 전환합니다")
+                self._profile = None
+                self.mode = 'sampling'
+
+        if self.mode == 'sampling':
+            self._sampler = StackSampler(threading.get_ident(), self.sample_interval)
+            self._sampler.start()
+
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        global _tracemalloc_users
+        wall_time = time.perf_counter() - self._started
+
+        if self._profile is not None:
+            self._profile.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+
+        snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        traced_peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None
+        with _tracemalloc_lock:
+            _tracemalloc_users -= 1
+            if _tracemalloc_users == 0 and tracemalloc.is_tracing():
+                tracemalloc.stop()
+
+        try:
+            self._write(wall_time, snapshot, traced_peak)
+        except Exception as e:
+            logger.error(f"[{self.site}] 프로파일 결과 저장 실패: {e}")
+        return False
+
+    def _write(self, wall_time: float, snapshot, traced_peak: Optional[int]):
+        os.makedirs(self.profile_dir, exist_ok=True)
+        files = {}
+
+        if self._profile is not None:
+            files['pstats'] = self.base_path + '.pstats'
+            self._profile.dump_stats(files['pstats'])
+        if self._sampler is not None:
+            files['collapsed'] = self.base_path + '.collapsed'
+            self._sampler.write_collapsed(files['collapsed'])
+
+        top = []
+        if snapshot is not None:
+            snapshot = snapshot.filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            ))
+            for stat in snapshot.statistics('lineno')[:self.top_allocations]:
+                frame = stat.traceback[0]
+                top.append({'location': f"{frame.filename}:{frame.lineno}", 'size': stat.size, 'count': stat.count})
+
+            files['memory'] = self.base_path + '.memory.txt'
+            with open(files['memory'], 'w', encoding='utf-8') as f:
+                for item in top:
+                    f.write(f"{item['size']:>12,} B  {item['count']:>8,}  {item['location']}\n")
+
+        self.summary = {
+            'site': self.site,
+            'run_id': self.run_id,
+            'mode': self.mode,
+            'wall_time': round(wall_time, 3),
+            'samples': sum(self._sampler.samples.values()) if self._sampler else None,
+            'peak_rss_bytes': peak_rss_bytes(),
+            'tracemalloc_peak_bytes': traced_peak,
+            'top_allocations': top,
+            'files': files,
+        }
+        with open(self.base_path + '.profile.json', 'w', encoding='utf-8') as f:
+            json.dump(self.summary, f, ensure_ascii=False, indent=2)
+
+        logger.info(f"[{self.site}] 프로파일 저장: {self.base_path}.* ({self.mode}, {wall_time:.1f}초)")
+
+
+if __name__ == "__main__":
+    # pstats 파일 요약 출력
+    if len(sys.argv) < 2:
+        print("사용법: python scraper_profiler.py <pstats 파일> [출력 줄 수]")
+        sys.exit(1)
+
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    pstats.Stats(sys.argv[1]).sort_stats('cumulative').print_stats(limit)
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+공고 전문 검색 색인 - 수집한 공고 제목/본문/첨부파일 텍스트를 SQLite FTS5로 색인하고 조회
+"""
+
+import os
+import re
+import sys
+import sqlite3
+import logging
+import argparse
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_date(value: Optional[str]) -> Optional[str]:
+    """'2024.01.05', '2024-1-5', '2024년 1월 5일' 등을 'YYYY-MM-DD'로 변환"""
+    if not value:
+        return None
+    match = re.search(r'(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})', str(value))
+    if not match:
+        return None
+    year, month, day = (int(group) for group in match.groups())
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+class SearchIndex:
+    """SQLite FTS5 기반 공고 검색 색인
+
+    announcements 테이블이 원본이고, announcements_fts는 외부 콘텐츠 FTS5 테이블로
+    트리거가 동기화한다. 한글은 띄어쓰기 단위 토큰화가 맞지 않아 trigram 토크나이저를 쓰며,
+    3글자 미만 검색어는 FTS 대신 부분 문자열 조건으로 거른다.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS announcements (
+                id INTEGER PRIMARY KEY,
+                folder_path TEXT UNIQUE NOT NULL,
+                site TEXT NOT NULL,
+                title TEXT NOT NULL,
+                url TEXT,
+                date TEXT,
+                content TEXT,
+                attachment_text TEXT DEFAULT '',
+                indexed_at TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_announcements_site_date ON announcements (site, date);
+            CREATE INDEX IF NOT EXISTS idx_announcements_date ON announcements (date);
+
+            CREATE VIRTUAL TABLE IF NOT EXISTS announcements_fts USING fts5(
+                title, content, attachment_text,
+                content='announcements', content_rowid='id', tokenize='trigram'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS announcements_ai AFTER INSERT ON announcements BEGIN
+                INSERT INTO announcements_fts (rowid, title, content, attachment_text)
+                VALUES (new.id, new.title, new.content, new.attachment_text);
+            END;
+            CREATE TRIGGER IF NOT EXISTS announcements_ad AFTER DELETE ON announcements BEGIN
+                INSERT INTO announcements_fts (announcements_fts, rowid, title, content, attachment_text)
+                VALUES ('delete', old.id, old.title, old.content, old.attachment_text);
+            END;
+            CREATE TRIGGER IF NOT EXISTS announcements_au AFTER UPDATE ON announcements BEGIN
+                INSERT INTO announcements_fts (announcements_fts, rowid, title, content, attachment_text)
+                VALUES ('delete', old.id, old.title, old.content, old.attachment_text);
+                INSERT INTO announcements_fts (rowid, title, content, attachment_text)
+                VALUES (new.id, new.title, new.content, new.attachment_text);
+            END;
+        """)
+        self._conn.commit()
+
+    def add(self, record: Dict[str, Any], folder_path: str):
+        """공고 레코드 색인 (같은 폴더는 갱신)
+
+        record는 AnnouncementSink에 기록하는 것과 같은 형식이다.
+        """
+        date = normalize_date(record.get('date')) or normalize_date(record.get('collected_at'))
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO announcements (folder_path, site, title, url, date, content, indexed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (folder_path) DO UPDATE SET
+                    site = excluded.site, title = excluded.title, url = excluded.url,
+                    date = excluded.date, content = excluded.content, indexed_at = excluded.indexed_at
+            """, (
+                os.path.abspath(folder_path),
+                record.get('site', ''),
+                record.get('title', ''),
+                record.get('url', ''),
+                date,
+                record.get('content', ''),
+                datetime.now().isoformat()
+            ))
+            self._conn.commit()
+
+    def set_attachment_text(self, folder_path: str, text: str) -> bool:
+        """공고의 첨부파일 추출 텍스트 색인 - 색인된 공고가 없으면 False"""
+        with self._lock:
+            cursor = self._conn.execute(
+                'UPDATE announcements SET attachment_text = ? WHERE folder_path = ?',
+                (text, os.path.abspath(folder_path))
+            )
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def search(self, keywords: Optional[List[str]] = None, site: Optional[str] = None,
+               since: Optional[str] = None, until: Optional[str] = None,
+               limit: int = 50) -> List[Dict[str, Any]]:
+        """키워드/사이트/기간 조건으로 검색 - 모든 키워드를 포함하는 공고를 최신순으로 반환"""
+        keywords = [keyword for keyword in (keywords or []) if keyword.strip()]
+        fts_terms = [keyword for keyword in keywords if len(keyword) >= 3]
+        short_terms = [keyword for keyword in keywords if len(keyword) < 3]
+
+        conditions, params = [], []
+        if fts_terms:
+            conditions.append('a.id IN (SELECT rowid FROM announcements_fts WHERE announcements_fts MATCH ?)')
+            params.append(' AND '.join('"' + term.replace('"', '""') + '"' for term in fts_terms))
+        for term in short_terms:
+            conditions.append("instr(a.title || ' ' || a.content || ' ' || a.attachment_text, ?) > 0")
+            params.append(term)
+        if site:
+            conditions.append('a.site = ?')
+            params.append(site)
+        if since:
+            conditions.append('a.date >= ?')
+            params.append(normalize_date(since) or since)
+        if until:
+            conditions.append('a.date <= ?')
+            params.append(normalize_date(until) or until)
+
+        where = ('WHERE ' + ' AND '.join(conditions)) if conditions else ''
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(f"""
+                SELECT a.site, a.date, a.title, a.url, a.folder_path
+                FROM announcements a
+                {where}
+                ORDER BY a.date DESC, a.id DESC
+                LIMIT ?
+            """, params).fetchall()
+
+        return [dict(row) for row in rows]
+
+    def close(self):
+        """색인 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+def index_records(index: SearchIndex, records_dir: str) -> int:
+    """AnnouncementSink의 records/ 디렉토리로 색인 채우기 (기존 수집분 색인용)"""
+    from announcement_sink import iter_records
+
+    output_base = os.path.dirname(os.path.abspath(records_dir))
+    count = 0
+    for record in iter_records(records_dir):
+        index.add(record, os.path.join(output_base, record.get('folder', '')))
+        count += 1
+    return count
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='공고 전문 검색')
+    parser.add_argument('keywords', nargs='*', help='검색어 (모두 포함하는 공고 검색)')
+    parser.add_argument('--db', type=str, default='output/.search_index.sqlite3', help='색인 파일 경로')
+    parser.add_argument('--site', type=str, help='사이트 (예: acci)')
+    parser.add_argument('--since', type=str, help='시작일 (YYYY-MM-DD)')
+    parser.add_argument('--until', type=str, help='종료일 (YYYY-MM-DD)')
+    parser.add_argument('--limit', type=int, default=50, help='최대 결과 수 (기본값: 50)')
+    parser.add_argument('--index', type=str, nargs='+', metavar='RECORDS_DIR',
+                        help='records/ 디렉토리를 색인한 뒤 종료')
+
+    args = parser.parse_args()
+    search_index = SearchIndex(args.db)
+
+    if args.index:
+        for records_dir in args.index:
+            logger.info(f"{records_dir}: {index_records(search_index, records_dir)}개 공고 색인")
+        search_index.close()
+        sys.exit(0)
+
+    results = search_index.search(args.keywords, site=args.site, since=args.since,
+                                  until=args.until, limit=args.limit)
+    for result in results:
+        print(f"{result['date'] or '----------'}  [{result['site']}] {result['title']}")
+        print(f"            {result['url']}")
+    print(f"\n{len(results)}건")
+    search_index.close()
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+사이트 목록 CSV → 스크래퍼 클래스 매핑
+sitelist.csv, server_site.csv, 0424full.csv 같은 사이트 목록을 읽어 site_code마다 실행할 스크래퍼를 찾는다.
+
+찾는 순서:
+1. 실행기에 등록된 스크래퍼 (main.py의 ENHANCED_SCRAPERS)
+2. 모듈 이름 규칙 - enhanced_<site_code 소문자>_scraper.py 안의 Enhanced*Scraper 클래스
+3. sites_config.yaml의 egov 항목 - EnhancedEgovBoardScraper에 set_config로 설정 주입
+4. 공용 스크래퍼 표 - CCEI 지역 센터, 그누보드 게시판(GNUBOARD_SITES), 전자정부 게시판(EGOV_SITES)
+
+CCEI 지역 센터는 EnhancedCCEIFamilyScraper 하나로 묶어 목록 API를 한 번만 수집한다.
+찾지 못한 사이트는 이유와 함께 따로 돌려준다.
+"""
+
+import os
+import csv
+import inspect
+import logging
+import importlib
+from functools import partial
+from types import SimpleNamespace
+from urllib.parse import urlparse
+from typing import Dict, List, Any, Optional, Tuple
+
+import yaml
+
+from enhanced_base_scraper import EnhancedBaseScraper
+
+logger = logging.getLogger(__name__)
+
+# 사이트 목록 CSV에서 0424full.csv처럼 이름 없는 첫 열이 실행 여부(1이면 실행)
+ENABLE_VALUES = ('1', 'y', 'yes', 'true', 'o')
+
+SITES_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sites_config.yaml')
+
+
+def load_site_list(path: str, include_disabled: bool = False) -> List[Dict[str, str]]:
+    """사이트 목록 CSV 읽기 - [{'site_code', 'site_name', 'start_url', 'enabled'}, ...]
+
+    주석(#) 행, URL이 없는 깨진 행, 중복 site_code는 건너뛴다.
+    실행 여부 열이 있는 파일은 include_disabled가 아니면 실행 대상만 반환한다.
+    """
+    sites = []
+    seen = set()
+
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = [col.strip() for col in next(reader, [])]
+        if 'site_code' not in header:
+            raise ValueError(f"site_code 열이 없는 사이트 목록: {path}")
+
+        code_idx = header.index('site_code')
+        name_idx = header.index('site_name') if 'site_name' in header else None
+        url_idx = header.index('start_url') if 'start_url' in header else None
+        flag_idx = header.index('') if '' in header else None
+
+        for row in reader:
+            if len(row) <= code_idx:
+                continue
+            code = row[code_idx].strip()
+            if not code or code.startswith('#'):
+                continue
+
+            url = row[url_idx].strip().split()[0] if url_idx is not None and len(row) > url_idx and row[url_idx].strip() else ''
+            if url_idx is not None and not url.startswith('http'):
+                logger.debug(f"URL이 없는 행 스킵: {row}")
+                continue
+
+            enabled = True
+            if flag_idx is not None:
+                enabled = row[flag_idx].strip().lower() in ENABLE_VALUES
+            if not enabled and not include_disabled:
+                continue
+
+            if code in seen:
+                continue
+            seen.add(code)
+
+            sites.append({
+                'site_code': code,
+                'site_name': row[name_idx].strip() if name_idx is not None and len(row) > name_idx else code,
+                'start_url': url,
+                'enabled': enabled
+            })
+
+    logger.info(f"사이트 목록 로드: {path} - {len(sites)}개")
+    return sites
+
+
+def find_module_scraper(site_code: str) -> Tuple[Optional[type], str]:
+    """모듈 이름 규칙으로 스크래퍼 클래스 찾기 - (클래스, 실패 이유)"""
+    module_name = f"enhanced_{site_code.lower()}_scraper"
+    module_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{module_name}.py")
+    if not os.path.exists(module_path):
+        return None, f"{module_name}.py 없음"
+
+    try:
+        module = importlib.import_module(module_name)
+    except Exception as e:
+        return None, f"{module_name} import 실패: {e}"
+
+    candidates = [
+        obj for name, obj in inspect.getmembers(module, inspect.isclass)
+        if obj.__module__ == module_name and name.startswith('Enhanced')
+        and issubclass(obj, EnhancedBaseScraper) and not inspect.isabstract(obj)
+    ]
+    if not candidates:
+        return None, f"{module_name}에 Enhanced*Scraper 클래스 없음"
+
+    # 여러 개면 EnhancedGBTPScraper처럼 site_code와 이름이 맞는 클래스
+    expected = f"enhanced{site_code.lower()}scraper"
+    for cls in candidates:
+        if cls.__name__.lower() == expected:
+            return cls, ''
+    if len(candidates) > 1:
+        return None, f"{module_name}에 스크래퍼 클래스가 여러 개: {', '.join(c.__name__ for c in candidates)}"
+    return candidates[0], ''
+
+
+def load_sites_config(path: str = SITES_CONFIG_PATH) -> Dict[str, SimpleNamespace]:
+    """sites_config.yaml의 sites 항목 읽기 - {site_code: 설정 객체}
+
+    항목에 없는 값은 defaults로 채우고, base_url이 없으면 list_url에서 만든다.
+    """
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or {}
+
+    defaults = {'encoding': 'auto', 'ssl_verify': True, **(data.get('defaults') or {})}
+    configs = {}
+    for code, entry in (data.get('sites') or {}).items():
+        config = {**defaults, **entry}
+        if not config.get('base_url') and config.get('list_url'):
+            parsed = urlparse(config['list_url'])
+            config['base_url'] = f"{parsed.scheme}://{parsed.netloc}"
+        configs[code] = SimpleNamespace(**config)
+    return configs
+
+
+def find_config_scraper(site_code: str, configs: Dict[str, SimpleNamespace]):
+    """sites_config.yaml의 egov 항목으로 전자정부 게시판 스크래퍼 생성자 만들기 - egov 항목이 없으면 None"""
+    config = configs.get(site_code)
+    if config is None or not getattr(config, 'egov', None):
+        return None
+
+    return partial(build_egov_scraper, site_code, config)
+
+
+def build_egov_scraper(site_code: str, config: SimpleNamespace):
+    """sites_config.yaml 항목으로 EnhancedEgovBoardScraper 생성"""
+    from enhanced_egov_board_scraper import EnhancedEgovBoardScraper
+
+    scraper = EnhancedEgovBoardScraper(config.list_url, site_code=site_code)
+    scraper.set_config(config)
+    return scraper
+
+
+def find_shared_scraper(site_code: str):
+    """공용 스크래퍼 표에서 찾기 - 인자 없이 호출할 수 있는 생성자 또는 None"""
+    from enhanced_gnuboard_scraper import GNUBOARD_SITES, EnhancedGnuboardScraper
+    from enhanced_egov_board_scraper import EGOV_SITES, EnhancedEgovBoardScraper
+
+    if site_code in GNUBOARD_SITES:
+        return partial(EnhancedGnuboardScraper, site_code=site_code)
+    if site_code in EGOV_SITES:
+        return partial(EnhancedEgovBoardScraper, site_code=site_code)
+    return None
+
+
+def resolve_sites(sites: List[Dict[str, Any]],
+                  registered: Optional[Dict[str, Dict[str, Any]]] = None,
+                  configs: Optional[Dict[str, SimpleNamespace]] = None
+                  ) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+    """site_code마다 스크래퍼 찾기
+
+    configs: load_sites_config() 결과 (없으면 sites_config.yaml을 읽음)
+    반환: (실행기 형식의 {key: {'class', 'name', 'output_dir'}}, [찾지 못한 사이트 + 'reason'])
+    """
+    from enhanced_ccei_family_scraper import CCEI_REGIONS, EnhancedCCEIFamilyScraper
+
+    registered = registered or {}
+    configs = load_sites_config() if configs is None else configs
+    resolved = {}
+    unresolved = []
+    ccei_regions = []
+
+    for site in sites:
+        code = site['site_code']
+        if code in resolved or code in ccei_regions or any(u['site_code'] == code for u in unresolved):
+            continue  # 여러 목록에 같은 사이트
+        name = f"{code} ({site.get('site_name') or code})"
+
+        if code in registered:
+            resolved[code] = registered[code]
+            continue
+
+        if code in CCEI_REGIONS:
+            ccei_regions.append(code)
+            continue
+
+        cls, reason = find_module_scraper(code)
+        factory = cls or find_config_scraper(code, configs) or find_shared_scraper(code)
+        if factory is None:
+            unresolved.append({**site, 'reason': reason})
+            continue
+
+        resolved[code] = {'class': factory, 'name': name, 'output_dir': f"{code}_enhanced"}
+
+    if ccei_regions:
+        resolved['ccei'] = {
+            'class': partial(EnhancedCCEIFamilyScraper, regions=ccei_regions),
+            'name': f"CCEI (창조경제혁신센터 {len(ccei_regions)}곳)",
+            'output_dir': 'ccei_enhanced'
+        }
+
+    logger.info(f"스크래퍼 매핑: {len(resolved)}개 실행, {len(unresolved)}개 미지원")
+    return resolved, unresolved
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='사이트 목록 CSV의 스크래퍼 매핑 확인')
+    parser.add_argument('csv', nargs='+', help='사이트 목록 CSV')
+    parser.add_argument('--include-disabled', action='store_true', help='실행 여부가 꺼진 사이트도 포함')
+    args = parser.parse_args()
+
+    sites = []
+    for path in args.csv:
+        sites.extend(load_site_list(path, include_disabled=args.include_disabled))
+
+    resolved, unresolved = resolve_sites(sites)
+    for key, info in resolved.items():
+        print(f"✅ {key}: {getattr(info['class'], '__name__', None) or info['class'].func.__name__}")
+    for site in unresolved:
+        print(f"❌ {site['site_code']} ({site['site_name']}): {site['reason']}")
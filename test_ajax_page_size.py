@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+목록 API 페이지 크기 확대 테스트
+"""
+
+from enhanced_base_scraper import AjaxAPIScraper
+
+
+class DemoAPIScraper(AjaxAPIScraper):
+    """항목 total개를 가진 가짜 목록 API - 서버 상한(server_max)까지만 page_size를 따른다"""
+
+    def __init__(self, total, server_max=None):
+        super().__init__()
+        self.page_size_param = 'pageUnit'
+        self.items = [{'title': f'공고 {n}', 'url': f'https://example.org/view?id={n}'} for n in range(total, 0, -1)]
+        self.server_max = server_max
+        self.requests = []
+
+    def parse_list_page(self, html_content):
+        return []
+
+    def parse_detail_page(self, html_content):
+        return {'content': '', 'attachments': []}
+
+    def fetch_api_page(self, page_num, page_size=None):
+        self.requests.append((page_num, page_size))
+        size = page_size or self.page_size
+        if self.server_max is not None:
+            size = min(size, self.server_max)
+        return self.items[(page_num - 1) * size:page_num * size]
+
+
+def _titles(rows):
+    return [row['title'] for row in rows]
+
+
+def test_logical_pages_come_from_one_large_request():
+    scraper = DemoAPIScraper(total=35)
+    pages = [scraper._get_page_announcements(n) for n in range(1, 6)]
+
+    assert _titles(pages[0]) == [f'공고 {n}' for n in range(35, 25, -1)]
+    assert _titles(pages[3]) == ['공고 5', '공고 4', '공고 3', '공고 2', '공고 1']
+    assert pages[4] == []
+    assert scraper.requests == [(1, 100), (2, 35)]  # 5페이지에서 목록 끝 확인
+    assert scraper.endpoint_cache['list_page_size']['page_size'] == 35
+
+    # 서버 상한 25: 탐색 결과를 캐시하고 다음 실행에서 재사용
+    scraper = DemoAPIScraper(total=60, server_max=25)
+    pages = [scraper._get_page_announcements(n) for n in range(1, 5)]
+    assert _titles(pages[2])[0] == '공고 40'
+    assert scraper.requests == [(1, 100), (2, 25)]
+    assert scraper.endpoint_cache['list_page_size']['page_size'] == 25
+
+    cache = scraper.endpoint_cache
+    scraper = DemoAPIScraper(total=60, server_max=25)
+    scraper.endpoint_cache = cache
+    assert _titles(scraper._get_page_announcements(3)) == _titles(pages[2])
+    assert scraper.requests == [(1, 25), (2, 25)]  # 탐색 요청 없이 캐시된 크기 사용
+
+
+def test_ignored_page_size_falls_back_to_default():
+    scraper = DemoAPIScraper(total=30, server_max=10)
+    pages = [scraper._get_page_announcements(n) for n in range(1, 4)]
+
+    assert [len(page) for page in pages] == [10, 10, 10]
+    assert _titles(pages[1])[0] == '공고 20'
+    assert scraper.requests == [(1, 100), (2, 10), (3, 10)]
+    assert scraper.endpoint_cache['list_page_size']['page_size'] == 10
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+안정 ID 기반 중복 체크 테스트
+"""
+
+import json
+
+
+def _ann(title, seq=None, **fields):
+    url = f'https://example.org/board/view.do?nttId={seq}&page=1' if seq else 'https://example.org/board/view.do'
+    return {'title': title, 'url': url, **fields}
+
+
+def _finish_run(scraper, announcements):
+    new, _ = scraper.filter_new_announcements(announcements)
+    for ann in new:
+        scraper.add_processed_title(ann['title'])
+    scraper.save_processed_titles()
+    return new
+
+
+def test_stable_id_extraction_rules(demo_scraper):
+    scraper = demo_scraper()
+    assert scraper.extract_stable_id(_ann('a', 101)) == '101'
+    assert scraper.extract_stable_id(_ann('a', 101, content_id='C7')) == 'C7'
+    assert scraper.extract_stable_id(_ann('a')) is None
+
+    scraper.id_rules = [{'regex': r"fn_view\('(\d+)'\)", 'source': 'onclick'}, {'query_param': 'page'}]
+    assert scraper.extract_stable_id({'url': 'x', 'onclick': "fn_view('55')"}) == '55'
+    assert scraper.extract_stable_id(_ann('a', 101)) == '1'
+
+
+def test_same_title_different_ids_and_edited_titles(tmp_path, demo_scraper):
+    scraper = demo_scraper()
+    scraper.load_processed_titles(str(tmp_path))
+    _finish_run(scraper, [_ann('교육 안내', 1), _ann('모집 공고', 2)])
+
+    scraper = demo_scraper()
+    scraper.load_processed_titles(str(tmp_path))
+    new = _finish_run(scraper, [_ann('교육 안내', 3), _ann('모집 공고 (수정)', 2), _ann('제목만 있는 공고')])
+    assert [ann['title'] for ann in new] == ['교육 안내', '제목만 있는 공고']
+
+    with open(tmp_path / 'processed_titles_demo.json', encoding='utf-8') as f:
+        keys = set(json.load(f)['keys'])
+    assert {'id:1', 'id:2', 'id:3', scraper.get_title_hash('제목만 있는 공고')} == keys
+
+
+def test_title_hash_files_are_migrated(tmp_path, demo_scraper):
+    legacy = demo_scraper()
+    with open(tmp_path / 'processed_titles_demo.json', 'w', encoding='utf-8') as f:
+        json.dump({'title_hashes': [legacy.get_title_hash('기존 공고')]}, f)
+
+    scraper = demo_scraper()
+    scraper.load_processed_titles(str(tmp_path))
+    new = _finish_run(scraper, [_ann('신규 공고', 10), _ann('기존 공고', 9)])
+    assert [ann['title'] for ann in new] == ['신규 공고']
+
+    # 제목 해시 기록은 9번 글의 ID로 옮겨졌으므로 같은 제목의 새 글은 수집
+    scraper = demo_scraper()
+    scraper.load_processed_titles(str(tmp_path))
+    assert scraper.legacy_title_hashes == set()
+    new = _finish_run(scraper, [_ann('기존 공고', 12), _ann('신규 공고', 10), _ann('기존 공고', 9)])
+    assert [ann['title'] for ann in new] == ['기존 공고']
+    assert scraper.get_announcement_key(new[0]) == 'id:12'
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+공고/첨부파일 레코드 테스트
+"""
+
+import json
+
+from announcement_model import Announcement, Attachment
+from announcement_sink import AnnouncementSink
+from enhanced_gnuboard_scraper import EnhancedGnuboardScraper
+
+
+def test_legacy_dict_keys_map_to_fields():
+    ann = Announcement.from_dict({'title': '공고', 'url': 'https://example.org/1', 'author': '담당자',
+                                  'num': '12', 'is_notice': True})
+    assert ann.writer == '담당자' and ann.number == '12'
+    assert ann['author'] == ann.get('writer') == '담당자'
+    assert 'post_num' in ann and ann.get('is_notice') and 'period' not in ann
+    assert not hasattr(ann, '__dict__')
+
+    ann['date'] = '2024-05-01'
+    del ann['num']
+    assert ann.number is None
+    assert ann == {'title': '공고', 'url': 'https://example.org/1', 'date': '2024-05-01', 'writer': '담당자',
+                   'is_notice': True}
+
+    # 정식 키와 별칭이 함께 있으면 정식 키가 필드, 별칭은 extra에 그대로 보존
+    att = Attachment.from_dict({'name': 'b.hwp', 'filename': 'a.pdf', 'url': 'https://example.org/a'})
+    assert att.filename == 'a.pdf' and att['name'] == 'b.hwp'
+
+    # dict에서 변환한 공고의 첨부파일도 레코드로 변환
+    ann = Announcement.from_dict({'title': '공고', 'attachments': [{'name': 'a.pdf', 'url': 'https://example.org/a'}]})
+    assert isinstance(ann.attachments[0], Attachment)
+    assert ann.copy().to_dict() == {'title': '공고', 'attachments': [{'filename': 'a.pdf', 'url': 'https://example.org/a'}]}
+
+
+def test_base_scraper_and_sink_accept_records(tmp_path):
+    scraper = EnhancedGnuboardScraper('https://example.org/bbs/board.php?bo_table=notice')
+    meta = scraper._create_meta_info({'title': '공고', 'url': 'https://example.org/1', 'author': '담당자'})
+    assert '**작성자**: 담당자' in meta
+
+    ann = Announcement(title='공고', url='https://example.org/1', date='2024-05-01',
+                       attachments=[{'name': 'a.pdf', 'url': 'https://example.org/a'}])
+    meta = scraper._create_meta_info(ann)
+    assert '**작성일**: 2024-05-01' in meta and '작성자' not in meta
+
+    sink = AnnouncementSink(str(tmp_path), 'demo')
+    sink.write(ann)
+    sink.close()
+    with open(sink.paths[0], encoding='utf-8') as f:
+        record = json.loads(f.readline())
+    assert record['attachments'] == [{'filename': 'a.pdf', 'url': 'https://example.org/a'}]
+    assert record['date'] == '2024-05-01'
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+내용 주소 기반 첨부파일 저장소 테스트
+"""
+
+import os
+import shutil
+import stat
+from types import SimpleNamespace
+
+from attachment_store import AttachmentStore
+
+
+def _ingest(store, tmp_path, folder, data):
+    temp_path = tmp_path / f'{folder}.part'
+    temp_path.write_bytes(data)
+    dest_path = tmp_path / folder / 'attachments' / '공고문.pdf'
+    store.ingest(str(temp_path), AttachmentStore.hash_file(str(temp_path)), str(dest_path))
+    return dest_path
+
+
+def test_same_file_is_stored_once_as_read_only_blob(tmp_path):
+    store = AttachmentStore(str(tmp_path / 'store'))
+    first = _ingest(store, tmp_path, '001_a', b'pdf')
+    second = _ingest(store, tmp_path, '002_b', b'pdf')
+    _ingest(store, tmp_path, '003_c', b'hwp')
+
+    blob = store.blob_path(AttachmentStore.hash_file(str(first)))
+    assert first.read_bytes() == second.read_bytes() == b'pdf'
+    assert stat.S_IMODE(os.stat(blob).st_mode) == AttachmentStore.BLOB_MODE
+    assert not list(tmp_path.glob('*.part'))
+    assert store.stats() == {'blobs': 2, 'links': 3, 'stored_bytes': 6, 'logical_bytes': 9, 'saved_bytes': 3}
+    store.close()
+
+
+def test_gc_removes_blobs_only_after_last_link_is_gone(tmp_path):
+    store = AttachmentStore(str(tmp_path / 'store'))
+    first = _ingest(store, tmp_path, '001_a', b'pdf')
+    _ingest(store, tmp_path, '002_b', b'pdf')
+    blob = store.blob_path(AttachmentStore.hash_file(str(first)))
+
+    # 같은 경로에 다시 저장해도 참조 수는 늘지 않음
+    _ingest(store, tmp_path, '001_a', b'pdf')
+    assert store.stats()['links'] == 2
+
+    shutil.rmtree(tmp_path / '001_a')
+    assert store.gc(dry_run=True) == {'removed_links': 1, 'removed_blobs': 0, 'freed_bytes': 0}
+    assert store.gc() == {'removed_links': 1, 'removed_blobs': 0, 'freed_bytes': 0}
+    assert os.path.exists(blob)
+
+    shutil.rmtree(tmp_path / '002_b')
+    assert store.gc() == {'removed_links': 1, 'removed_blobs': 1, 'freed_bytes': 3}
+    assert not os.path.exists(blob)
+    store.close()
+
+
+def test_files_written_by_site_overrides_are_not_linked_to_shared_blobs(tmp_path, demo_scraper):
+    store = AttachmentStore(str(tmp_path / 'store'))
+    shared = _ingest(store, tmp_path, 'other', b'v1')  # 다른 사이트가 기본 다운로드로 받은 같은 파일
+    contents = iter([b'v1', b'v2'])
+
+    def save_own_folder(scraper, announcement, index, output_base):
+        # process_announcement 재정의처럼 폴더와 첨부파일을 직접 'wb'로 씀 - 매 실행 같은 번호의 폴더
+        folder_path = os.path.join(output_base, f"{index:03d}_{announcement['title']}")
+        os.makedirs(os.path.join(folder_path, 'attachments'), exist_ok=True)
+        with open(os.path.join(folder_path, 'content.md'), 'w', encoding='utf-8') as f:
+            f.write(f"# {announcement['title']}\n\n본문")
+        with open(os.path.join(folder_path, 'attachments', '공고문.pdf'), 'wb') as f:
+            f.write(next(contents))
+        scraper.record_saved_folder(folder_path, announcement)
+
+    pages = {1: [{'title': '공고', 'url': 'https://example.org/view.do?nttId=1'}]}
+    for _ in range(2):
+        scraper = demo_scraper(site='own', pages=pages, process=save_own_folder, attachment_store=store,
+                               enable_duplicate_check=False, watermark_kind='off')
+        scraper.scrape_pages(max_pages=1, output_base=str(tmp_path / 'own'))
+        scraper.manifest.close()
+
+    own = tmp_path / 'own' / '001_공고' / 'attachments' / '공고문.pdf'
+    assert (own.read_bytes(), shared.read_bytes()) == (b'v2', b'v1')
+    assert store.stats()['links'] == 1
+    store.close()
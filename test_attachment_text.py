@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+첨부파일 텍스트 추출 테스트
+"""
+
+import os
+import zipfile
+
+from attachment_text import AttachmentTextExtractor, extract_text
+from search_index import SearchIndex
+
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+S = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+HP = 'http://www.hancom.co.kr/hwpml/2011/paragraph'
+
+
+def _write_zip(path, members):
+    with zipfile.ZipFile(path, 'w') as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return str(path)
+
+
+def _docx(path, paragraphs):
+    body = ''.join(f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>' for text in paragraphs)
+    return _write_zip(path, {'word/document.xml': f'<w:document xmlns:w="{W}"><w:body>{body}</w:body></w:document>'})
+
+
+def test_docx_hwpx_xlsx(tmp_path):
+    assert extract_text(_docx(tmp_path / 'a.docx', ['사업 개요', '신청 자격'])) == '사업 개요\n신청 자격'
+
+    section = f'<hs:sec xmlns:hs="x" xmlns:hp="{HP}"><hp:p><hp:run><hp:t>지원 내용</hp:t></hp:run></hp:p></hs:sec>'
+    hwpx = _write_zip(tmp_path / 'b.hwpx', {'Contents/section0.xml': section, 'Contents/header.xml': '<h/>'})
+    assert extract_text(hwpx) == '지원 내용'
+
+    sheet = (f'<worksheet xmlns="{S}"><sheetData>'
+             '<row><c t="s"><v>0</v></c><c><v>100</v></c></row>'
+             '<row><c t="inlineStr"><is><t>합계</t></is></c></row>'
+             '</sheetData></worksheet>')
+    xlsx = _write_zip(tmp_path / 'c.xlsx', {
+        'xl/sharedStrings.xml': f'<sst xmlns="{S}"><si><t>지원금</t></si></sst>',
+        'xl/worksheets/sheet1.xml': sheet
+    })
+    assert extract_text(xlsx) == '지원금\t100\n합계'
+
+    broken = tmp_path / 'd.docx'
+    broken.write_bytes(b'not a zip')
+    assert extract_text(str(broken)) == ''
+
+
+def test_extractor_writes_sidecar_and_indexes(tmp_path):
+    index = SearchIndex(str(tmp_path / 'index.sqlite3'))
+    folder = tmp_path / 'site' / '001_공고'
+    os.makedirs(folder / 'attachments')
+    index.add({'site': 'site', 'title': '공고', 'date': '2024-01-01', 'content': ''}, str(folder))
+
+    first = _docx(folder / 'attachments' / '공고문.docx', ['제출 서류 목록'])
+    same = _docx(folder / 'attachments' / '사본.docx', ['제출 서류 목록'])
+    other = str(folder / 'attachments' / 'image.png')
+    open(other, 'wb').close()
+
+    extractor = AttachmentTextExtractor(str(tmp_path / 'cache'), max_workers=1, search_index=index)
+    extractor.submit(str(folder), [(first, 'a' * 64), (same, 'a' * 64), (other, None)])
+    extractor.close()
+
+    with open(folder / 'attachments.txt', encoding='utf-8') as f:
+        sidecar = f.read()
+    assert '===== 공고문.docx =====\n제출 서류 목록' in sidecar
+    assert '===== 사본.docx =====' in sidecar
+    assert extractor.stats['submitted'] == 2
+    assert os.path.exists(tmp_path / 'cache' / 'aa' / f"{'a' * 64}.txt")
+    assert len(index.search(['제출 서류'])) == 1
+    index.close()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+CCEI 패밀리 스크래퍼 지역 분배 테스트
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from enhanced_ccei_family_scraper import EnhancedCCEIFamilyScraper, CCEI_REGIONS
+
+
+def _page(*rows):
+    return {'result': {'totalCnt': 100, 'list': [
+        {'SEQ': seq, 'TITLE': f'공고 {seq}', 'COUNTRY_NM': label, 'REG_DATE': '2024-05-01', 'FILE': ''}
+        for seq, label in rows
+    ]}}
+
+
+def test_rows_are_demultiplexed_and_deduplicated_by_seq():
+    scraper = EnhancedCCEIFamilyScraper()
+    first = scraper.parse_api_response(_page((10, '통합'), (9, '부산'), (8, '제주')), 1)
+    assert [ann['regions'] for ann in first] == [list(CCEI_REGIONS), ['cceiBusan'], ['cceiJeju']]
+    assert first[0]['url'].endswith('/chungbuk/custom/notice_view.do?no=10')
+
+    # 목록이 밀려 다음 페이지에 같은 SEQ가 다시 나와도 한 번만 처리
+    second = scraper.parse_api_response(_page((8, '제주'), (7, '미상')), 2)
+    assert [(ann['seq'], ann['regions']) for ann in second] == [(7, [])]
+    assert scraper.unmatched_labels == {'미상': 1}
+
+    subset = EnhancedCCEIFamilyScraper(regions=['cceiBusan'])
+    assert [ann['regions'] for ann in subset.parse_api_response(_page((10, '통합'), (9, '부산'), (8, '제주')), 1)] \
+        == [['cceiBusan'], ['cceiBusan']]
+
+    with pytest.raises(ValueError):
+        EnhancedCCEIFamilyScraper(regions=['cceiMars'])
+
+
+def test_saved_folder_is_linked_into_each_region(tmp_path):
+    src = tmp_path / '001_공고'
+    (src / 'attachments').mkdir(parents=True)
+    (src / 'content.md').write_text('본문', encoding='utf-8')
+    (src / 'attachments' / 'a.hwp').write_bytes(b'hwp')
+
+    dest = tmp_path / 'regions' / 'cceiBusan' / '001_공고'
+    EnhancedCCEIFamilyScraper.link_tree(str(src), str(dest))
+    assert os.path.samefile(src / 'attachments' / 'a.hwp', dest / 'attachments' / 'a.hwp')
+
+    # 다음 실행에서 원본 content.md를 다시 써도 센터별 사본은 그대로
+    with open(src / 'content.md', 'w', encoding='utf-8') as f:
+        f.write('다른 공고')
+    assert (dest / 'content.md').read_text(encoding='utf-8') == '본문'
+
+
+def test_region_endpoints_are_used_when_hub_returns_only_its_own_rows():
+    responses = {'chungbuk': _page((10, '충북'), (9, '통합')), 'busan': _page((8, '부산센터'), (9, '통합')),
+                 'jeju': _page((7, '제주'))}
+    scraper = EnhancedCCEIFamilyScraper(regions=['cceiBusan', 'cceiJeju'])
+    scraper.post_page = lambda url, data=None, **kwargs: SimpleNamespace(
+        status_code=200, json=lambda: responses[url.split('/')[3]])
+    assert not scraper._hub_covers_regions()
+
+    scraper.per_region_endpoints = True
+    announcements = scraper._get_page_announcements(1)
+    assert [(ann['seq'], ann['regions']) for ann in announcements] == \
+        [(8, ['cceiBusan']), (9, ['cceiBusan', 'cceiJeju']), (7, ['cceiJeju'])]
+    assert '/busan/custom/notice_view.do' in announcements[0]['url']
+    assert scraper.region_path == 'chungbuk'
+
+    responses['busan'] = responses['chungbuk']
+    assert scraper._hub_covers_regions()
+
+
+def test_attachments_use_base_download_and_region_numbers_continue(tmp_path):
+    (tmp_path / 'regions' / 'cceiBusan' / '007_이전 공고').mkdir(parents=True)
+    scraper = EnhancedCCEIFamilyScraper(regions=['cceiBusan', 'cceiJeju'])
+    scraper.per_region_endpoints = False
+    scraper.delay_between_pages = scraper.delay_between_requests = 0
+    rows = scraper.parse_api_response(_page((10, '통합')), 1)
+
+    def download_file(url, save_path, attachment_info=None):
+        with open(save_path, 'wb') as f:
+            f.write(b'hwp')
+        return True
+
+    scraper._get_page_announcements = lambda page_num: rows if page_num == 1 else []
+    scraper.get_page = lambda url, **kwargs: SimpleNamespace(text='')
+    scraper.parse_detail_page = lambda html, url=None: {
+        'content': '본문', 'attachments': [{'name': '공고문.hwp', 'uuid': 'f1', 'url': 'https://example.org/f1'}]}
+    scraper.download_file = download_file
+    scraper.scrape_pages(max_pages=1, output_base=str(tmp_path))
+
+    assert scraper.manifest.summary['files'] == 1
+    assert (tmp_path / 'regions' / 'cceiBusan' / '008_공고 10' / 'attachments' / '공고문.hwp').read_bytes() == b'hwp'
+    assert (tmp_path / 'regions' / 'cceiJeju' / '001_공고 10' / 'content.md').exists()
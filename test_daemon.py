@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+데몬 모드 수집 주기 기록 테스트
+"""
+
+import signal
+import time
+from types import SimpleNamespace
+
+
+class _Scheduler:
+    """사이트 하나를 두 번 돌리고 데몬을 멈추는 스케줄러 - record_run에 넘어온 새 공고 수 기록"""
+
+    def __init__(self, handlers):
+        self.handlers = handlers
+        self.new_counts = []
+
+    def register(self, keys):
+        pass
+
+    def save(self):
+        pass
+
+    def due_sites(self, keys):
+        return keys if len(self.new_counts) < 2 else []
+
+    def next_due(self, keys):
+        return None
+
+    def record_run(self, key, new_count):
+        self.new_counts.append(new_count)
+        if len(self.new_counts) == 2:
+            self.handlers[signal.SIGTERM](signal.SIGTERM, None)
+        return time.time()
+
+    def record_failure(self, key):
+        raise AssertionError('수집 실패')
+
+
+def test_run_without_new_posts_reports_zero_new_announcements(tmp_path, monkeypatch, demo_scraper):
+    monkeypatch.chdir(tmp_path)
+    import main
+
+    handlers = {}
+    monkeypatch.setattr(main.signal, 'signal', lambda signum, handler: handlers.__setitem__(signum, handler))
+    for name in ('get_attachment_store', 'get_search_index', 'get_near_duplicate_index', 'get_text_extractor'):
+        monkeypatch.setattr(main, name, lambda: None)
+
+    pages = {1: [{'title': f'공고 {i}', 'url': f'https://example.org/view.do?nttId={i}'} for i in (3, 2, 1)]}
+    scrapers = {'demo': {'name': 'DEMO', 'output_dir': 'demo', 'class': lambda: demo_scraper(
+        pages=pages, watermark_kind='off', get_page=lambda url, **kwargs: SimpleNamespace(text=''))}}
+    scheduler = _Scheduler(handlers)
+    main.run_daemon(scrapers, max_pages=2, max_workers=1, scheduler=scheduler)
+
+    # 두 번째 실행은 디렉토리에 공고 폴더 3개가 있어도 새 공고가 없음
+    assert scheduler.new_counts == [3, 0]
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+전자정부 표준프레임워크 계열 게시판 파싱 테스트
+"""
+
+from enhanced_egov_board_scraper import EnhancedEgovBoardScraper
+
+LIST_HTML = """
+<table class="board_list"><thead><tr><th>번호</th><th>제목</th><th>등록일</th></tr></thead>
+<tbody>
+<tr class="notice"><td>공지</td>
+  <td class="subject"><a href="#" onclick="fn_egov_inqire_notice('7', 'BBSMSTR_000000000021'); return false;">이용 안내</a></td>
+  <td class="date">2023.01.05</td></tr>
+<tr><td>120</td>
+  <td class="subject"><a href="javascript:fn_egov_inqire_notice('1530','BBSMSTR_000000000021')">2024년 기술지원 공고</a></td>
+  <td class="date">2024.05.07</td></tr>
+<tr><td>119</td>
+  <td class="subject"><a href="/kfsweb/cop/bbs/selectBoardArticle.do?bbsId=BBSMSTR_000000000021&amp;nttId=1529">모집 공고</a></td>
+  <td class="date">2024-05-01</td></tr>
+</tbody></table>
+"""
+
+DETAIL_HTML = """
+<div class="view_cont"><p>접수는 5월 31일까지입니다.</p></div>
+<ul class="file">
+<li><a href="javascript:fn_egov_downFile('FILE_000000000012345','0')">공고문.hwp [120KB]</a></li>
+<li><a href="/kfsweb/cmm/fms/FileDown.do?atchFileId=FILE_000000000012345&amp;fileSn=1">서식.zip</a></li>
+<li><a href="/kfsweb/cop/bbs/selectBoardList.do?bbsId=BBSMSTR_000000000021">목록</a></li>
+</ul>
+"""
+
+
+def test_egov_list_and_attachments():
+    scraper = EnhancedEgovBoardScraper(
+        'https://www.forest.go.kr/kfsweb/cop/bbs/selectBoardList.do?bbsId=BBSMSTR_000000000021&mn=NKFS_04&pageIndex=3',
+        settings={'context_path': '/kfsweb'})
+    assert scraper.get_list_url(2) == ('https://www.forest.go.kr/kfsweb/cop/bbs/selectBoardList.do'
+                                       '?bbsId=BBSMSTR_000000000021&mn=NKFS_04&pageIndex=2')
+
+    notice, first, second = scraper.parse_list_page(LIST_HTML)
+    assert notice['is_notice'] and notice['announcement_id'] == '7'
+    assert first['url'] == ('https://www.forest.go.kr/kfsweb/cop/bbs/selectBoardArticle.do'
+                            '?bbsId=BBSMSTR_000000000021&mn=NKFS_04&nttId=1530')
+    assert (first['number'], first['date']) == ('120', '2024-05-07')
+    assert second['announcement_id'] == '1529' and second['date'] == '2024-05-01'
+
+    detail = scraper.parse_detail_page(DETAIL_HTML, first['url'])
+    assert '5월 31일' in detail['content']
+    assert detail['attachments'] == [
+        {'name': '공고문.hwp', 'url': 'https://www.forest.go.kr/kfsweb/cmm/fms/FileDown.do?atchFileId=FILE_000000000012345&fileSn=0'},
+        {'name': '서식.zip', 'url': 'https://www.forest.go.kr/kfsweb/cmm/fms/FileDown.do?atchFileId=FILE_000000000012345&fileSn=1'},
+    ]
+
+
+def test_presets_and_site_table():
+    scraper = EnhancedEgovBoardScraper(site_code='kicox')
+    assert scraper.get_list_url(2).endswith('BD_selectBbsList.do?q_bbsCode=1016&q_currPage=2')
+    assert scraper.get_view_url('55').endswith('/user/bbs/BD_selectBbs.do?q_bbsCode=1016&q_bbscttSn=55')
+
+    ntt = EnhancedEgovBoardScraper(site_code='reb', settings={'selectors': {'rows': 'ul.list > li'}})
+    rows = ntt.parse_list_page('<ul class="list"><li><a href="#" onclick="view(\'1134\', \'900\')">공고</a></li></ul>')
+    assert rows[0]['announcement_id'] == '900'
+    assert ntt.get_site_key() == 'reb'
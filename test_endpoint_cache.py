@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+엔드포인트 탐색 캐시 테스트
+"""
+
+import time
+
+TEMPLATES = ['/fileList.jsp?id={id}', '/file/list.do?id={id}', '/cmm/fileList.do?id={id}']
+
+
+def test_failed_templates_are_skipped_until_expiry(tmp_path, demo_scraper):
+    scraper = demo_scraper()
+    scraper.load_endpoint_cache(str(tmp_path))
+    scraper.record_endpoint_failure('file_list', TEMPLATES[0], 404)
+    scraper.record_endpoint_failure('file_list', TEMPLATES[1], 500)  # 일시적 오류는 기록하지 않음
+    scraper.record_endpoint_success('file_list', TEMPLATES[2])
+    assert scraper.get_endpoint_candidates('file_list', TEMPLATES) == [TEMPLATES[2], TEMPLATES[1]]
+    scraper.save_endpoint_cache()
+
+    rerun = demo_scraper()
+    rerun.load_endpoint_cache(str(tmp_path))
+    assert rerun.get_endpoint_candidates('file_list', TEMPLATES) == [TEMPLATES[2], TEMPLATES[1]]
+
+    # 실패 기록 유지 시간이 지나면 다시 시도
+    rerun.endpoint_cache['file_list']['failed'][TEMPLATES[0]] = time.time() - rerun.endpoint_negative_ttl - 1
+    assert rerun.get_endpoint_candidates('file_list', TEMPLATES) == [TEMPLATES[2], TEMPLATES[0], TEMPLATES[1]]
+    assert TEMPLATES[0] not in rerun.endpoint_cache['file_list']['failed']
+
+
+def test_templates_that_worked_are_never_blacklisted(demo_scraper):
+    scraper = demo_scraper()
+    scraper.record_endpoint_success('download', TEMPLATES[0])
+
+    # 없는 파일 하나의 존재 확인 실패는 템플릿 실패가 아님
+    scraper.record_endpoint_failure('download', TEMPLATES[0], 404, per_resource=True)
+    assert scraper.is_known_endpoint('download', TEMPLATES[0])
+
+    # 확인된 템플릿이 실패하면 재탐색하되, 한 번이라도 동작한 템플릿은 제외하지 않음
+    scraper.record_endpoint_failure('download', TEMPLATES[0], 404)
+    assert not scraper.is_known_endpoint('download', TEMPLATES[0])
+    assert scraper.get_endpoint_candidates('download', TEMPLATES) == TEMPLATES
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+그누보드 공용 스크래퍼 파싱 테스트
+"""
+
+from types import SimpleNamespace
+
+from enhanced_gnuboard_scraper import EnhancedGnuboardScraper
+
+LIST_HTML = """
+<ul class="gnb"><li><a href="/bbs/board.php?bo_table=other&wr_id=99">다른 게시판</a></li></ul>
+<form name="fboardlist">
+<table><tbody>
+<tr class="bo_notice"><td class="td_num2"><strong class="notice_icon">공지</strong></td>
+  <td class="td_subject"><a href="https://example.org/bbs/board.php?bo_table=notice&amp;wr_id=3&amp;page=1">운영 안내</a></td>
+  <td class="td_name"><span class="sv_member">관리자</span></td><td class="td_datetime">2023-01-02</td></tr>
+<tr><td class="td_num2">42</td>
+  <td class="td_subject"><a href="https://example.org/bbs/board.php?bo_table=notice&amp;wr_id=51&amp;page=1">2024년 지원사업 공고 <span class="cnt_cmt">3</span></a>
+  <a href="https://example.org/bbs/board.php?bo_table=notice&amp;wr_id=51#c_10">댓글</a></td>
+  <td class="td_name"><span class="sv_member">담당자</span></td><td class="td_datetime">24-05-07</td></tr>
+</tbody></table>
+</form>
+"""
+
+DETAIL_HTML = """
+<article id="bo_v">
+<section id="bo_v_file"><ul>
+<li><a href="https://example.org/bbs/download.php?bo_table=notice&amp;wr_id=51&amp;no=0&amp;nonce=abc"><strong>공고문.hwp</strong> (160.1K)</a></li>
+<li><a href="javascript:file_download('./download.php?bo_table=notice&amp;wr_id=51&amp;no=1', '서식.zip');">서식.zip (2.0M)</a></li>
+</ul></section>
+<div id="bo_v_con"><p>신청 기간은 5월 31일까지입니다.</p></div>
+</article>
+"""
+
+RSS_XML = """<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel>
+<item><title>새 공고</title><link>https://example.org/bbs/board.php?bo_table=notice&amp;wr_id=52</link></item>
+<item><title>이전 공고</title><link>https://example.org/bbs/board.php?bo_table=notice&amp;wr_id=51</link></item>
+</channel></rss>"""
+
+
+def test_list_and_detail_parsing():
+    scraper = EnhancedGnuboardScraper('https://example.org/bbs/board.php?bo_table=notice&sca=공고')
+    assert scraper.get_list_url(2) == 'https://example.org/bbs/board.php?bo_table=notice&sca=%EA%B3%B5%EA%B3%A0&page=2'
+    assert scraper.get_site_key() == 'gnuboard_example_org_notice'
+
+    notice, post = scraper.parse_list_page(LIST_HTML)
+    assert notice['is_notice'] and notice['wr_id'] == '3'
+    assert post == {'title': '2024년 지원사업 공고', 'url': 'https://example.org/bbs/board.php?bo_table=notice&wr_id=51',
+                    'wr_id': '51', 'number': '42', 'writer': '담당자', 'date': '2024-05-07'}
+
+    detail = scraper.parse_detail_page(DETAIL_HTML, post['url'])
+    assert '5월 31일' in detail['content']
+    assert detail['attachments'] == [
+        {'name': '공고문.hwp', 'url': 'https://example.org/bbs/download.php?bo_table=notice&wr_id=51&no=0&nonce=abc'},
+        {'name': '서식.zip', 'url': 'https://example.org/bbs/download.php?bo_table=notice&wr_id=51&no=1'},
+    ]
+
+
+def test_feed_skips_crawl_when_nothing_is_newer(tmp_path, monkeypatch):
+    scraper = EnhancedGnuboardScraper(site_code='gnlife')
+    monkeypatch.setattr(scraper, 'get_page', lambda url, **kwargs: SimpleNamespace(content=RSS_XML.encode('utf-8')))
+
+    (tmp_path / 'high_water_gnlife.json').write_text('{"kind": "id", "value": 52}', encoding='utf-8')
+    assert not scraper.has_new_posts(str(tmp_path))
+
+    (tmp_path / 'high_water_gnlife.json').write_text('{"kind": "id", "value": 51}', encoding='utf-8')
+    assert scraper.has_new_posts(str(tmp_path))
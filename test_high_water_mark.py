@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+최고 수위 기반 증분 수집 테스트
+"""
+
+import json
+
+import pytest
+
+
+def _row(number, title=None, **extra):
+    return dict({'title': title or f'공고 {number}', 'url': f'https://example.org/board/view.do?nttId={number}'}, **extra)
+
+
+@pytest.fixture
+def new_scraper(tmp_path, demo_scraper):
+    """같은 출력 디렉토리의 다음 실행 스크래퍼"""
+    def new(kind=None):
+        scraper = demo_scraper(watermark_kind=kind)
+        scraper.load_processed_titles(str(tmp_path))
+        return scraper
+    return new
+
+
+def _process(scraper, announcements):
+    new, should_stop = scraper.filter_new_announcements(announcements)
+    for ann in new:
+        scraper.add_processed_title(ann['title'], ann)
+    return [ann['title'] for ann in new], should_stop
+
+
+def test_stops_at_mark_and_skips_pinned_rows(tmp_path, new_scraper):
+    scraper = new_scraper()
+    titles, should_stop = _process(scraper, [_row(3, '상단 공지', is_notice=True), _row(12), _row(11), _row(10)])
+    assert (len(titles), should_stop) == (4, False)
+    scraper.save_processed_titles()
+
+    state = json.loads((tmp_path / 'high_water_demo.json').read_text(encoding='utf-8'))
+    assert (state['kind'], state['value']) == ('id', 12)
+
+    scraper = new_scraper()
+    titles, should_stop = _process(scraper, [_row(3, '상단 공지', is_notice=True), _row(2, '오래된 고정 공지', is_notice=True),
+                                             _row(14), _row(13), _row(12), _row(11)])
+    assert titles == ['공고 14', '공고 13']
+    assert should_stop
+
+
+def test_unflagged_pinned_row_does_not_stop_the_crawl(tmp_path, new_scraper):
+    # 공지 플래그 없이 상단에 고정된 5번 글 - 종류 감지는 첫 페이지에서, 수위는 첫 페이지의 100번까지
+    scraper = new_scraper()
+    _process(scraper, [_row(5), _row(100), _row(99), _row(98)])
+    _process(scraper, [_row(97), _row(96)])
+    scraper.save_processed_titles()
+    assert scraper.high_water == {'kind': 'id', 'value': 100}
+
+    scraper = new_scraper()
+    assert _process(scraper, [_row(5), _row(102), _row(101), _row(100)]) == (['공고 102', '공고 101'], False)
+    assert _process(scraper, [_row(99), _row(98)]) == ([], True)
+
+
+def test_configured_number_mark_stays_below_unprocessed_items(tmp_path, new_scraper):
+    numbered = [dict(_row(n), url='https://example.org/board/view.do', number=str(n)) for n in (5, 4, 3)]
+    scraper = new_scraper('number')
+    new, _ = scraper.filter_new_announcements(numbered)
+    # 4번 처리 실패 - 다음 실행에서 다시 보여야 함
+    scraper.add_processed_title(new[0]['title'], new[0])
+    scraper.add_processed_title(new[2]['title'], new[2])
+    scraper.save_processed_titles()
+    assert scraper.high_water['value'] == 3
+
+    # 번호 칸은 설정한 사이트에서만 수위로 사용
+    assert new_scraper().high_water is None
+
+    scraper = new_scraper('number')
+    new, should_stop = scraper.filter_new_announcements(numbered)
+    assert ([ann['title'] for ann in new], should_stop) == (['공고 4'], False)
+    _, should_stop = scraper.filter_new_announcements([dict(numbered[0], title='공고 2', number='2')])
+    assert should_stop
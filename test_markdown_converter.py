@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+TreeHTML2Text 패리티 테스트 - 저장된 상세 페이지에서 html2text와 같은 마크다운을 내는지 확인
+"""
+
+import os
+import glob
+
+import html2text
+import pytest
+from bs4 import BeautifulSoup
+
+from enhanced_base_scraper import TreeHTML2Text
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'detail_pages')
+FIXTURES = sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html')))
+
+# 스크래퍼들이 본문 영역으로 넘기는 요소들
+CONTENT_SELECTORS = ['div', 'td', 'table', 'ul', 'ol', 'section', 'article', 'p']
+
+
+def make_reference():
+    h = html2text.HTML2Text()
+    h.ignore_links = False
+    h.ignore_images = False
+    return h
+
+
+def make_tree_converter():
+    h = TreeHTML2Text()
+    h.ignore_links = False
+    h.ignore_images = False
+    return h
+
+
+def load_soup(path, parser):
+    with open(path, 'r', encoding='utf-8') as f:
+        return BeautifulSoup(f.read(), parser)
+
+
+@pytest.mark.parametrize('parser', ['html.parser', 'lxml'])
+@pytest.mark.parametrize('path', FIXTURES, ids=os.path.basename)
+def test_whole_document_parity(path, parser):
+    soup = load_soup(path, parser)
+    assert make_tree_converter().handle(soup) == make_reference().handle(str(soup))
+
+
+@pytest.mark.parametrize('parser', ['html.parser', 'lxml'])
+@pytest.mark.parametrize('path', FIXTURES, ids=os.path.basename)
+def test_content_element_parity(path, parser):
+    soup = load_soup(path, parser)
+    
+    # 스크래퍼처럼 하나의 변환기를 여러 번 재사용
+    reference = make_reference()
+    converter = make_tree_converter()
+    
+    for element in soup.find_all(CONTENT_SELECTORS):
+        assert converter.handle(element) == reference.handle(str(element)), str(element)[:200]
+
+
+def test_modified_tree_parity():
+    """decompose/insert 후 인접한 텍스트 노드가 생겨도 같은 결과"""
+    soup = load_soup(os.path.join(FIXTURE_DIR, 'korcham_board_view.html'), 'html.parser')
+    content = soup.find('td', class_='td_content')
+    for img in content.find_all('img'):
+        img.decompose()
+    content.append(' 추가 텍스트 * 1. ')
+    content.append('&<끝>')
+    
+    assert make_tree_converter().handle(content) == make_reference().handle(str(content))
+
+
+def test_string_input_uses_html2text():
+    html = '<p>문자열 <a href="/x">입력</a></p>'
+    assert make_tree_converter().handle(html) == make_reference().handle(html)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+사이트 간 유사 공고 색인 테스트
+"""
+
+import os
+import json
+import glob
+from types import SimpleNamespace
+
+from attachment_store import AttachmentStore
+from near_duplicate_index import NearDuplicateIndex
+
+BODY = ("2024년 중소기업 수출바우처 지원사업 참여기업 모집 공고입니다. 해외 진출을 희망하는 중소·중견기업을 대상으로 "
+        "수출 역량에 따라 바우처를 지급하며, 기업은 수행기관 메뉴판에서 디자인, 번역, 해외인증, 전시회 참가 등 "
+        "필요한 서비스를 선택하여 이용할 수 있습니다. 신청 기간은 2024년 1월 15일부터 2월 2일 18시까지이며 "
+        "수출바우처 누리집(www.exportvoucher.com)에서 온라인으로 접수합니다. 제출 서류는 사업신청서, 재무제표, "
+        "수출실적 증명서류이고 평가는 서류 평가와 발표 평가로 진행됩니다. 문의는 수출바우처 콜센터로 연락 바랍니다.")
+
+
+def _reposting_scraper(demo_scraper, site, index, store, attachments):
+    """BODY를 그대로 옮겨 싣고 첨부파일을 받는 사이트 - 받은 URL은 scraper.processed에 기록
+
+    download_file은 기본 구현처럼 임시 파일을 저장소에 넣고 링크한다.
+    """
+    def download_file(url, save_path, attachment_info=None):
+        scraper.processed.append(url)
+        with open(save_path + '.part', 'wb') as f:
+            f.write(b'pdf')
+        scraper.last_download_sha256 = store.hash_file(save_path + '.part')
+        store.ingest(save_path + '.part', scraper.last_download_sha256, save_path)
+        return True
+
+    scraper = demo_scraper(
+        site=site, near_duplicate_index=index, skip_duplicate_attachments=True, attachment_store=store,
+        detail={'content': f"{BODY}\n\n원문: https://{site}.example.org/view?id=7", 'attachments': attachments},
+        get_page=lambda url, **kwargs: SimpleNamespace(text=''), download_file=download_file)
+    return scraper
+
+
+def test_reposted_text_matches_other_sites_only(tmp_path):
+    index = NearDuplicateIndex(str(tmp_path / 'near.sqlite3'))
+    original = index.fingerprint('수출바우처 지원사업 모집', BODY)
+    repost = index.fingerprint('[대한상의] 수출바우처 지원사업 모집', f"상공회의소 알림\n{BODY}\nhttps://cci.example.org/1")
+    other = index.fingerprint('스마트공장 구축 지원사업 공고', BODY[::-1])
+    assert index.fingerprint('공고', '첨부파일 참조') is None
+
+    index.add('kita', str(tmp_path / 'kita/001_a'), '수출바우처 지원사업 모집', '', original)
+    assert index.find(original, 'kita') is None
+    match = index.find(repost, 'acci')
+    assert match['site'] == 'kita' and match['distance'] <= index.max_distance
+    assert index.find(other, 'acci') is None
+
+    index.add('acci', str(tmp_path / 'acci/001_a'), '[대한상의] 수출바우처', '', repost, match)
+    assert index.reposts()[0]['copies'] == 1
+
+
+def test_repost_skips_attachments_stored_by_canonical_copy(tmp_path, demo_scraper):
+    index = NearDuplicateIndex(str(tmp_path / 'near.sqlite3'))
+    store = AttachmentStore(str(tmp_path / 'store'))
+    original = 'https://technopark.example.org/file/1'
+    first = _reposting_scraper(demo_scraper, 'technopark', index, store, [{'name': '공고문.pdf', 'url': original}])
+    # 원본 파일을 그대로 링크한 첨부파일만 생략 - 이름이 같아도 URL이 다르면 다른 파일일 수 있음
+    second = _reposting_scraper(demo_scraper, 'gjtp', index, store, [
+        {'name': '공고문(재게시).pdf', 'url': original}, {'name': '공고문.pdf', 'url': 'https://gjtp.example.org/file/1'}])
+    # 원본 blob이 없는 저장소를 쓰는 사이트는 생략하지 않고 받음
+    third = _reposting_scraper(demo_scraper, 'gbtp', index, AttachmentStore(str(tmp_path / 'other_store')),
+                               [{'name': '공고문.pdf', 'url': original}])
+    announcement = {'title': '수출바우처 지원사업 모집', 'url': 'https://example.org/view?id=7'}
+
+    for scraper in (first, second, third):
+        scraper.process_announcement(announcement, 1, str(tmp_path / scraper.site))
+        scraper.manifest.close()
+        scraper.record_sink.close()
+
+    assert first.processed == [original] and second.processed == ['https://gjtp.example.org/file/1']
+    assert third.processed == [original]
+    assert os.path.samefile(glob.glob(str(tmp_path / 'technopark' / '*' / 'attachments' / '공고문.pdf'))[0],
+                            glob.glob(str(tmp_path / 'gjtp' / '*' / 'attachments' / '공고문(재게시).pdf'))[0])
+    with open(glob.glob(str(tmp_path / 'gjtp' / 'records' / '*.jsonl'))[0], encoding='utf-8') as f:
+        record = json.loads(f.readline())
+    assert record['near_duplicate_of'] == 'technopark/001_수출바우처 지원사업 모집'
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+파싱 전략 기억(run_strategies) 테스트
+"""
+
+
+def _strategies(calls, results):
+    def strategy(name):
+        def run():
+            calls.append(name)
+            return results[name]
+        return run
+    return [(name, strategy(name)) for name in results]
+
+
+def test_winning_strategy_is_tried_first_and_replaced_on_miss(demo_scraper):
+    scraper = demo_scraper()
+    calls = []
+    results = {'table': [], 'cards': ['a'], 'links': ['b']}
+
+    assert scraper.run_strategies('list', _strategies(calls, results)) == ['a']
+    assert calls == ['table', 'cards']
+
+    calls.clear()
+    assert scraper.run_strategies('list', _strategies(calls, results)) == ['a']
+    assert calls == ['cards']
+
+    # 선호 전략이 결과를 못 내면 선언 순서대로 다시 찾고 선호 전략을 바꿈
+    calls.clear()
+    results['cards'] = []
+    assert scraper.run_strategies('list', _strategies(calls, results)) == ['b']
+    assert calls == ['cards', 'table', 'links']
+    assert scraper.strategy_stats['list']['preferred'] == 'links'
+    cards = scraper.strategy_stats['list']['strategies']['cards']
+    assert (cards['hits'], cards['misses']) == (2, 1)
+
+
+def test_preferred_strategy_persists_between_runs(tmp_path, demo_scraper):
+    scraper = demo_scraper()
+    scraper.load_strategy_stats(str(tmp_path))
+    scraper.run_strategies('list', _strategies([], {'table': [], 'cards': ['a']}))
+    scraper.save_strategy_stats()
+
+    calls = []
+    rerun = demo_scraper()
+    rerun.load_strategy_stats(str(tmp_path))
+    assert rerun.run_strategies('list', _strategies(calls, {'table': ['x'], 'cards': ['a']})) == ['a']
+    assert calls == ['cards']
+    assert rerun.run_strategies('list', _strategies([], {'table': [], 'cards': []})) == []
+
+
+def test_probing_attachment_strategy_is_skipped_after_repeated_misses(monkeypatch):
+    from types import SimpleNamespace
+    from bs4 import BeautifulSoup
+    from enhanced_djbea_scraper import EnhancedDJBEAScraper
+
+    scraper = EnhancedDJBEAScraper()
+    scraper.strategy_skip_after = 3
+    scraper.strategy_reprobe_interval = 2
+    probes = []
+    monkeypatch.setattr(scraper.session, 'head', lambda url, **kwargs: probes.append(url) or SimpleNamespace(status_code=404))
+    soup = BeautifulSoup('<script>var A2mUpload; var key = "0123456789abcdef";</script>'
+                         '<a href="/download.do?fileId=1">공고문.pdf</a>', 'html.parser')
+
+    counts = []
+    for _ in range(6):
+        probes.clear()
+        scraper._extract_detail_attachments(soup)
+        counts.append(len(probes))
+
+    # 세 번 연속 결과가 없으면 해시 경로 확인(HEAD 4개)을 건너뛰고, 건너뛴 두 번째마다 다시 확인
+    assert counts == [4, 4, 4, 0, 4, 0]
+    a2m = scraper.strategy_stats['attachments']['strategies']['a2m']
+    assert (a2m['hits'], a2m['misses']) == (0, 4)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+적응형 수집 주기 스케줄러 테스트
+"""
+
+from datetime import datetime
+
+from poll_scheduler import PollScheduler
+
+HOUR = 3600
+
+
+def _scheduler(tmp_path, **kwargs):
+    options = {'min_interval': 1800, 'max_interval': 86400, 'default_interval': HOUR, 'jitter': 0}
+    options.update(kwargs)
+    return PollScheduler(str(tmp_path / 'schedule.json'), **options)
+
+
+def test_intervals_follow_posting_rate_and_back_off(tmp_path):
+    scheduler = _scheduler(tmp_path)
+    scheduler.register(['busy', 'quiet'], now=0, stagger=0)
+    assert scheduler.due_sites(['busy', 'quiet'], now=0) == ['busy', 'quiet']
+
+    # busy: 2시간마다 새 공고 1개 → 1시간 간격
+    scheduler.record_run('busy', 5, now=0)
+    for n in range(1, 5):
+        scheduler.record_run('busy', 1, now=n * 2 * HOUR)
+    assert scheduler.sites['busy']['interval'] == HOUR
+
+    # quiet: 새 공고가 없을 때마다 1.5배, 최대 간격에서 멈춤
+    intervals = []
+    for n in range(12):
+        next_run = scheduler.record_run('quiet', 0, now=n * HOUR)
+        intervals.append(next_run - n * HOUR)
+    assert intervals[:3] == [1.5 * HOUR, 2.25 * HOUR, 3.375 * HOUR]
+    assert intervals[-1] == 86400
+
+    scheduler.save()
+    reloaded = _scheduler(tmp_path)
+    assert reloaded.sites['quiet']['quiet_runs'] == 12
+    assert reloaded.next_due(['busy', 'quiet']) == scheduler.sites['busy']['next_run']
+
+
+def test_failures_double_and_quiet_hours_are_skipped(tmp_path):
+    scheduler = _scheduler(tmp_path, min_hour_samples=5)
+    scheduler.register(['site'], now=0, stagger=0)
+
+    assert scheduler.record_failure('site', now=0) == 1800
+    assert scheduler.record_failure('site', now=0) == 3600
+
+    # 게시가 9시대에만 있었으면 새벽 예정은 다음 9시로 미룬다
+    scheduler.sites['site']['hour_counts'][9] = 10
+    night = datetime(2024, 5, 1, 2, 0).timestamp()
+    next_run = scheduler.record_run('site', 0, now=night)
+    assert datetime.fromtimestamp(next_run) == datetime(2024, 5, 1, 9, 0)
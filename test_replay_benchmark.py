@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""
+오프라인 재생 벤치마크 테스트 - 녹화 응답으로 스크래퍼 전체 흐름 실행
+"""
+
+from replay_benchmark import BENCHMARK_SITES, compare_results, run_site
+
+
+def test_replay_runs_scrapers_end_to_end():
+    for site in BENCHMARK_SITES:
+        result = run_site(site)
+        assert result['replay_misses'] == []
+        assert result['announcements'] > 0 and result['files'] > 0
+        assert result['phases']['detail_fetch']['count'] == result['announcements']
+        assert result['phases']['attachment_download']['p95'] is not None
+
+
+def test_compare_flags_throughput_regression(capsys):
+    params = {'latency': 0.0, 'bandwidth': None, 'repeat': 1, 'keep_delays': False}
+    baseline = {'params': params, 'sites': {'btp': {'announcements_per_sec': 20.0},
+                                            'gsif': {'announcements_per_sec': 20.0}}}
+    current = {'params': params, 'sites': {'btp': {'announcements_per_sec': 17.0},
+                                           'gsif': {'announcements_per_sec': 19.5}}}
+    assert compare_results(current, baseline) == ['btp']
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+실행 시간 예산 테스트
+"""
+
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+from run_budget import BudgetExceeded, parse_deadline
+
+
+PAGES = {n: [{'title': f'공고 {n}-{i}', 'url': f'https://example.org/view.do?nttId={n * 10 + i}'} for i in range(2)]
+         for n in range(1, 6)}
+
+
+def _process_until_budget_runs_out(scraper, announcement, index, output_base):
+    scraper.processed.append(announcement['title'])
+    scraper.add_processed_title(announcement['title'], announcement)
+    if len(scraper.processed) == 3:
+        scraper.deadline = time.time() - 1  # 예산 소진
+    scraper.sleep(0.01)
+
+
+class FakePage:
+    def __init__(self):
+        self.calls = []
+
+    def goto(self, url, **kwargs):
+        self.calls.append(('goto', kwargs.get('timeout')))
+
+    def wait_for_timeout(self, timeout):
+        self.calls.append(('wait_for_timeout', timeout))
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    def content(self):
+        return '<html></html>'
+
+
+def test_budget_stops_the_site_but_keeps_completed_work(tmp_path, demo_scraper):
+    scraper = demo_scraper(pages=PAGES, process=_process_until_budget_runs_out, watermark_kind='off')
+    scraper.deadline = time.time() + 60
+    with pytest.raises(BudgetExceeded):
+        scraper.scrape_pages(max_pages=5, output_base=str(tmp_path))
+
+    assert scraper.processed == ['공고 1-0', '공고 1-1', '공고 2-0']
+    scraper.save_partial_progress()
+    assert not os.path.exists(tmp_path / 'processed_titles_demo.json')
+
+    # 다음 실행은 중단 전에 처리한 공고를 다시 받지 않음
+    resumed = demo_scraper(pages=PAGES, process=_process_until_budget_runs_out, watermark_kind='off', resume=True)
+    resumed.scrape_pages(max_pages=2, output_base=str(tmp_path))
+    assert resumed.processed == ['공고 2-1']
+    assert resumed.checkpoint.state['last_index'] == 4
+
+
+def test_requests_and_browser_waits_are_capped(demo_scraper):
+    scraper = demo_scraper()
+    page = scraper.guard_page(FakePage())
+    page.set_default_timeout(60000)
+    page.goto('https://example.org', timeout=5000)
+    assert page.content() == '<html></html>'
+
+    scraper.deadline = time.time() + 2
+    assert scraper._budget_timeout(30) <= 2
+    page.goto('https://example.org')
+    page.wait_for_timeout(10000)
+    assert page._page.calls[0] == ('goto', 5000)
+    assert page._page.calls[1][1] <= 2000 and page._page.calls[2][1] <= 2000
+
+    scraper.deadline = time.time() - 1
+    with pytest.raises(BudgetExceeded):
+        page.goto('https://example.org')
+    with pytest.raises(BudgetExceeded):
+        scraper.get_page('https://example.org')
+
+
+def test_parse_deadline_rolls_over_to_next_day():
+    now = datetime(2024, 5, 1, 9, 30)
+    assert datetime.fromtimestamp(parse_deadline('08:00', now)) == datetime(2024, 5, 2, 8, 0)
+    assert datetime.fromtimestamp(parse_deadline('10:15', now)) == datetime(2024, 5, 1, 10, 15)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+실행 체크포인트/재개 테스트
+"""
+
+import os
+
+PAGES = {n: [{'title': f'공고 {n}-{i}', 'url': f'https://example.org/view.do?nttId={n * 10 + i}'}
+             for i in range(3)] for n in range(1, 4)}
+
+
+def _process(kill_at=None):
+    def process(scraper, announcement, index, output_base):
+        if announcement['title'] == kill_at:
+            raise KeyboardInterrupt  # 프로세스 종료 흉내
+        scraper.processed.append((index, announcement['title']))
+        scraper.add_processed_title(announcement['title'], announcement)
+    return process
+
+
+def test_resume_continues_pages_and_folder_numbers(tmp_path, demo_scraper):
+    scraper = demo_scraper(pages=PAGES, process=_process(kill_at='공고 2-1'), watermark_kind='off')
+    try:
+        scraper.scrape_pages(max_pages=3, output_base=str(tmp_path))
+    except KeyboardInterrupt:
+        pass
+    assert [title for _, title in scraper.processed] == ['공고 1-0', '공고 1-1', '공고 1-2', '공고 2-0']
+    assert os.path.exists(tmp_path / 'checkpoint_demo.json')
+
+    resumed = demo_scraper(pages=PAGES, process=_process(), watermark_kind='off', resume=True)
+    resumed.scrape_pages(max_pages=3, output_base=str(tmp_path))
+    assert resumed.processed == [(5, '공고 2-1'), (6, '공고 2-2'), (7, '공고 3-0'), (8, '공고 3-1'), (9, '공고 3-2')]
+    assert not os.path.exists(tmp_path / 'checkpoint_demo.json')
+
+    # 완료 후 다음 실행은 모두 처리된 공고
+    rerun = demo_scraper(pages=PAGES, process=_process(), watermark_kind='off')
+    rerun.scrape_pages(max_pages=3, output_base=str(tmp_path))
+    assert rerun.processed == []
+
+
+def test_interrupted_work_is_kept_without_resume_and_downloads_are_skipped(tmp_path, demo_scraper):
+    scraper = demo_scraper(pages=PAGES, process=_process(kill_at='공고 1-2'), watermark_kind='off')
+    try:
+        scraper.scrape_pages(max_pages=3, output_base=str(tmp_path))
+    except KeyboardInterrupt:
+        pass
+
+    fresh = demo_scraper(pages=PAGES, process=_process(), watermark_kind='off')
+    fresh.scrape_pages(max_pages=1, output_base=str(tmp_path))
+    assert fresh.processed == [(1, '공고 1-2')]
+
+    # 진행 중이던 공고의 받아 둔 첨부파일은 다시 받지 않음
+    folder = tmp_path / '003_공고'
+    (folder / 'attachments').mkdir(parents=True)
+    (folder / 'attachments' / 'a.pdf').write_bytes(b'pdf')
+    fresh.open_checkpoint(str(tmp_path))
+    fresh.checkpoint.announcement_started(3)
+    fresh.checkpoint.file_done('https://example.org/a', str(folder / 'attachments' / 'a.pdf'))
+
+    downloads = []
+    fresh.download_file = lambda url, path, info=None: downloads.append(url) or True
+    fresh._download_attachments([{'url': 'https://example.org/a', 'name': 'a.pdf'},
+                                 {'url': 'https://example.org/b', 'name': 'b.pdf'}], str(folder))
+    assert downloads == ['https://example.org/b']
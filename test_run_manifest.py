@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+실행 매니페스트 기록 테스트
+"""
+
+import os
+import json
+import glob
+
+
+def _save_own_folder(scraper, announcement, index, output_base):
+    """process_announcement를 재정의해 폴더와 첨부파일을 직접 저장하는 사이트"""
+    folder_path = os.path.join(output_base, f"{index:03d}_{announcement['title']}")
+    os.makedirs(os.path.join(folder_path, 'attachments'), exist_ok=True)
+    with open(os.path.join(folder_path, 'content.md'), 'w', encoding='utf-8') as f:
+        f.write(f"# {announcement['title']}\n\n본문")
+    with open(os.path.join(folder_path, 'attachments', 'a.pdf'), 'wb') as f:
+        f.write(b'pdf')
+    scraper.record_saved_folder(folder_path, announcement)
+    scraper.add_processed_title(announcement['title'], announcement)
+
+
+def test_folders_saved_by_overrides_are_recorded(tmp_path, demo_scraper):
+    pages = {1: [{'title': f'공고 {i}', 'url': f'https://example.org/view.do?nttId={i}'} for i in (1, 2)]}
+    scraper = demo_scraper(site='own', pages=pages, process=_save_own_folder, watermark_kind='off')
+    scraper.scrape_pages(max_pages=2, output_base=str(tmp_path))
+
+    summary = scraper.manifest.summary
+    assert (summary['announcements'], summary['files'], summary['total_size']) == (2, 2, 6)
+    assert scraper.record_sink.total_records == 2
+    scraper.record_sink.close()
+
+    with open(glob.glob(str(tmp_path / 'records' / '*.jsonl'))[0], encoding='utf-8') as f:
+        urls = [json.loads(line)['url'] for line in f]
+    assert urls == [f'https://example.org/view.do?nttId={i}' for i in (1, 2)]
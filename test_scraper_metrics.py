@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+단계별 계측 테스트
+"""
+
+import json
+
+import pytest
+
+from scraper_metrics import ScraperMetrics
+
+
+def test_histogram_and_report():
+    metrics = ScraperMetrics(buckets=(0.1, 1.0))
+    metrics.observe('detail_fetch', 'acci', 0.05, host='acci.korcham.net', nbytes=100)
+    metrics.observe('detail_fetch', 'acci', 0.5, host='acci.korcham.net', nbytes=200)
+    metrics.observe('detail_fetch', 'acci', 3.0, host='cdn.example', error=True)
+    metrics.observe('request_delay', 'acci', 1.0)
+
+    text = metrics.to_openmetrics()
+    labels = 'phase="detail_fetch",site="acci",host="acci.korcham.net"'
+    assert f'scraper_phase_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'scraper_phase_seconds_bucket{{{labels},le="1.0"}} 2' in text
+    assert f'scraper_phase_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f'scraper_phase_bytes_total{{{labels}}} 300' in text
+    assert text.endswith('# EOF\n')
+
+    report = json.loads(json.dumps(metrics.report()))
+    fetch = report['sites']['acci']['phases']['detail_fetch']
+    assert (fetch['count'], fetch['errors'], fetch['bytes']) == (3, 1, 300)
+    assert fetch['p50_le'] == 1.0 and fetch['p95_le'] == '+Inf'
+    assert report['sites']['acci']['hosts']['cdn.example']['detail_fetch']['errors'] == 1
+    assert report['sites']['acci']['total_seconds'] == 4.55
+
+
+def test_measure_records_errors_and_site_filter():
+    metrics = ScraperMetrics()
+    with metrics.measure('content_write', 'acci') as sample:
+        sample['bytes'] = 10
+    with pytest.raises(ValueError):
+        with metrics.measure('detail_parse', 'ulsancci'):
+            raise ValueError('parse')
+
+    assert metrics.report(site='ulsancci')['sites']['ulsancci']['phases']['detail_parse']['errors'] == 1
+    assert 'ulsancci' not in metrics.to_openmetrics(site='acci')
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+전문 검색 색인 테스트
+"""
+
+import os
+
+from search_index import SearchIndex, normalize_date
+
+
+def _record(site, title, date, content=''):
+    return {'site': site, 'title': title, 'url': f'https://{site}.example/{title}', 'date': date,
+            'content': content, 'collected_at': '2024-06-30T10:00:00'}
+
+
+def _build_index(tmp_path):
+    index = SearchIndex(str(tmp_path / 'index.sqlite3'))
+    index.add(_record('acci', '2024년 창업지원사업 모집 공고', '2024.03.05', '예비창업자 대상 지원'), str(tmp_path / 'acci' / '001'))
+    index.add(_record('ulsancci', '수출바우처 참여기업 모집', '2024-05-20', '해외 마케팅 지원'), str(tmp_path / 'ulsancci' / '001'))
+    index.add(_record('acci', '교육 안내', '', '창업 교육 일정'), str(tmp_path / 'acci' / '002'))
+    return index
+
+
+def test_normalize_date():
+    assert normalize_date('2024.3.5') == '2024-03-05'
+    assert normalize_date('2024년 3월 5일') == '2024-03-05'
+    assert normalize_date('2024-03-05 10:00') == '2024-03-05'
+    assert normalize_date('상시') is None
+
+
+def test_keyword_site_and_date_filters(tmp_path):
+    index = _build_index(tmp_path)
+
+    assert [r['site'] for r in index.search(['모집 공고'])] == ['acci']
+    assert {r['site'] for r in index.search(['모집'])} == {'acci', 'ulsancci'}
+    assert [r['title'] for r in index.search(['창업'], site='acci', since='2024-03-01', until='2024-04-01')] == ['2024년 창업지원사업 모집 공고']
+    assert [r['site'] for r in index.search(since='2024-04-01', until='2024-05-31')] == ['ulsancci']
+
+    # 날짜가 없는 공고는 수집일로 색인
+    assert index.search(['교육 일정'])[0]['date'] == '2024-06-30'
+    index.close()
+
+
+def test_reindex_and_attachment_text(tmp_path):
+    index = _build_index(tmp_path)
+    folder = str(tmp_path / 'ulsancci' / '001')
+
+    assert index.search(['신청서 양식']) == []
+    assert index.set_attachment_text(folder, '붙임 신청서 양식 및 제출 서류')
+    assert [r['folder_path'] for r in index.search(['신청서 양식'])] == [os.path.abspath(folder)]
+
+    index.add(_record('ulsancci', '수출바우처 참여기업 추가 모집', '2024-05-21'), folder)
+    results = index.search(['추가 모집'])
+    assert len(results) == 1 and results[0]['date'] == '2024-05-21'
+    assert len(index.search(site='ulsancci')) == 1
+    index.close()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+사이트 목록 CSV → 스크래퍼 매핑 테스트
+"""
+
+from enhanced_btp_scraper import EnhancedBTPScraper
+from site_registry import load_site_list, load_sites_config, resolve_sites
+
+
+def test_load_site_list_skips_comments_broken_rows_and_disabled(tmp_path):
+    path = tmp_path / 'sites.csv'
+    path.write_text(
+        ',site_code,site_name,start_url\n'
+        '1,btp,부산테크노파크,https://www.btp.or.kr/kor/CMS/Board/Board.do?mCode=MN013\n'
+        ',kotra,대한무역투자진흥공사,https://www.kotra.or.kr/subList/20000005958\n'
+        '1,  cceiSeoul,서울창조경제혁신센터,https://ccei.creativekorea.or.kr/seoul/allim/allim   ccei\n'
+        '41.79\n'
+        '1,# 77 부터 100,,\n'
+        '1,btp,부산테크노파크,https://www.btp.or.kr/\n',
+        encoding='utf-8'
+    )
+
+    sites = load_site_list(str(path))
+    assert [site['site_code'] for site in sites] == ['btp', 'cceiSeoul']
+    assert sites[1]['start_url'] == 'https://ccei.creativekorea.or.kr/seoul/allim/allim'
+
+    all_sites = load_site_list(str(path), include_disabled=True)
+    assert [site['site_code'] for site in all_sites] == ['btp', 'kotra', 'cceiSeoul']
+    assert all_sites[1]['enabled'] is False
+
+
+def test_resolve_sites_by_registry_convention_and_shared_tables():
+    sites = [{'site_code': code, 'site_name': code, 'start_url': 'https://example.org/'}
+             for code in ('btp', 'sjtp', 'cceiSeoul', 'cceiBusan', 'nosuchsite', 'btp')]
+    registered = {'btp': {'class': EnhancedBTPScraper, 'name': 'BTP', 'output_dir': 'btp_enhanced'}}
+
+    resolved, unresolved = resolve_sites(sites, registered=registered)
+
+    assert resolved['btp'] is registered['btp']
+    assert resolved['sjtp']['class']().bo_table == 'business01'
+    assert resolved['ccei']['class']().regions == ['cceiSeoul', 'cceiBusan']
+    assert [site['site_code'] for site in unresolved] == ['nosuchsite']
+    assert 'enhanced_nosuchsite_scraper.py' in unresolved[0]['reason']
+
+    resolved, _ = resolve_sites(sites[:1])
+    assert resolved['btp']['class'] is EnhancedBTPScraper
+
+
+def test_egov_block_in_sites_config_builds_board_scraper(tmp_path):
+    path = tmp_path / 'sites_config.yaml'
+    path.write_text(
+        'sites:\n'
+        '  mybrd:\n'
+        '    name: "예시 기관"\n'
+        '    list_url: "https://www.example.go.kr/user/bbs/BD_selectBbsList.do?q_bbsCode=1001"\n'
+        '    ssl_verify: false\n'
+        '    egov:\n'
+        '      preset: "bd_bbs"\n'
+        '      context_path: "/user"\n'
+        '  other:\n'
+        '    list_url: "https://www.example.org/list"\n'
+        'defaults:\n'
+        '  user_agent: "test-agent"\n',
+        encoding='utf-8'
+    )
+    sites = [{'site_code': code, 'site_name': code, 'start_url': 'https://example.org/'} for code in ('mybrd', 'other')]
+
+    resolved, unresolved = resolve_sites(sites, configs=load_sites_config(str(path)))
+    scraper = resolved['mybrd']['class']()
+    assert (scraper.preset, scraper.context_path, scraper.get_site_key()) == ('bd_bbs', '/user', 'mybrd')
+    assert scraper.get_list_url(2).endswith('BD_selectBbsList.do?q_bbsCode=1001&q_currPage=2')
+    assert scraper.verify_ssl is False and scraper.headers['User-Agent'] == 'test-agent'
+    assert [site['site_code'] for site in unresolved] == ['other']